@@ -0,0 +1,215 @@
+"""Event search vector
+
+Revision ID: 3c9d2f7a61be
+Revises: 1570d6e17ba8
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "3c9d2f7a61be"
+down_revision: Union[str, None] = "1570d6e17ba8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.add_column(
+        "events", sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True)
+    )
+
+    # 'simple' config: event names are multilingual, no stemming / stop words
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION event_search_document(
+            p_event_id bigint,
+            p_name text,
+            p_description text,
+            p_organization_id bigint
+        ) RETURNS tsvector LANGUAGE sql STABLE AS $$
+            SELECT
+                setweight(to_tsvector('simple', coalesce(p_name, '')), 'A')
+                || setweight(to_tsvector('simple', coalesce((
+                    SELECT o.name FROM organizations o WHERE o.id = p_organization_id
+                ), '')), 'B')
+                || setweight(to_tsvector('simple', coalesce((
+                    SELECT string_agg(t.name, ' ')
+                    FROM tag_associations ta
+                    JOIN tags t ON t.id = ta.tag_id
+                    WHERE ta.entity_code = 'EVENT' AND ta.entity_id = p_event_id
+                ), '')), 'B')
+                || setweight(to_tsvector('simple', coalesce(p_description, '')), 'C')
+        $$
+        """
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION events_search_vector_trigger() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            NEW.search_vector := event_search_document(
+                NEW.id, NEW.name, NEW.description, NEW.organization_id
+            );
+            RETURN NEW;
+        END
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER events_search_vector_update
+        BEFORE INSERT OR UPDATE OF name, description, organization_id ON events
+        FOR EACH ROW EXECUTE FUNCTION events_search_vector_trigger()
+        """
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION refresh_event_search_vector(p_event_id bigint)
+        RETURNS void LANGUAGE sql AS $$
+            UPDATE events
+            SET search_vector = event_search_document(
+                id, name, description, organization_id
+            )
+            WHERE id = p_event_id
+        $$
+        """
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION tag_associations_search_vector_trigger()
+        RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                IF NEW.entity_code = 'EVENT' THEN
+                    PERFORM refresh_event_search_vector(NEW.entity_id);
+                END IF;
+            END IF;
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                IF OLD.entity_code = 'EVENT' THEN
+                    PERFORM refresh_event_search_vector(OLD.entity_id);
+                END IF;
+            END IF;
+            RETURN NULL;
+        END
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER tag_associations_search_vector_update
+        AFTER INSERT OR UPDATE OR DELETE ON tag_associations
+        FOR EACH ROW EXECUTE FUNCTION tag_associations_search_vector_trigger()
+        """
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION organizations_search_vector_trigger()
+        RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE events
+            SET search_vector = event_search_document(
+                id, name, description, organization_id
+            )
+            WHERE organization_id = NEW.id;
+            RETURN NULL;
+        END
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER organizations_search_vector_update
+        AFTER UPDATE OF name ON organizations
+        FOR EACH ROW EXECUTE FUNCTION organizations_search_vector_trigger()
+        """
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION tags_search_vector_trigger()
+        RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE events
+            SET search_vector = event_search_document(
+                id, name, description, organization_id
+            )
+            WHERE id IN (
+                SELECT entity_id FROM tag_associations
+                WHERE tag_id = NEW.id AND entity_code = 'EVENT'
+            );
+            RETURN NULL;
+        END
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER tags_search_vector_update
+        AFTER UPDATE OF name ON tags
+        FOR EACH ROW EXECUTE FUNCTION tags_search_vector_trigger()
+        """
+    )
+
+    # Backfill
+    op.execute(
+        """
+        UPDATE events
+        SET search_vector = event_search_document(
+            id, name, description, organization_id
+        )
+        """
+    )
+
+    op.create_index(
+        "ix_events_search_vector",
+        "events",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_events_name_trgm",
+        "events",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_events_name_trgm", table_name="events")
+    op.drop_index("ix_events_search_vector", table_name="events")
+
+    op.execute("DROP TRIGGER IF EXISTS tags_search_vector_update ON tags")
+    op.execute(
+        "DROP TRIGGER IF EXISTS organizations_search_vector_update ON organizations"
+    )
+    op.execute(
+        "DROP TRIGGER IF EXISTS tag_associations_search_vector_update"
+        " ON tag_associations"
+    )
+    op.execute("DROP TRIGGER IF EXISTS events_search_vector_update ON events")
+
+    op.execute("DROP FUNCTION IF EXISTS tags_search_vector_trigger()")
+    op.execute("DROP FUNCTION IF EXISTS organizations_search_vector_trigger()")
+    op.execute("DROP FUNCTION IF EXISTS tag_associations_search_vector_trigger()")
+    op.execute("DROP FUNCTION IF EXISTS refresh_event_search_vector(bigint)")
+    op.execute("DROP FUNCTION IF EXISTS events_search_vector_trigger()")
+    op.execute(
+        "DROP FUNCTION IF EXISTS event_search_document(bigint, text, text, bigint)"
+    )
+
+    op.drop_column("events", "search_vector")
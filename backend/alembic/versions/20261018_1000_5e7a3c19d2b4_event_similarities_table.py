@@ -0,0 +1,70 @@
+"""Event similarities table
+
+Revision ID: 5e7a3c19d2b4
+Revises: 8b41e0d2c7f3
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e7a3c19d2b4"
+down_revision: Union[str, None] = "8b41e0d2c7f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "event_similarities",
+        sa.Column("id", sa.BIGINT(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("created_by", sa.Integer(), nullable=True),
+        sa.Column("updated_by", sa.Integer(), nullable=True),
+        sa.Column("event_id", sa.BIGINT(), nullable=False),
+        sa.Column("similar_event_id", sa.BIGINT(), nullable=False),
+        sa.Column("score", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["event_id"],
+            ["events.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["similar_event_id"],
+            ["events.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "event_id",
+            "similar_event_id",
+            name="uq_event_similarities_event_id_similar_event_id",
+        ),
+    )
+    op.create_index(
+        "ix_event_similarities_similar_event_id",
+        "event_similarities",
+        ["similar_event_id"],
+        unique=False,
+    )
+    # Populate with: python -m backend.commands.rebuild_event_similarities
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_event_similarities_similar_event_id", table_name="event_similarities"
+    )
+    op.drop_table("event_similarities")
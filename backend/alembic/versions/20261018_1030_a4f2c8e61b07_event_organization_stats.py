@@ -0,0 +1,131 @@
+"""Event and organization stats
+
+Revision ID: a4f2c8e61b07
+Revises: 5e7a3c19d2b4
+Create Date: 2026-10-18 10:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a4f2c8e61b07"
+down_revision: Union[str, None] = "5e7a3c19d2b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _base_columns() -> list[sa.Column]:
+    return [
+        sa.Column("id", sa.BIGINT(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("created_by", sa.Integer(), nullable=True),
+        sa.Column("updated_by", sa.Integer(), nullable=True),
+    ]
+
+
+def _counter(name: str) -> sa.Column:
+    return sa.Column(name, sa.Integer(), server_default="0", nullable=False)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "event_stats",
+        *_base_columns(),
+        sa.Column("event_id", sa.BIGINT(), nullable=False),
+        _counter("sold_tickets_number"),
+        _counter("application_number"),
+        _counter("bookmark_number"),
+        _counter("view_number"),
+        sa.ForeignKeyConstraint(
+            ["event_id"],
+            ["events.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("event_id"),
+    )
+    op.create_table(
+        "organization_stats",
+        *_base_columns(),
+        sa.Column("organization_id", sa.Integer(), nullable=False),
+        _counter("event_number"),
+        _counter("follower_number"),
+        sa.ForeignKeyConstraint(
+            ["organization_id"],
+            ["organizations.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("organization_id"),
+    )
+
+    # Backfill (same counts as backend.commands.reconcile_stats)
+    op.execute(
+        """
+        INSERT INTO event_stats (
+            event_id,
+            sold_tickets_number,
+            application_number,
+            bookmark_number,
+            view_number
+        )
+        SELECT
+            e.id,
+            COALESCE((
+                SELECT SUM(ti.sold_quantity) FROM ticket_inventories ti
+                WHERE ti.event_id = e.id
+            ), 0),
+            (SELECT COUNT(*) FROM applications a WHERE a.event_id = e.id),
+            (SELECT COUNT(*) FROM bookmarks b WHERE b.event_id = e.id),
+            COALESCE(e.view_number, 0)
+        FROM events e
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO organization_stats (organization_id, event_number, follower_number)
+        SELECT
+            o.id,
+            (
+                SELECT COUNT(*) FROM events e
+                WHERE e.organization_id = o.id AND e.published_at IS NOT NULL
+            ),
+            (
+                SELECT COUNT(*) FROM follows f
+                WHERE f.following_id = o.id AND f.entity_code = 'ORGANIZATION'
+            )
+        FROM organizations o
+        """
+    )
+
+    # Views are counted in event_stats from now on
+    op.drop_column("events", "view_number")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "events",
+        sa.Column("view_number", sa.Integer(), autoincrement=False, nullable=True),
+    )
+    op.execute(
+        """
+        UPDATE events e SET view_number = es.view_number
+        FROM event_stats es WHERE es.event_id = e.id
+        """
+    )
+
+    op.drop_table("organization_stats")
+    op.drop_table("event_stats")
@@ -0,0 +1,109 @@
+"""Ticket reservations table
+
+Revision ID: 6b1e4d8a93c5
+Revises: d93b7e0f4a26
+Create Date: 2026-10-18 11:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6b1e4d8a93c5"
+down_revision: Union[str, None] = "d93b7e0f4a26"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ticket_reservations",
+        sa.Column("id", sa.BIGINT(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("created_by", sa.Integer(), nullable=True),
+        sa.Column("updated_by", sa.Integer(), nullable=True),
+        sa.Column("reference", sa.String(length=255), nullable=False),
+        sa.Column("event_id", sa.BIGINT(), nullable=False),
+        sa.Column("ticket_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum(
+                "HELD", "CONFIRMED", "RELEASED", name="ticketreservationstatuscode"
+            ),
+            nullable=False,
+        ),
+        sa.Column("expired_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["event_id"],
+            ["events.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["ticket_id"],
+            ["tickets.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_ticket_reservations_reference",
+        "ticket_reservations",
+        ["reference"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_ticket_reservations_status_expired_at",
+        "ticket_reservations",
+        ["status", "expired_at"],
+        unique=False,
+    )
+
+    # Conditional updates of the inventory of a ticket
+    op.create_index(
+        "ix_ticket_inventories_ticket_id",
+        "ticket_inventories",
+        ["ticket_id"],
+        unique=False,
+    )
+    # Inventories must never go negative, whatever the writer (existing rows are
+    # not validated)
+    op.execute(
+        """
+        ALTER TABLE ticket_inventories
+        ADD CONSTRAINT ck_ticket_inventories_quantities_non_negative
+        CHECK (
+            available_quantity >= 0 AND reserved_quantity >= 0 AND sold_quantity >= 0
+        ) NOT VALID
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "ck_ticket_inventories_quantities_non_negative", "ticket_inventories"
+    )
+    op.drop_index("ix_ticket_inventories_ticket_id", table_name="ticket_inventories")
+    op.drop_index(
+        "ix_ticket_reservations_status_expired_at", table_name="ticket_reservations"
+    )
+    op.drop_index("ix_ticket_reservations_reference", table_name="ticket_reservations")
+    op.drop_table("ticket_reservations")
+    sa.Enum(name="ticketreservationstatuscode").drop(op.get_bind())
@@ -0,0 +1,90 @@
+"""Checkouts and stripe webhook events tables
+
+Revision ID: f2a7c5d18e39
+Revises: 6b1e4d8a93c5
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "f2a7c5d18e39"
+down_revision: Union[str, None] = "6b1e4d8a93c5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _base_columns() -> list[sa.Column]:
+    return [
+        sa.Column("id", sa.BIGINT(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("created_by", sa.Integer(), nullable=True),
+        sa.Column("updated_by", sa.Integer(), nullable=True),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "checkouts",
+        *_base_columns(),
+        sa.Column("reference", sa.String(length=255), nullable=False),
+        sa.Column("stripe_checkout_session_id", sa.String(length=255), nullable=True),
+        sa.Column("event_id", sa.BIGINT(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum(
+                "PENDING", "COMPLETED", "EXPIRED", "FAILED", name="checkoutstatuscode"
+            ),
+            nullable=False,
+        ),
+        sa.Column("total_amount", sa.Float(), nullable=False),
+        sa.Column(
+            "application_request",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+        ),
+        sa.Column("tickets", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("expired_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["event_id"],
+            ["events.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("reference"),
+        sa.UniqueConstraint("stripe_checkout_session_id"),
+    )
+    op.create_table(
+        "stripe_webhook_events",
+        *_base_columns(),
+        sa.Column("stripe_event_id", sa.String(length=255), nullable=False),
+        sa.Column("type", sa.String(length=255), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("stripe_event_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("stripe_webhook_events")
+    op.drop_table("checkouts")
+    sa.Enum(name="checkoutstatuscode").drop(op.get_bind())
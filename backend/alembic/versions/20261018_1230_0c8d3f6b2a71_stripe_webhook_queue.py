@@ -0,0 +1,145 @@
+"""Stripe webhook queue and dead letters
+
+Revision ID: 0c8d3f6b2a71
+Revises: f2a7c5d18e39
+Create Date: 2026-10-18 12:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0c8d3f6b2a71"
+down_revision: Union[str, None] = "f2a7c5d18e39"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+webhook_event_status_code = postgresql.ENUM(
+    "PENDING", "DONE", "DEAD", name="webhookeventstatuscode", create_type=False
+)
+
+
+def upgrade() -> None:
+    webhook_event_status_code.create(op.get_bind(), checkfirst=True)
+
+    op.add_column(
+        "stripe_webhook_events",
+        sa.Column("ordering_key", sa.String(length=255), nullable=True),
+    )
+    op.add_column(
+        "stripe_webhook_events",
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+    op.add_column(
+        "stripe_webhook_events",
+        sa.Column("status", webhook_event_status_code, nullable=True),
+    )
+    op.add_column(
+        "stripe_webhook_events",
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "stripe_webhook_events",
+        sa.Column(
+            "next_attempt_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        "stripe_webhook_events", sa.Column("last_error", sa.Text(), nullable=True)
+    )
+    op.add_column(
+        "stripe_webhook_events",
+        sa.Column("processed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+    # Events recorded by the former inline webhook were already processed
+    op.execute(
+        """
+        UPDATE stripe_webhook_events
+        SET ordering_key = stripe_event_id, payload = '{}', status = 'DONE',
+            processed_at = created_at
+        """
+    )
+    op.alter_column("stripe_webhook_events", "ordering_key", nullable=False)
+    op.alter_column("stripe_webhook_events", "payload", nullable=False)
+    op.alter_column("stripe_webhook_events", "status", nullable=False)
+
+    op.create_index(
+        "ix_stripe_webhook_events_pending",
+        "stripe_webhook_events",
+        ["next_attempt_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
+    op.create_index(
+        "ix_stripe_webhook_events_pending_ordering_key",
+        "stripe_webhook_events",
+        ["ordering_key", "id"],
+        unique=False,
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
+
+    op.create_table(
+        "stripe_webhook_dead_letters",
+        sa.Column("id", sa.BIGINT(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("created_by", sa.Integer(), nullable=True),
+        sa.Column("updated_by", sa.Integer(), nullable=True),
+        sa.Column("stripe_event_id", sa.String(length=255), nullable=False),
+        sa.Column("type", sa.String(length=255), nullable=False),
+        sa.Column("ordering_key", sa.String(length=255), nullable=False),
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_stripe_webhook_dead_letters_stripe_event_id"),
+        "stripe_webhook_dead_letters",
+        ["stripe_event_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_stripe_webhook_dead_letters_stripe_event_id"),
+        table_name="stripe_webhook_dead_letters",
+    )
+    op.drop_table("stripe_webhook_dead_letters")
+    op.drop_index(
+        "ix_stripe_webhook_events_pending_ordering_key",
+        table_name="stripe_webhook_events",
+    )
+    op.drop_index(
+        "ix_stripe_webhook_events_pending", table_name="stripe_webhook_events"
+    )
+    for column in (
+        "processed_at",
+        "last_error",
+        "next_attempt_at",
+        "attempts",
+        "status",
+        "payload",
+        "ordering_key",
+    ):
+        op.drop_column("stripe_webhook_events", column)
+    webhook_event_status_code.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,100 @@
+"""email campaigns and deliveries
+
+Revision ID: 3f9b6d2e8c47
+Revises: 7a5e2b9c4d10
+Create Date: 2026-10-18 13:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9b6d2e8c47"
+down_revision: Union[str, None] = "7a5e2b9c4d10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _base_columns() -> list[sa.Column]:
+    return [
+        sa.Column("id", sa.BIGINT(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("created_by", sa.Integer(), nullable=True),
+        sa.Column("updated_by", sa.Integer(), nullable=True),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "email_campaigns",
+        *_base_columns(),
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("subject", sa.String(length=255), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("PENDING", "SENDING", "DONE", name="emailcampaignstatuscode"),
+            nullable=False,
+        ),
+        sa.Column("recipients_count", sa.Integer(), nullable=False),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["event_id"], ["events.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_email_campaigns_event_id"),
+        "email_campaigns",
+        ["event_id"],
+        unique=False,
+    )
+
+    op.create_table(
+        "email_deliveries",
+        *_base_columns(),
+        sa.Column("email_campaign_id", sa.Integer(), nullable=False),
+        sa.Column("application_id", sa.Integer(), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("PENDING", "SENT", "FAILED", name="emaildeliverystatuscode"),
+            nullable=False,
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("sent_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["email_campaign_id"], ["email_campaigns.id"]),
+        sa.ForeignKeyConstraint(["application_id"], ["applications.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("email_campaign_id", "application_id"),
+    )
+    op.create_index(
+        "ix_email_deliveries_email_campaign_id_status",
+        "email_deliveries",
+        ["email_campaign_id", "status"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_email_deliveries_email_campaign_id_status", table_name="email_deliveries"
+    )
+    op.drop_table("email_deliveries")
+    sa.Enum(name="emaildeliverystatuscode").drop(op.get_bind())
+    op.drop_index(op.f("ix_email_campaigns_event_id"), table_name="email_campaigns")
+    op.drop_table("email_campaigns")
+    sa.Enum(name="emailcampaignstatuscode").drop(op.get_bind())
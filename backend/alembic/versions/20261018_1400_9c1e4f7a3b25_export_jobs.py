@@ -0,0 +1,95 @@
+"""export jobs
+
+Revision ID: 9c1e4f7a3b25
+Revises: 3f9b6d2e8c47
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "9c1e4f7a3b25"
+down_revision: Union[str, None] = "3f9b6d2e8c47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _base_columns() -> list[sa.Column]:
+    return [
+        sa.Column("id", sa.BIGINT(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("created_by", sa.Integer(), nullable=True),
+        sa.Column("updated_by", sa.Integer(), nullable=True),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "export_jobs",
+        *_base_columns(),
+        sa.Column("organization_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "kind",
+            sa.Enum(
+                "ATTENDEES", "SURVEY_RESPONSES", "TRANSACTIONS", name="exportkindcode"
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "format", sa.Enum("CSV", "XLSX", name="exportformatcode"), nullable=False
+        ),
+        sa.Column("gzip", sa.Boolean(), nullable=False),
+        sa.Column("params", postgresql.JSONB(), nullable=False),
+        sa.Column("fingerprint", sa.String(length=64), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum(
+                "PENDING",
+                "RUNNING",
+                "DONE",
+                "FAILED",
+                "EXPIRED",
+                name="exportjobstatuscode",
+            ),
+            nullable=False,
+        ),
+        sa.Column("total_rows", sa.Integer(), nullable=True),
+        sa.Column("processed_rows", sa.Integer(), nullable=False),
+        sa.Column("artifact_key", sa.String(length=255), nullable=True),
+        sa.Column("size_bytes", sa.BIGINT(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("expired_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["organization_id"], ["organizations.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_export_jobs_fingerprint",
+        "export_jobs",
+        ["fingerprint", "status"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_export_jobs_fingerprint", table_name="export_jobs")
+    op.drop_table("export_jobs")
+    sa.Enum(name="exportjobstatuscode").drop(op.get_bind())
+    sa.Enum(name="exportformatcode").drop(op.get_bind())
+    sa.Enum(name="exportkindcode").drop(op.get_bind())
@@ -0,0 +1,112 @@
+"""event analytics rollups
+
+Revision ID: 5b8d2a6e9f13
+Revises: 9c1e4f7a3b25
+Create Date: 2026-10-18 14:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b8d2a6e9f13"
+down_revision: Union[str, None] = "9c1e4f7a3b25"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _base_columns() -> list[sa.Column]:
+    return [
+        sa.Column("id", sa.BIGINT(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("created_by", sa.Integer(), nullable=True),
+        sa.Column("updated_by", sa.Integer(), nullable=True),
+    ]
+
+
+def _counter(name: str) -> sa.Column:
+    return sa.Column(name, sa.Integer(), server_default="0", nullable=False)
+
+
+def _amount(name: str) -> sa.Column:
+    return sa.Column(name, sa.Float(), server_default="0", nullable=False)
+
+
+def _period() -> sa.Column:
+    return sa.Column(
+        "period",
+        sa.Enum("HOUR", "DAY", name="analyticsperiodcode"),
+        nullable=False,
+    )
+
+
+def upgrade() -> None:
+    op.create_table(
+        "event_analytics",
+        *_base_columns(),
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("organization_id", sa.Integer(), nullable=False),
+        _period(),
+        sa.Column("bucket_at", sa.DateTime(timezone=True), nullable=False),
+        _counter("application_number"),
+        _amount("revenue"),
+        _counter("sold_tickets_number"),
+        _counter("check_in_number"),
+        _counter("view_number"),
+        _counter("bookmark_number"),
+        sa.ForeignKeyConstraint(["event_id"], ["events.id"]),
+        sa.ForeignKeyConstraint(["organization_id"], ["organizations.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("event_id", "period", "bucket_at"),
+    )
+    op.create_index(
+        "ix_event_analytics_organization_id",
+        "event_analytics",
+        ["organization_id", "period", "bucket_at"],
+        unique=False,
+    )
+
+    op.create_table(
+        "event_ticket_analytics",
+        *_base_columns(),
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("ticket_id", sa.Integer(), nullable=False),
+        _period(),
+        sa.Column("bucket_at", sa.DateTime(timezone=True), nullable=False),
+        _counter("sold_quantity"),
+        _amount("revenue"),
+        sa.ForeignKeyConstraint(["event_id"], ["events.id"]),
+        sa.ForeignKeyConstraint(["ticket_id"], ["tickets.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("ticket_id", "period", "bucket_at"),
+    )
+    op.create_index(
+        "ix_event_ticket_analytics_event_id",
+        "event_ticket_analytics",
+        ["event_id", "period", "bucket_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_event_ticket_analytics_event_id", table_name="event_ticket_analytics"
+    )
+    op.drop_table("event_ticket_analytics")
+    op.drop_index("ix_event_analytics_organization_id", table_name="event_analytics")
+    op.drop_table("event_analytics")
+    sa.Enum(name="analyticsperiodcode").drop(op.get_bind())
@@ -0,0 +1,151 @@
+"""survey question / answer stats
+
+Revision ID: e2a7c4b9d681
+Revises: 5b8d2a6e9f13
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2a7c4b9d681"
+down_revision: Union[str, None] = "5b8d2a6e9f13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _base_columns() -> list[sa.Column]:
+    return [
+        sa.Column("id", sa.BIGINT(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("created_by", sa.Integer(), nullable=True),
+        sa.Column("updated_by", sa.Integer(), nullable=True),
+    ]
+
+
+def _counter(name: str) -> sa.Column:
+    return sa.Column(name, sa.Integer(), server_default="0", nullable=False)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "survey_question_stats",
+        *_base_columns(),
+        sa.Column("survey_id", sa.Integer(), nullable=False),
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("question_id", sa.Integer(), nullable=False),
+        _counter("response_number"),
+        _counter("answer_text_number"),
+        sa.ForeignKeyConstraint(["survey_id"], ["surveys.id"]),
+        sa.ForeignKeyConstraint(["event_id"], ["events.id"]),
+        sa.ForeignKeyConstraint(["question_id"], ["questions.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("event_id", "question_id"),
+    )
+    op.create_index(
+        op.f("ix_survey_question_stats_survey_id"),
+        "survey_question_stats",
+        ["survey_id"],
+        unique=False,
+    )
+
+    op.create_table(
+        "survey_answer_stats",
+        *_base_columns(),
+        sa.Column("survey_id", sa.Integer(), nullable=False),
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("question_id", sa.Integer(), nullable=False),
+        sa.Column("answer_id", sa.Integer(), nullable=False),
+        _counter("response_number"),
+        sa.ForeignKeyConstraint(["survey_id"], ["surveys.id"]),
+        sa.ForeignKeyConstraint(["event_id"], ["events.id"]),
+        sa.ForeignKeyConstraint(["question_id"], ["questions.id"]),
+        sa.ForeignKeyConstraint(["answer_id"], ["answers.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("event_id", "question_id", "answer_id"),
+    )
+    op.create_index(
+        op.f("ix_survey_answer_stats_survey_id"),
+        "survey_answer_stats",
+        ["survey_id"],
+        unique=False,
+    )
+
+    op.create_index(
+        "ix_survey_response_results_answers_ids",
+        "survey_response_results",
+        ["answers_ids"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_survey_response_results_question_id_answer_text",
+        "survey_response_results",
+        ["question_id", "id"],
+        unique=False,
+        postgresql_where=sa.text("answer_text IS NOT NULL"),
+    )
+
+    # Backfill (same counts as backend.commands.rebuild_survey_stats)
+    op.execute(
+        """
+        INSERT INTO survey_question_stats (
+            survey_id, event_id, question_id, response_number, answer_text_number
+        )
+        SELECT
+            q.survey_id,
+            r.event_id,
+            q.id,
+            COUNT(*),
+            COUNT(*) FILTER (WHERE r.answer_text IS NOT NULL AND r.answer_text <> '')
+        FROM survey_response_results r
+        JOIN questions q ON q.id = r.question_id
+        GROUP BY q.survey_id, r.event_id, q.id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO survey_answer_stats (
+            survey_id, event_id, question_id, answer_id, response_number
+        )
+        SELECT q.survey_id, r.event_id, q.id, a.id, COUNT(DISTINCT r.id)
+        FROM survey_response_results r
+        JOIN questions q ON q.id = r.question_id
+        JOIN answers a ON a.id = ANY(r.answers_ids) AND a.question_id = q.id
+        GROUP BY q.survey_id, r.event_id, q.id, a.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_survey_response_results_question_id_answer_text",
+        table_name="survey_response_results",
+    )
+    op.drop_index(
+        "ix_survey_response_results_answers_ids",
+        table_name="survey_response_results",
+    )
+    op.drop_index(
+        op.f("ix_survey_answer_stats_survey_id"), table_name="survey_answer_stats"
+    )
+    op.drop_table("survey_answer_stats")
+    op.drop_index(
+        op.f("ix_survey_question_stats_survey_id"), table_name="survey_question_stats"
+    )
+    op.drop_table("survey_question_stats")
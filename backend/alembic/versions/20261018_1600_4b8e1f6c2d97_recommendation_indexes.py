@@ -0,0 +1,50 @@
+"""recommendation indexes
+
+Revision ID: 4b8e1f6c2d97
+Revises: 7d3e9a1c5f62
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4b8e1f6c2d97"
+down_revision: Union[str, None] = "7d3e9a1c5f62"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_events_target_id", "events", ["target_id"], unique=False)
+    op.create_index(
+        "ix_targets_industry_codes",
+        "targets",
+        ["industry_codes"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_targets_job_type_codes",
+        "targets",
+        ["job_type_codes"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_tag_associations_entity_code_tag_id",
+        "tag_associations",
+        ["entity_code", "tag_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_tag_associations_entity_code_tag_id", table_name="tag_associations"
+    )
+    op.drop_index("ix_targets_job_type_codes", table_name="targets")
+    op.drop_index("ix_targets_industry_codes", table_name="targets")
+    op.drop_index("ix_events_target_id", table_name="events")
@@ -0,0 +1,88 @@
+"""organization analytics rollup
+
+Revision ID: c6a2e9d41f58
+Revises: 4b8e1f6c2d97
+Create Date: 2026-10-18 16:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import ENUM
+
+# revision identifiers, used by Alembic.
+revision: str = "c6a2e9d41f58"
+down_revision: Union[str, None] = "4b8e1f6c2d97"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _base_columns() -> list[sa.Column]:
+    return [
+        sa.Column("id", sa.BIGINT(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("created_by", sa.Integer(), nullable=True),
+        sa.Column("updated_by", sa.Integer(), nullable=True),
+    ]
+
+
+def _counter(name: str) -> sa.Column:
+    return sa.Column(name, sa.Integer(), server_default="0", nullable=False)
+
+
+def _amount(name: str) -> sa.Column:
+    return sa.Column(name, sa.Float(), server_default="0", nullable=False)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "organization_analytics",
+        *_base_columns(),
+        sa.Column("organization_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "period",
+            ENUM("HOUR", "DAY", name="analyticsperiodcode", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("bucket_at", sa.DateTime(timezone=True), nullable=False),
+        _counter("application_number"),
+        _amount("revenue"),
+        _counter("sold_tickets_number"),
+        _counter("check_in_number"),
+        _counter("view_number"),
+        _counter("bookmark_number"),
+        sa.ForeignKeyConstraint(["organization_id"], ["organizations.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("organization_id", "period", "bucket_at"),
+    )
+    op.execute(
+        """
+        INSERT INTO organization_analytics (
+            organization_id, period, bucket_at, application_number, revenue,
+            sold_tickets_number, check_in_number, view_number, bookmark_number
+        )
+        SELECT
+            organization_id, period, bucket_at, SUM(application_number),
+            SUM(revenue), SUM(sold_tickets_number), SUM(check_in_number),
+            SUM(view_number), SUM(bookmark_number)
+        FROM event_analytics
+        GROUP BY organization_id, period, bucket_at
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("organization_analytics")
@@ -6,9 +6,10 @@ import pytz
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from sqlmodel import Session, column, select
+from sqlmodel import column, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from backend.api.v1.services.auth.auth_service import get_user_by_email
+from backend.api.v1.services.auth.auth_service import get_authenticated_user
 from backend.core.config import settings
 from backend.core.constants import RoleCode
 from backend.core.error_code import ErrorCode, ErrorMessage
@@ -17,17 +18,17 @@ from backend.core.exception import (
     BadRequestException,
     UnauthorizedException,
 )
-from backend.db.database import get_read_db
+from backend.db.database import get_db
 from backend.models.user import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/v1/auth/", auto_error=False)
 
 
-DBDep = Annotated[Session, Depends(get_read_db)]
+DBDep = Annotated[AsyncSession, Depends(get_db)]
 TokenDep = Annotated[str, Depends(oauth2_scheme)]
 
 
-def get_current_user(
+async def get_current_user(
     db: DBDep,
     token: TokenDep,
 ) -> User:
@@ -45,7 +46,7 @@ def get_current_user(
                 raise UnauthorizedException(error_code=ErrorCode.ERR_UNAUTHORIZED)
         except JWTError:
             raise UnauthorizedException(error_code=ErrorCode.ERR_UNAUTHORIZED)
-        user = get_user_by_email(db, email, payload.get("role"))
+        user = await get_authenticated_user(db, email, payload.get("role"))
         if not user:
             raise UnauthorizedException(error_code=ErrorCode.ERR_UNAUTHORIZED)
         return user
@@ -53,12 +54,12 @@ def get_current_user(
         raise UnauthorizedException(error_code=ErrorCode.ERR_UNAUTHORIZED)
 
 
-def get_user_if_logged_in(
+async def get_user_if_logged_in(
     db: DBDep,
     token: TokenDep,
 ):
     if token:
-        return get_current_user(db, token)
+        return await get_current_user(db, token)
 
     return None
 
@@ -73,10 +74,10 @@ def authorize_role(role: RoleCode):
 
 
 def validate_encrypted_token(token_col: str):
-    def wrapper(db: DBDep, token: str):
+    async def wrapper(db: DBDep, token: str):
         hashed_token = hashlib.sha256(token.encode("utf-8")).hexdigest()
         # Find user based on reset token.
-        user = db.scalar(select(User).where(column(token_col) == hashed_token))
+        user = await db.scalar(select(User).where(column(token_col) == hashed_token))
 
         if not user:
             raise BadRequestException(
@@ -0,0 +1,71 @@
+from typing import Awaitable, Callable, Iterable
+
+from fastapi import Depends, Request, Response
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core.conditional import (
+    PRIVATE_CACHE_CONTROL,
+    PUBLIC_CACHE_CONTROL,
+    get_resource_validators,
+    is_not_modified,
+    validator_headers,
+)
+from backend.core.exception import NotModifiedException
+from backend.db.database import get_db
+
+ResourceTagsLoader = Callable[[AsyncSession, Request], Awaitable[list[str] | None]]
+
+
+def conditional_response(
+    resource_tags: Iterable[str] | ResourceTagsLoader,
+    cache_control: str = PUBLIC_CACHE_CONTROL,
+    on_not_modified: Callable[[Request], None] | None = None,
+    time_bucket_seconds: int | None = None,
+):
+    """
+    Route dependency validating anonymous requests against the versions of the
+    resources of the response (named by their cache tags, or loaded from the
+    path params), answering 304 before the route runs its queries.
+
+    Sets ETag / Last-Modified, Cache-Control and Surrogate-Key (the cache tags,
+    for CDN purges) on the response. Authenticated responses are per user and
+    never cached by shared caches. A loader returning None (resource not found)
+    lets the route answer. `on_not_modified` runs before answering 304 (e.g. to
+    count a view). Responses filtered on the current time pass
+    `time_bucket_seconds`, so that their validators expire with the bucket.
+    """
+
+    async def dependency(
+        request: Request, response: Response, db: AsyncSession = Depends(get_db)
+    ):
+        response.headers["Vary"] = "Authorization"
+        if request.headers.get("authorization"):
+            response.headers["Cache-Control"] = PRIVATE_CACHE_CONTROL
+            return
+
+        tags = (
+            await resource_tags(db, request)
+            if callable(resource_tags)
+            else list(resource_tags)
+        )
+        if tags is None:
+            return
+
+        etag, last_modified = await get_resource_validators(
+            db, tags, time_bucket_seconds
+        )
+        headers = {
+            **validator_headers(etag, last_modified),
+            "Cache-Control": cache_control,
+            "Surrogate-Key": " ".join(tags),
+            "Vary": "Authorization",
+        }
+
+        if is_not_modified(request, etag, last_modified):
+            if on_not_modified:
+                on_not_modified(request)
+            raise NotModifiedException(headers)
+
+        response.headers.update(headers)
+
+    return dependency
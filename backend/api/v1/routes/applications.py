@@ -1,13 +1,13 @@
 from http import HTTPStatus
 
 from fastapi import APIRouter, Depends
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 import backend.api.v1.services.applications as application_service
 from backend.api.v1.dependencies.authentication import authorize_role, get_current_user
 from backend.core.constants import RoleCode
 from backend.core.response import authenticated_api_responses
-from backend.db.database import get_read_db
+from backend.db.database import get_db
 from backend.models.user import User
 from backend.schemas.application import (
     CreateApplicationCheckoutSessionResponse,
@@ -23,7 +23,7 @@ router = APIRouter()
     responses=authenticated_api_responses,
 )
 async def cancel_application(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     application_id: int = None,
 ):
@@ -38,7 +38,7 @@ async def cancel_application(
     response_model=CreateApplicationCheckoutSessionResponse,
 )
 async def create_application_checkout_session(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(authorize_role(RoleCode.AUDIENCE)),
     create_application_request: CreateApplicationRequest = None,
 ):
@@ -54,7 +54,7 @@ async def create_application_checkout_session(
     response_model=int,
 )
 async def create_free_application(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(authorize_role(RoleCode.AUDIENCE)),
     create_application_request: CreateApplicationRequest = None,
 ):
@@ -1,7 +1,7 @@
 from http import HTTPStatus
 
-from fastapi import APIRouter, BackgroundTasks, Depends
-from sqlmodel import Session
+from fastapi import APIRouter, Depends
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 import backend.api.v1.services.auth as auth_service
 import backend.api.v1.services.tags as tags_service
@@ -15,7 +15,7 @@ from backend.core.constants import RoleCode, TagAssociationEntityCode
 from backend.core.error_code import ErrorCode
 from backend.core.exception import BadRequestException, UnauthorizedException
 from backend.core.response import authenticated_api_responses, public_api_responses
-from backend.db.database import get_read_db
+from backend.db.database import get_db, get_master_db
 from backend.models.user import User
 from backend.schemas.auth import (
     ChangeEmailRequest,
@@ -39,26 +39,25 @@ router = APIRouter()
 @router.post("/login", responses=public_api_responses, response_model=TokenResponse)
 async def login(
     request: UserLoginRequest,
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
 ) -> TokenResponse:
-    user = auth_service.authenticate_user(db, **request.model_dump())
+    user = await auth_service.authenticate_user(db, **request.model_dump())
     if not user:
         raise UnauthorizedException(ErrorCode.ERR_UNAUTHORIZED)
     if not user.email_verified_at:
         raise BadRequestException(ErrorCode.ERR_USER_NOT_VERIFIED)
 
-    return auth_service.gen_auth_token(user, remember_me=True)
+    return await auth_service.gen_auth_token(db, user, remember_me=True)
 
 
 @router.post(
     "/register", response_model=RegisterAudienceResponse, responses=public_api_responses
 )
 async def register_audience(
-    db: Session = Depends(get_read_db),
-    worker: BackgroundTasks = None,
+    db: AsyncSession = Depends(get_db),
     request: RegisterAudienceRequest = None,
 ):
-    new_user = await auth_service.register_audience(db, worker, request)
+    new_user = await auth_service.register_audience(db, request)
     return RegisterAudienceResponse(
         email=new_user.email, expire_at=new_user.verify_email_token_expire_at
     )
@@ -70,12 +69,11 @@ async def register_audience(
     responses=public_api_responses,
 )
 async def verify_audience(
-    db: Session = Depends(get_read_db),
-    worker: BackgroundTasks = None,
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(validate_encrypted_token("verify_email_token")),
     request: VerifyAudienceRequest = None,
 ):
-    return await auth_service.verify_audience(db, worker, user, request)
+    return await auth_service.verify_audience(db, user, request)
 
 
 @router.post(
@@ -83,7 +81,7 @@ async def verify_audience(
 )
 async def social_auth(
     request: SocialAuthRequest,
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
 ) -> TokenResponse:
     token = await auth_service.social_auth(db, request)
     return token
@@ -91,7 +89,7 @@ async def social_auth(
 
 @router.get("/me", response_model=GetMeResponse, responses=authenticated_api_responses)
 async def me(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User | None = Depends(get_user_if_logged_in),
 ):
     return (
@@ -111,7 +109,7 @@ async def me(
             industry_code=current_user.industry_code,
             job_type_code=current_user.job_type_code,
             avatar_url=current_user.avatar_url,
-            tags=tags_service.get_tag_association(
+            tags=await tags_service.get_tag_association(
                 db, current_user.id, TagAssociationEntityCode.USER
             ),
         )
@@ -125,15 +123,21 @@ async def me(
 )
 async def refresh_token(
     token: str,
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_master_db),
 ) -> TokenResponse:
-    payload = auth_service.verify_refresh_token(token)
+    return await auth_service.refresh_auth_token(db, token)
 
-    user = auth_service.get_user_by_email(db, payload["sub"], payload["role"])
-    if not user:
-        raise UnauthorizedException(ErrorCode.ERR_UNAUTHORIZED)
 
-    return auth_service.gen_auth_token(user)
+@router.post(
+    "/logout-everywhere",
+    status_code=HTTPStatus.NO_CONTENT,
+    responses=authenticated_api_responses,
+)
+async def logout_everywhere(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    await auth_service.revoke_refresh_tokens(db, current_user.id)
 
 
 @router.post(
@@ -143,7 +147,7 @@ async def refresh_token(
 )
 async def forgot_password(
     request: ForgotPasswordRequest = None,
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
 ):
     user = await auth_service.forgot_password(db, request)
     return ForgotPasswordResponse(
@@ -157,7 +161,7 @@ async def forgot_password(
     responses=public_api_responses,
 )
 async def reset_password(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(validate_encrypted_token("reset_password_token")),
     request: ResetPasswordRequest = None,
 ):
@@ -170,7 +174,7 @@ async def reset_password(
     responses=authenticated_api_responses,
 )
 async def change_password(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     request: ChangePasswordRequest = None,
 ):
@@ -183,7 +187,7 @@ async def change_password(
     responses=authenticated_api_responses,
 )
 async def request_change_email(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(authorize_role(RoleCode.AUDIENCE)),
     request: ChangeEmailRequest = None,
 ):
@@ -199,7 +203,7 @@ async def request_change_email(
     responses=public_api_responses,
 )
 async def verify_change_email(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(validate_encrypted_token("verify_change_email_token")),
 ):
     return await auth_service.verify_new_email(db, user)
@@ -209,7 +213,7 @@ async def verify_change_email(
     "/revert-email/{token}", status_code=HTTPStatus.OK, responses=public_api_responses
 )
 async def revert_email(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(validate_encrypted_token("revert_email_token")),
 ):
     return await auth_service.revert_email(db, user)
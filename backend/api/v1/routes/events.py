@@ -1,20 +1,28 @@
 from http import HTTPStatus
 
-from fastapi import APIRouter, Depends
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, Request
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+import backend.api.v1.services.email_campaigns as email_campaigns_service
 import backend.api.v1.services.events as events_service
+import backend.api.v1.services.stats as stats_service
 import backend.api.v1.services.tickets as tickets_service
 from backend.api.v1.dependencies.authentication import (
     authorize_role,
     get_current_user,
     get_user_if_logged_in,
 )
+from backend.api.v1.dependencies.conditional import conditional_response
+from backend.core.cache import EVENTS_TAG, event_tag, organization_tag, response_cache
+from backend.core.config import settings
 from backend.core.constants import RoleCode
+from backend.core.query_stats import query_budget
 from backend.core.response import authenticated_api_responses, public_api_responses
-from backend.db.database import get_read_db
+from backend.db.database import get_db, get_master_db
 from backend.models import User
+from backend.schemas.analytics import AnalyticsQueryParams, EventAnalyticsResponse
 from backend.schemas.check_in import CreateCheckInRequest
+from backend.schemas.email_campaign import CreateEmailCampaignRequest, EmailCampaignItem
 from backend.schemas.event import (
     CreateDraftEventRequest,
     GetDraftEventResponse,
@@ -34,20 +42,50 @@ from backend.schemas.ticket import TicketItem
 router = APIRouter()
 
 
+async def _event_detail_tags(db: AsyncSession, request: Request):
+    event = await events_service.get_event_ids(db, request.path_params["slug"])
+    if not event:
+        return None
+
+    request.state.event_id = event.id
+    return [event_tag(event.id), organization_tag(event.organization_id)]
+
+
+def _count_not_modified_event_view(request: Request):
+    stats_service.event_view_counter.record(
+        request.state.event_id, request.client.host if request.client else None
+    )
+
+
 @router.get(
     "",
     response_model=SearchEventsResponse,
     responses=public_api_responses,
+    dependencies=[
+        Depends(
+            # Filtered on now() (application open, today, upcoming...)
+            conditional_response(
+                [EVENTS_TAG],
+                time_bucket_seconds=settings.HTTP_CACHE_TIME_BUCKET_SECONDS,
+            )
+        )
+    ],
 )
 async def search_events(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     user: User | None = Depends(get_user_if_logged_in),
     query_params: SearchEventsQueryParams = Depends(SearchEventsQueryParams),
 ):
-    events, total = await events_service.search_events(db, user, query_params)
+    events, total, next_cursor = await events_service.search_events(
+        db, user, query_params
+    )
 
     return SearchEventsResponse(
-        page=query_params.page, per_page=query_params.per_page, total=total, data=events
+        page=query_params.page,
+        per_page=query_params.per_page,
+        total=total,
+        data=events,
+        next_cursor=next_cursor,
     )
 
 
@@ -55,9 +93,12 @@ async def search_events(
     "/rank",
     response_model=ListingEventRankResponse,
     responses=public_api_responses,
+    dependencies=[Depends(conditional_response([EVENTS_TAG]))],
 )
-async def listing_event_rank(db: Session = Depends(get_read_db)):
-    events = await events_service.listing_event_rank(db)
+async def listing_event_rank(request: Request, db: AsyncSession = Depends(get_db)):
+    events = await response_cache.get_or_set(
+        request, lambda: events_service.listing_event_rank(db), tags=[EVENTS_TAG]
+    )
     return ListingEventRankResponse(events=events)
 
 
@@ -95,11 +136,11 @@ async def listing_event_rank(db: Session = Depends(get_read_db)):
     responses=authenticated_api_responses,
 )
 async def listing_my_events(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(authorize_role(RoleCode.AUDIENCE)),
     query_params: ListingMyEventsQueryParams = Depends(ListingMyEventsQueryParams),
 ):
-    events, total = await events_service.listing_my_events(
+    events, total, next_cursor = await events_service.listing_my_events(
         db, current_user, query_params
     )
     return ListingMyEventsResponse(
@@ -107,6 +148,7 @@ async def listing_my_events(
         per_page=query_params.per_page,
         total=total,
         data=events,
+        next_cursor=next_cursor,
     )
 
 
@@ -116,7 +158,7 @@ async def listing_my_events(
     responses=public_api_responses,
 )
 async def listing_recommendation_events(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
     query_params: SearchEventsQueryParams = Depends(SearchEventsQueryParams),
 ):
@@ -130,22 +172,49 @@ async def listing_recommendation_events(
 
 
 @router.get(
-    "/{slug}", response_model=GetEventDetailResponse, responses=public_api_responses
+    "/{slug}",
+    response_model=GetEventDetailResponse,
+    responses=public_api_responses,
+    dependencies=[
+        Depends(
+            conditional_response(
+                _event_detail_tags, on_not_modified=_count_not_modified_event_view
+            )
+        )
+    ],
 )
+@query_budget(8)
 async def get_event_detail(
     slug: str,
-    db: Session = Depends(get_read_db),
+    request: Request,
+    db: AsyncSession = Depends(get_db),
     current_user: User | None = Depends(get_user_if_logged_in),
 ):
-    return await events_service.get_event_detail(db, current_user, slug)
+    if current_user:
+        event = await events_service.get_event_detail(db, current_user, slug)
+        return events_service.count_event_view(event, current_user.id)
+
+    # Identical for every anonymous visitor
+    event = await response_cache.get_or_set(
+        request,
+        lambda: events_service.get_event_detail(db, None, slug),
+        tags=lambda event: [
+            event_tag(event["id"]),
+            organization_tag(event["organization_id"]),
+        ],
+    )
+    return events_service.count_event_view(
+        event, request.client.host if request.client else None
+    )
 
 
 @router.get(
     "/{slug}/related-events",
     response_model=ListingRelatedEventsResponse,
     responses=public_api_responses,
+    dependencies=[Depends(conditional_response([EVENTS_TAG]))],
 )
-async def listing_related_events(slug: str = None, db: Session = Depends(get_read_db)):
+async def listing_related_events(slug: str = None, db: AsyncSession = Depends(get_db)):
     events = await events_service.listing_related_events(db, slug)
     return ListingRelatedEventsResponse(events=events)
 
@@ -157,7 +226,7 @@ async def listing_related_events(slug: str = None, db: Session = Depends(get_rea
 )
 async def create_event_bookmark(
     event_id: int,
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     return await events_service.create_event_bookmark(db, current_user, event_id)
@@ -170,7 +239,7 @@ async def create_event_bookmark(
 )
 async def delete_event_bookmark(
     event_id: int,
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     return await events_service.delete_event_bookmark(db, current_user, event_id)
@@ -182,7 +251,8 @@ async def delete_event_bookmark(
     responses=authenticated_api_responses,
 )
 async def get_draft_event(
-    db: Session = Depends(get_read_db),
+    # Read-your-own-writes: the editor reloads the draft right after saving it
+    db: AsyncSession = Depends(get_master_db),
     organizer: User = Depends(authorize_role(RoleCode.ORGANIZER)),
     slug: str = None,
 ):
@@ -191,7 +261,7 @@ async def get_draft_event(
 
 @router.post("/draft", response_model=int, responses=authenticated_api_responses)
 async def create_draft_event(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     organizer: User = Depends(authorize_role(RoleCode.ORGANIZER)),
     request: CreateDraftEventRequest = None,
 ):
@@ -202,7 +272,7 @@ async def create_draft_event(
     "/draft/{event_id}", response_model=int, responses=authenticated_api_responses
 )
 async def save_draft_event(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     organizer: User = Depends(authorize_role(RoleCode.ORGANIZER)),
     request: SaveDraftEventRequest = None,
     event_id: int = None,
@@ -212,7 +282,7 @@ async def save_draft_event(
 
 @router.post("/{event_id}", response_model=int, responses=authenticated_api_responses)
 async def publish_event(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     organizer: User = Depends(authorize_role(RoleCode.ORGANIZER)),
     request: PublishEventRequest = None,
     event_id: int = None,
@@ -226,20 +296,71 @@ async def publish_event(
     responses=authenticated_api_responses,
 )
 async def listing_tickets_of_event(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     organizer: User = Depends(get_current_user),
     event_id: int = None,
 ):
     return await tickets_service.listing_tickets_of_event(db, organizer, event_id)
 
 
+@router.post(
+    "/{event_id}/email-campaigns",
+    response_model=EmailCampaignItem,
+    responses=authenticated_api_responses,
+)
+async def create_email_campaign(
+    db: AsyncSession = Depends(get_db),
+    organizer: User = Depends(authorize_role(RoleCode.ORGANIZER)),
+    request: CreateEmailCampaignRequest = None,
+    event_id: int = None,
+):
+    campaign = await email_campaigns_service.create_email_campaign(
+        db, organizer, event_id, request
+    )
+    return await email_campaigns_service.get_email_campaign(
+        db, organizer, event_id, campaign.id
+    )
+
+
+@router.get(
+    "/{event_id}/email-campaigns/{email_campaign_id}",
+    response_model=EmailCampaignItem,
+    responses=authenticated_api_responses,
+)
+async def get_email_campaign(
+    db: AsyncSession = Depends(get_db),
+    organizer: User = Depends(authorize_role(RoleCode.ORGANIZER)),
+    event_id: int = None,
+    email_campaign_id: int = None,
+):
+    return await email_campaigns_service.get_email_campaign(
+        db, organizer, event_id, email_campaign_id
+    )
+
+
+@router.get(
+    "/{event_id}/analytics",
+    response_model=EventAnalyticsResponse,
+    responses=authenticated_api_responses,
+)
+async def get_event_analytics(
+    db: AsyncSession = Depends(get_db),
+    organizer: User = Depends(authorize_role(RoleCode.ORGANIZER)),
+    event_id: int = None,
+    query_params: AnalyticsQueryParams = Depends(AnalyticsQueryParams),
+):
+    return await events_service.get_event_analytics(
+        db, organizer, event_id, query_params
+    )
+
+
 @router.post(
     "/{event_id}/check-in",
     response_model=int,
     responses=authenticated_api_responses,
 )
 async def create_check_in(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     request: CreateCheckInRequest = None,
     event_id: int = None,
 ):
@@ -252,7 +373,7 @@ async def create_check_in(
     responses=authenticated_api_responses,
 )
 async def delete_check_in(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
     event_id: int = None,
     check_in_id: int = None,
@@ -1,21 +1,28 @@
 from http import HTTPStatus
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Request, Response
 from fastapi.responses import StreamingResponse
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 import backend.api.v1.services.auth as auth_service
 import backend.api.v1.services.events as events_service
+import backend.api.v1.services.exports as exports_service
 import backend.api.v1.services.organizations as organizations_service
 from backend.api.v1.dependencies.authentication import (
     authorize_role,
     get_current_user,
     get_user_if_logged_in,
 )
-from backend.core.constants import RoleCode
+from backend.api.v1.dependencies.conditional import conditional_response
+from backend.core.artifact_store import artifact_store
+from backend.core.cache import EVENTS_TAG, organization_tag, response_cache
+from backend.core.constants import ExportJobStatusCode, RoleCode
+from backend.core.error_code import ErrorCode, ErrorMessage
+from backend.core.exception import BadRequestException
 from backend.core.response import authenticated_api_responses, public_api_responses
-from backend.db.database import get_read_db
+from backend.db.database import get_db
 from backend.models.user import User
+from backend.schemas.analytics import AnalyticsQueryParams, AnalyticsResponse
 from backend.schemas.auth import RegisterOrganizationRequest
 from backend.schemas.event import (
     ListingOrganizationEventsQueryParams,
@@ -24,24 +31,41 @@ from backend.schemas.event import (
     ListingTopOrganizationEventsResponse,
 )
 from backend.schemas.organization import (
+    CreateExportJobRequest,
     DownloadAttendeesRequest,
+    ExportJobItem,
     GetAttendeeDetailResponse,
     GetOrganizationDetailResponse,
     ListingAttendeesQueryParams,
     ListingAttendeesResponse,
     ListingRandomOrganizationsResponse,
 )
+from backend.utils.export import EXPORT_MEDIA_TYPES, export_file_info, parse_byte_range
 
 router = APIRouter()
 
 
+async def _organization_detail_tags(db: AsyncSession, request: Request):
+    organization_id = await organizations_service.get_organization_id(
+        db, request.path_params["organization_slug"]
+    )
+    if not organization_id:
+        return None
+
+    return [organization_tag(organization_id), EVENTS_TAG]
+
+
+async def _top_organization_events_tags(db: AsyncSession, request: Request):
+    return [organization_tag(request.path_params["organization_id"]), EVENTS_TAG]
+
+
 @router.post(
     "/register",
     response_model=int,
     responses=public_api_responses,
 )
 async def register_organization(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     request: RegisterOrganizationRequest = None,
 ):
     organization_id = await auth_service.register_organization(db, request)
@@ -54,17 +78,21 @@ async def register_organization(
     responses=authenticated_api_responses,
 )
 async def listing_organization_events(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     organizer: User = Depends(authorize_role(RoleCode.ORGANIZER)),
     query_params: ListingOrganizationEventsQueryParams = Depends(
         ListingOrganizationEventsQueryParams
     ),
 ):
-    events, total = await events_service.listing_organization_events(
+    events, total, next_cursor = await events_service.listing_organization_events(
         db, organizer, query_params
     )
     return ListingOrganizationEventsResponse(
-        data=events, total=total, page=1, per_page=10
+        data=events,
+        total=total,
+        page=query_params.page,
+        per_page=query_params.per_page,
+        next_cursor=next_cursor,
     )
 
 
@@ -74,7 +102,7 @@ async def listing_organization_events(
     responses=authenticated_api_responses,
 )
 async def listing_organization_events_timeline(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     organizer: User = Depends(authorize_role(RoleCode.ORGANIZER)),
 ):
     events = await events_service.listing_events_timeline(db, organizer)
@@ -87,14 +115,20 @@ async def listing_organization_events_timeline(
     responses=authenticated_api_responses,
 )
 async def listing_attendees(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     organizer: User = Depends(authorize_role(RoleCode.ORGANIZER)),
     query_params: ListingAttendeesQueryParams = Depends(ListingAttendeesQueryParams),
 ):
-    attendees, total = await organizations_service.listing_attendees(
+    attendees, total, next_cursor = await organizations_service.listing_attendees(
         db, organizer, query_params
     )
-    return ListingAttendeesResponse(data=attendees, total=total, page=1, per_page=10)
+    return ListingAttendeesResponse(
+        data=attendees,
+        total=total,
+        page=query_params.page,
+        per_page=query_params.per_page,
+        next_cursor=next_cursor,
+    )
 
 
 @router.get(
@@ -108,25 +142,135 @@ async def listing_attendees(
         **authenticated_api_responses,
     },
 )
-async def download_attendees_csv(
-    db: Session = Depends(get_read_db),
+@router.get(
+    "/attendees/export",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()},
+            "description": "Stream the attendees as CSV (optionally gzipped) or XLSX.",
+        },
+        **authenticated_api_responses,
+    },
+)
+async def download_attendees(
     organizer: User = Depends(authorize_role(RoleCode.ORGANIZER)),
     request: DownloadAttendeesRequest = Depends(DownloadAttendeesRequest),
 ):
-    stream = await organizations_service.download_attendees_csv(db, organizer, request)
+    filename, media_type = export_file_info("attendees", request.format, request.gzip)
+
+    response = StreamingResponse(
+        organizations_service.export_attendees(organizer, request),
+        media_type=media_type,
+    )
+    response.headers["Content-Disposition"] = f"attachment; filename={filename}"
+    return response
+
+
+@router.post(
+    "/exports",
+    response_model=ExportJobItem,
+    responses=authenticated_api_responses,
+)
+async def create_export_job(
+    db: AsyncSession = Depends(get_db),
+    organizer: User = Depends(authorize_role(RoleCode.ORGANIZER)),
+    request: CreateExportJobRequest = None,
+):
+    return await exports_service.create_export_job(db, organizer, request)
+
+
+@router.get(
+    "/exports/{export_job_id}",
+    response_model=ExportJobItem,
+    responses=authenticated_api_responses,
+)
+async def get_export_job(
+    db: AsyncSession = Depends(get_db),
+    organizer: User = Depends(authorize_role(RoleCode.ORGANIZER)),
+    export_job_id: int = None,
+):
+    return await exports_service.get_export_job(db, organizer, export_job_id)
+
 
-    response = StreamingResponse(iter([stream.getvalue()]), media_type="text/csv")
-    response.headers["Content-Disposition"] = "attachment; filename=attendees.csv"
+@router.get(
+    "/exports/{export_job_id}/download",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {
+                media_type: {}
+                for media_type in [*EXPORT_MEDIA_TYPES.values(), "application/gzip"]
+            },
+            "description": "The export file, partial content for a Range request.",
+        },
+        **authenticated_api_responses,
+    },
+)
+async def download_export(
+    db: AsyncSession = Depends(get_db),
+    organizer: User = Depends(authorize_role(RoleCode.ORGANIZER)),
+    export_job_id: int = None,
+    range_header: str | None = Header(None, alias="Range"),
+):
+    export_job = await exports_service.get_export_job(db, organizer, export_job_id)
+    size = (
+        await artifact_store.size(export_job.artifact_key)
+        if export_job.status == ExportJobStatusCode.DONE
+        else None
+    )
+    if size is None:
+        raise BadRequestException(
+            ErrorCode.ERR_EXPORT_NOT_READY, ErrorMessage.ERR_EXPORT_NOT_READY
+        )
+
+    try:
+        byte_range = parse_byte_range(range_header, size)
+    except ValueError:
+        return Response(
+            status_code=HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE,
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+
+    filename, media_type = export_file_info(
+        export_job.kind.value.lower(), export_job.format, export_job.gzip
+    )
+    start, end = byte_range or (0, size - 1)
+    response = StreamingResponse(
+        artifact_store.read(export_job.artifact_key, start, end),
+        status_code=HTTPStatus.PARTIAL_CONTENT if byte_range else HTTPStatus.OK,
+        media_type=media_type,
+    )
+    response.headers["Content-Disposition"] = f"attachment; filename={filename}"
+    response.headers["Accept-Ranges"] = "bytes"
+    response.headers["Content-Length"] = str(end - start + 1)
+    if byte_range:
+        response.headers["Content-Range"] = f"bytes {start}-{end}/{size}"
     return response
 
 
+@router.get(
+    "/analytics",
+    response_model=AnalyticsResponse,
+    responses=authenticated_api_responses,
+)
+async def get_organization_analytics(
+    db: AsyncSession = Depends(get_db),
+    organizer: User = Depends(authorize_role(RoleCode.ORGANIZER)),
+    query_params: AnalyticsQueryParams = Depends(AnalyticsQueryParams),
+):
+    return await organizations_service.get_organization_analytics(
+        db, organizer, query_params
+    )
+
+
 @router.get(
     "/attendees/{attendee_id}",
     response_model=GetAttendeeDetailResponse,
     responses=authenticated_api_responses,
 )
 async def get_attendee_detail(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     organizer: User = Depends(authorize_role(RoleCode.ORGANIZER)),
     attendee_id: int = None,
 ):
@@ -139,7 +283,7 @@ async def get_attendee_detail(
     responses=public_api_responses,
 )
 async def listing_random_organizations(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     user: User | None = Depends(get_user_if_logged_in),
 ):
     organizations = await organizations_service.listing_random_organizations(db, user)
@@ -155,26 +299,38 @@ async def listing_random_organizations(
     "/{organization_slug}",
     response_model=GetOrganizationDetailResponse,
     responses=public_api_responses,
+    dependencies=[Depends(conditional_response(_organization_detail_tags))],
 )
 async def get_organization_detail(
-    db: Session = Depends(get_read_db),
+    request: Request,
+    db: AsyncSession = Depends(get_db),
     user: User | None = Depends(get_user_if_logged_in),
     organization_slug: str = None,
 ):
-    organization = await organizations_service.get_organization_detail(
-        db, user, organization_slug
+    if user:
+        return await organizations_service.get_organization_detail(
+            db, user, organization_slug
+        )
+
+    # Identical for every anonymous visitor
+    return await response_cache.get_or_set(
+        request,
+        lambda: organizations_service.get_organization_detail(
+            db, None, organization_slug
+        ),
+        tags=lambda organization: [organization_tag(organization["id"]), EVENTS_TAG],
     )
-    return organization
 
 
 @router.get(
     "/{organization_id}/top-events",
     response_model=ListingTopOrganizationEventsResponse,
     responses=public_api_responses,
+    dependencies=[Depends(conditional_response(_top_organization_events_tags))],
 )
 async def listing_top_organization_events(
     organization_id: int = None,
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
 ):
     events = await events_service.listing_top_organization_events(db, organization_id)
     return ListingTopOrganizationEventsResponse(events=events)
@@ -186,7 +342,7 @@ async def listing_top_organization_events(
     responses=authenticated_api_responses,
 )
 async def create_organization_follow(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     organization_id: int = None,
 ):
@@ -201,7 +357,7 @@ async def create_organization_follow(
     responses=authenticated_api_responses,
 )
 async def delete_organization_follow(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     organization_id: int = None,
 ):
@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 import backend.api.v1.services.speakers as speakers_service
 from backend.core.response import public_api_responses
-from backend.db.database import get_read_db
+from backend.db.database import get_db
 from backend.schemas.speaker import ListingRandomSpeakersResponse
 
 router = APIRouter()
@@ -15,7 +15,7 @@ router = APIRouter()
     responses=public_api_responses,
 )
 async def listing_random_speakers(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
 ):
     speakers = await speakers_service.listing_random_speakers(db)
     return ListingRandomSpeakersResponse(
@@ -1,12 +1,18 @@
-from fastapi import APIRouter, Depends
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, Request
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 import backend.api.v1.services.surveys as survey_service
 from backend.api.v1.dependencies.authentication import authorize_role
+from backend.core.cache import response_cache, surveys_tag
 from backend.core.response import authenticated_api_responses
-from backend.db.database import get_read_db
+from backend.db.database import get_db
 from backend.models.user import RoleCode, User
-from backend.schemas.survey import CreateSurveyRequest, ListingSurveyOptionsItem
+from backend.schemas.survey import (
+    CreateSurveyRequest,
+    ListingSurveyOptionsItem,
+    SurveyAnalyticsQueryParams,
+    SurveyAnalyticsResponse,
+)
 
 router = APIRouter()
 
@@ -17,7 +23,7 @@ router = APIRouter()
     responses=authenticated_api_responses,
 )
 async def create_survey(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     organizer: User = Depends(authorize_role(RoleCode.ORGANIZER)),
     request: CreateSurveyRequest = None,
 ):
@@ -77,10 +83,32 @@ async def create_survey(
     responses=authenticated_api_responses,
 )
 async def listing_survey_options(
-    db: Session = Depends(get_read_db),
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    organizer: User = Depends(authorize_role(RoleCode.ORGANIZER)),
+):
+    return await response_cache.get_or_set(
+        request,
+        lambda: survey_service.listing_survey_options(db, organizer),
+        tags=[surveys_tag(organizer.organization_id)],
+        vary=organizer.organization_id,
+    )
+
+
+@router.get(
+    "/{survey_id}/analytics",
+    response_model=SurveyAnalyticsResponse,
+    responses=authenticated_api_responses,
+)
+async def get_survey_analytics(
+    db: AsyncSession = Depends(get_db),
     organizer: User = Depends(authorize_role(RoleCode.ORGANIZER)),
+    survey_id: int = None,
+    query_params: SurveyAnalyticsQueryParams = Depends(SurveyAnalyticsQueryParams),
 ):
-    return await survey_service.listing_survey_options(db, organizer)
+    return await survey_service.get_survey_analytics(
+        db, organizer, survey_id, query_params
+    )
 
 
 # @router.get(
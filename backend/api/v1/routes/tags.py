@@ -1,23 +1,37 @@
-from fastapi import APIRouter, Depends
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, Request
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 import backend.api.v1.services.tags as tags_service
+from backend.api.v1.dependencies.conditional import conditional_response
+from backend.core.cache import EVENTS_TAG, TAGS_TAG, response_cache
 from backend.core.response import public_api_responses
-from backend.db.database import get_read_db
+from backend.db.database import get_db
 from backend.schemas.tag import ListingTagRankResponse, ListingTagsResponse
 
 router = APIRouter()
 
 
-@router.get("", response_model=ListingTagsResponse, responses=public_api_responses)
-async def listing_tags(db: Session = Depends(get_read_db)):
-    data = await tags_service.listing_tags(db)
+@router.get(
+    "",
+    response_model=ListingTagsResponse,
+    responses=public_api_responses,
+    dependencies=[Depends(conditional_response([TAGS_TAG]))],
+)
+async def listing_tags(request: Request, db: AsyncSession = Depends(get_db)):
+    data = await response_cache.get_or_set(
+        request, lambda: tags_service.listing_tags(db), tags=[TAGS_TAG]
+    )
     return ListingTagsResponse(data=data)
 
 
 @router.get(
-    "/rank", response_model=ListingTagRankResponse, responses=public_api_responses
+    "/rank",
+    response_model=ListingTagRankResponse,
+    responses=public_api_responses,
+    dependencies=[Depends(conditional_response([TAGS_TAG, EVENTS_TAG]))],
 )
-async def listing_tag_rank(db: Session = Depends(get_read_db)):
-    tags = await tags_service.listing_tag_rank(db)
+async def listing_tag_rank(request: Request, db: AsyncSession = Depends(get_db)):
+    tags = await response_cache.get_or_set(
+        request, lambda: tags_service.listing_tag_rank(db), tags=[TAGS_TAG, EVENTS_TAG]
+    )
     return ListingTagRankResponse(tags=tags)
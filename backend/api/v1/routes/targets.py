@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, Request
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 import backend.api.v1.services.targets as targets_service
 from backend.api.v1.dependencies.authentication import authorize_role
+from backend.core.cache import response_cache, targets_tag
 from backend.core.response import authenticated_api_responses
-from backend.db.database import get_read_db
+from backend.db.database import get_db
 from backend.models.user import RoleCode, User
 from backend.schemas.target import CreateTargetRequest, ListingTargetOptionsItem
 
@@ -27,7 +28,7 @@ router = APIRouter()
 
 @router.post("", response_model=int, responses=authenticated_api_responses)
 async def create_target(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     organizer: User = Depends(authorize_role(RoleCode.ORGANIZER)),
     request: CreateTargetRequest = None,
 ):
@@ -36,10 +37,16 @@ async def create_target(
 
 @router.get("/options", response_model=list[ListingTargetOptionsItem])
 async def listing_target_options(
-    db: Session = Depends(get_read_db),
+    request: Request,
+    db: AsyncSession = Depends(get_db),
     organizer: User = Depends(authorize_role(RoleCode.ORGANIZER)),
 ):
-    return await targets_service.listing_target_options(db, organizer)
+    return await response_cache.get_or_set(
+        request,
+        lambda: targets_service.listing_target_options(db, organizer),
+        tags=[targets_tag(organizer.organization_id)],
+        vary=organizer.organization_id,
+    )
 
 
 # @router.get(
@@ -1,11 +1,11 @@
 from http import HTTPStatus
 
 from fastapi import APIRouter, Depends, Request
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 import backend.api.v1.services.transactions as transaction_service
 from backend.core.response import public_api_responses
-from backend.db.database import get_read_db
+from backend.db.database import get_db
 
 router = APIRouter()
 
@@ -16,7 +16,8 @@ router = APIRouter()
     responses=public_api_responses,
 )
 async def handle_application_transaction(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     request: Request = None,
 ):
-    return await transaction_service.handle_application_transaction(db, request)
+    # Processed by the webhook worker (python -m backend.commands.run_stripe_webhook_worker)
+    await transaction_service.enqueue_stripe_event(db, request)
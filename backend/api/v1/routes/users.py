@@ -1,12 +1,12 @@
 from fastapi import APIRouter, Body, Depends
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 import backend.api.v1.services.tags as tags_service
 import backend.api.v1.services.users as users_service
 from backend.api.v1.dependencies.authentication import authorize_role
-from backend.core.constants import RoleCode
+from backend.core.constants import RoleCode, TagAssociationEntityCode
 from backend.core.response import authenticated_api_responses
-from backend.db.database import get_read_db
+from backend.db.database import get_db
 from backend.models.user import User
 from backend.schemas.auth import GetMeResponse
 from backend.schemas.user import UpdateUserRequest
@@ -18,7 +18,7 @@ router = APIRouter()
     "/profile", response_model=GetMeResponse, responses=authenticated_api_responses
 )
 async def update_audience(
-    db: Session = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(authorize_role(RoleCode.AUDIENCE)),
     request: UpdateUserRequest = Body(...),
 ):
@@ -37,5 +37,7 @@ async def update_audience(
         industry_code=updated_user.industry_code,
         job_type_code=updated_user.job_type_code,
         avatar_url=updated_user.avatar_url,
-        tags=tags_service.get_user_tags(db, current_user.id),
+        tags=await tags_service.get_tag_association(
+            db, current_user.id, TagAssociationEntityCode.USER
+        ),
     )
@@ -1,4 +1,5 @@
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.core.config import settings
 from backend.core.error_code import ErrorCode, ErrorMessage
@@ -8,19 +9,22 @@ from backend.models.application import Application
 from backend.models.event import Event
 from backend.models.organization import Organization
 from backend.models.ticket import Ticket
+from backend.models.transaction import Transaction
+from backend.models.transaction_item import TransactionItem
 from backend.models.user import User
 from backend.utils.database import save
 from backend.utils.format_start_end_datetime import format_start_end_datetime
 
 
-async def cancel_application(db: Session, current_user: User, application_id: int):
-    application = db.exec(
+async def cancel_application(db: AsyncSession, current_user: User, application_id: int):
+    result = await db.exec(
         select(Application).where(
             Application.id == application_id,
             Application.user_id == current_user.id,
             # Application.canceled_at.is_(None),
         )
-    ).one_or_none()
+    )
+    application = result.one_or_none()
 
     if not application:
         raise BadRequestException(
@@ -31,21 +35,29 @@ async def cancel_application(db: Session, current_user: User, application_id: in
     try:
         # application.canceled_at = datetime.now()
         # application.status = ApplicationStatusCode.REJECTED
-        save(db, application)
 
-        event = db.exec(
+        result = await db.exec(
             select(Event, Organization)
             .join(Organization, Organization.id == Event.organization_id)
             .where(Event.id == application.event_id)
-        ).one_or_none()
+        )
+        event, organization = result.one()
 
-        ticket = db.get(Ticket, application.ticket_id)
+        ticket_names = (
+            await db.exec(
+                select(Ticket.name)
+                .join(TransactionItem, TransactionItem.ticket_id == Ticket.id)
+                .join(Transaction, Transaction.id == TransactionItem.transaction_id)
+                .where(Transaction.application_id == application.id)
+                .distinct()
+            )
+        ).all()
         context = {
             "username": current_user.first_name,
-            "organization_name": event.organization_name,
-            "contact_url": event.contact_url,
+            "organization_name": organization.name,
+            "contact_url": organization.contact_url,
             "event_name": event.name,
-            "ticket_name": ticket.name,
+            "ticket_name": ", ".join(ticket_names),
             "ticket_url": "",
             "datetime": format_start_end_datetime(event.start_at, event.end_at),
             "address": event.organize_address,
@@ -55,13 +67,15 @@ async def cancel_application(db: Session, current_user: User, application_id: in
         }
 
         mailer = Email()
-        await mailer.send_email(
+        mailer.queue_aud_email(
+            db,
             current_user.email,
             "cancel_event_application_success.html",
             "Cancel Application Success",
             context,
         )
+        await save(db, application)
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise e
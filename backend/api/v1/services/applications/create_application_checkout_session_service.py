@@ -1,102 +1,150 @@
-import json
+from datetime import datetime, timedelta
 from uuid import uuid4
 
+import pytz
 import stripe
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 import backend.api.v1.services.applications as applications_service
-from backend.core.config import settings
+import backend.api.v1.services.tickets as tickets_service
+from backend.core.cache import EVENTS_TAG, event_tag, response_cache
+from backend.core.conditional import touch_resources
+from backend.core.config import logger, settings
+from backend.core.constants import CheckoutStatusCode
 from backend.core.error_code import ErrorCode, ErrorMessage
 from backend.core.exception import BadRequestException
+from backend.models.checkout import Checkout
 from backend.models.user import User
 from backend.schemas.application import CreateApplicationRequest
+from backend.utils.database import save
 
 stripe.api_key = settings.STRIPE_SECRET_KEY
 
+# Stripe accepts checkout sessions expiring in 30 minutes to 24 hours
+STRIPE_CHECKOUT_MIN_TTL_SECONDS = 1800
+STRIPE_CHECKOUT_MAX_TTL_SECONDS = 24 * 3600
+# Time the session creation request may take to reach Stripe
+STRIPE_CHECKOUT_TTL_MARGIN_SECONDS = 60
+
 
 async def create_application_checkout_session(
-    db: Session,
+    db: AsyncSession,
     current_user: User,
     create_application_request: CreateApplicationRequest,
 ):
     event_id = create_application_request.event_id
     try:
-        result = applications_service.validate_application_tickets(
+        result = await applications_service.validate_application_tickets(
             db, current_user.id, create_application_request, False
         )
         event = result["event"]
         tickets = result["tickets"]
 
-        total_amount = 0
-        line_items = []
-        # Create a unique reference for the transaction
-        transaction_reference = f"{current_user.id}-{event_id}-{uuid4()}"
-
-        for ticket in tickets:
-            total_amount += ticket["price"] * ticket["requested_quantity"]
-
-            line_items.append(
+        # Hold the tickets for the lifetime of the session, committed before
+        # calling Stripe so that no inventory row stays locked meanwhile
+        reference = f"{current_user.id}-{event_id}-{uuid4()}"
+        reservations = await tickets_service.reserve_tickets(
+            db,
+            event_id,
+            {ticket["id"]: ticket["requested_quantity"] for ticket in tickets},
+            reference,
+            current_user.id,
+            max(
+                settings.TICKET_RESERVATION_TTL_SECONDS, STRIPE_CHECKOUT_MIN_TTL_SECONDS
+            ),
+        )
+        checkout = Checkout(
+            reference=reference,
+            event_id=event_id,
+            user_id=current_user.id,
+            total_amount=sum(
+                ticket["price"] * ticket["requested_quantity"] for ticket in tickets
+            ),
+            application_request=create_application_request.model_dump(mode="json"),
+            tickets=[
                 {
-                    "price_data": {
-                        "currency": "usd",
-                        "product_data": {
-                            "name": ticket["name"],
-                            "description": ticket["description"],
-                        },
-                        "unit_amount": int(ticket["price"] * 100),
-                    },
+                    "id": ticket["id"],
                     "quantity": ticket["requested_quantity"],
+                    "price": ticket["price"],
                 }
-            )
+                for ticket in tickets
+            ],
+            expired_at=reservations[0].expired_at,
+        )
+        # The available quantities changed
+        await touch_resources(db, EVENTS_TAG, event_tag(event_id))
+        checkout = await save(db, checkout)
+        await response_cache.invalidate(EVENTS_TAG, event_tag(event_id))
 
-        # Create Stripe Checkout Session
-        session = stripe.checkout.Session.create(
+        # The hold was computed before the commit: make sure the session is
+        # accepted by Stripe, and never outlives the hold
+        expires_at = _checkout_session_expires_at(checkout.expired_at)
+        await tickets_service.extend_ticket_reservations(db, reference, expires_at)
+        checkout.expired_at = expires_at
+        checkout = await save(db, checkout)
+
+    except Exception as e:
+        await db.rollback()
+        raise e
+
+    line_items = [
+        {
+            "price_data": {
+                "currency": "usd",
+                "product_data": {
+                    "name": ticket["name"],
+                    "description": ticket["description"],
+                },
+                "unit_amount": int(ticket["price"] * 100),
+            },
+            "quantity": ticket["requested_quantity"],
+        }
+        for ticket in tickets
+    ]
+    metadata = {"checkout_reference": reference}
+
+    try:
+        session = await stripe.checkout.Session.create_async(
             line_items=line_items,
             customer_email=current_user.email,
-            metadata={
-                "transaction_reference": transaction_reference,
-                "event_id": event_id,
-                "user_id": current_user.id,
-                "email": create_application_request.email,
-                "first_name": create_application_request.first_name,
-                "last_name": create_application_request.last_name,
-                "workplace_name": create_application_request.workplace_name,
-                "phone": create_application_request.phone,
-                "industry_code": create_application_request.industry_code,
-                "job_type_code": create_application_request.job_type_code,
-                "tickets": json.dumps(
-                    [
-                        ticket.model_dump()
-                        for ticket in create_application_request.tickets
-                    ],
-                    separators=(",", ":"),
-                ),
-                "survey_response_results": (
-                    json.dumps(
-                        [
-                            srr.model_dump()
-                            for srr in create_application_request.survey_response_results
-                        ],
-                        separators=(",", ":"),
-                    )
-                ),
-            },
-            client_reference_id=transaction_reference,
+            metadata=metadata,
+            payment_intent_data={"metadata": metadata},
+            client_reference_id=reference,
+            expires_at=int(expires_at.timestamp()),
             mode="payment",
             ui_mode="embedded",
             return_url=f"{settings.AUD_FRONTEND_URL}/events/{event.slug}/apply/result",
         )
 
-        return session.client_secret
-
     except stripe.StripeError as e:
-        print(e)
-        db.rollback()
+        logger.error(f"Stripe checkout session of {reference} failed: {e}")
+        await tickets_service.release_ticket_reservations(db, reference)
+        await touch_resources(db, EVENTS_TAG, event_tag(event_id))
+        checkout.status = CheckoutStatusCode.FAILED
+        await save(db, checkout)
+        await response_cache.invalidate(EVENTS_TAG, event_tag(event_id))
         raise BadRequestException(
             ErrorCode.ERR_STRIPE_ERROR, ErrorMessage.ERR_STRIPE_ERROR
         )
 
-    except Exception as e:
-        print(e)
-        db.rollback()
-        raise e
+    checkout.stripe_checkout_session_id = session.id
+    await save(db, checkout)
+
+    return session.client_secret
+
+
+def _checkout_session_expires_at(hold_expired_at: datetime) -> datetime:
+    now = datetime.now(pytz.utc)
+    expires_at = min(
+        max(
+            hold_expired_at,
+            now
+            + timedelta(
+                seconds=STRIPE_CHECKOUT_MIN_TTL_SECONDS
+                + STRIPE_CHECKOUT_TTL_MARGIN_SECONDS
+            ),
+        ),
+        now + timedelta(seconds=STRIPE_CHECKOUT_MAX_TTL_SECONDS),
+    )
+    # Stripe takes whole seconds
+    return expires_at.replace(microsecond=0)
@@ -1,30 +1,41 @@
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 import backend.api.v1.services.applications as applications_service
+import backend.api.v1.services.stats as stats_service
+import backend.api.v1.services.tickets as tickets_service
+import backend.api.v1.services.users as users_service
+from backend.core.cache import EVENTS_TAG, event_tag, response_cache
+from backend.core.conditional import touch_resources
 from backend.models.application import Application
 from backend.models.survey_response_result import SurveyResponseResult
-from backend.models.ticket_inventory import TicketInventory
 from backend.models.transaction import Transaction, TransactionStatusCode
 from backend.models.transaction_item import TransactionItem
 from backend.models.user import User
 from backend.schemas.application import CreateApplicationRequest
-from backend.utils.database import save
 
 
 async def create_free_application(
-    db: Session,
+    db: AsyncSession,
     current_user: User,
     create_application_request: CreateApplicationRequest,
 ):
     try:
         event_id = create_application_request.event_id
-        result = applications_service.validate_application_tickets(
+        result = await applications_service.validate_application_tickets(
             db, current_user.id, create_application_request, True
         )
         tickets = result["tickets"]
         total_requested_quantity = result["total_requested_quantity"]
         application = result["application"]
 
+        # Sell first: fails when a ticket sold out meanwhile, before anything
+        # else is written. Everything is committed at once below.
+        await tickets_service.sell_tickets(
+            db,
+            event_id,
+            {ticket["id"]: ticket["requested_quantity"] for ticket in tickets},
+        )
+
         # Create Application
         if not application:
             application = Application(
@@ -46,7 +57,14 @@ async def create_free_application(
                     else None
                 ),
             )
-            application = save(db, application)
+            await stats_service.increment_event_stats(
+                db, event_id, application_number=1
+            )
+            await stats_service.increment_event_analytics(
+                db, event_id, application_number=1
+            )
+            db.add(application)
+            await db.flush()
 
             # Create Survey Response Results
             if create_application_request.survey_response_results:
@@ -61,7 +79,10 @@ async def create_free_application(
                     )
                     for srr in create_application_request.survey_response_results
                 ]
-                db.bulk_save_objects(survey_responses)
+                db.add_all(survey_responses)
+                await stats_service.increment_survey_stats(
+                    db, event_id, survey_responses
+                )
 
         # Create Transaction
         transaction = Transaction(
@@ -71,26 +92,12 @@ async def create_free_application(
             total_amount=0,
             status=TransactionStatusCode.SUCCESS,
         )
-        transaction = save(db, transaction)
+        db.add(transaction)
+        await db.flush()
 
         new_transaction_items = []
-        update_ticket_inventories = []
         for ticket in tickets:
-            ticket = dict(ticket)
-
-            update_ticket_inventories.append(
-                {
-                    "id": ticket["ticket_inventory_id"],
-                    "available_quantity": ticket["available_quantity"]
-                    - ticket["requested_quantity"],
-                    "sold_quantity": ticket["sold_quantity"]
-                    + ticket["requested_quantity"],
-                    "ticket_id": ticket["id"],
-                    "event_id": event_id,
-                }
-            )
-
-            for _ in range(ticket["quantity"]):
+            for _ in range(ticket["requested_quantity"]):
                 # Create the transaction item
                 new_transaction_items.append(
                     TransactionItem(
@@ -100,12 +107,22 @@ async def create_free_application(
                     )
                 )
 
-        db.bulk_update_mappings(TicketInventory, update_ticket_inventories)
-        db.bulk_save_objects(new_transaction_items)
-        db.commit()
+        await stats_service.increment_event_stats(
+            db, event_id, sold_tickets_number=total_requested_quantity
+        )
+        await stats_service.increment_ticket_analytics(
+            db,
+            event_id,
+            {ticket["id"]: (ticket["requested_quantity"], 0) for ticket in tickets},
+        )
+        db.add_all(new_transaction_items)
+        await users_service.refresh_user_interests(db, current_user.id)
+        await touch_resources(db, EVENTS_TAG, event_tag(event_id))
+        await db.commit()
+        await response_cache.invalidate(EVENTS_TAG, event_tag(event_id))
 
         return application.id
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise e
@@ -1,7 +1,8 @@
 from datetime import datetime
 
 import pytz
-from sqlmodel import Session, func, select
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.core.constants import TransactionStatusCode
 from backend.core.error_code import ErrorCode, ErrorMessage
@@ -14,12 +15,12 @@ from backend.models.transaction import Transaction
 from backend.models.transaction_item import TransactionItem
 
 
-def validate_application_tickets(
-    db: Session, user_id: int, request: any, is_free_application: bool
+async def validate_application_tickets(
+    db: AsyncSession, user_id: int, request: any, is_free_application: bool
 ):
     event_id = request.event_id
     try:
-        event = db.get(Event, event_id)
+        event = await db.get(Event, event_id)
 
         # Check if the event exists
         if not event:
@@ -35,24 +36,21 @@ def validate_application_tickets(
                 ErrorMessage.ERR_EVENT_NO_LONGER_OPEN_APPLY,
             )
 
-        tickets = (
-            db.exec(
-                select(
-                    Ticket.__table__.columns,
-                    TicketInventory.available_quantity,
-                    TicketInventory.sold_quantity,
-                    TicketInventory.id.label("ticket_inventory_id"),
-                )
-                .join(Event, Event.id == Ticket.event_id)
-                .join(TicketInventory, TicketInventory.ticket_id == Ticket.id)
-                .where(
-                    Ticket.id.in_([ticket.id for ticket in request.tickets]),
-                    Event.id == event_id,
-                )
+        result = await db.exec(
+            select(
+                Ticket.__table__.columns,
+                TicketInventory.available_quantity,
+                TicketInventory.sold_quantity,
+                TicketInventory.id.label("ticket_inventory_id"),
+            )
+            .join(Event, Event.id == Ticket.event_id)
+            .join(TicketInventory, TicketInventory.ticket_id == Ticket.id)
+            .where(
+                Ticket.id.in_([ticket.id for ticket in request.tickets]),
+                Event.id == event_id,
             )
-            .mappings()
-            .all()
         )
+        tickets = result.mappings().all()
 
         # Check if tickets are really created from the event
         if len(tickets) != len(request.tickets):
@@ -94,7 +92,7 @@ def validate_application_tickets(
 
             total_requested_quantity += ticket["requested_quantity"]
 
-        application = db.exec(
+        result = await db.exec(
             select(
                 Application.__table__.columns,
                 func.count(TransactionItem.id).label("purchased_ticket_number"),
@@ -109,7 +107,8 @@ def validate_application_tickets(
                 Transaction.status == TransactionStatusCode.SUCCESS,
             )
             .group_by(Application.id)
-        ).one_or_none()
+        )
+        application = result.one_or_none()
 
         # Check if the user has reached the maximum ticket number per account
         if application and (
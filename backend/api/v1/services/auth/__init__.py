@@ -1,8 +1,20 @@
-from .auth_service import authenticate_user, get_user_by_email
+from .auth_service import authenticate_user, get_authenticated_user, get_user_by_email
 from .change_email_service import request_change_email, verify_new_email
 from .change_password_service import change_password
 from .forgot_password_service import forgot_password
-from .password_service import get_password_hash, verify_password
+from .password_service import (
+    get_password_hash,
+    password_hashing_pool,
+    verify_and_update_password,
+    verify_password,
+)
+from .refresh_token_service import (
+    compact_refresh_tokens,
+    issue_refresh_token,
+    refresh_auth_token,
+    revoke_refresh_tokens,
+    run_refresh_tokens_compactor,
+)
 from .register_audience_service import register_audience
 from .register_organization_service import register_organization
 from .reset_password_service import reset_password
@@ -13,6 +25,7 @@ from .token_service import (
     create_refresh_token,
     gen_auth_token,
     gen_encrypted_token,
+    gen_token_response,
     verify_refresh_token,
 )
 from .verify_audience_service import verify_audience
@@ -20,8 +33,11 @@ from .verify_audience_service import verify_audience
 all = (
     authenticate_user,
     get_user_by_email,
+    get_authenticated_user,
     get_password_hash,
     verify_password,
+    verify_and_update_password,
+    password_hashing_pool,
     create_access_token,
     create_refresh_token,
     verify_refresh_token,
@@ -37,4 +53,10 @@ all = (
     gen_encrypted_token,
     register_organization,
     revert_email,
+    gen_token_response,
+    issue_refresh_token,
+    refresh_auth_token,
+    revoke_refresh_tokens,
+    compact_refresh_tokens,
+    run_refresh_tokens_compactor,
 )
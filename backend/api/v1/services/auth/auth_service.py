@@ -1,22 +1,49 @@
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from backend.api.v1.services.auth.password_service import verify_password
+from backend.api.v1.services.auth.password_service import verify_and_update_password
+from backend.core.principal_cache import principal_cache
 from backend.models.user import User
-from backend.utils.database import fetch_one
+from backend.utils.database import fetch_one, save
 
 
-def get_user_by_email(db: Session, email: str, role_code: str) -> User | None:
+async def get_user_by_email(
+    db: AsyncSession, email: str, role_code: str
+) -> User | None:
     query = select(User).where(User.email == email, User.role_code == role_code)
-    return fetch_one(db, query)
+    return await fetch_one(db, query)
 
 
-def authenticate_user(db: Session, **kwargs):
-    user = get_user_by_email(db, kwargs.get("email"), kwargs.get("role_code"))
+async def get_authenticated_user(
+    db: AsyncSession, email: str, role_code: str
+) -> User | None:
+    """User of a token's (sub, role) claims, from the principal cache if there."""
+    user = await principal_cache.get(db, email, role_code)
+    if user:
+        return user
+
+    user = await get_user_by_email(db, email, role_code)
+    if user:
+        await principal_cache.set(email, role_code, user)
+    return user
+
+
+async def authenticate_user(db: AsyncSession, **kwargs):
+    user = await get_user_by_email(db, kwargs.get("email"), kwargs.get("role_code"))
 
     if not user:
         return None
 
-    if not verify_password(kwargs.get("password"), user.password):
+    verified, new_hash = await verify_and_update_password(
+        kwargs.get("password"), user.password
+    )
+    if not verified:
         return None
 
+    # Hashed with a previous cost factor
+    if new_hash:
+        user.password = new_hash
+        user = await save(db, user)
+        await principal_cache.invalidate(user.id)
+
     return user
@@ -1,11 +1,12 @@
 from datetime import datetime
 
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 import backend.api.v1.services.auth as auth_service
 from backend.core.config import settings
 from backend.core.error_code import ErrorCode, ErrorMessage
 from backend.core.exception import BadRequestException
+from backend.core.principal_cache import principal_cache
 from backend.mails.mail import Email
 from backend.models.user import RoleCode, User
 from backend.schemas.auth import ChangeEmailRequest
@@ -13,10 +14,10 @@ from backend.utils.database import save
 
 
 async def request_change_email(
-    db: Session, current_user: User, request: ChangeEmailRequest
+    db: AsyncSession, current_user: User, request: ChangeEmailRequest
 ):
     email = request.new_email
-    is_user_existed = auth_service.get_user_by_email(db, email, RoleCode.AUDIENCE)
+    is_user_existed = await auth_service.get_user_by_email(db, email, RoleCode.AUDIENCE)
 
     if is_user_existed:
         raise BadRequestException(
@@ -28,7 +29,7 @@ async def request_change_email(
             ErrorCode.ERR_INVALID_EMAIL, ErrorMessage.ERR_INVALID_EMAIL
         )
 
-    if not auth_service.verify_password(request.password, current_user.password):
+    if not await auth_service.verify_password(request.password, current_user.password):
         raise BadRequestException(
             ErrorCode.ERR_INVALID_PASSWORD, ErrorMessage.ERR_INVALID_PASSWORD
         )
@@ -59,7 +60,8 @@ async def request_change_email(
         current_user.revert_email_token = encrypted_revert_token
         current_user.revert_email_token_expire_at = revert_expire_at
 
-        save(db, current_user)
+        await save(db, current_user)
+        await principal_cache.invalidate(current_user.id)
 
         request_context = {
             "first_name": f"{current_user.first_name}",
@@ -98,11 +100,11 @@ async def request_change_email(
 
         return current_user
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise e
 
 
-async def verify_new_email(db: Session, user: User):
+async def verify_new_email(db: AsyncSession, user: User):
     try:
         user.email = user.new_email
         user.new_email = None
@@ -110,7 +112,8 @@ async def verify_new_email(db: Session, user: User):
         user.verify_change_email_token_expire_at = None
         user.email_verified_at = user.email_changed_at = datetime.now()
 
-        save(db, user)
+        await save(db, user)
+        await principal_cache.invalidate(user.id)
 
         context = {
             "first_name": f"{user.first_name}",
@@ -140,5 +143,5 @@ async def verify_new_email(db: Session, user: User):
         )
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise e
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.api.v1.services.auth.password_service import (
     get_password_hash,
@@ -9,6 +9,7 @@ from backend.api.v1.services.auth.password_service import (
 from backend.core.constants import RoleCode
 from backend.core.error_code import ErrorCode
 from backend.core.exception import BadRequestException
+from backend.core.principal_cache import principal_cache
 from backend.mails.mail import Email
 from backend.models.user import User
 from backend.schemas.auth import ChangePasswordRequest
@@ -16,19 +17,20 @@ from backend.utils.database import save
 
 
 async def change_password(
-    db: Session, current_user: User, request: ChangePasswordRequest
+    db: AsyncSession, current_user: User, request: ChangePasswordRequest
 ):
-    if not verify_password(request.current_password, current_user.password):
+    if not await verify_password(request.current_password, current_user.password):
         raise BadRequestException(
             ErrorCode.ERR_INVALID_PASSWORD, "Your current password is incorrect."
         )
 
     try:
-        current_user.password = get_password_hash(request.new_password)
+        current_user.password = await get_password_hash(request.new_password)
         current_user.password_changed_at = datetime.now()
         current_user.updated_by = current_user.id
 
-        current_user = save(db, current_user)
+        current_user = await save(db, current_user)
+        await principal_cache.invalidate(current_user.id)
 
         context = {
             "first_name": f"{current_user.first_name}",
@@ -49,5 +51,5 @@ async def change_password(
         return current_user
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise e
@@ -1,4 +1,4 @@
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 import backend.api.v1.services.auth as auth_service
 from backend.core.config import settings
@@ -10,9 +10,9 @@ from backend.models.user import RoleCode
 from backend.schemas.auth import ForgotPasswordRequest
 
 
-async def forgot_password(db: Session, request: ForgotPasswordRequest):
+async def forgot_password(db: AsyncSession, request: ForgotPasswordRequest):
     # Get user based on POSTed email
-    user = auth_service.get_user_by_email(db, request.email, request.role_code)
+    user = await auth_service.get_user_by_email(db, request.email, request.role_code)
 
     if not user:
         raise BadRequestException(
@@ -42,7 +42,7 @@ async def forgot_password(db: Session, request: ForgotPasswordRequest):
         # Update user reset password token and expire_at
         user.reset_password_token = encrypted_token
         user.reset_password_token_expire_at = expire_at
-        db.commit()
+        await db.commit()
 
         context = {
             "expire_at": user.reset_password_token_expire_at.strftime("%Y/%m/%d %H:%M"),
@@ -69,5 +69,5 @@ async def forgot_password(db: Session, request: ForgotPasswordRequest):
         return user
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise e
@@ -1,11 +1,118 @@
+import asyncio
+import threading
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from backend.core.config import settings
+from backend.core.error_code import ErrorCode, ErrorMessage
+from backend.core.exception import ServiceUnavailableException
+
+# Hashes of another cost factor still verify but are flagged for rehashing
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+)
+
+
+class PasswordHashingPool:
+    """
+    Runs bcrypt (which releases the GIL) in a thread pool so that it doesn't
+    block the event loop. At most `size` calls run at once and `max_queue`
+    more wait, further calls are rejected instead of piling up behind a burst
+    of logins.
+    """
+
+    def __init__(self, size: int, max_queue: int):
+        self.size = size
+        self.max_queue = max_queue
+        self.pending = 0
+        self.max_pending = 0
+        self.counts: Counter = Counter()
+        self._executor: ThreadPoolExecutor | None = None
+        # pending and counts are also updated from the pool's threads
+        self._lock = threading.Lock()
+
+    async def run(self, fn: Callable, *args):
+        with self._lock:
+            if self.pending >= self.size + self.max_queue:
+                self.counts["rejected"] += 1
+                raise ServiceUnavailableException(
+                    ErrorCode.ERR_SERVER_BUSY,
+                    ErrorMessage.ERR_SERVER_BUSY,
+                    settings.PASSWORD_HASH_RETRY_AFTER_SECONDS,
+                )
+            self.pending += 1
+            self.max_pending = max(self.max_pending, self.pending)
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                self.size, thread_name_prefix="password-hashing"
+            )
+
+        # A call stays counted until its thread is done with it, even if the
+        # caller was cancelled meanwhile (only a queued call is dropped)
+        try:
+            future = self._executor.submit(fn, *args)
+        except Exception as e:
+            with self._lock:
+                self.pending -= 1
+            raise e
+        future.add_done_callback(self._done)
+        return await asyncio.wrap_future(future)
+
+    def _done(self, future: Future):
+        with self._lock:
+            self.pending -= 1
+            if future.cancelled():
+                self.counts["cancelled"] += 1
+            elif future.exception() is not None:
+                self.counts["failed"] += 1
+            else:
+                self.counts["completed"] += 1
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def metrics(self) -> dict[str, int]:
+        return {
+            "size": self.size,
+            "running": min(self.pending, self.size),
+            "queued": max(self.pending - self.size, 0),
+            "max_queued": max(self.max_pending - self.size, 0),
+            "completed": self.counts["completed"],
+            "failed": self.counts["failed"],
+            "cancelled": self.counts["cancelled"],
+            "rejected": self.counts["rejected"],
+        }
+
+
+password_hashing_pool = PasswordHashingPool(
+    settings.PASSWORD_HASH_POOL_SIZE, settings.PASSWORD_HASH_MAX_QUEUE
+)
+
+
+async def get_password_hash(password: str) -> str:
+    return await password_hashing_pool.run(pwd_context.hash, password)
 
 
-def get_password_hash(password: str):
-    return pwd_context.hash(password)
+async def verify_password(plain_password, hashed_password) -> bool:
+    return await password_hashing_pool.run(
+        pwd_context.verify, plain_password, hashed_password
+    )
 
 
-def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+async def verify_and_update_password(
+    plain_password, hashed_password
+) -> tuple[bool, str | None]:
+    """Also returns the new hash of the password if its cost factor changed."""
+    return await password_hashing_pool.run(
+        pwd_context.verify_and_update, plain_password, hashed_password
+    )
@@ -0,0 +1,245 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy.orm import aliased
+from sqlmodel import delete, exists, func, select, text, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import backend.api.v1.services.auth as auth_service
+from backend.api.v1.services.auth.token_service import (
+    create_refresh_token,
+    gen_token_response,
+    verify_refresh_token,
+)
+from backend.core.cache import MemoryCacheBackend
+from backend.core.config import logger, settings
+from backend.core.error_code import ErrorCode
+from backend.core.exception import UnauthorizedException
+from backend.db.database import MasterDBSession
+from backend.models.refresh_token import RefreshToken
+from backend.models.user import User
+
+# Tokens and families known to be revoked, so that replays are rejected by
+# this process without a query. The table stays the source of truth.
+revoked_refresh_tokens = MemoryCacheBackend(
+    settings.REFRESH_TOKEN_REVOKED_CACHE_MAX_ENTRIES
+)
+
+# Marks the token as used and inserts its successor in one round trip. No row
+# when the token is unknown, expired, revoked or already used.
+_ROTATE_REFRESH_TOKEN = """
+WITH used AS (
+    UPDATE refresh_tokens
+    SET used_at = now(), updated_at = now()
+    WHERE jti = :jti
+        AND used_at IS NULL
+        AND revoked_at IS NULL
+        AND expired_at > now()
+    RETURNING user_id, family_id
+)
+INSERT INTO refresh_tokens (user_id, jti, family_id, expired_at)
+SELECT user_id, :new_jti, family_id, :expired_at FROM used
+RETURNING family_id
+"""
+
+
+def _refresh_token_claims(user: User, jti: str, family_id: str) -> dict:
+    return {"sub": user.email, "role": user.role_code, "jti": jti, "fam": family_id}
+
+
+async def issue_refresh_token(
+    db: AsyncSession, user: User, remember_me: bool = False
+) -> tuple[str, datetime]:
+    """New refresh token starting a family (login), committed."""
+    jti, family_id = uuid4().hex, uuid4().hex
+    refresh_token, expire_at = create_refresh_token(
+        _refresh_token_claims(user, jti, family_id), remember_me
+    )
+    db.add(
+        RefreshToken(
+            user_id=user.id,
+            jti=jti,
+            family_id=family_id,
+            expired_at=expire_at.astimezone(timezone.utc),
+        )
+    )
+    await db.commit()
+
+    return refresh_token, expire_at
+
+
+async def refresh_auth_token(db: AsyncSession, token: str) -> dict:
+    """
+    New access token and refresh token (same family) for a refresh token,
+    which can't be used again: within REFRESH_TOKEN_REUSE_GRACE_SECONDS of its
+    rotation it gets the current token of its family, later its family is
+    revoked.
+    """
+    payload = verify_refresh_token(token)
+    jti, family_id = payload.get("jti"), payload.get("fam")
+    # Issued before the rotation of refresh tokens
+    if not jti or not family_id:
+        raise UnauthorizedException(ErrorCode.ERR_UNAUTHORIZED)
+
+    if await _is_revoked(jti, family_id):
+        raise UnauthorizedException(ErrorCode.ERR_UNAUTHORIZED)
+
+    user = await auth_service.get_authenticated_user(
+        db, payload["sub"], payload["role"]
+    )
+    if not user:
+        raise UnauthorizedException(ErrorCode.ERR_UNAUTHORIZED)
+
+    new_jti = uuid4().hex
+    refresh_token, refresh_expire_at = create_refresh_token(
+        _refresh_token_claims(user, new_jti, family_id), remember_me=False
+    )
+    rotated = (
+        await db.exec(
+            text(_ROTATE_REFRESH_TOKEN),
+            params={
+                "jti": jti,
+                "new_jti": new_jti,
+                "expired_at": refresh_expire_at.astimezone(timezone.utc),
+            },
+        )
+    ).first()
+    if not rotated:
+        successor = await _get_refresh_token_successor(db, jti, family_id)
+        if not successor:
+            await _reject_refresh_token(db, payload)
+        # Rotated by a concurrent refresh (another tab) a moment ago
+        refresh_token, refresh_expire_at = create_refresh_token(
+            _refresh_token_claims(user, successor.jti, family_id),
+            remember_me=False,
+            expire=successor.expired_at,
+        )
+    await db.commit()
+
+    return gen_token_response(user, refresh_token, refresh_expire_at)
+
+
+async def revoke_refresh_tokens(db: AsyncSession, user_id: int) -> int:
+    """Revoke every refresh token of the user (logout everywhere)."""
+    families = (
+        await db.exec(
+            update(RefreshToken)
+            .where(
+                RefreshToken.user_id == user_id,
+                RefreshToken.revoked_at.is_(None),
+                RefreshToken.expired_at > func.now(),
+            )
+            .values(revoked_at=func.now())
+            .returning(RefreshToken.family_id, RefreshToken.expired_at)
+        )
+    ).all()
+    await db.commit()
+
+    for family_id, expired_at in families:
+        await _remember_revoked(f"family:{family_id}", expired_at.timestamp())
+
+    return len({family_id for family_id, _ in families})
+
+
+async def compact_refresh_tokens(db: AsyncSession) -> int:
+    """Delete the expired refresh tokens by batches. Returns their number."""
+    deleted = 0
+    while True:
+        expired_ids = (
+            select(RefreshToken.id)
+            .where(RefreshToken.expired_at <= func.now())
+            .limit(settings.REFRESH_TOKEN_COMPACT_BATCH_SIZE)
+        )
+        result = await db.exec(
+            delete(RefreshToken).where(RefreshToken.id.in_(expired_ids))
+        )
+        await db.commit()
+
+        deleted += result.rowcount
+        if result.rowcount < settings.REFRESH_TOKEN_COMPACT_BATCH_SIZE:
+            return deleted
+
+
+async def run_refresh_tokens_compactor():
+    """Compact the refresh tokens every REFRESH_TOKEN_COMPACT_INTERVAL_SECONDS."""
+    while True:
+        await asyncio.sleep(settings.REFRESH_TOKEN_COMPACT_INTERVAL_SECONDS)
+        try:
+            async with MasterDBSession() as db:
+                deleted = await compact_refresh_tokens(db)
+            if deleted:
+                logger.info(f"Deleted {deleted} expired refresh tokens.")
+        except Exception as e:
+            logger.error(f"Failed to compact refresh tokens: {e}")
+
+
+async def _get_refresh_token_successor(
+    db: AsyncSession, jti: str, family_id: str
+) -> RefreshToken | None:
+    """
+    Current token of the family if the token `jti` was rotated within
+    REFRESH_TOKEN_REUSE_GRACE_SECONDS (and nothing was revoked since).
+    """
+    used = aliased(RefreshToken)
+    return (
+        await db.exec(
+            select(RefreshToken)
+            .where(
+                RefreshToken.family_id == family_id,
+                RefreshToken.used_at.is_(None),
+                RefreshToken.revoked_at.is_(None),
+                RefreshToken.expired_at > func.now(),
+                exists().where(
+                    used.jti == jti,
+                    used.family_id == family_id,
+                    used.revoked_at.is_(None),
+                    used.used_at
+                    > func.now()
+                    - timedelta(seconds=settings.REFRESH_TOKEN_REUSE_GRACE_SECONDS),
+                ),
+            )
+            .order_by(RefreshToken.id.desc())
+        )
+    ).first()
+
+
+async def _reject_refresh_token(db: AsyncSession, payload: dict):
+    jti, family_id = payload["jti"], payload["fam"]
+    token = (await db.exec(select(RefreshToken).where(RefreshToken.jti == jti))).first()
+
+    await _remember_revoked(f"jti:{jti}", payload["exp"])
+    if not token or not (token.used_at or token.revoked_at):
+        raise UnauthorizedException(ErrorCode.ERR_UNAUTHORIZED)
+
+    # A rotated token presented again: stolen, its family can't be trusted
+    if not token.revoked_at:
+        logger.warning(
+            f"Refresh token {jti} of user {token.user_id} reused, "
+            f"revoking its family {family_id}"
+        )
+        await db.exec(
+            update(RefreshToken)
+            .where(
+                RefreshToken.family_id == family_id,
+                RefreshToken.revoked_at.is_(None),
+            )
+            .values(revoked_at=func.now())
+        )
+        await db.commit()
+    await _remember_revoked(f"family:{family_id}", payload["exp"])
+
+    raise UnauthorizedException(ErrorCode.ERR_UNAUTHORIZED)
+
+
+async def _is_revoked(jti: str, family_id: str) -> bool:
+    return (
+        await revoked_refresh_tokens.get(f"jti:{jti}") is not None
+        or await revoked_refresh_tokens.get(f"family:{family_id}") is not None
+    )
+
+
+async def _remember_revoked(key: str, expire_timestamp: float):
+    ttl = int(expire_timestamp - datetime.now().timestamp()) + 1
+    if ttl > 0:
+        await revoked_refresh_tokens.set(key, "1", ttl, ())
@@ -1,8 +1,7 @@
 from datetime import datetime
 
-from fastapi import BackgroundTasks
 import pytz
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 import backend.api.v1.services.auth as auth_service
 from backend.api.v1.services.auth.token_service import gen_encrypted_token
@@ -16,11 +15,9 @@ from backend.schemas.auth import RegisterAudienceRequest
 from backend.utils.database import save
 
 
-async def register_audience(
-    db: Session, worker: BackgroundTasks, request: RegisterAudienceRequest
-) -> User:
+async def register_audience(db: AsyncSession, request: RegisterAudienceRequest) -> User:
     email = request.email
-    user = auth_service.get_user_by_email(db, email, RoleCode.AUDIENCE)
+    user = await auth_service.get_user_by_email(db, email, RoleCode.AUDIENCE)
 
     if user and user.email_verified_at:
         raise BadRequestException(
@@ -36,7 +33,6 @@ async def register_audience(
         if user and user.verify_email_token_expire_at > datetime.now(pytz.utc):
             user.verify_email_token = encrypted_verify_token
             user.verify_email_token_expire_at = verify_expire_at
-            new_user = save(db, user)
 
             context = {
                 "url": f"""
@@ -49,27 +45,26 @@ async def register_audience(
             }
 
             mailer = Email()
-            worker.add_task(
-                mailer.send_aud_email,
+            mailer.queue_aud_email(
+                db,
                 email,
                 "register_audience.html",
                 "Account Verification",
                 context,
             )
 
-            return user
+            return await save(db, user)
 
         new_user = User(
             email=email,
             verify_email_token=encrypted_verify_token,
             verify_email_token_expire_at=verify_expire_at,
             role_code=RoleCode.AUDIENCE,
-            password=auth_service.get_password_hash(request.password),
+            password=await auth_service.get_password_hash(request.password),
             first_name=request.first_name,
             last_name=request.last_name,
             login_method_code=LoginMethodCode.NORMAL,
         )
-        new_user = save(db, new_user)
 
         context = {
             "url": f"{settings.AUD_FRONTEND_URL}/email/verify/{verify_token}",
@@ -78,16 +73,16 @@ async def register_audience(
         }
 
         mailer = Email()
-        worker.add_task(
-            mailer.send_aud_email,
+        mailer.queue_aud_email(
+            db,
             email,
             "register_audience.html",
             "Account Verification",
             context,
         )
 
-        return new_user
+        return await save(db, new_user)
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise e
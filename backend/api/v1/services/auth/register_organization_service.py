@@ -1,4 +1,5 @@
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 import backend.api.v1.services.auth as auth_service
 from backend.core.constants import OrganizationTypeCode
@@ -11,13 +12,14 @@ from backend.utils.database import save
 
 
 async def register_organization(
-    db: Session, request: RegisterOrganizationRequest
+    db: AsyncSession, request: RegisterOrganizationRequest
 ) -> int:
-    user = db.exec(
+    result = await db.exec(
         select(User).where(
             (User.email == request.email) & (User.role_code == RoleCode.ORGANIZER)
         )
-    ).one_or_none()
+    )
+    user = result.one_or_none()
 
     if user:
         raise BadRequestException(
@@ -40,24 +42,24 @@ async def register_organization(
             slug=request.slug,
         )
 
-        save(db, organization)
+        await save(db, organization)
 
         user = User(
             email=request.email,
             role_code=RoleCode.ORGANIZER,
             first_name=request.first_name,
             last_name=request.last_name,
-            password=auth_service.get_password_hash(request.password),
+            password=await auth_service.get_password_hash(request.password),
             organization_id=organization.id,
             phone=request.phone,
         )
 
-        save(db, user)
+        await save(db, user)
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         if organization:
-            db.delete(organization)
-            db.commit()
+            await db.delete(organization)
+            await db.commit()
         raise e
 
     # TODO: change context
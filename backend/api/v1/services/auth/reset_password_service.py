@@ -1,23 +1,25 @@
 from datetime import datetime
 
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.api.v1.services.auth.password_service import get_password_hash
 from backend.core.constants import RoleCode
+from backend.core.principal_cache import principal_cache
 from backend.mails.mail import Email
 from backend.models.user import User
 from backend.schemas.auth import ResetPasswordRequest
 from backend.utils.database import save
 
 
-async def reset_password(db: Session, user: User, request: ResetPasswordRequest):
+async def reset_password(db: AsyncSession, user: User, request: ResetPasswordRequest):
     try:
         user.reset_password_token = user.reset_password_token_expire_at = None
-        user.password = get_password_hash(request.new_password)
+        user.password = await get_password_hash(request.new_password)
         user.password_changed_at = datetime.now()
         user.updated_by = user.id
 
-        user = save(db, user)
+        user = await save(db, user)
+        await principal_cache.invalidate(user.id)
 
         context = {"first_name": f"{user.first_name}", "email": user.email}
 
@@ -33,5 +35,5 @@ async def reset_password(db: Session, user: User, request: ResetPasswordRequest)
         return user
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise e
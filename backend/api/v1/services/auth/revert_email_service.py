@@ -1,15 +1,16 @@
 from datetime import datetime
 
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 import backend.api.v1.services.auth as auth_service
 from backend.core.config import settings
+from backend.core.principal_cache import principal_cache
 from backend.mails.mail import Email
 from backend.models.user import User
 from backend.utils.database import save
 
 
-async def revert_email(db: Session, user: User):
+async def revert_email(db: AsyncSession, user: User):
     try:
         user.email = user.new_email
         user.new_email = None
@@ -17,7 +18,8 @@ async def revert_email(db: Session, user: User):
         user.REVERT_email_token_expire_at = None
         user.email_verified_at = user.email_changed_at = datetime.now()
 
-        save(db, user)
+        await save(db, user)
+        await principal_cache.invalidate(user.id)
 
         context = {
             "first_name": f"{user.first_name}",
@@ -46,8 +48,8 @@ async def revert_email(db: Session, user: User):
             alert_context,
         )
 
-        return auth_service.gen_auth_token(user)
+        return await auth_service.gen_auth_token(db, user)
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise e
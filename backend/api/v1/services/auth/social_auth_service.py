@@ -1,6 +1,6 @@
-from datetime import datetime, timedelta
+from datetime import datetime
 
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 import backend.api.v1.services.auth as auth_service
 from backend.core.config import settings
@@ -13,14 +13,14 @@ from backend.schemas.auth import SocialAuthRequest, TokenResponse
 from backend.utils.database import save
 
 
-async def social_auth(db: Session, request: SocialAuthRequest):
+async def social_auth(db: AsyncSession, request: SocialAuthRequest):
     if not request.is_verified:
         raise BadRequestException(
             ErrorCode.ERR_GOOGLE_ACCOUNT_NOT_VERIFIED,
             ErrorMessage.ERR_GOOGLE_ACCOUNT_NOT_VERIFIED,
         )
 
-    user = auth_service.get_user_by_email(db, request.email, RoleCode.AUDIENCE)
+    user = await auth_service.get_user_by_email(db, request.email, RoleCode.AUDIENCE)
 
     if user and not user.email_verified_at:
         raise BadRequestException(
@@ -39,7 +39,6 @@ async def social_auth(db: Session, request: SocialAuthRequest):
             verify_email_token_expire_at=None,
             login_method_code=LoginMethodCode.GOOGLE,
         )
-        user = save(db, user)
 
         context = {
             "first_name": user.first_name,
@@ -48,27 +47,14 @@ async def social_auth(db: Session, request: SocialAuthRequest):
         }
 
         mailer = Email()
-        await mailer.send_aud_email(
+        mailer.queue_aud_email(
+            db,
             user.email,
             "create_audience_account_success.html",
             "Thankyu",
             context,
         )
+        user = await save(db, user)
 
-    access_token_expires = datetime.now() + timedelta(
-        minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-    )
-    access_token = auth_service.create_access_token(
-        data={"sub": user.email, "role": user.role_code}, expire=access_token_expires
-    )
-    refresh_token, refresh_expire_at = auth_service.create_refresh_token(
-        {"sub": user.email, "role": user.role_code}, remember_me=True
-    )
-
-    return TokenResponse(
-        access_token=access_token,
-        token_type="bearer",
-        expire_at=access_token_expires,
-        refresh_token=refresh_token,
-        refresh_expire_at=refresh_expire_at,
-    )
+    token = await auth_service.gen_auth_token(db, user, remember_me=True)
+    return TokenResponse(**token)
@@ -5,23 +5,30 @@ from datetime import datetime, timedelta, timezone
 from typing import Tuple
 
 from jose import ExpiredSignatureError, JWTError, jwt
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+import backend.api.v1.services.auth as auth_service
 from backend.core.config import settings
 from backend.core.error_code import ErrorCode
 from backend.core.exception import BadRequestException, UnauthorizedException
 from backend.models.user import User
 
 
-def gen_auth_token(user: User, remember_me: bool = False):
+async def gen_auth_token(db: AsyncSession, user: User, remember_me: bool = False):
+    refresh_token, refresh_expire_at = await auth_service.issue_refresh_token(
+        db, user, remember_me=remember_me
+    )
+
+    return gen_token_response(user, refresh_token, refresh_expire_at)
+
+
+def gen_token_response(user: User, refresh_token: str, refresh_expire_at: datetime):
     access_token_expire_at = datetime.now() + timedelta(
         minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
     )
     access_token = create_access_token(
         data={"sub": user.email, "role": user.role_code}, expire=access_token_expire_at
     )
-    refresh_token, refresh_expire_at = create_refresh_token(
-        {"sub": user.email, "role": user.role_code}, remember_me=remember_me
-    )
 
     return {
         "token_type": "bearer",
@@ -38,9 +45,11 @@ def create_token(token_length: int):
     return token
 
 
-def create_refresh_token(data: dict, remember_me: bool) -> Tuple[str, datetime]:
+def create_refresh_token(
+    data: dict, remember_me: bool, expire: datetime | None = None
+) -> Tuple[str, datetime]:
     to_encode = data.copy()
-    expire = datetime.now() + timedelta(
+    expire = expire or datetime.now() + timedelta(
         minutes=(
             settings.REFRESH_TOKEN_REMEMBERED_EXPIRE_MINUTES
             if remember_me
@@ -1,12 +1,14 @@
 from datetime import datetime
 
-from fastapi import BackgroundTasks
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+import backend.api.v1.services.users as users_service
 from backend.core.config import settings
 from backend.core.constants import TagAssociationEntityCode
 from backend.core.error_code import ErrorCode, ErrorMessage
 from backend.core.exception import BadRequestException
+from backend.core.principal_cache import principal_cache
 from backend.mails.mail import Email
 from backend.models.tag import Tag
 from backend.models.tag_association import TagAssociation
@@ -16,8 +18,7 @@ from backend.utils.database import save
 
 
 async def verify_audience(
-    db: Session,
-    worker: BackgroundTasks,
+    db: AsyncSession,
     user: User,
     request: VerifyAudienceRequest,
 ) -> User:
@@ -32,7 +33,9 @@ async def verify_audience(
 
     try:
         if request.tags:
-            request_tags = db.exec(select(Tag.id).where(Tag.id.in_(request.tags))).all()
+            request_tags = (
+                await db.exec(select(Tag.id).where(Tag.id.in_(request.tags)))
+            ).all()
             if (not request_tags) or (len(request.tags) != len(request_tags)):
                 raise BadRequestException(
                     ErrorCode.ERR_TAG_NOT_FOUND, ErrorMessage.ERR_TAG_NOT_FOUND
@@ -50,7 +53,7 @@ async def verify_audience(
         user.email_verified_at = datetime.now()
         user.verify_email_token = None
         user.verify_email_token_expire_at = None
-        user = save(db, user)
+        await users_service.refresh_user_interests(db, user.id)
 
         context = {
             "first_name": user.first_name,
@@ -59,15 +62,17 @@ async def verify_audience(
         }
 
         mailer = Email()
-        worker.add_task(
-            mailer.send_aud_email,
+        mailer.queue_aud_email(
+            db,
             user.email,
             "create_audience_account_success.html",
             "Thankyu",
             context,
         )
+        user = await save(db, user)
+        await principal_cache.invalidate(user.id)
         return user.id
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise e
@@ -0,0 +1,9 @@
+from .create_email_campaign_service import create_email_campaign
+from .get_email_campaign_service import get_email_campaign
+from .send_email_campaign_service import send_email_campaign
+
+all = (
+    create_email_campaign,
+    get_email_campaign,
+    send_email_campaign,
+)
@@ -0,0 +1,53 @@
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import backend.api.v1.services.jobs as jobs_service
+from backend.api.v1.services.email_campaigns.send_email_campaign_service import (
+    SEND_EMAIL_CAMPAIGN_JOB,
+)
+from backend.core.error_code import ErrorCode, ErrorMessage
+from backend.core.exception import BadRequestException
+from backend.models.email_campaign import EmailCampaign
+from backend.models.event import Event
+from backend.models.user import User
+from backend.schemas.email_campaign import CreateEmailCampaignRequest
+from backend.utils.database import save
+
+
+async def create_email_campaign(
+    db: AsyncSession,
+    organizer: User,
+    event_id: int,
+    request: CreateEmailCampaignRequest,
+) -> EmailCampaign:
+    event_exists = (
+        await db.exec(
+            select(Event.id).where(
+                Event.id == event_id,
+                Event.organization_id == organizer.organization_id,
+            )
+        )
+    ).first()
+    if not event_exists:
+        raise BadRequestException(
+            ErrorCode.ERR_EVENT_NOT_FOUND, ErrorMessage.ERR_EVENT_NOT_FOUND
+        )
+
+    try:
+        campaign = EmailCampaign(
+            event_id=event_id,
+            subject=request.subject,
+            content=request.content,
+            created_by=organizer.id,
+        )
+        db.add(campaign)
+        await db.flush()
+
+        jobs_service.enqueue_job(
+            db, SEND_EMAIL_CAMPAIGN_JOB, {"email_campaign_id": campaign.id}
+        )
+        return await save(db, campaign)
+
+    except Exception as e:
+        await db.rollback()
+        raise e
@@ -0,0 +1,49 @@
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core.constants import EmailDeliveryStatusCode
+from backend.core.error_code import ErrorCode, ErrorMessage
+from backend.core.exception import BadRequestException
+from backend.models.email_campaign import EmailCampaign
+from backend.models.email_delivery import EmailDelivery
+from backend.models.event import Event
+from backend.models.user import User
+from backend.schemas.email_campaign import EmailCampaignItem
+
+
+async def get_email_campaign(
+    db: AsyncSession, organizer: User, event_id: int, email_campaign_id: int
+) -> EmailCampaignItem:
+    campaign = (
+        await db.exec(
+            select(EmailCampaign)
+            .join(Event, Event.id == EmailCampaign.event_id)
+            .where(
+                EmailCampaign.id == email_campaign_id,
+                EmailCampaign.event_id == event_id,
+                Event.organization_id == organizer.organization_id,
+            )
+        )
+    ).first()
+    if not campaign:
+        raise BadRequestException(
+            ErrorCode.ERR_EMAIL_CAMPAIGN_NOT_FOUND,
+            ErrorMessage.ERR_EMAIL_CAMPAIGN_NOT_FOUND,
+        )
+
+    counts = dict(
+        (
+            await db.exec(
+                select(EmailDelivery.status, func.count())
+                .where(EmailDelivery.email_campaign_id == campaign.id)
+                .group_by(EmailDelivery.status)
+            )
+        ).all()
+    )
+
+    return EmailCampaignItem(
+        **campaign.model_dump(),
+        sent_count=counts.get(EmailDeliveryStatusCode.SENT, 0),
+        failed_count=counts.get(EmailDeliveryStatusCode.FAILED, 0),
+        pending_count=counts.get(EmailDeliveryStatusCode.PENDING, 0),
+    )
@@ -0,0 +1,258 @@
+import asyncio
+import html
+import time
+from datetime import datetime
+from string import Template
+
+import pytz
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import and_, func, or_, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core.config import logger, settings
+from backend.core.constants import EmailCampaignStatusCode, EmailDeliveryStatusCode
+from backend.core.jobs import job_handler
+from backend.db.database import MasterDBSession
+from backend.mails.mail import Email
+from backend.models.application import Application
+from backend.models.email_campaign import EmailCampaign
+from backend.models.email_delivery import EmailDelivery
+from backend.models.event import Event
+from backend.models.organization import Organization
+from backend.utils.format_start_end_datetime import format_start_end_datetime
+
+SEND_EMAIL_CAMPAIGN_JOB = "send_email_campaign"
+EMAIL_CAMPAIGN_TEMPLATE = "event_announcement.html"
+
+
+async def _add_recipients(campaign: EmailCampaign) -> int:
+    """
+    Add a pending delivery per application of the event, paging the
+    applications by id. Deliveries of a previous run are kept as they are.
+    Returns the number of recipients.
+    """
+    last_application_id = 0
+    while True:
+        async with MasterDBSession() as db:
+            applications = (
+                await db.exec(
+                    select(Application.id, Application.email)
+                    .where(
+                        Application.event_id == campaign.event_id,
+                        Application.id > last_application_id,
+                    )
+                    .order_by(Application.id)
+                    .limit(settings.EMAIL_CAMPAIGN_BATCH_SIZE)
+                )
+            ).all()
+            if not applications:
+                break
+
+            await db.exec(
+                insert(EmailDelivery)
+                .values(
+                    [
+                        {
+                            "email_campaign_id": campaign.id,
+                            "application_id": application_id,
+                            "email": email,
+                        }
+                        for application_id, email in applications
+                    ]
+                )
+                .on_conflict_do_nothing(
+                    index_elements=[
+                        EmailDelivery.email_campaign_id,
+                        EmailDelivery.application_id,
+                    ]
+                )
+            )
+            await db.commit()
+            last_application_id = applications[-1][0]
+
+    async with MasterDBSession() as db:
+        recipients_count = (
+            await db.exec(
+                select(func.count()).where(
+                    EmailDelivery.email_campaign_id == campaign.id
+                )
+            )
+        ).one()
+        await db.exec(
+            update(EmailCampaign)
+            .where(EmailCampaign.id == campaign.id)
+            .values(recipients_count=recipients_count)
+        )
+        await db.commit()
+
+    return recipients_count
+
+
+async def _render_campaign(db: AsyncSession, campaign: EmailCampaign) -> Template:
+    """
+    Render the campaign email once, leaving `$first_name` to substitute per
+    recipient.
+    """
+    event, organization = (
+        await db.exec(
+            select(Event, Organization)
+            .join(Organization, Organization.id == Event.organization_id)
+            .where(Event.id == campaign.event_id)
+        )
+    ).one()
+
+    context = {
+        "subject": campaign.subject,
+        "content": campaign.content,
+        "event_name": event.name,
+        "organization_name": organization.name,
+        "datetime": format_start_end_datetime(event.start_at, event.end_at),
+        "address": event.organize_address,
+        "meeting_url": event.meeting_url,
+        "detail_event_url": f"{settings.AUD_FRONTEND_URL}/events/{event.slug}",
+    }
+    # Keep a literal "$" of the data out of the substitution
+    context = {
+        key: value.replace("$", "$$") if isinstance(value, str) else value
+        for key, value in context.items()
+    }
+    content = Email().render_template(
+        EMAIL_CAMPAIGN_TEMPLATE, {**context, "first_name": "${first_name}"}
+    )
+
+    return Template(content)
+
+
+async def _send_batch(mailer: Email, messages: list) -> list[Exception | None]:
+    """Send at most EMAIL_CAMPAIGN_RATE_PER_SECOND messages per second."""
+    rate = settings.EMAIL_CAMPAIGN_RATE_PER_SECOND
+    results = []
+    for start in range(0, len(messages), rate):
+        started_at = time.monotonic()
+        end = start + rate
+        results += await mailer.send_messages(messages[start:end])
+
+        if end < len(messages):
+            await asyncio.sleep(max(0.0, 1 - (time.monotonic() - started_at)))
+
+    return results
+
+
+async def send_email_campaign(email_campaign_id: int):
+    """
+    Send an email campaign to the attendees of its event, by batches of
+    EMAIL_CAMPAIGN_BATCH_SIZE, recording the delivery of each recipient.
+
+    Resumable: a new run only sends the pending deliveries and the failed
+    ones with attempts left. It raises while some are left, for the job to
+    be retried later.
+    """
+    async with MasterDBSession() as db:
+        campaign = await db.get(EmailCampaign, email_campaign_id)
+        if not campaign or campaign.status == EmailCampaignStatusCode.DONE:
+            return
+
+        template = await _render_campaign(db, campaign)
+        campaign.status = EmailCampaignStatusCode.SENDING
+        db.add(campaign)
+        await db.commit()
+
+    recipients_count = await _add_recipients(campaign)
+
+    mailer = Email()
+    to_send = or_(
+        EmailDelivery.status == EmailDeliveryStatusCode.PENDING,
+        and_(
+            EmailDelivery.status == EmailDeliveryStatusCode.FAILED,
+            EmailDelivery.attempts < settings.EMAIL_CAMPAIGN_MAX_ATTEMPTS,
+        ),
+    )
+    last_delivery_id = 0
+    while True:
+        async with MasterDBSession() as db:
+            deliveries = (
+                await db.exec(
+                    select(
+                        EmailDelivery.id,
+                        EmailDelivery.email,
+                        EmailDelivery.attempts,
+                        Application.first_name,
+                    )
+                    .join(Application, Application.id == EmailDelivery.application_id)
+                    .where(
+                        EmailDelivery.email_campaign_id == campaign.id,
+                        EmailDelivery.id > last_delivery_id,
+                        to_send,
+                    )
+                    .order_by(EmailDelivery.id)
+                    .limit(settings.EMAIL_CAMPAIGN_BATCH_SIZE)
+                )
+            ).all()
+            if not deliveries:
+                break
+
+            messages = [
+                mailer.build_message(
+                    email,
+                    campaign.subject,
+                    template.safe_substitute(first_name=html.escape(first_name)),
+                )
+                for _, email, _, first_name in deliveries
+            ]
+            results = await _send_batch(mailer, messages)
+
+            sent_at = datetime.now(pytz.utc)
+            await db.exec(
+                update(EmailDelivery),
+                params=[
+                    {
+                        "id": delivery_id,
+                        "attempts": attempts + 1,
+                        "status": (
+                            EmailDeliveryStatusCode.FAILED
+                            if error
+                            else EmailDeliveryStatusCode.SENT
+                        ),
+                        "last_error": repr(error) if error else None,
+                        "sent_at": None if error else sent_at,
+                    }
+                    for (delivery_id, _, attempts, _), error in zip(deliveries, results)
+                ],
+            )
+            await db.commit()
+            last_delivery_id = deliveries[-1][0]
+
+    async with MasterDBSession() as db:
+        retryable = (
+            await db.exec(
+                select(func.count()).where(
+                    EmailDelivery.email_campaign_id == campaign.id, to_send
+                )
+            )
+        ).one()
+
+        if not retryable:
+            await db.exec(
+                update(EmailCampaign)
+                .where(EmailCampaign.id == campaign.id)
+                .values(
+                    status=EmailCampaignStatusCode.DONE,
+                    finished_at=datetime.now(pytz.utc),
+                )
+            )
+            await db.commit()
+
+    if retryable:
+        raise RuntimeError(
+            f"{retryable} deliveries of email campaign {email_campaign_id} failed"
+        )
+    logger.info(
+        f"Email campaign {email_campaign_id} sent to {recipients_count} recipients."
+    )
+
+
+@job_handler(SEND_EMAIL_CAMPAIGN_JOB)
+async def send_email_campaign_job(db: AsyncSession, email_campaign_id: int):
+    # Committed batch by batch in its own sessions, the job's transaction
+    # only holds the claim of the job
+    await send_email_campaign(email_campaign_id)
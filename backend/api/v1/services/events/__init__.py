@@ -4,7 +4,9 @@ from .create_event_bookmark_service import create_event_bookmark
 from .delete_check_in_service import delete_check_in
 from .delete_event_bookmark_service import delete_event_bookmark
 from .get_draft_event_service import get_draft_event
-from .get_event_detail_service import get_event_detail
+from .get_event_analytics_service import get_event_analytics
+from .get_event_detail_service import count_event_view, get_event_detail
+from .get_event_ids_service import get_event_ids
 from .listing_event_rank_service import listing_event_rank
 from .listing_my_events_service import listing_my_events
 from .listing_organization_events_service import listing_organization_events
@@ -13,12 +15,17 @@ from .listing_recommendation_events_service import listing_recommendation_events
 from .listing_related_events_service import listing_related_events
 from .listing_top_organization_events_service import listing_top_organization_events
 from .publish_event_service import publish_event
+from .refresh_event_similarities_service import (
+    rebuild_event_similarities,
+    refresh_event_similarities,
+)
 from .save_draft_event_service import save_draft_event
 from .search_events_service import search_events
 
 all = (
     search_events,
     get_event_detail,
+    get_event_ids,
     listing_related_events,
     listing_top_organization_events,
     listing_event_rank,
@@ -34,4 +41,8 @@ all = (
     save_draft_event,
     listing_events_timeline,
     listing_recommendation_events,
+    refresh_event_similarities,
+    rebuild_event_similarities,
+    count_event_view,
+    get_event_analytics,
 )
@@ -1,5 +1,7 @@
-from sqlmodel import Session, exists
+from sqlmodel import exists
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+import backend.api.v1.services.stats as stats_service
 from backend.core.constants import CheckInMethodCode
 from backend.core.error_code import ErrorCode, ErrorMessage
 from backend.core.exception import BadRequestException
@@ -8,11 +10,11 @@ from backend.schemas.check_in import CreateCheckInRequest
 
 
 async def create_check_in(
-    db: Session,
+    db: AsyncSession,
     request: CreateCheckInRequest,
     event_id: int,
 ):
-    check_in = db.scalar(
+    check_in = await db.scalar(
         exists()
         .where(
             CheckIn.event_id == event_id,
@@ -36,11 +38,12 @@ async def create_check_in(
             checkin_method_code=CheckInMethodCode.MANUAL,
         )
         db.add(check_in)
-        db.commit()
+        await stats_service.increment_event_analytics(db, event_id, check_in_number=1)
+        await db.commit()
 
         return check_in.id
 
     except Exception as e:
         print(e)
-        db.rollback()
+        await db.rollback()
         raise e
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.core.constants import EventStatusCode
 from backend.models.event import Event
@@ -10,7 +10,7 @@ from backend.utils.database import save
 
 
 async def create_draft_event(
-    db: Session, organizer: User, request: CreateDraftEventRequest
+    db: AsyncSession, organizer: User, request: CreateDraftEventRequest
 ):
     if not request.event_id:
         event = Event(
@@ -19,7 +19,7 @@ async def create_draft_event(
             name=f"""
                 Draft Event {datetime.now().strftime("%Y/%m/%d %H:%M")}""",
         )
-        save(db, event)
+        await save(db, event)
         return event.id
 
     return None
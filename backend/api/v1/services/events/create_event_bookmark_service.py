@@ -1,12 +1,17 @@
-from sqlmodel import Session, exists
+from sqlmodel import exists
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+import backend.api.v1.services.stats as stats_service
+import backend.api.v1.services.users as users_service
+from backend.core.cache import EVENTS_TAG, response_cache
+from backend.core.conditional import touch_resources
 from backend.core.error_code import ErrorCode, ErrorMessage
 from backend.core.exception import BadRequestException
 from backend.models import Bookmark, User
 
 
-async def create_event_bookmark(db: Session, current_user: User, event_id: int):
-    bookmark = db.scalar(
+async def create_event_bookmark(db: AsyncSession, current_user: User, event_id: int):
+    bookmark = await db.scalar(
         exists()
         .where(Bookmark.user_id == current_user.id, Bookmark.event_id == event_id)
         .select()
@@ -21,10 +26,15 @@ async def create_event_bookmark(db: Session, current_user: User, event_id: int):
     try:
         bookmark = Bookmark(user_id=current_user.id, event_id=event_id)
         db.add(bookmark)
-        db.commit()
+        await stats_service.increment_event_stats(db, event_id, bookmark_number=1)
+        await stats_service.increment_event_analytics(db, event_id, bookmark_number=1)
+        await users_service.refresh_user_interests(db, current_user.id)
+        await touch_resources(db, EVENTS_TAG)
+        await db.commit()
+        await response_cache.invalidate(EVENTS_TAG)
 
         return bookmark.id
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise e
@@ -1,5 +1,7 @@
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+import backend.api.v1.services.stats as stats_service
 from backend.core.error_code import ErrorCode, ErrorMessage
 from backend.core.exception import BadRequestException
 from backend.models.check_in import CheckIn
@@ -7,8 +9,10 @@ from backend.models.event import Event
 from backend.models.user import User
 
 
-async def delete_check_in(db: Session, user: User, event_id: int, check_in_id: int):
-    check_in = db.exec(
+async def delete_check_in(
+    db: AsyncSession, user: User, event_id: int, check_in_id: int
+):
+    result = await db.exec(
         select(CheckIn)
         .join(Event, CheckIn.event_id == Event.id)
         .where(
@@ -16,7 +20,8 @@ async def delete_check_in(db: Session, user: User, event_id: int, check_in_id: i
             CheckIn.event_id == event_id,
             Event.organization_id == user.organization_id,
         )
-    ).one_or_none()
+    )
+    check_in = result.one_or_none()
 
     if not check_in:
         raise BadRequestException(
@@ -24,9 +29,12 @@ async def delete_check_in(db: Session, user: User, event_id: int, check_in_id: i
         )
 
     try:
-        db.delete(check_in)
-        db.commit()
+        await db.delete(check_in)
+        await stats_service.increment_event_analytics(
+            db, event_id, check_in.created_at, check_in_number=-1
+        )
+        await db.commit()
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise e
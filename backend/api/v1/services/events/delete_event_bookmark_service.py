@@ -1,16 +1,22 @@
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+import backend.api.v1.services.stats as stats_service
+import backend.api.v1.services.users as users_service
+from backend.core.cache import EVENTS_TAG, response_cache
+from backend.core.conditional import touch_resources
 from backend.core.error_code import ErrorCode, ErrorMessage
 from backend.core.exception import BadRequestException
 from backend.models import Bookmark, User
 
 
-async def delete_event_bookmark(db: Session, current_user: User, event_id: int):
-    bookmark = db.exec(
+async def delete_event_bookmark(db: AsyncSession, current_user: User, event_id: int):
+    result = await db.exec(
         select(Bookmark).where(
             Bookmark.user_id == current_user.id, Bookmark.event_id == event_id
         )
-    ).one_or_none()
+    )
+    bookmark = result.one_or_none()
 
     if not bookmark:
         raise BadRequestException(
@@ -18,9 +24,16 @@ async def delete_event_bookmark(db: Session, current_user: User, event_id: int):
         )
 
     try:
-        db.delete(bookmark)
-        db.commit()
+        await db.delete(bookmark)
+        await stats_service.increment_event_stats(db, event_id, bookmark_number=-1)
+        await stats_service.increment_event_analytics(
+            db, event_id, bookmark.created_at, bookmark_number=-1
+        )
+        await users_service.refresh_user_interests(db, current_user.id)
+        await touch_resources(db, EVENTS_TAG)
+        await db.commit()
+        await response_cache.invalidate(EVENTS_TAG)
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise e
@@ -0,0 +1,181 @@
+import asyncio
+import time
+
+from sqlmodel import and_, case, false, func, literal, or_, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core.config import settings
+from backend.core.constants import (
+    EventSearchModeCode,
+    EventStatusCode,
+    TagAssociationEntityCode,
+)
+from backend.models.event import Event
+from backend.models.organization import Organization
+from backend.models.tag import Tag
+from backend.models.tag_association import TagAssociation
+from backend.utils.search import InvertedIndex, build_prefix_tsquery
+
+# Same weights as event_search_document() in the search_vector migration (A/B/B/C)
+EVENT_NAME_WEIGHT = 1.0
+ORGANIZATION_NAME_WEIGHT = 0.4
+TAG_NAME_WEIGHT = 0.4
+DESCRIPTION_WEIGHT = 0.2
+
+_memory_index = InvertedIndex()
+_memory_index_built_at = 0.0
+_memory_index_lock = asyncio.Lock()
+
+
+async def build_keyword_search(
+    db: AsyncSession,
+    keyword: str | None,
+    search_mode: EventSearchModeCode | None = EventSearchModeCode.FULLTEXT,
+):
+    """
+    Returns (condition, rank) for the keyword, or (None, None) without keyword.
+
+    `rank` is a column expression usable in `order_by` (higher is better).
+    """
+    if not keyword or not keyword.strip():
+        return None, None
+
+    search_mode = search_mode or EventSearchModeCode.FULLTEXT
+    if settings.EVENT_SEARCH_BACKEND == "memory":
+        return await _build_memory_keyword_search(db, keyword, search_mode)
+
+    return _build_postgres_keyword_search(keyword, search_mode)
+
+
+def _build_postgres_keyword_search(keyword: str, search_mode: EventSearchModeCode):
+    name_similarity = func.word_similarity(keyword, Event.name)
+
+    if search_mode == EventSearchModeCode.PARTIAL:
+        # Indexable through the pg_trgm GIN index on events.name
+        condition = Event.name.ilike(f"%{_escape_like(keyword)}%", escape="\\")
+        return condition, name_similarity
+
+    tsquery_text = build_prefix_tsquery(keyword)
+    if not tsquery_text:
+        return false(), literal(0)
+
+    tsquery = func.to_tsquery("simple", tsquery_text)
+    condition = Event.search_vector.op("@@")(tsquery)
+    rank = func.ts_rank_cd(Event.search_vector, tsquery)
+
+    if search_mode == EventSearchModeCode.FUZZY:
+        # keyword <% name: word_similarity(keyword, name) >= pg_trgm threshold
+        condition = or_(condition, Event.name.op("%>")(keyword))
+        rank = rank + name_similarity
+
+    return condition, rank
+
+
+async def _build_memory_keyword_search(
+    db: AsyncSession, keyword: str, search_mode: EventSearchModeCode
+):
+    index = await get_memory_index(db)
+    scores = index.search(
+        keyword,
+        fuzzy=search_mode == EventSearchModeCode.FUZZY,
+        substring=search_mode == EventSearchModeCode.PARTIAL,
+        limit=settings.EVENT_SEARCH_MAX_RESULTS,
+    )
+    if not scores:
+        return false(), literal(0)
+
+    return Event.id.in_(scores.keys()), case(scores, value=Event.id, else_=0)
+
+
+async def search_event_ids(
+    db: AsyncSession,
+    keyword: str,
+    search_mode: EventSearchModeCode | None = EventSearchModeCode.FULLTEXT,
+) -> list[int]:
+    """Event ids matching the keyword, best match first (memory backend)."""
+    index = await get_memory_index(db)
+    return list(
+        index.search(
+            keyword,
+            fuzzy=search_mode == EventSearchModeCode.FUZZY,
+            substring=search_mode == EventSearchModeCode.PARTIAL,
+            limit=settings.EVENT_SEARCH_MAX_RESULTS,
+        )
+    )
+
+
+async def get_memory_index(db: AsyncSession) -> InvertedIndex:
+    global _memory_index, _memory_index_built_at
+
+    if (
+        time.monotonic() - _memory_index_built_at
+        < settings.EVENT_SEARCH_INDEX_TTL_SECONDS
+    ):
+        return _memory_index
+
+    async with _memory_index_lock:
+        # Another request may have rebuilt it while we were waiting
+        if (
+            time.monotonic() - _memory_index_built_at
+            < settings.EVENT_SEARCH_INDEX_TTL_SECONDS
+        ):
+            return _memory_index
+
+        _memory_index = await _build_memory_index(db)
+        _memory_index_built_at = time.monotonic()
+
+    return _memory_index
+
+
+def invalidate_memory_index():
+    global _memory_index_built_at
+    _memory_index_built_at = 0.0
+
+
+async def _build_memory_index(db: AsyncSession) -> InvertedIndex:
+    EventTagNames = (
+        select(
+            TagAssociation.entity_id.label("event_id"),
+            func.string_agg(Tag.name, " ").label("tag_names"),
+        )
+        .join(Tag, Tag.id == TagAssociation.tag_id)
+        .where(TagAssociation.entity_code == TagAssociationEntityCode.EVENT)
+        .group_by(TagAssociation.entity_id)
+        .cte()
+    )
+
+    query = (
+        select(
+            Event.id,
+            Event.name,
+            Event.description,
+            Organization.name.label("organization_name"),
+            EventTagNames.c.tag_names,
+        )
+        .join(Organization, Event.organization_id == Organization.id)
+        .outerjoin(EventTagNames, Event.id == EventTagNames.c.event_id)
+        .where(
+            and_(
+                Event.published_at.isnot(None),
+                Event.status == EventStatusCode.PUBLIC,
+            )
+        )
+    )
+
+    index = InvertedIndex()
+    for event in (await db.exec(query)).mappings().all():
+        index.add(
+            event.id,
+            [
+                (event.name, EVENT_NAME_WEIGHT),
+                (event.organization_name, ORGANIZATION_NAME_WEIGHT),
+                (event.tag_names, TAG_NAME_WEIGHT),
+                (event.description, DESCRIPTION_WEIGHT),
+            ],
+        )
+
+    return index
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
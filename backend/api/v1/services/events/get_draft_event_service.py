@@ -1,4 +1,5 @@
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 import backend.api.v1.services.tags as tag_service
 import backend.api.v1.services.tickets as ticket_service
@@ -8,8 +9,8 @@ from backend.models import Event, User
 from backend.utils.database import fetch_one
 
 
-async def get_draft_event(db: Session, organizer: User, slug: str):
-    event = fetch_one(
+async def get_draft_event(db: AsyncSession, organizer: User, slug: str):
+    event = await fetch_one(
         db,
         select(Event).where(
             Event.slug == slug, Event.organization_id == organizer.organization_id
@@ -26,6 +27,6 @@ async def get_draft_event(db: Session, organizer: User, slug: str):
     event["tickets"] = await ticket_service.listing_tickets_of_event(
         db, organizer, event["id"]
     )
-    event["tags"] = tag_service.get_event_tags(db, event["id"])
+    event["tags"] = await tag_service.get_event_tags(db, event["id"])
 
     return event
@@ -0,0 +1,132 @@
+from datetime import datetime
+
+import pytz
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import backend.api.v1.services.stats as stats_service
+from backend.core.constants import AnalyticsPeriodCode
+from backend.core.error_code import ErrorCode, ErrorMessage
+from backend.core.exception import BadRequestException
+from backend.models.event import Event
+from backend.models.event_analytics import (
+    EventAnalytics,
+    EventTicketAnalytics,
+    OrganizationAnalytics,
+)
+from backend.models.ticket import Ticket
+from backend.models.user import User
+from backend.schemas.analytics import (
+    ANALYTICS_DEFAULT_RANGES,
+    AnalyticsBucket,
+    AnalyticsCounters,
+    AnalyticsQueryParams,
+    EventAnalyticsResponse,
+    TicketAnalyticsItem,
+)
+
+ANALYTICS_COUNTERS = list(AnalyticsCounters.model_fields)
+
+
+def _analytics_range(query_params: AnalyticsQueryParams) -> tuple[datetime, datetime]:
+    to_at = query_params.to_at or datetime.now(pytz.utc)
+    from_at = (
+        query_params.from_at or to_at - ANALYTICS_DEFAULT_RANGES[query_params.period]
+    )
+    # From the bucket `from_at` is in
+    return stats_service.analytics_buckets(from_at)[query_params.period], to_at
+
+
+async def _listing_analytics_buckets(
+    db: AsyncSession,
+    model: type[EventAnalytics] | type[OrganizationAnalytics],
+    filters: list,
+    period: AnalyticsPeriodCode,
+    from_at,
+    to_at,
+) -> tuple[list[AnalyticsBucket], AnalyticsCounters]:
+    """Rollup buckets of `model` matching `filters`, and their totals."""
+    rows = (
+        await db.exec(
+            select(
+                model.bucket_at,
+                *(getattr(model, field).label(field) for field in ANALYTICS_COUNTERS),
+            )
+            .where(
+                *filters,
+                model.period == period,
+                model.bucket_at >= from_at,
+                model.bucket_at <= to_at,
+            )
+            .order_by(model.bucket_at)
+        )
+    ).all()
+
+    buckets = [AnalyticsBucket.model_validate(row._mapping) for row in rows]
+    totals = AnalyticsCounters(
+        **{
+            field: sum(getattr(bucket, field) for bucket in buckets)
+            for field in ANALYTICS_COUNTERS
+        }
+    )
+    return buckets, totals
+
+
+async def get_event_analytics(
+    db: AsyncSession,
+    organizer: User,
+    event_id: int,
+    query_params: AnalyticsQueryParams,
+) -> EventAnalyticsResponse:
+    event_exists = (
+        await db.exec(
+            select(Event.id).where(
+                Event.id == event_id,
+                Event.organization_id == organizer.organization_id,
+            )
+        )
+    ).first()
+    if not event_exists:
+        raise BadRequestException(
+            ErrorCode.ERR_EVENT_NOT_FOUND, ErrorMessage.ERR_EVENT_NOT_FOUND
+        )
+
+    from_at, to_at = _analytics_range(query_params)
+    buckets, totals = await _listing_analytics_buckets(
+        db,
+        EventAnalytics,
+        [EventAnalytics.event_id == event_id],
+        query_params.period,
+        from_at,
+        to_at,
+    )
+
+    tickets = (
+        await db.exec(
+            select(
+                Ticket.id.label("ticket_id"),
+                Ticket.name.label("ticket_name"),
+                func.sum(EventTicketAnalytics.sold_quantity).label("sold_quantity"),
+                func.sum(EventTicketAnalytics.revenue).label("revenue"),
+            )
+            .join(Ticket, Ticket.id == EventTicketAnalytics.ticket_id)
+            .where(
+                EventTicketAnalytics.event_id == event_id,
+                EventTicketAnalytics.period == query_params.period,
+                EventTicketAnalytics.bucket_at >= from_at,
+                EventTicketAnalytics.bucket_at <= to_at,
+            )
+            .group_by(Ticket.id)
+            .order_by(Ticket.id)
+        )
+    ).all()
+
+    return EventAnalyticsResponse(
+        event_id=event_id,
+        period=query_params.period,
+        from_at=from_at,
+        to_at=to_at,
+        buckets=buckets,
+        totals=totals,
+        tickets=[TicketAnalyticsItem.model_validate(row._mapping) for row in tickets],
+    )
@@ -1,58 +1,35 @@
-from sqlmodel import Session, and_, case, exists, func, select, update
+from sqlmodel import and_, case, exists, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+import backend.api.v1.services.stats as stats_service
 from backend.api.v1.services.surveys.get_survey_detail_service import get_survey_detail
 from backend.api.v1.services.tags.get_event_tags_service import get_event_tags
-from backend.core.constants import FollowEntityCode
 from backend.core.error_code import ErrorCode, ErrorMessage
 from backend.core.exception import BadRequestException
 from backend.models import Bookmark, Event, Organization, Ticket, User
+from backend.models.event_stats import EventStats
 from backend.models.follow import Follow
+from backend.models.organization_stats import OrganizationStats
 from backend.models.ticket_inventory import TicketInventory
 from backend.utils.database import fetch_one
 
 
-async def get_event_detail(db: Session, current_user: User, slug: str):
-    event = fetch_one(db, select(Event).where(Event.slug == slug))
+async def get_event_detail(db: AsyncSession, current_user: User, slug: str):
+    event_id = await fetch_one(db, select(Event.id).where(Event.slug == slug))
 
-    if not event:
+    if not event_id:
         raise BadRequestException(
             ErrorCode.ERR_EVENT_NOT_FOUND, ErrorMessage.ERR_EVENT_NOT_FOUND
         )
 
-    OrganizationEventFollowCount = (
-        select(
-            Organization.id,
-            func.count(Event.id.distinct()).label("organization_event_number"),
-            func.count(Follow.follower_id.distinct()).label(
-                "organization_follower_number"
-            ),
-        )
-        .outerjoin(Event, Event.organization_id == Organization.id)
-        .outerjoin(
-            Follow,
-            and_(
-                Follow.following_id == Organization.id,
-                Follow.entity_code == FollowEntityCode.ORGANIZATION,
-            ),
-        )
-        .where(Event.published_at.isnot(None))
-        .group_by(Organization.id)
-        .subquery()
-    )
-
-    SoldTicketsNumber = (
-        select(
-            Event.id,
-            func.sum(TicketInventory.sold_quantity).label("sold_tickets_number"),
-        )
-        .join(TicketInventory, TicketInventory.event_id == Event.id)
-        .group_by(Event.id)
-        .subquery()
-    )
-
     query = (
         select(
-            *Event.__table__.columns,
+            # Not the search_vector, only used by the search
+            *(
+                column
+                for column in Event.__table__.columns
+                if column is not Event.__table__.c.search_vector
+            ),
             Organization.name.label("organization_name"),
             Organization.address.label("organization_address"),
             Organization.hp_url.label("organization_url"),
@@ -60,20 +37,24 @@ async def get_event_detail(db: Session, current_user: User, slug: str):
             Organization.contact_url.label("organization_contact_url"),
             Organization.avatar_url.label("organization_avatar_url"),
             Organization.description.label("organization_description"),
-            OrganizationEventFollowCount.c.organization_event_number,
-            OrganizationEventFollowCount.c.organization_follower_number,
-            SoldTicketsNumber.c.sold_tickets_number,
+            func.coalesce(OrganizationStats.event_number, 0).label(
+                "organization_event_number"
+            ),
+            func.coalesce(OrganizationStats.follower_number, 0).label(
+                "organization_follower_number"
+            ),
+            EventStats.sold_tickets_number,
+            func.coalesce(EventStats.view_number, 0).label("view_number"),
         )
         .where(
             Event.slug == slug,
             Event.published_at.isnot(None),
         )
         .join(Organization, Event.organization_id == Organization.id)
-        .join(
-            OrganizationEventFollowCount,
-            OrganizationEventFollowCount.c.id == Organization.id,
+        .outerjoin(
+            OrganizationStats, OrganizationStats.organization_id == Organization.id
         )
-        .outerjoin(SoldTicketsNumber, SoldTicketsNumber.c.id == Event.id)
+        .outerjoin(EventStats, EventStats.event_id == Event.id)
     )
 
     if current_user:
@@ -93,74 +74,72 @@ async def get_event_detail(db: Session, current_user: User, slug: str):
             ),
         )
 
-    event = db.exec(query).mappings().one_or_none()
+    event = (await db.exec(query)).mappings().one_or_none()
     event = dict(event)
 
     event.update(
         {
             "survey": (
-                get_survey_detail(db, event["survey_id"])
+                await get_survey_detail(db, event["survey_id"])
                 if event["survey_id"]
                 else None
             ),
-            "tickets": _get_tickets(db, event["id"]),
+            "tickets": await _get_tickets(db, event["id"]),
             "organization_contact_url": event["organization_contact_url"],
-            "tags": get_event_tags(db, event["id"]),
+            "tags": await get_event_tags(db, event["id"]),
         }
     )
 
     if current_user:
-        is_bookmarked = db.exec(
+        result = await db.exec(
             select(
                 exists().where(
                     Bookmark.user_id == current_user.id,
                     Bookmark.event_id == event["id"],
                 )
             )
-        ).first()
+        )
+        is_bookmarked = result.first()
         event["is_bookmarked"] = is_bookmarked
 
-    try:
-        db.exec(
-            update(Event)
-            .where(Event.id == event["id"])
-            .values(view_number=event["view_number"] + 1)
-        )
-        db.commit()
-        event["view_number"] += 1
-        return event
+    return event
 
-    except Exception as e:
-        db.rollback()
-        raise e
 
+def count_event_view(event: dict, viewer: int | str | None) -> dict:
+    """
+    Count a view of the event detail (kept apart from get_event_detail, whose
+    result may come from the response cache).
+    """
+    # Buffered, flushed to event_stats by stats_service.run_event_views_flusher
+    stats_service.event_view_counter.record(event["id"], viewer)
+    event["view_number"] += stats_service.event_view_counter.pending(event["id"])
 
-def _get_tickets(db: Session, event_id: int):
-    tickets = (
-        db.exec(
-            select(
-                Ticket.id,
-                Ticket.name,
-                TicketInventory.available_quantity,
-                Ticket.quantity,
-                Ticket.description,
-                Ticket.price,
-                Ticket.expired_at,
-                Ticket.type,
-                Ticket.status,
-                Ticket.sales_start_at,
-                Ticket.sales_end_at,
-                Ticket.delivery_method,
-                Ticket.is_refundable,
-            )
-            .where(
-                Ticket.event_id == event_id,
-            )
-            .join(TicketInventory, TicketInventory.ticket_id == Ticket.id)
-            .order_by(Ticket.id)
+    return event
+
+
+async def _get_tickets(db: AsyncSession, event_id: int):
+    result = await db.exec(
+        select(
+            Ticket.id,
+            Ticket.name,
+            TicketInventory.available_quantity,
+            Ticket.quantity,
+            Ticket.description,
+            Ticket.price,
+            Ticket.expired_at,
+            Ticket.type,
+            Ticket.status,
+            Ticket.sales_start_at,
+            Ticket.sales_end_at,
+            Ticket.delivery_method,
+            Ticket.is_refundable,
+        )
+        .where(
+            Ticket.event_id == event_id,
         )
-        .mappings()
-        .all()
+        .join(TicketInventory, TicketInventory.ticket_id == Ticket.id)
+        .order_by(Ticket.id)
     )
+    tickets = result.mappings().all()
 
     return tickets
@@ -0,0 +1,12 @@
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.models.event import Event
+
+
+async def get_event_ids(db: AsyncSession, slug: str):
+    """Id and organization id of an event (None if the slug is unknown)."""
+    result = await db.exec(
+        select(Event.id, Event.organization_id).where(Event.slug == slug)
+    )
+    return result.first()
@@ -1,4 +1,5 @@
-from sqlmodel import Boolean, Session, and_, case, func, literal, or_, select
+from sqlmodel import Boolean, and_, case, func, literal, or_, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.core.constants import (
     EventStatusCode,
@@ -12,63 +13,75 @@ from backend.models.tag_association import TagAssociation
 from backend.models.transaction import Transaction
 from backend.models.transaction_item import TransactionItem
 from backend.schemas.event import ListingMyEventsQueryParams, MyEventStatusCode
+from backend.utils.pagination import (
+    SortKey,
+    decode_cursor,
+    keyset_filter,
+    keyset_order_by,
+    paginate_by_keyset,
+    should_count_total,
+)
+
+MY_EVENTS_SORT_NAME = "START_AT"
+MY_EVENTS_SORT_KEYS = [SortKey(Event.start_at, "start_at"), SortKey(Event.id, "id")]
 
 
 async def listing_my_events(
-    db: Session, current_user: User, query_params: ListingMyEventsQueryParams
+    db: AsyncSession, current_user: User, query_params: ListingMyEventsQueryParams
 ):
     filters = await _build_filters(current_user, query_params)
-    events = await _listing_events(db, current_user, filters, query_params)
-    total = await _count_events(db, filters)
-    return events, total
+    events, next_cursor = await _listing_events(db, current_user, filters, query_params)
+    total = (
+        await _count_events(db, current_user, filters)
+        if should_count_total(query_params)
+        else None
+    )
+    return events, total, next_cursor
 
 
 async def _listing_events(
-    db: Session,
+    db: AsyncSession,
     current_user: User,
     filters: list,
     query_params: ListingMyEventsQueryParams,
 ):
-    transaction_histories = (
-        db.exec(
-            select(
-                func.max(Application.event_id).label("event_id"),
-                Transaction.id,
-                Transaction.status.label("transaction_status"),
-                Transaction.total_amount,
-                Transaction.created_at.label("purchased_at"),
-                Transaction.quantity,
-                func.json_agg(
-                    func.json_build_object(
-                        "id",
-                        TransactionItem.id,
-                        "ticket_name",
-                        Ticket.name,
-                        "ticket_id",
-                        Ticket.id,
-                        "ticket_price",
-                        Ticket.price,
-                        "ticket_type",
-                        Ticket.type,
-                        "event_access_link_url",
-                        Ticket.access_link_url,
-                        "amount",
-                        TransactionItem.amount,
-                        "note",
-                        TransactionItem.note,
-                    )
-                ).label("ticket_transaction_items"),
-            )
-            .select_from(Transaction)
-            .join(Application, Application.id == Transaction.application_id)
-            .join(TransactionItem, TransactionItem.transaction_id == Transaction.id)
-            .join(Ticket, Ticket.id == TransactionItem.ticket_id)
-            .where(Application.user_id == current_user.id)
-            .group_by(Transaction.id)
+    result = await db.exec(
+        select(
+            func.max(Application.event_id).label("event_id"),
+            Transaction.id,
+            Transaction.status.label("transaction_status"),
+            Transaction.total_amount,
+            Transaction.created_at.label("purchased_at"),
+            Transaction.quantity,
+            func.json_agg(
+                func.json_build_object(
+                    "id",
+                    TransactionItem.id,
+                    "ticket_name",
+                    Ticket.name,
+                    "ticket_id",
+                    Ticket.id,
+                    "ticket_price",
+                    Ticket.price,
+                    "ticket_type",
+                    Ticket.type,
+                    "event_access_link_url",
+                    Ticket.access_link_url,
+                    "amount",
+                    TransactionItem.amount,
+                    "note",
+                    TransactionItem.note,
+                )
+            ).label("ticket_transaction_items"),
         )
-        .mappings()
-        .all()
+        .select_from(Transaction)
+        .join(Application, Application.id == Transaction.application_id)
+        .join(TransactionItem, TransactionItem.transaction_id == Transaction.id)
+        .join(Ticket, Ticket.id == TransactionItem.ticket_id)
+        .where(Application.user_id == current_user.id)
+        .group_by(Transaction.id)
     )
+    transaction_histories = result.mappings().all()
 
     EventTags = (
         select(
@@ -119,17 +132,35 @@ async def _listing_events(
             Bookmark,
             and_(Bookmark.event_id == Event.id, Bookmark.user_id == current_user.id),
         )
-        .outerjoin(Application, Application.event_id == Event.id)
+        .outerjoin(
+            Application,
+            and_(
+                Application.event_id == Event.id,
+                Application.user_id == current_user.id,
+            ),
+        )
         .outerjoin(EventTags, EventTags.c.event_id == Event.id)
         .where(*filters)
-        .limit(query_params.per_page)
-        .offset(query_params.per_page * (query_params.page - 1))
-        .order_by(Event.start_at)
+        .order_by(*keyset_order_by(MY_EVENTS_SORT_KEYS))
+        .limit(query_params.per_page + 1)
     )
 
-    my_events = db.exec(query).mappings().all()
+    if query_params.cursor:
+        cursor_values = decode_cursor(
+            query_params.cursor, MY_EVENTS_SORT_NAME, MY_EVENTS_SORT_KEYS
+        )
+        query = query.where(keyset_filter(MY_EVENTS_SORT_KEYS, cursor_values))
+    else:
+        query = query.offset(query_params.per_page * (query_params.page - 1))
+
+    my_events = (await db.exec(query)).mappings().all()
 
-    my_events = [dict(event) for event in my_events]
+    my_events, next_cursor = paginate_by_keyset(
+        [dict(event) for event in my_events],
+        query_params.per_page,
+        MY_EVENTS_SORT_NAME,
+        MY_EVENTS_SORT_KEYS,
+    )
     for event in my_events:
         event["transaction_histories"] = [
             {
@@ -151,19 +182,32 @@ async def _listing_events(
         ):
             event["is_applied"] = True
 
-    return my_events
+    return my_events, next_cursor
 
 
 async def _count_events(
-    db: Session,
+    db: AsyncSession,
+    current_user: User,
     filters: list,
 ):
     total = (
-        db.scalar(
-            select(func.count(Event.id))
+        await db.scalar(
+            select(func.count(Event.id.distinct()))
             .select_from(Event)
-            .outerjoin(Bookmark, Event.id == Bookmark.event_id)
-            .outerjoin(Application, Application.event_id == Event.id)
+            .outerjoin(
+                Bookmark,
+                and_(
+                    Bookmark.event_id == Event.id,
+                    Bookmark.user_id == current_user.id,
+                ),
+            )
+            .outerjoin(
+                Application,
+                and_(
+                    Application.event_id == Event.id,
+                    Application.user_id == current_user.id,
+                ),
+            )
             .where(*filters)
         )
         or 0
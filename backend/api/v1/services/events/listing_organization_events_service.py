@@ -1,6 +1,7 @@
 from datetime import datetime
 
-from sqlmodel import Date, Session, and_, case, func, select, text
+from sqlmodel import Date, and_, case, exists, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.core.constants import (
     EventTimeStatusCode,
@@ -8,28 +9,54 @@ from backend.core.constants import (
     TagAssociationEntityCode,
 )
 from backend.models.event import Event
+from backend.models.event_stats import EventStats
 from backend.models.tag import Tag
 from backend.models.tag_association import TagAssociation
 from backend.models.ticket import Ticket
 from backend.models.ticket_inventory import TicketInventory
 from backend.models.user import User
 from backend.schemas.event import ListingOrganizationEventsQueryParams
+from backend.utils.pagination import (
+    SortKey,
+    decode_cursor,
+    keyset_filter,
+    keyset_order_by,
+    paginate_by_keyset,
+    should_count_total,
+)
+
+SOLD_TICKETS_NUMBER = func.coalesce(EventStats.sold_tickets_number, 0)
+VIEW_NUMBER = func.coalesce(EventStats.view_number, 0)
 
 
 async def listing_organization_events(
-    db: Session, organizer: User, query_params: ListingOrganizationEventsQueryParams
+    db: AsyncSession,
+    organizer: User,
+    query_params: ListingOrganizationEventsQueryParams,
 ):
-    filters, sort_by = _build_filters_sort(organizer, query_params)
-    events = await _listing_events(db, filters, sort_by, query_params)
-    total = await _count_events(db, filters)
+    filters, sort_keys = _build_filters_sort(organizer, query_params)
+    total = (
+        await _count_events(db, filters) if should_count_total(query_params) else None
+    )
+
+    if query_params.cursor:
+        cursor_values = decode_cursor(
+            query_params.cursor, query_params.sort_by, sort_keys
+        )
+        filters = [*filters, keyset_filter(sort_keys, cursor_values)]
+
+    events = await _listing_events(db, filters, sort_keys, query_params)
+    events, next_cursor = paginate_by_keyset(
+        events, query_params.per_page, query_params.sort_by, sort_keys
+    )
 
-    return events, total
+    return events, total, next_cursor
 
 
 async def _listing_events(
-    db: Session,
+    db: AsyncSession,
     filters: list,
-    sort_by: ManageEventSortByCode,
+    sort_keys: list[SortKey],
     query_params: ListingOrganizationEventsQueryParams,
 ):
     EventTicket = (
@@ -91,9 +118,11 @@ async def _listing_events(
             Event.organize_address,
             Event.total_ticket_number,
             Event.status,
-            Event.view_number,
+            VIEW_NUMBER.label("view_number"),
             Event.meeting_tool_code,
             Event.meeting_url,
+            Event.created_at,
+            SOLD_TICKETS_NUMBER.label("sold_tickets_number"),
             case(
                 (EventTicket.c.tickets.is_(None), "[]"),
                 else_=EventTicket.c.tickets,
@@ -105,31 +134,24 @@ async def _listing_events(
         )
         .outerjoin(EventTicket, Event.id == EventTicket.c.event_id)
         .outerjoin(EventTag, Event.id == EventTag.c.event_id)
+        .outerjoin(EventStats, Event.id == EventStats.event_id)
         .where(*filters)
-        .limit(query_params.per_page)
-        .offset(query_params.per_page * (query_params.page - 1))
-        .order_by(sort_by)
+        .order_by(*keyset_order_by(sort_keys))
+        .limit(query_params.per_page + 1)
     )
-    events = db.exec(query).mappings().all()
+    if not query_params.cursor:
+        query = query.offset(query_params.per_page * (query_params.page - 1))
+
+    events = (await db.exec(query)).mappings().all()
 
     result = {event.id: dict(event) for event in events}
 
     return list(result.values())
 
 
-async def _count_events(db: Session, filters: list):
-    query = (
-        select(func.count(Event.id.distinct()))
-        .outerjoin(
-            TagAssociation,
-            and_(
-                Event.id == TagAssociation.tag_id,
-                TagAssociation.entity_code == TagAssociationEntityCode.EVENT,
-            ),
-        )
-        .where(*filters)
-    )
-    total = db.scalar(query) or 0
+async def _count_events(db: AsyncSession, filters: list):
+    query = select(func.count(Event.id)).where(*filters)
+    total = await db.scalar(query) or 0
 
     return total
 
@@ -139,13 +161,19 @@ def _build_filters_sort(
     query_params: ListingOrganizationEventsQueryParams,
 ):
     filters = [Event.organization_id == organizer.organization_id]
-    sort_by = Event.created_at
+    sort_by = SortKey(Event.created_at, "created_at")
 
     if query_params.keyword:
         filters.append(Event.name.contains(query_params.keyword))
 
     if query_params.tags:
-        filters.append(TagAssociation.tag_id.in_(query_params.tags))
+        filters.append(
+            exists().where(
+                TagAssociation.entity_id == Event.id,
+                TagAssociation.entity_code == TagAssociationEntityCode.EVENT,
+                TagAssociation.tag_id.in_(query_params.tags),
+            )
+        )
 
     if query_params.meeting_tool_codes:
         filters.append(Event.meeting_tool_code.in_(query_params.meeting_tool_codes))
@@ -177,15 +205,16 @@ def _build_filters_sort(
         filters.append(Event.end_at < datetime.now())
 
     if query_params.sort_by == ManageEventSortByCode.SOLD_TICKETS_NUMBER:
-        sort_by = text("sold_tickets_number.sold_tickets_number")
+        sort_by = SortKey(SOLD_TICKETS_NUMBER, "sold_tickets_number")
 
     if query_params.sort_by == ManageEventSortByCode.START_AT:
-        sort_by = Event.start_at
+        sort_by = SortKey(Event.start_at, "start_at")
 
     if query_params.sort_by == ManageEventSortByCode.NAME:
-        sort_by = Event.name
+        sort_by = SortKey(Event.name, "name")
 
     if query_params.sort_by == ManageEventSortByCode.VIEW_NUMBER:
-        sort_by = Event.view_number
+        sort_by = SortKey(VIEW_NUMBER, "view_number")
 
-    return filters, sort_by
+    # id as tie-breaker so the keyset cursor is unique
+    return filters, [sort_by, SortKey(Event.id, "id")]
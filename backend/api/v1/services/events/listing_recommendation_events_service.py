@@ -1,20 +1,42 @@
-from sqlmodel import Session, text
+from sqlmodel import text
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from backend.core.constants import EventStatusCode
+from backend.api.v1.services.events.event_keyword_search_service import search_event_ids
+from backend.core.config import settings
+from backend.core.constants import EventSearchModeCode, EventStatusCode
 from backend.models.user import User
 from backend.schemas.event import SearchEventsQueryParams
+from backend.utils.search import build_prefix_tsquery
 
 
 async def listing_recommendation_events(
-    db: Session, user: User, query_params: SearchEventsQueryParams
+    db: AsyncSession, user: User, query_params: SearchEventsQueryParams
 ):
     # Ensure safe default values
     page = max(query_params.page or 1, 1)
     per_page = min(max(query_params.per_page or 10, 1), 100)
 
     filters = []
+    keyword_tsquery = build_prefix_tsquery(query_params.keyword)
+    keyword_event_ids = []
     if query_params.keyword:
-        filters.append("e.name ILIKE '%' || :keyword || '%'")
+        search_mode = query_params.search_mode or EventSearchModeCode.FULLTEXT
+        if settings.EVENT_SEARCH_BACKEND == "memory":
+            keyword_event_ids = await search_event_ids(
+                db, query_params.keyword, search_mode
+            )
+            filters.append("e.id = ANY(:keyword_event_ids)")
+        elif search_mode == EventSearchModeCode.PARTIAL:
+            filters.append("e.name ILIKE '%' || :keyword || '%'")
+        elif not keyword_tsquery:
+            filters.append("FALSE")
+        elif search_mode == EventSearchModeCode.FUZZY:
+            filters.append(
+                "(e.search_vector @@ to_tsquery('simple', :keyword_tsquery)"
+                " OR e.name %> :keyword)"
+            )
+        else:
+            filters.append("e.search_vector @@ to_tsquery('simple', :keyword_tsquery)")
     if query_params.start_at_from:
         filters.append("e.start_at >= :start_at_from")
     if query_params.start_at_to:
@@ -43,96 +65,66 @@ async def listing_recommendation_events(
         filters.append("e.organize_city_code = ANY(:city_codes)")
 
     if query_params.tags:
-        filters.append("ta.tag_id = ANY(:tags)")
+        filters.append(
+            "EXISTS (SELECT 1 FROM tag_associations ta"
+            " WHERE ta.entity_code = 'EVENT' AND ta.entity_id = e.id"
+            " AND ta.tag_id = ANY(:tags))"
+        )
 
     filters = " AND ".join(filters)
     if filters:
         filters = " AND " + filters
 
-    # ✅ **Total Count Query (Fix)**
-    count_statement = text(
-        f"""
-        WITH event_tags AS (
-            SELECT ta.entity_id AS event_id, array_agg(ta.tag_id) AS tag_ids
-            FROM tag_associations ta
-            WHERE ta.entity_code = 'EVENT'
-            GROUP BY ta.entity_id
-        ),
-
-        user_interactions AS (
-            SELECT
-                t.industry_codes AS industry_codes,
-                t.job_type_codes AS job_type_codes,
-                et.tag_ids AS tag_ids,
-                CASE
-                    WHEN EXISTS (
-                        SELECT 1 FROM survey_response_results srr WHERE srr.application_id = a.id
-                    )
-                    THEN 8 ELSE 7
-                END AS score
-            FROM applications a
-            JOIN events e ON e.id = a.event_id
-            LEFT JOIN targets t ON t.id = e.target_id
-            LEFT JOIN event_tags et ON et.event_id = e.id
-            WHERE a.user_id = :user_id
-
-            UNION ALL
-
-            SELECT
-                t.industry_codes AS industry_codes,
-                t.job_type_codes AS job_type_codes,
-                et.tag_ids AS tag_ids,
-                5 AS score
-            FROM bookmarks b
-            JOIN events e ON e.id = b.event_id
-            LEFT JOIN targets t ON t.id = e.target_id
-            LEFT JOIN event_tags et ON et.event_id = e.id
-            WHERE b.user_id = :user_id
-
-            UNION ALL
-
-            SELECT
-                ARRAY[u.industry_code]::varchar[] AS industry_codes,
-                ARRAY[u.job_type_code]::varchar[] AS job_type_codes,
-                array_agg(ta.tag_id) AS tag_ids,
-                3 AS score
-            FROM users u
-            LEFT JOIN tag_associations ta ON ta.entity_id = u.id AND ta.entity_code = 'USER'
-            WHERE u.id = :user_id
-            GROUP BY u.id
+    # Driven by the user's interest codes (see users_service.refresh_user_interests):
+    # only the events sharing a target code or a tag with them are scored, through
+    # indexed joins, whatever the size of the catalogue. An interest matching an
+    # event several ways counts once.
+    scored_events = f"""
+        WITH interest_matches AS (
+            SELECT e.id AS event_id, ui.code, ui.score
+            FROM user_interests ui
+            JOIN targets t
+                ON t.industry_codes @> ARRAY[ui.code]::varchar[]
+                OR t.job_type_codes @> ARRAY[ui.code]::varchar[]
+            JOIN events e ON e.target_id = t.id
+            WHERE ui.user_id = :user_id
+
+            UNION
+
+            SELECT ta.entity_id AS event_id, ui.code, ui.score
+            FROM user_interests ui
+            JOIN tag_associations ta
+                ON ta.entity_code = 'EVENT'
+                AND ta.tag_id = CASE
+                    WHEN ui.code ~ '^[0-9]+$' THEN ui.code::integer
+                END
+            WHERE ui.user_id = :user_id
         ),
 
-        total_scores AS (
-            SELECT
-                unnest(ui.industry_codes) AS code,
-                SUM(ui.score) AS score
-            FROM user_interactions ui
-            WHERE ui.industry_codes IS NOT NULL
-            GROUP BY code
-
-            UNION ALL
-
-            SELECT
-                unnest(ui.job_type_codes) AS code,
-                SUM(ui.score) AS score
-            FROM user_interactions ui
-            WHERE ui.job_type_codes IS NOT NULL
-            GROUP BY code
-
-            UNION ALL
-
-            SELECT
-                unnest(ui.tag_ids::varchar[]) AS code,
-                SUM(ui.score) AS score
-            FROM user_interactions ui
-            WHERE ui.tag_ids IS NOT NULL
-            GROUP BY code
+        scored_events AS (
+            SELECT event_id, SUM(score) AS total_score
+            FROM interest_matches
+            GROUP BY event_id
         )
 
-        SELECT COUNT(*)
-        FROM events e
+        SELECT
+            e.id,
+            e.name,
+            e.slug,
+            e.start_at,
+            e.end_at,
+            e.total_ticket_number,
+            e.application_start_at,
+            e.application_end_at,
+            e.cover_image_url,
+            e.published_at,
+            o.name AS organization_name,
+            s.total_score,
+            COUNT(*) OVER () AS total
+        FROM scored_events s
+        JOIN events e ON e.id = s.event_id
+        JOIN organizations o ON e.organization_id = o.id
         LEFT JOIN targets t ON e.target_id = t.id
-        LEFT JOIN event_tags et ON e.id = et.event_id
         WHERE e.status = :status
         AND NOT EXISTS (
             SELECT 1 FROM applications a WHERE a.event_id = e.id AND a.user_id = :user_id
@@ -140,124 +132,14 @@ async def listing_recommendation_events(
         AND NOT EXISTS (
             SELECT 1 FROM bookmarks b WHERE b.event_id = e.id AND b.user_id = :user_id
         )
-        AND EXISTS (
-            SELECT 1 FROM total_scores ts
-            WHERE ts.code = ANY(t.industry_codes)
-                OR ts.code = ANY(t.job_type_codes)
-                OR ts.code = ANY(et.tag_ids::varchar[])
-        )
-        {filters};
-        """
-    )
+        {filters}
+    """
 
-    # ✅ **Recommendation Query (With Filters)**
+    # The total comes with the page (one statement)
     statement = text(
         f"""
-        WITH event_tags AS (
-            SELECT ta.entity_id AS event_id, array_agg(ta.tag_id) AS tag_ids
-            FROM tag_associations ta
-            WHERE ta.entity_code = 'EVENT'
-            GROUP BY ta.entity_id
-        ),
-
-        user_interactions AS (
-            SELECT
-                t.industry_codes AS industry_codes,
-                t.job_type_codes AS job_type_codes,
-                et.tag_ids AS tag_ids,
-                CASE WHEN EXISTS (
-                    SELECT 1 FROM survey_response_results srr WHERE srr.application_id = a.id
-                ) THEN 8 ELSE 7 END AS score
-            FROM applications a
-            JOIN events e ON e.id = a.event_id
-            LEFT JOIN targets t ON t.id = e.target_id
-            LEFT JOIN event_tags et ON et.event_id = e.id
-            WHERE a.user_id = :user_id
-
-            UNION ALL
-
-            SELECT
-                t.industry_codes AS industry_codes,
-                t.job_type_codes AS job_type_codes,
-                et.tag_ids AS tag_ids,
-                5 AS score
-            FROM bookmarks b
-            JOIN events e ON e.id = b.event_id
-            LEFT JOIN targets t ON t.id = e.target_id
-            LEFT JOIN event_tags et ON et.event_id = e.id
-            WHERE b.user_id = :user_id
-
-            UNION ALL
-
-            SELECT
-                ARRAY[u.industry_code]::varchar[] AS industry_codes,
-                ARRAY[u.job_type_code]::varchar[] AS job_type_codes,
-                array_agg(ta.tag_id) AS tag_ids,
-                3 AS score
-            FROM users u
-            LEFT JOIN tag_associations ta ON ta.entity_id = u.id AND ta.entity_code = 'USER'
-            WHERE u.id = :user_id
-            GROUP BY u.id
-        ),
-
-        total_scores AS (
-            SELECT unnest(ui.industry_codes) AS code, SUM(ui.score) AS score
-            FROM user_interactions ui
-            WHERE ui.industry_codes IS NOT NULL
-            GROUP BY code
-
-            UNION ALL
-
-            SELECT unnest(ui.job_type_codes) AS code, SUM(ui.score) AS score
-            FROM user_interactions ui
-            WHERE ui.job_type_codes IS NOT NULL
-            GROUP BY code
-
-            UNION ALL
-
-            SELECT unnest(ui.tag_ids::VARCHAR[]) AS code, SUM(ui.score) AS score
-            FROM user_interactions ui
-            WHERE ui.tag_ids IS NOT NULL
-            GROUP BY code
-        ),
-
-        scored_events AS (
-            SELECT
-                e.id,
-                e.name,
-                e.slug,
-                e.start_at,
-                e.end_at,
-                e.total_ticket_number,
-                e.application_start_at,
-                e.application_end_at,
-                e.cover_image_url,
-                e.published_at,
-                o.name AS organization_name,
-                COALESCE((
-                    SELECT SUM(ts.score)
-                    FROM total_scores ts
-                    WHERE ts.code = ANY(t.industry_codes)
-                        OR ts.code = ANY(t.job_type_codes)
-                        OR ts.code = ANY(et.tag_ids::varchar[])
-                ), 0) AS total_score
-            FROM events e
-            JOIN organizations o ON e.organization_id = o.id
-            LEFT JOIN targets t ON e.target_id = t.id
-            LEFT JOIN event_tags et ON e.id = et.event_id
-            WHERE e.status = :status
-            AND NOT EXISTS (
-                SELECT 1 FROM applications a WHERE a.event_id = e.id AND a.user_id = :user_id
-            )
-            AND NOT EXISTS (
-                SELECT 1 FROM bookmarks b WHERE b.event_id = e.id AND b.user_id = :user_id
-            )
-            {filters}
-        )
-
-        SELECT * FROM scored_events
-        WHERE total_score > 0
-        ORDER BY total_score DESC
+        {scored_events}
+        ORDER BY s.total_score DESC, e.id DESC
         LIMIT :per_page OFFSET (:page - 1) * :per_page;
         """
     )
@@ -266,6 +148,8 @@ async def listing_recommendation_events(
         "status": EventStatusCode.PUBLIC,
         "user_id": user.id,
         "keyword": query_params.keyword,
+        "keyword_tsquery": keyword_tsquery,
+        "keyword_event_ids": keyword_event_ids,
         "start_at_from": query_params.start_at_from,
         "start_at_to": query_params.start_at_to,
         "job_type_codes": query_params.job_type_codes or [],
@@ -279,9 +163,22 @@ async def listing_recommendation_events(
         "per_page": per_page,
     }
 
-    # Execute both queries
-    total_count = db.exec(count_statement, params=params).scalar() or 0
-    events = db.exec(statement, params=params).mappings().all() or []
+    rows = (await db.exec(statement, params=params)).mappings().all()
+    if rows:
+        total_count = rows[0]["total"]
+    elif page > 1:
+        # Past the last page: no row to carry the total
+        total_count = (
+            await db.exec(
+                text(f"SELECT COUNT(*) FROM ({scored_events}) AS scored"),
+                params=params,
+            )
+        ).scalar()
+    else:
+        total_count = 0
+
+    events = [
+        {key: value for key, value in row.items() if key != "total"} for row in rows
+    ]
 
-    # ✅ Return paginated results & total count
     return {"total": total_count, "events": events}
@@ -1,54 +1,46 @@
-from sqlmodel import Session, select, text
+from sqlmodel import and_, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from backend.core.constants import EventStatusCode
 from backend.core.error_code import ErrorCode, ErrorMessage
 from backend.core.exception import BadRequestException
 from backend.models.event import Event
-from backend.models.target import Target
+from backend.models.event_similarity import EventSimilarity
 
+RELATED_EVENTS_LIMIT = 6
 
-async def listing_related_events(db: Session, slug: str):
-    targets = (
-        db.exec(
-            select(Target.industry_codes, Target.job_type_codes)
-            .select_from(Event)
-            .where(Event.slug == slug)
-            .join(Target, Target.id == Event.target_id)
-        )
-        .mappings()
-        .one_or_none()
-    )
 
-    if not targets:
+async def listing_related_events(db: AsyncSession, slug: str):
+    event_id = (await db.exec(select(Event.id).where(Event.slug == slug))).first()
+
+    if not event_id:
         raise BadRequestException(
             ErrorCode.ERR_EVENT_NOT_FOUND, ErrorMessage.ERR_EVENT_NOT_FOUND
         )
 
-    events = (
-        db.exec(
-            text(
-                f"""
-                SELECT e.id, e.slug, e.cover_image_url, e.name, e.start_at
-                FROM events e
-                JOIN targets t ON t.id = e.target_id
-                WHERE e.slug != '{slug}'
-                ORDER BY (
-                    (
-                        SELECT COUNT(*)
-                        FROM unnest(t.industry_codes) AS industry_code
-                        WHERE industry_code = ANY(ARRAY{targets.industry_codes})
-                    ) +
-                    (
-                        SELECT COUNT(*)
-                        FROM unnest(t.job_type_codes) AS job_type_code
-                        WHERE job_type_code = ANY(ARRAY{targets.job_type_codes})
-                    )
-                ) DESC
-                LIMIT 6;
-            """
-            )
-        )
-        .mappings()
-        .all()
+    columns = (Event.id, Event.slug, Event.cover_image_url, Event.name, Event.start_at)
+    is_public = and_(
+        Event.status == EventStatusCode.PUBLIC, Event.published_at.isnot(None)
     )
 
+    result = await db.exec(
+        select(*columns)
+        .join(EventSimilarity, EventSimilarity.similar_event_id == Event.id)
+        .where(EventSimilarity.event_id == event_id, is_public)
+        .order_by(EventSimilarity.score.desc(), EventSimilarity.similar_event_id.desc())
+        .limit(RELATED_EVENTS_LIMIT)
+    )
+    events = list(result.mappings().all())
+
+    # Not enough similar events: fill with the latest published ones
+    if len(events) < RELATED_EVENTS_LIMIT:
+        excluded_ids = [event_id, *(event.id for event in events)]
+        result = await db.exec(
+            select(*columns)
+            .where(Event.id.not_in(excluded_ids), is_public)
+            .order_by(Event.published_at.desc(), Event.id.desc())
+            .limit(RELATED_EVENTS_LIMIT - len(events))
+        )
+        events.extend(result.mappings().all())
+
     return events
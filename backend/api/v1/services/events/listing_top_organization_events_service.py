@@ -1,44 +1,39 @@
-from sqlmodel import Session, column, desc, distinct, func, select
+from sqlmodel import column, desc, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.core.constants import EventStatusCode
-from backend.models.application import Application
-from backend.models.bookmark import Bookmark
 from backend.models.event import Event
+from backend.models.event_stats import EventStats
 
 
-async def listing_top_organization_events(db: Session, organization_id: int):
+async def listing_top_organization_events(db: AsyncSession, organization_id: int):
     """
     rank = view * 1  +  bookmark * 500 + applied * 5000
     """
 
-    top_events = (
-        db.exec(
-            select(
-                distinct(Event.id).label("id"),
-                Event.slug,
-                Event.cover_image_url,
-                Event.name,
-                Event.start_at,
-                (
-                    5000 * func.count(Application.id)
-                    + 500 * func.count(Bookmark.id)
-                    + Event.view_number
-                ).label("rank"),
-            )
-            .outerjoin(Application, Event.id == Application.event_id)
-            .outerjoin(Bookmark, Event.id == Bookmark.event_id)
-            .where(
-                Event.published_at.isnot(None),
-                Event.organization_id == organization_id,
-                Event.status == EventStatusCode.PUBLIC,
-                # Application.canceled_at.is_(None),
-            )
-            .group_by(Event.id, Application.id, Bookmark.id)
-            .order_by(desc(column("rank")))
-            .limit(3)
+    result = await db.exec(
+        select(
+            Event.id,
+            Event.slug,
+            Event.cover_image_url,
+            Event.name,
+            Event.start_at,
+            func.coalesce(
+                5000 * EventStats.application_number
+                + 500 * EventStats.bookmark_number
+                + EventStats.view_number,
+                0,
+            ).label("rank"),
         )
-        .mappings()
-        .all()
+        .outerjoin(EventStats, EventStats.event_id == Event.id)
+        .where(
+            Event.published_at.isnot(None),
+            Event.organization_id == organization_id,
+            Event.status == EventStatusCode.PUBLIC,
+        )
+        .order_by(desc(column("rank")))
+        .limit(3)
     )
+    top_events = result.mappings().all()
 
     return top_events
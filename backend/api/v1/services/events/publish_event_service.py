@@ -1,7 +1,23 @@
 from datetime import datetime
 
-from sqlmodel import Session, delete, select
+from sqlmodel import delete, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+import backend.api.v1.services.stats as stats_service
+from backend.api.v1.services.events.event_keyword_search_service import (
+    invalidate_memory_index,
+)
+from backend.api.v1.services.events.refresh_event_similarities_service import (
+    refresh_event_similarities,
+)
+from backend.core.cache import (
+    EVENTS_TAG,
+    TAGS_TAG,
+    event_tag,
+    organization_tag,
+    response_cache,
+)
+from backend.core.conditional import touch_resources
 from backend.core.constants import EventStatusCode, TagAssociationEntityCode
 from backend.core.error_code import ErrorCode, ErrorMessage
 from backend.core.exception import BadRequestException
@@ -12,10 +28,10 @@ from backend.utils.database import fetch_one, save
 
 
 async def publish_event(
-    db: Session, organizer: User, request: PublishEventRequest, event_id: int
+    db: AsyncSession, organizer: User, request: PublishEventRequest, event_id: int
 ):
     try:
-        event = fetch_one(
+        event = await fetch_one(
             db,
             select(Event).where(
                 Event.id == event_id, Event.organization_id == organizer.organization_id
@@ -27,6 +43,9 @@ async def publish_event(
                 ErrorCode.ERR_EVENT_NOT_FOUND, ErrorMessage.ERR_EVENT_NOT_FOUND
             )
 
+        previous_target_id, previous_status = event.target_id, event.status
+        is_first_publish = event.published_at is None
+
         Event.update_by_dict(event, request.model_dump())
         event.organization_id = organizer.organization_id
         event.published_at = datetime.now()
@@ -36,16 +55,18 @@ async def publish_event(
 
         if request.tags:
             # Remove existing tags associated with the event
-            db.exec(
+            await db.exec(
                 delete(TagAssociation)
                 .where(TagAssociation.entity_id == event.id)
                 .where(TagAssociation.entity_code == TagAssociationEntityCode.EVENT)
             )
 
-            db.flush()
+            await db.flush()
 
             # Add new tags
-            request_tags = db.exec(select(Tag.id).where(Tag.id.in_(request.tags))).all()
+            request_tags = (
+                await db.exec(select(Tag.id).where(Tag.id.in_(request.tags)))
+            ).all()
             if (not request_tags) or (len(request.tags) != len(request_tags)):
                 raise BadRequestException(ErrorCode.ERR_TAG_NOT_FOUND)
             tags = [
@@ -58,11 +79,31 @@ async def publish_event(
             ]
             db.add_all(tags)
 
-        db.flush()
-        save(db, event)
+        if is_first_publish:
+            await stats_service.increment_organization_stats(
+                db, organizer.organization_id, event_number=1
+            )
+
+        await db.flush()
+        if (
+            request.tags
+            or event.target_id != previous_target_id
+            or event.status != previous_status
+        ):
+            await refresh_event_similarities(db, event.id)
+        resource_tags = (
+            EVENTS_TAG,
+            TAGS_TAG,
+            event_tag(event.id),
+            organization_tag(organizer.organization_id),
+        )
+        await touch_resources(db, *resource_tags)
+        await save(db, event)
+        invalidate_memory_index()
+        await response_cache.invalidate(*resource_tags)
 
         return event.id
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise e
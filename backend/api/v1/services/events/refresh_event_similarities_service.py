@@ -0,0 +1,147 @@
+from sqlmodel import delete, func, or_, select, text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core.config import settings
+from backend.models.event_similarity import EventSimilarity
+
+TARGET_CODE_WEIGHT = 1
+TAG_WEIGHT = 2
+
+_INSERT_EVENT_SIMILARITIES = """
+    WITH event_features AS (
+        SELECT
+            e.id,
+            t.industry_codes,
+            t.job_type_codes,
+            ARRAY(
+                SELECT ta.tag_id
+                FROM tag_associations ta
+                WHERE ta.entity_code = 'EVENT' AND ta.entity_id = e.id
+            ) AS tag_ids
+        FROM events e
+        LEFT JOIN targets t ON t.id = e.target_id
+        WHERE e.status = 'PUBLIC' AND e.published_at IS NOT NULL
+    ),
+
+    scored_pairs AS (
+        SELECT
+            s.id AS event_id,
+            c.id AS similar_event_id,
+            {target_code_weight} * (
+                (
+                    SELECT COUNT(*)
+                    FROM unnest(c.industry_codes) AS industry_code
+                    WHERE industry_code = ANY(s.industry_codes)
+                ) + (
+                    SELECT COUNT(*)
+                    FROM unnest(c.job_type_codes) AS job_type_code
+                    WHERE job_type_code = ANY(s.job_type_codes)
+                )
+            ) + {tag_weight} * (
+                SELECT COUNT(*)
+                FROM unnest(c.tag_ids) AS tag_id
+                WHERE tag_id = ANY(s.tag_ids)
+            ) AS score
+        FROM event_features s
+        JOIN event_features c ON c.id != s.id
+        WHERE {pair_filter}
+    ),
+
+    ranked_pairs AS (
+        SELECT
+            event_id,
+            similar_event_id,
+            score,
+            row_number() OVER (
+                PARTITION BY event_id ORDER BY score DESC, similar_event_id DESC
+            ) AS rank
+        FROM scored_pairs
+        WHERE score > 0
+    )
+
+    INSERT INTO event_similarities (event_id, similar_event_id, score)
+    SELECT event_id, similar_event_id, score
+    FROM ranked_pairs
+    WHERE rank <= {top_k}
+    ON CONFLICT (event_id, similar_event_id) DO UPDATE SET
+        score = EXCLUDED.score,
+        updated_at = now()
+"""
+
+# Keep only the top-K of the lists the refreshed event was just added to
+_PRUNE_EVENT_SIMILARITIES = """
+    DELETE FROM event_similarities es
+    USING (
+        SELECT
+            id,
+            row_number() OVER (
+                PARTITION BY event_id ORDER BY score DESC, similar_event_id DESC
+            ) AS rank
+        FROM event_similarities
+        WHERE event_id IN (
+            SELECT event_id FROM event_similarities WHERE similar_event_id = :event_id
+        )
+    ) ranked
+    WHERE es.id = ranked.id AND ranked.rank > {top_k}
+"""
+
+
+async def _lock_event_similarities(db: AsyncSession):
+    # A pair of events is written by the refreshes of both of them: they wait
+    # for each other until commit (instead of deadlocking on the pair rows)
+    await db.exec(
+        select(func.pg_advisory_xact_lock(func.hashtext("event_similarities")))
+    )
+
+
+def _insert_event_similarities(pair_filter: str):
+    return text(
+        _INSERT_EVENT_SIMILARITIES.format(
+            pair_filter=pair_filter,
+            target_code_weight=TARGET_CODE_WEIGHT,
+            tag_weight=TAG_WEIGHT,
+            top_k=settings.EVENT_SIMILARITY_TOP_K,
+        )
+    )
+
+
+async def refresh_event_similarities(db: AsyncSession, event_id: int):
+    """
+    Recompute the similar events of one event and its place in the similar
+    events of the others, after a change of its status, target or tags.
+
+    Events which lose this event from their list are not backfilled until the
+    next rebuild. Runs in the caller's transaction (pending changes are flushed
+    first), so call it before the caller commits.
+    """
+    await db.flush()
+    await _lock_event_similarities(db)
+    await db.exec(
+        delete(EventSimilarity).where(
+            or_(
+                EventSimilarity.event_id == event_id,
+                EventSimilarity.similar_event_id == event_id,
+            )
+        )
+    )
+
+    params = {"event_id": event_id}
+    await db.exec(_insert_event_similarities("s.id = :event_id"), params=params)
+    await db.exec(_insert_event_similarities("c.id = :event_id"), params=params)
+    await db.exec(
+        text(_PRUNE_EVENT_SIMILARITIES.format(top_k=settings.EVENT_SIMILARITY_TOP_K)),
+        params=params,
+    )
+
+
+async def rebuild_event_similarities(db: AsyncSession):
+    """Recompute the similar events of every public event (batch rebuild)."""
+    try:
+        await _lock_event_similarities(db)
+        await db.exec(delete(EventSimilarity))
+        await db.exec(_insert_event_similarities("TRUE"))
+        await db.commit()
+
+    except Exception as e:
+        await db.rollback()
+        raise e
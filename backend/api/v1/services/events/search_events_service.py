@@ -1,31 +1,47 @@
 from datetime import datetime
 
 import pytz
-from sqlmodel import Date, Session, and_, asc, case, desc, func, or_, select
+from sqlmodel import Date, and_, case, exists, func, or_, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from backend.api.v1.services.events.event_keyword_search_service import (
+    build_keyword_search,
+)
 from backend.core.constants import (
     EventSortByCode,
     EventStatusCode,
     TagAssociationEntityCode,
 )
-from backend.models.application import Application
 from backend.models.bookmark import Bookmark
 from backend.models.event import Event
+from backend.models.event_stats import EventStats
 from backend.models.organization import Organization
 from backend.models.tag import Tag
 from backend.models.tag_association import TagAssociation
 from backend.models.target import Target
-from backend.models.ticket_inventory import TicketInventory
 from backend.models.user import User
 from backend.schemas.event import SearchEventsQueryParams
+from backend.utils.pagination import (
+    SortKey,
+    decode_cursor,
+    keyset_filter,
+    keyset_order_by,
+    paginate_by_keyset,
+    should_count_total,
+)
 
 
 async def search_events(
-    db: Session,
+    db: AsyncSession,
     user: User | None,
     query_params: SearchEventsQueryParams,
 ):
     filters = _build_filters_sort(query_params)
+    keyword_condition, rank = await build_keyword_search(
+        db, query_params.keyword, query_params.search_mode
+    )
+    if keyword_condition is not None:
+        filters["conditions"].append(keyword_condition)
 
     EventTag = (
         select(
@@ -44,16 +60,6 @@ async def search_events(
         .cte()
     )
 
-    SoldTicketsNumber = (
-        select(
-            TicketInventory.event_id,
-            func.sum(TicketInventory.sold_quantity).label("sold_tickets_number"),
-        )
-        .select_from(TicketInventory)
-        .group_by(TicketInventory.event_id)
-        .cte()
-    )
-
     query = (
         select(
             Event.id,
@@ -73,20 +79,12 @@ async def search_events(
             Event.meeting_tool_code,
             Event.published_at,
             EventTag.c.tags,
-            SoldTicketsNumber.c.sold_tickets_number,
+            EventStats.sold_tickets_number,
         )
         .join(Organization, Event.organization_id == Organization.id)
         .outerjoin(Target, Event.target_id == Target.id)
-        .outerjoin(Application, Application.event_id == Event.id)
-        .outerjoin(
-            TagAssociation,
-            and_(
-                TagAssociation.entity_id == Event.id,
-                TagAssociation.entity_code == TagAssociationEntityCode.EVENT,
-            ),
-        )
         .outerjoin(EventTag, Event.id == EventTag.c.event_id)
-        .outerjoin(SoldTicketsNumber, Event.id == SoldTicketsNumber.c.event_id)
+        .outerjoin(EventStats, Event.id == EventStats.event_id)
     )
 
     if user:
@@ -101,43 +99,59 @@ async def search_events(
         ).outerjoin(
             Bookmark, and_(Event.id == Bookmark.event_id, Bookmark.user_id == user.id)
         )
-    query = (
-        query.where(and_(*filters["conditions"]))
-        .order_by(
-            asc(filters["sort_by"])
-            if query_params.sort_by == EventSortByCode.APPLICATION_END_AT
-            else desc(filters["sort_by"])
+    sort_keys = _build_sort_keys(query_params, filters["sort_by"], rank)
+    if rank is not None:
+        query = query.add_columns(rank.label("search_rank"))
+
+    query = query.where(and_(*filters["conditions"]))
+    if query_params.cursor:
+        query = query.where(
+            keyset_filter(
+                sort_keys,
+                decode_cursor(query_params.cursor, query_params.sort_by, sort_keys),
+            )
         )
-        .limit(query_params.per_page)
-        .offset((query_params.page - 1) * query_params.per_page)
+    else:
+        query = query.offset((query_params.page - 1) * query_params.per_page)
+
+    query = query.order_by(*keyset_order_by(sort_keys)).limit(query_params.per_page + 1)
+
+    events = [dict(event) for event in (await db.exec(query)).mappings().all()]
+    events, next_cursor = paginate_by_keyset(
+        events, query_params.per_page, query_params.sort_by, sort_keys
     )
 
-    events = db.exec(query).mappings().all()
+    total = (
+        await count_events(db, filters) if should_count_total(query_params) else None
+    )
+    return events, total, next_cursor
+
+
+def _build_sort_keys(query_params: SearchEventsQueryParams, sort_by, rank):
+    if query_params.sort_by == EventSortByCode.APPLICATION_END_AT:
+        return [SortKey(sort_by, "application_end_at"), SortKey(Event.id, "id")]
 
-    result = {event.id: dict(event) for event in events}
+    sort_keys = [
+        SortKey(sort_by, sort_by.key, descending=True),
+        SortKey(Event.id, "id", descending=True),
+    ]
+    if query_params.sort_by == EventSortByCode.RELEVANCE and rank is not None:
+        sort_keys.insert(0, SortKey(rank, "search_rank", descending=True))
 
-    total = count_events(db, filters)
-    return list(result.values()), total
+    return sort_keys
 
 
-def count_events(
-    db: Session,
+async def count_events(
+    db: AsyncSession,
     filters: list,
 ):
     query = (
-        select(func.count(Event.id.distinct()))
+        select(func.count(Event.id))
         .join(Organization, Event.organization_id == Organization.id)
-        .join(Target, Event.target_id == Target.id)
-        .outerjoin(
-            TagAssociation,
-            and_(
-                Event.id == TagAssociation.entity_id,
-                TagAssociation.entity_code == TagAssociationEntityCode.EVENT,
-            ),
-        )
+        .outerjoin(Target, Event.target_id == Target.id)
         .where(and_(*filters["conditions"]))
     )
-    total = db.scalars(query).one()
+    total = (await db.scalars(query)).one()
 
     return total
 
@@ -149,9 +163,6 @@ def _build_filters_sort(query_params: SearchEventsQueryParams):
     ]
     sort_by = Event.published_at
 
-    if query_params.keyword:
-        filters.append(Event.name.contains(query_params.keyword))
-
     if query_params.is_online is True and query_params.is_offline is False:
         filters.append(Event.is_online == query_params.is_online)
 
@@ -194,7 +205,13 @@ def _build_filters_sort(query_params: SearchEventsQueryParams):
         filters.append(Event.organize_city_code.in_(query_params.city_codes))
 
     if query_params.tags:
-        filters.append(TagAssociation.tag_id.in_(query_params.tags))
+        filters.append(
+            exists().where(
+                TagAssociation.entity_id == Event.id,
+                TagAssociation.entity_code == TagAssociationEntityCode.EVENT,
+                TagAssociation.tag_id.in_(query_params.tags),
+            )
+        )
 
     if query_params.start_at_from:
         filters.append(Event.start_at.cast(Date) >= query_params.start_at_from.date())
@@ -205,7 +222,10 @@ def _build_filters_sort(query_params: SearchEventsQueryParams):
     if query_params.organization_id:
         filters.append(Event.organization_id == query_params.organization_id)
 
-    if query_params.sort_by == EventSortByCode.PUBLISHED_AT:
+    if query_params.sort_by in (
+        EventSortByCode.PUBLISHED_AT,
+        EventSortByCode.RELEVANCE,
+    ):
         filters.append(Event.end_at > datetime.now(pytz.utc))
 
     if query_params.sort_by == EventSortByCode.START_AT:
@@ -0,0 +1,15 @@
+from .create_export_job_service import create_export_job
+from .expire_export_artifacts_service import (
+    expire_export_artifacts,
+    run_export_artifacts_sweeper,
+)
+from .get_export_job_service import get_export_job
+from .run_export_job_service import run_export_job
+
+all = (
+    create_export_job,
+    get_export_job,
+    run_export_job,
+    expire_export_artifacts,
+    run_export_artifacts_sweeper,
+)
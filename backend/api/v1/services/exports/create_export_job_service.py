@@ -0,0 +1,83 @@
+import hashlib
+import json
+
+from sqlmodel import and_, func, or_, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import backend.api.v1.services.jobs as jobs_service
+from backend.api.v1.services.exports.run_export_job_service import RUN_EXPORT_JOB
+from backend.core.constants import ExportJobStatusCode
+from backend.models.export_job import ExportJob
+from backend.models.user import User
+from backend.schemas.organization import CreateExportJobRequest
+from backend.utils.database import save
+
+
+async def create_export_job(
+    db: AsyncSession, organizer: User, request: CreateExportJobRequest
+) -> ExportJob:
+    """
+    Queue an export, or return the pending, running or unexpired one of an
+    identical request.
+    """
+    params = request.model_dump(
+        mode="json", exclude={"kind", "format", "gzip"}, exclude_none=True
+    )
+    fingerprint = hashlib.sha256(
+        json.dumps(
+            {
+                "organization_id": organizer.organization_id,
+                "user_id": organizer.id,
+                "kind": request.kind,
+                "format": request.format,
+                "gzip": request.gzip,
+                "params": params,
+            },
+            sort_keys=True,
+        ).encode()
+    ).hexdigest()
+
+    try:
+        # Identical requests wait for each other until commit
+        await db.exec(select(func.pg_advisory_xact_lock(func.hashtext(fingerprint))))
+
+        export_job = (
+            await db.exec(
+                select(ExportJob)
+                .where(
+                    ExportJob.fingerprint == fingerprint,
+                    or_(
+                        ExportJob.status.in_(
+                            [ExportJobStatusCode.PENDING, ExportJobStatusCode.RUNNING]
+                        ),
+                        and_(
+                            ExportJob.status == ExportJobStatusCode.DONE,
+                            ExportJob.expired_at > func.now(),
+                        ),
+                    ),
+                )
+                .order_by(ExportJob.id.desc())
+            )
+        ).first()
+        if export_job:
+            await db.commit()
+            return export_job
+
+        export_job = ExportJob(
+            organization_id=organizer.organization_id,
+            kind=request.kind,
+            format=request.format,
+            gzip=request.gzip,
+            params=params,
+            fingerprint=fingerprint,
+            created_by=organizer.id,
+        )
+        db.add(export_job)
+        await db.flush()
+
+        jobs_service.enqueue_job(db, RUN_EXPORT_JOB, {"export_job_id": export_job.id})
+        return await save(db, export_job)
+
+    except Exception as e:
+        await db.rollback()
+        raise e
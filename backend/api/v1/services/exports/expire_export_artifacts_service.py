@@ -0,0 +1,45 @@
+import asyncio
+
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core.artifact_store import artifact_store
+from backend.core.config import logger, settings
+from backend.core.constants import ExportJobStatusCode
+from backend.db.database import MasterDBSession
+from backend.models.export_job import ExportJob
+
+
+async def expire_export_artifacts(db: AsyncSession) -> int:
+    """Delete the files of the exports past their TTL. Returns their number."""
+    export_jobs = (
+        await db.exec(
+            select(ExportJob)
+            .where(
+                ExportJob.status == ExportJobStatusCode.DONE,
+                ExportJob.expired_at <= func.now(),
+            )
+            .with_for_update(skip_locked=True)
+        )
+    ).all()
+
+    for export_job in export_jobs:
+        await artifact_store.delete(export_job.artifact_key)
+        export_job.status = ExportJobStatusCode.EXPIRED
+        db.add(export_job)
+    await db.commit()
+
+    return len(export_jobs)
+
+
+async def run_export_artifacts_sweeper():
+    """Expire the export files every EXPORT_SWEEP_INTERVAL_SECONDS until cancelled."""
+    while True:
+        await asyncio.sleep(settings.EXPORT_SWEEP_INTERVAL_SECONDS)
+        try:
+            async with MasterDBSession() as db:
+                expired = await expire_export_artifacts(db)
+            if expired:
+                logger.info(f"Expired {expired} export files.")
+        except Exception as e:
+            logger.error(f"Failed to expire export files: {e}")
@@ -0,0 +1,26 @@
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core.error_code import ErrorCode, ErrorMessage
+from backend.core.exception import BadRequestException
+from backend.models.export_job import ExportJob
+from backend.models.user import User
+
+
+async def get_export_job(
+    db: AsyncSession, organizer: User, export_job_id: int
+) -> ExportJob:
+    export_job = (
+        await db.exec(
+            select(ExportJob).where(
+                ExportJob.id == export_job_id,
+                ExportJob.organization_id == organizer.organization_id,
+            )
+        )
+    ).first()
+    if not export_job:
+        raise BadRequestException(
+            ErrorCode.ERR_EXPORT_JOB_NOT_FOUND, ErrorMessage.ERR_EXPORT_JOB_NOT_FOUND
+        )
+
+    return export_job
@@ -0,0 +1,214 @@
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Mapping
+
+import pytz
+from sqlmodel import func, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.api.v1.services.organizations.export_attendees_service import (
+    EXPORT_FETCH_SIZE,
+    _export_attendees_query,
+    attendee_export_headers,
+)
+from backend.core.artifact_store import artifact_store
+from backend.core.config import logger, settings
+from backend.core.constants import ExportJobStatusCode, ExportKindCode
+from backend.core.jobs import job_handler
+from backend.db.database import MasterDBSession, read_db_session
+from backend.models.answer import Answer
+from backend.models.application import Application
+from backend.models.event import Event
+from backend.models.export_job import ExportJob
+from backend.models.question import Question
+from backend.models.survey_response_result import SurveyResponseResult
+from backend.models.transaction import Transaction
+from backend.schemas.organization import DownloadAttendeesRequest
+from backend.utils.export import export_file_info, iter_export
+
+RUN_EXPORT_JOB = "run_export"
+
+survey_response_export_headers = {
+    "id": "Response ID",
+    "event_id": "Event ID",
+    "event_name": "Event Name",
+    "application_id": "Application ID",
+    "email": "Email",
+    "question": "Question",
+    "answers": "Answers",
+    "answer_text": "Answer Text",
+    "responded_at": "Responded At",
+}
+
+transaction_export_headers = {
+    "id": "Transaction ID",
+    "event_id": "Event ID",
+    "event_name": "Event Name",
+    "application_id": "Application ID",
+    "email": "Email",
+    "quantity": "Quantity",
+    "total_amount": "Total Amount",
+    "status": "Status",
+    "stripe_payment_intent_id": "Stripe Payment Intent ID",
+    "created_at": "Created At",
+}
+
+
+def _survey_responses_query(export_job: ExportJob):
+    answers = (
+        select(func.string_agg(Answer.answer, ", "))
+        .where(Answer.id == func.any(SurveyResponseResult.answers_ids))
+        .scalar_subquery()
+    )
+    query = (
+        select(
+            SurveyResponseResult.id,
+            Event.id.label("event_id"),
+            Event.name.label("event_name"),
+            SurveyResponseResult.application_id,
+            SurveyResponseResult.email,
+            Question.question,
+            answers.label("answers"),
+            SurveyResponseResult.answer_text,
+            SurveyResponseResult.created_at.label("responded_at"),
+        )
+        .join(Event, Event.id == SurveyResponseResult.event_id)
+        .join(Question, Question.id == SurveyResponseResult.question_id)
+        .where(Event.organization_id == export_job.organization_id)
+        .order_by(SurveyResponseResult.id)
+    )
+    if event_id := export_job.params.get("event_id"):
+        query = query.where(Event.id == event_id)
+
+    return query
+
+
+def _transactions_query(export_job: ExportJob):
+    query = (
+        select(
+            Transaction.id,
+            Event.id.label("event_id"),
+            Event.name.label("event_name"),
+            Transaction.application_id,
+            Application.email,
+            Transaction.quantity,
+            Transaction.total_amount,
+            Transaction.status,
+            Transaction.stripe_payment_intent_id,
+            Transaction.created_at,
+        )
+        .join(Event, Event.id == Transaction.event_id)
+        .join(Application, Application.id == Transaction.application_id)
+        .where(Event.organization_id == export_job.organization_id)
+        .order_by(Transaction.id)
+    )
+    if event_id := export_job.params.get("event_id"):
+        query = query.where(Event.id == event_id)
+
+    return query
+
+
+def _export_source(export_job: ExportJob):
+    """Headers and query of the rows of an export."""
+    if export_job.kind == ExportKindCode.ATTENDEES:
+        return attendee_export_headers, _export_attendees_query(
+            export_job.organization_id, DownloadAttendeesRequest(**export_job.params)
+        )
+    if export_job.kind == ExportKindCode.SURVEY_RESPONSES:
+        return survey_response_export_headers, _survey_responses_query(export_job)
+
+    return transaction_export_headers, _transactions_query(export_job)
+
+
+async def _update_export_job(export_job_id: int, **values):
+    async with MasterDBSession() as db:
+        await db.exec(
+            update(ExportJob).where(ExportJob.id == export_job_id).values(**values)
+        )
+        await db.commit()
+
+
+async def _stream_rows(
+    export_job_id: int, query, progress: dict[str, int]
+) -> AsyncIterator[Mapping[str, Any]]:
+    """Rows through a server-side cursor, saving the progress of the export."""
+    async with read_db_session() as db:
+        total_rows = (
+            await db.exec(
+                select(func.count()).select_from(query.order_by(None).subquery())
+            )
+        ).one()
+        await _update_export_job(export_job_id, total_rows=total_rows)
+
+        result = await db.stream(query.execution_options(yield_per=EXPORT_FETCH_SIZE))
+        async for row in result.mappings():
+            yield row
+            progress["rows"] += 1
+            if progress["rows"] % settings.EXPORT_PROGRESS_INTERVAL_ROWS == 0:
+                await _update_export_job(export_job_id, processed_rows=progress["rows"])
+
+
+async def run_export_job(export_job_id: int):
+    """
+    Write an export to the artifact store, chunk by chunk. A failed export is
+    FAILED (not retried), identical requests then start a new one.
+    """
+    async with MasterDBSession() as db:
+        export_job = await db.get(ExportJob, export_job_id)
+        if not export_job or export_job.status not in (
+            ExportJobStatusCode.PENDING,
+            # Interrupted by a stopped worker
+            ExportJobStatusCode.RUNNING,
+        ):
+            return
+
+        headers, query = _export_source(export_job)
+
+        export_job.status = ExportJobStatusCode.RUNNING
+        export_job.processed_rows = 0
+        db.add(export_job)
+        await db.commit()
+
+    filename, _ = export_file_info(
+        export_job.kind.value.lower(), export_job.format, export_job.gzip
+    )
+    artifact_key = f"{export_job.organization_id}/{export_job.id}/{filename}"
+    progress = {"rows": 0}
+    try:
+        size = await artifact_store.write(
+            artifact_key,
+            iter_export(
+                headers,
+                _stream_rows(export_job.id, query, progress),
+                export_job.format,
+                export_job.gzip,
+            ),
+        )
+    except Exception as e:
+        logger.error(f"Export {export_job.id} failed: {e!r}")
+        await _update_export_job(
+            export_job.id,
+            status=ExportJobStatusCode.FAILED,
+            error=repr(e),
+            processed_rows=progress["rows"],
+            finished_at=datetime.now(pytz.utc),
+        )
+        return
+
+    finished_at = datetime.now(pytz.utc)
+    await _update_export_job(
+        export_job.id,
+        status=ExportJobStatusCode.DONE,
+        processed_rows=progress["rows"],
+        artifact_key=artifact_key,
+        size_bytes=size,
+        finished_at=finished_at,
+        expired_at=finished_at
+        + timedelta(seconds=settings.EXPORT_ARTIFACT_TTL_SECONDS),
+    )
+
+
+@job_handler(RUN_EXPORT_JOB)
+async def run_export_job_handler(db: AsyncSession, export_job_id: int):
+    # Progress is committed in sessions of its own, the job's transaction only
+    # holds the claim of the job
+    await run_export_job(export_job_id)
@@ -0,0 +1,10 @@
+from .enqueue_job_service import enqueue_job
+from .get_job_metrics_service import get_job_metrics
+from .run_job_worker_service import process_next_job, run_job_worker
+
+all = (
+    enqueue_job,
+    get_job_metrics,
+    process_next_job,
+    run_job_worker,
+)
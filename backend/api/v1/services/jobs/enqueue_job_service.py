@@ -0,0 +1,31 @@
+from datetime import datetime
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core.config import settings
+from backend.models.job import Job
+
+
+def enqueue_job(
+    db: AsyncSession,
+    name: str,
+    payload: dict[str, Any],
+    run_at: datetime | None = None,
+    max_attempts: int | None = None,
+) -> Job:
+    """
+    Add a job to the session. It is committed (or rolled back) with the
+    caller's transaction, so it only runs if the change triggering it is saved.
+    """
+    job = Job(
+        name=name,
+        payload=jsonable_encoder(payload),
+        max_attempts=max_attempts or settings.JOB_MAX_ATTEMPTS,
+    )
+    if run_at:
+        job.run_at = run_at
+    db.add(job)
+
+    return job
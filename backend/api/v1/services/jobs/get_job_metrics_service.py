@@ -0,0 +1,63 @@
+from datetime import timedelta
+
+from sqlmodel import case, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core.constants import JobStatusCode
+from backend.models.job import Job
+
+# Window of the finished jobs counted in the metrics
+JOB_METRICS_WINDOW = timedelta(hours=1)
+
+
+async def get_job_metrics(db: AsyncSession) -> dict[str, dict]:
+    """
+    Per job name: the pending jobs (and how many are due, the age of the oldest
+    one), then over the last hour the done and dead jobs, the retries and the
+    average latency from enqueue to completion.
+    """
+    pending = Job.status == JobStatusCode.PENDING
+    recent = Job.finished_at >= func.now() - JOB_METRICS_WINDOW
+    result = await db.exec(
+        select(
+            Job.name,
+            func.count().filter(pending),
+            func.count().filter(pending, Job.run_at <= func.now()),
+            func.extract(
+                "epoch", func.now() - func.min(case((pending, Job.created_at)))
+            ),
+            func.count().filter(recent, Job.status == JobStatusCode.DONE),
+            func.count().filter(recent, Job.status == JobStatusCode.DEAD),
+            func.coalesce(func.sum(Job.attempts - 1).filter(recent), 0),
+            func.extract(
+                "epoch",
+                func.avg(Job.finished_at - Job.created_at).filter(
+                    recent, Job.status == JobStatusCode.DONE
+                ),
+            ),
+        )
+        .where(pending | recent)
+        .group_by(Job.name)
+    )
+
+    return {
+        name: {
+            "pending": pending_count,
+            "due": due_count,
+            "oldest_pending_age_seconds": oldest_age,
+            "done_last_hour": done_count,
+            "dead_last_hour": dead_count,
+            "retries_last_hour": retries,
+            "avg_latency_seconds_last_hour": avg_latency,
+        }
+        for (
+            name,
+            pending_count,
+            due_count,
+            oldest_age,
+            done_count,
+            dead_count,
+            retries,
+            avg_latency,
+        ) in result.all()
+    }
@@ -0,0 +1,83 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytz
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core.config import logger, settings
+from backend.core.constants import JobStatusCode
+from backend.core.jobs import run_job_handler
+from backend.db.database import MasterDBSession
+from backend.models.job import Job
+
+
+async def process_next_job(db: AsyncSession) -> bool:
+    """
+    Claim the next due job, run it and commit. Returns False if no job is due.
+    Failures are retried with exponential backoff until `max_attempts`.
+    """
+    job = (
+        await db.exec(
+            select(Job)
+            .where(Job.status == JobStatusCode.PENDING, Job.run_at <= func.now())
+            .order_by(Job.run_at, Job.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+    ).first()
+
+    if not job:
+        await db.rollback()
+        return False
+
+    job.attempts += 1
+    job.started_at = datetime.now(pytz.utc)
+    try:
+        async with db.begin_nested():
+            await run_job_handler(db, job.name, job.payload)
+        job.status = JobStatusCode.DONE
+        job.finished_at = datetime.now(pytz.utc)
+
+    except Exception as e:
+        job.last_error = repr(e)
+
+        if job.attempts >= job.max_attempts:
+            logger.error(f"Job {job.id} ({job.name}) dead after {job.attempts}: {e!r}")
+            job.status = JobStatusCode.DEAD
+            job.finished_at = datetime.now(pytz.utc)
+        else:
+            delay = min(
+                settings.JOB_RETRY_BASE_SECONDS * 2 ** (job.attempts - 1),
+                settings.JOB_RETRY_MAX_SECONDS,
+            )
+            logger.warning(
+                f"Job {job.id} ({job.name}) failed (attempt {job.attempts}), "
+                f"retry in {delay:.0f}s: {e!r}"
+            )
+            job.run_at = datetime.now(pytz.utc) + timedelta(seconds=delay)
+
+    db.add(job)
+    await db.commit()
+
+    return True
+
+
+async def run_job_worker(concurrency: int | None = None):
+    """Run the queued jobs with `concurrency` consumers, forever."""
+
+    async def consume():
+        while True:
+            try:
+                async with MasterDBSession() as db:
+                    processed = await process_next_job(db)
+            except Exception as e:
+                logger.error(f"Job worker error: {e!r}")
+                processed = False
+
+            if not processed:
+                await asyncio.sleep(settings.JOB_POLL_INTERVAL_SECONDS)
+
+    await asyncio.gather(
+        *(consume() for _ in range(concurrency or settings.JOB_WORKER_CONCURRENCY))
+    )
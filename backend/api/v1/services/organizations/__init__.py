@@ -1,7 +1,9 @@
-from .download_attendees_csv_service import download_attendees_csv
+from .export_attendees_service import export_attendees
 from .follow_organization_service import follow_organization
 from .get_attendee_detail_service import get_attendee_detail
+from .get_organization_analytics_service import get_organization_analytics
 from .get_organization_detail_service import get_organization_detail
+from .get_organization_id_service import get_organization_id
 from .listing_attendees_service import listing_attendees
 from .listing_random_organizations_service import listing_random_organizations
 from .unfollow_organization_service import unfollow_organization
@@ -11,7 +13,9 @@ all = (
     follow_organization,
     unfollow_organization,
     listing_attendees,
-    download_attendees_csv,
+    export_attendees,
     get_attendee_detail,
     get_organization_detail,
+    get_organization_id,
+    get_organization_analytics,
 )
@@ -1,5 +1,9 @@
-from sqlmodel import Session, exists
+from sqlmodel import exists
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+import backend.api.v1.services.stats as stats_service
+from backend.core.cache import organization_tag, response_cache
+from backend.core.conditional import touch_resources
 from backend.core.constants import FollowEntityCode
 from backend.core.error_code import ErrorCode, ErrorMessage
 from backend.core.exception import BadRequestException
@@ -7,8 +11,10 @@ from backend.models import User
 from backend.models.follow import Follow
 
 
-async def follow_organization(db: Session, current_user: User, organization_id: int):
-    follow = db.scalar(
+async def follow_organization(
+    db: AsyncSession, current_user: User, organization_id: int
+):
+    follow = await db.scalar(
         exists()
         .where(
             Follow.follower_id == current_user.id,
@@ -30,10 +36,15 @@ async def follow_organization(db: Session, current_user: User, organization_id:
             entity_code=FollowEntityCode.ORGANIZATION,
         )
         db.add(follow)
-        db.commit()
+        await stats_service.increment_organization_stats(
+            db, organization_id, follower_number=1
+        )
+        await touch_resources(db, organization_tag(organization_id))
+        await db.commit()
+        await response_cache.invalidate(organization_tag(organization_id))
 
         return follow.id
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise e
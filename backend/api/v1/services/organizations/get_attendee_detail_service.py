@@ -1,4 +1,5 @@
-from sqlmodel import Session, and_, case, func, select
+from sqlmodel import and_, case, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.core.constants import FollowEntityCode
 from backend.core.error_code import ErrorCode, ErrorMessage
@@ -17,7 +18,7 @@ from backend.models.transaction_item import TransactionItem
 from backend.models.user import User
 
 
-async def get_attendee_detail(db: Session, organizer: User, attendee_id: int):
+async def get_attendee_detail(db: AsyncSession, organizer: User, attendee_id: int):
     query = (
         select(
             User.id,
@@ -50,7 +51,7 @@ async def get_attendee_detail(db: Session, organizer: User, attendee_id: int):
         .group_by(User.id)
     )
 
-    attendee = db.exec(query).mappings().one_or_none()
+    attendee = (await db.exec(query)).mappings().one_or_none()
 
     if not attendee:
         raise BadRequestException(
@@ -63,7 +64,7 @@ async def get_attendee_detail(db: Session, organizer: User, attendee_id: int):
     return attendee
 
 
-async def _get_applied_events(db: Session, attendee_id: int):
+async def _get_applied_events(db: AsyncSession, attendee_id: int):
     AnswersAgg = (
         select(
             SurveyResponseResult.id.label("srr_id"),
@@ -72,6 +73,9 @@ async def _get_applied_events(db: Session, attendee_id: int):
         .join(
             Answer, Answer.id == func.any(SurveyResponseResult.answers_ids)
         )  # Using `ANY` for array matching
+        # Only the attendee's responses, not every response of every survey
+        .join(Application, Application.id == SurveyResponseResult.application_id)
+        .where(Application.user_id == attendee_id)
         .group_by(SurveyResponseResult.id)
         .subquery()
     )
@@ -102,46 +106,43 @@ async def _get_applied_events(db: Session, attendee_id: int):
         .subquery()
     )
 
-    transaction_histories = (
-        db.exec(
-            select(
-                func.max(Application.event_id).label("event_id"),
-                Transaction.id,
-                Transaction.status.label("transaction_status"),
-                Transaction.total_amount,
-                Transaction.created_at.label("purchased_at"),
-                Transaction.quantity,
-                func.json_agg(
-                    func.json_build_object(
-                        "id",
-                        TransactionItem.id,
-                        "ticket_name",
-                        Ticket.name,
-                        "ticket_id",
-                        Ticket.id,
-                        "ticket_price",
-                        Ticket.price,
-                        "ticket_type",
-                        Ticket.type,
-                        "event_access_link_url",
-                        Ticket.access_link_url,
-                        "amount",
-                        TransactionItem.amount,
-                        "note",
-                        TransactionItem.note,
-                    )
-                ).label("ticket_transaction_items"),
-            )
-            .select_from(Transaction)
-            .join(Application, Application.id == Transaction.application_id)
-            .join(TransactionItem, TransactionItem.transaction_id == Transaction.id)
-            .join(Ticket, Ticket.id == TransactionItem.ticket_id)
-            .where(Application.user_id == attendee_id)
-            .group_by(Transaction.id)
+    result = await db.exec(
+        select(
+            func.max(Application.event_id).label("event_id"),
+            Transaction.id,
+            Transaction.status.label("transaction_status"),
+            Transaction.total_amount,
+            Transaction.created_at.label("purchased_at"),
+            Transaction.quantity,
+            func.json_agg(
+                func.json_build_object(
+                    "id",
+                    TransactionItem.id,
+                    "ticket_name",
+                    Ticket.name,
+                    "ticket_id",
+                    Ticket.id,
+                    "ticket_price",
+                    Ticket.price,
+                    "ticket_type",
+                    Ticket.type,
+                    "event_access_link_url",
+                    Ticket.access_link_url,
+                    "amount",
+                    TransactionItem.amount,
+                    "note",
+                    TransactionItem.note,
+                )
+            ).label("ticket_transaction_items"),
         )
-        .mappings()
-        .all()
+        .select_from(Transaction)
+        .join(Application, Application.id == Transaction.application_id)
+        .join(TransactionItem, TransactionItem.transaction_id == Transaction.id)
+        .join(Ticket, Ticket.id == TransactionItem.ticket_id)
+        .where(Application.user_id == attendee_id)
+        .group_by(Transaction.id)
     )
+    transaction_histories = result.mappings().all()
 
     query = (
         select(
@@ -160,7 +161,7 @@ async def _get_applied_events(db: Session, attendee_id: int):
             case(
                 (
                     AttendeeSurveyResponseResult.c.survey_response_results.is_(None),
-                    [],
+                    func.json_build_array(),
                 ),
                 else_=AttendeeSurveyResponseResult.c.survey_response_results,
             ).label("survey_response_results"),
@@ -178,7 +179,7 @@ async def _get_applied_events(db: Session, attendee_id: int):
         .order_by(Application.created_at.desc())
     )
 
-    applied_events = db.exec(query).mappings().all()
+    applied_events = (await db.exec(query)).mappings().all()
     applied_events = [dict(event) for event in applied_events]
     for event in applied_events:
         event["transaction_histories"] = [
@@ -0,0 +1,32 @@
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.api.v1.services.events.get_event_analytics_service import (
+    _analytics_range,
+    _listing_analytics_buckets,
+)
+from backend.models.event_analytics import OrganizationAnalytics
+from backend.models.user import User
+from backend.schemas.analytics import AnalyticsQueryParams, AnalyticsResponse
+
+
+async def get_organization_analytics(
+    db: AsyncSession, organizer: User, query_params: AnalyticsQueryParams
+) -> AnalyticsResponse:
+    """Analytics of all the events of the organizer's organization."""
+    from_at, to_at = _analytics_range(query_params)
+    buckets, totals = await _listing_analytics_buckets(
+        db,
+        OrganizationAnalytics,
+        [OrganizationAnalytics.organization_id == organizer.organization_id],
+        query_params.period,
+        from_at,
+        to_at,
+    )
+
+    return AnalyticsResponse(
+        period=query_params.period,
+        from_at=from_at,
+        to_at=to_at,
+        buckets=buckets,
+        totals=totals,
+    )
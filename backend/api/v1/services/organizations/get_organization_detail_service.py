@@ -1,18 +1,19 @@
-from sqlmodel import Session, and_, distinct, func, literal, select
+from sqlmodel import and_, exists, func, literal, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 import backend.api.v1.services.events as events_service
 from backend.core.constants import FollowEntityCode, TagAssociationEntityCode
 from backend.core.error_code import ErrorCode, ErrorMessage
-from backend.models.event import Event
 from backend.models.follow import Follow
 from backend.models.organization import Organization
+from backend.models.organization_stats import OrganizationStats
 from backend.models.tag import Tag
 from backend.models.tag_association import TagAssociation
 from backend.models.user import User
 from backend.schemas.event import SearchEventsQueryParams
 
 
-async def get_organization_detail(db: Session, user: User, organization_slug: str):
+async def get_organization_detail(db: AsyncSession, user: User, organization_slug: str):
     OrganizationTag = (
         select(
             Organization.id,
@@ -33,66 +34,42 @@ async def get_organization_detail(db: Session, user: User, organization_slug: st
         .subquery()
     )
 
-    OrganizationEventFollowCount = (
-        select(
-            Organization.id,
-            func.count(distinct(Event.id)).label("event_number"),
-            func.count(distinct(Follow.follower_id)).label("follower_number"),
-        )
-        .select_from(Organization)
-        .outerjoin(Event, Event.organization_id == Organization.id)
-        .outerjoin(
-            Follow,
-            and_(
-                Follow.following_id == Organization.id,
-                Follow.entity_code == FollowEntityCode.ORGANIZATION,
-            ),
-        )
-        .where(Event.published_at.isnot(None))
-    )
-
     if user:
-        OrganizationEventFollowCount = OrganizationEventFollowCount.add_columns(
-            func.bool_or(Follow.follower_id == user.id).label("is_followed")
+        is_followed = exists().where(
+            Follow.following_id == Organization.id,
+            Follow.follower_id == user.id,
+            Follow.entity_code == FollowEntityCode.ORGANIZATION,
         )
     else:
-        OrganizationEventFollowCount = OrganizationEventFollowCount.add_columns(
-            literal("false").label("is_followed")
-        )
-
-    OrganizationEventFollowCount = OrganizationEventFollowCount.group_by(
-        Organization.id
-    ).subquery()
+        is_followed = literal("false")
 
-    organization = (
-        db.exec(
-            select(
-                Organization.id,
-                Organization.name,
-                Organization.description,
-                Organization.avatar_url,
-                Organization.hp_url,
-                Organization.city_code,
-                Organization.contact_email,
-                Organization.address,
-                Organization.phone,
-                Organization.contact_url,
-                Organization.facebook_url,
-                OrganizationTag.c.tags,
-                OrganizationEventFollowCount.c.event_number,
-                OrganizationEventFollowCount.c.follower_number,
-                OrganizationEventFollowCount.c.is_followed,
-            )
-            .outerjoin(OrganizationTag, OrganizationTag.c.id == Organization.id)
-            .outerjoin(
-                OrganizationEventFollowCount,
-                OrganizationEventFollowCount.c.id == Organization.id,
-            )
-            .where(Organization.slug == organization_slug)
+    result = await db.exec(
+        select(
+            Organization.id,
+            Organization.name,
+            Organization.description,
+            Organization.avatar_url,
+            Organization.hp_url,
+            Organization.city_code,
+            Organization.contact_email,
+            Organization.address,
+            Organization.phone,
+            Organization.contact_url,
+            Organization.facebook_url,
+            OrganizationTag.c.tags,
+            func.coalesce(OrganizationStats.event_number, 0).label("event_number"),
+            func.coalesce(OrganizationStats.follower_number, 0).label(
+                "follower_number"
+            ),
+            is_followed.label("is_followed"),
+        )
+        .outerjoin(OrganizationTag, OrganizationTag.c.id == Organization.id)
+        .outerjoin(
+            OrganizationStats, OrganizationStats.organization_id == Organization.id
         )
-        .mappings()
-        .one_or_none()
+        .where(Organization.slug == organization_slug)
     )
+    organization = result.mappings().one_or_none()
 
     if not organization:
         raise ValueError(
@@ -103,7 +80,7 @@ async def get_organization_detail(db: Session, user: User, organization_slug: st
     organization = dict(organization)
 
     query_params = SearchEventsQueryParams().create(organization_id=organization["id"])
-    events, total_public_events = await events_service.search_events(
+    events, total_public_events, _ = await events_service.search_events(
         db,
         user,
         query_params,
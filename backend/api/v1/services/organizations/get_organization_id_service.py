@@ -0,0 +1,11 @@
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.models.organization import Organization
+
+
+async def get_organization_id(db: AsyncSession, organization_slug: str) -> int | None:
+    result = await db.exec(
+        select(Organization.id).where(Organization.slug == organization_slug)
+    )
+    return result.first()
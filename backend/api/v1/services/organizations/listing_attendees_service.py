@@ -1,4 +1,5 @@
-from sqlmodel import Date, Session, String, and_, func, or_, select
+from sqlmodel import Date, String, and_, func, or_, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.core.constants import AttendeeSortByCode
 from backend.models.application import Application
@@ -7,19 +8,50 @@ from backend.models.event import Event
 from backend.models.transaction import Transaction
 from backend.models.user import User
 from backend.schemas.organization import ListingAttendeesQueryParams
+from backend.utils.pagination import (
+    SortKey,
+    decode_cursor,
+    keyset_filter,
+    keyset_order_by,
+    paginate_by_keyset,
+    should_count_total,
+)
 
 
 async def listing_attendees(
-    db: Session, organizer: User, query_params: ListingAttendeesQueryParams
+    db: AsyncSession, organizer: User, query_params: ListingAttendeesQueryParams
 ):
-    filters, sort_by = _build_filters_sort(organizer, query_params)
-    attendees = await _get_attendees(db, filters, sort_by, query_params)
-    total = await count_attendees(db, filters)
+    filters, sort_keys = _build_filters_sort(organizer.organization_id, query_params)
+    total = (
+        await count_attendees(db, filters) if should_count_total(query_params) else None
+    )
+
+    if query_params.cursor:
+        cursor_values = decode_cursor(
+            query_params.cursor, query_params.sort_by, sort_keys
+        )
+        attendees = await _get_attendees(
+            db,
+            [*filters, keyset_filter(sort_keys, cursor_values)],
+            sort_keys,
+            limit=query_params.per_page + 1,
+        )
+    else:
+        attendees = await _get_attendees(
+            db,
+            filters,
+            sort_keys,
+            limit=query_params.per_page + 1,
+            offset=query_params.per_page * (query_params.page - 1),
+        )
 
-    return attendees, total
+    attendees, next_cursor = paginate_by_keyset(
+        attendees, query_params.per_page, query_params.sort_by, sort_keys
+    )
+    return attendees, total, next_cursor
 
 
-async def count_attendees(db: Session, filters: list):
+async def count_attendees(db: AsyncSession, filters: list):
     query = (
         select(func.count(Application.id))
         .select_from(User)
@@ -28,20 +60,34 @@ async def count_attendees(db: Session, filters: list):
         .where(*filters)
     )
 
-    total = db.scalar(query) or 0
+    total = await db.scalar(query) or 0
     return total
 
 
 async def _get_attendees(
-    db: Session,
+    db: AsyncSession,
     filters: list,
-    sort_by: AttendeeSortByCode,
-    query_params: ListingAttendeesQueryParams,
+    sort_keys: list[SortKey],
+    limit: int | None = None,
+    offset: int | None = None,
 ):
-    query = (
+    query = _attendees_query(filters, sort_keys)
+
+    if limit:
+        query = query.limit(limit)
+    if offset:
+        query = query.offset(offset)
+
+    attendees = (await db.exec(query)).mappings().all()
+    return attendees
+
+
+def _attendees_query(filters: list, sort_keys: list[SortKey]):
+    return (
         select(
             User.id,
             func.concat(User.first_name, " ", User.last_name).label("user_name"),
+            User.first_name,
             Application.email,
             Event.id.label("event_id"),
             Event.name.label("event_name"),
@@ -67,21 +113,18 @@ async def _get_attendees(
             ),
         )
         .where(*filters)
-        .order_by(sort_by)
+        .order_by(*keyset_order_by(sort_keys))
     )
 
-    if query_params.per_page:
-        query = query.limit(query_params.per_page)
-    if query_params.page:
-        query = query.offset(query_params.per_page * (query_params.page - 1))
 
-    attendees = db.exec(query).mappings().all()
-    return attendees
-
-
-def _build_filters_sort(organizer: User, query_params: ListingAttendeesQueryParams):
-    filters = [Event.organization_id == organizer.id, User.deleted_at.is_(None)]
-    sort_by = Application.created_at.desc()
+def _build_filters_sort(
+    organization_id: int, query_params: ListingAttendeesQueryParams
+):
+    filters = [Event.organization_id == organization_id, User.deleted_at.is_(None)]
+    sort_keys = [
+        SortKey(Application.created_at, "applied_at", descending=True),
+        SortKey(Application.id, "application_id", descending=True),
+    ]
     if query_params.keyword:
         filters.append(
             or_(
@@ -115,6 +158,9 @@ def _build_filters_sort(organizer: User, query_params: ListingAttendeesQueryPara
         filters.append(Application.industry_code == query_params.industry_code)
 
     if query_params.sort_by == AttendeeSortByCode.NAME:
-        sort_by = User.first_name.asc()
+        sort_keys = [
+            SortKey(User.first_name, "first_name"),
+            SortKey(Application.id, "application_id"),
+        ]
 
-    return filters, sort_by
+    return filters, sort_keys
@@ -1,15 +1,16 @@
-from sqlmodel import Session, and_, distinct, func, literal, select
+from sqlmodel import and_, exists, func, literal, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.core.constants import FollowEntityCode, TagAssociationEntityCode
-from backend.models.event import Event
 from backend.models.follow import Follow
 from backend.models.organization import Organization
+from backend.models.organization_stats import OrganizationStats
 from backend.models.tag import Tag
 from backend.models.tag_association import TagAssociation
 from backend.models.user import User
 
 
-async def listing_random_organizations(db: Session, user: User):
+async def listing_random_organizations(db: AsyncSession, user: User):
     OrganizationTag = (
         select(
             Organization.id,
@@ -29,60 +30,36 @@ async def listing_random_organizations(db: Session, user: User):
         .subquery()
     )
 
-    OrganizationEventFollowCount = (
-        select(
-            Organization.id,
-            func.count(distinct(Event.id)).label("event_number"),
-            func.count(distinct(Follow.follower_id)).label("follower_number"),
-        )
-        .select_from(Organization)
-        .outerjoin(Event, Event.organization_id == Organization.id)
-        .outerjoin(
-            Follow,
-            and_(
-                Follow.following_id == Organization.id,
-                Follow.entity_code == FollowEntityCode.ORGANIZATION,
-            ),
-        )
-        .where(Event.published_at.isnot(None))
-    )
-
     if user:
-        OrganizationEventFollowCount = OrganizationEventFollowCount.add_columns(
-            func.bool_or(Follow.follower_id == user.id).label("is_followed")
+        is_followed = exists().where(
+            Follow.following_id == Organization.id,
+            Follow.follower_id == user.id,
+            Follow.entity_code == FollowEntityCode.ORGANIZATION,
         )
     else:
-        OrganizationEventFollowCount = OrganizationEventFollowCount.add_columns(
-            literal("false").label("is_followed")
-        )
+        is_followed = literal("false")
 
-    OrganizationEventFollowCount = OrganizationEventFollowCount.group_by(
-        Organization.id
-    ).subquery()
-
-    organizations = (
-        db.exec(
-            select(
-                Organization.id,
-                Organization.slug,
-                Organization.name,
-                Organization.avatar_url,
-                Organization.description,
-                OrganizationTag.c.tags,
-                OrganizationEventFollowCount.c.event_number,
-                OrganizationEventFollowCount.c.follower_number,
-                OrganizationEventFollowCount.c.is_followed,
-            )
-            .outerjoin(OrganizationTag, OrganizationTag.c.id == Organization.id)
-            .outerjoin(
-                OrganizationEventFollowCount,
-                OrganizationEventFollowCount.c.id == Organization.id,
-            )
-            .order_by(func.random())
-            .limit(5)
+    result = await db.exec(
+        select(
+            Organization.id,
+            Organization.slug,
+            Organization.name,
+            Organization.avatar_url,
+            Organization.description,
+            OrganizationTag.c.tags,
+            func.coalesce(OrganizationStats.event_number, 0).label("event_number"),
+            func.coalesce(OrganizationStats.follower_number, 0).label(
+                "follower_number"
+            ),
+            is_followed.label("is_followed"),
+        )
+        .outerjoin(OrganizationTag, OrganizationTag.c.id == Organization.id)
+        .outerjoin(
+            OrganizationStats, OrganizationStats.organization_id == Organization.id
         )
-        .mappings()
-        .all()
+        .order_by(func.random())
+        .limit(5)
     )
+    organizations = result.mappings().all()
 
     return organizations
@@ -1,18 +1,25 @@
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+import backend.api.v1.services.stats as stats_service
+from backend.core.cache import organization_tag, response_cache
+from backend.core.conditional import touch_resources
 from backend.core.error_code import ErrorCode, ErrorMessage
 from backend.core.exception import BadRequestException
 from backend.models import User
 from backend.models.follow import Follow
 
 
-async def unfollow_organization(db: Session, current_user: User, organization_id: int):
-    follow = db.exec(
+async def unfollow_organization(
+    db: AsyncSession, current_user: User, organization_id: int
+):
+    result = await db.exec(
         select(Follow).where(
             Follow.follower_id == current_user.id,
             Follow.following_id == organization_id,
         )
-    ).one_or_none()
+    )
+    follow = result.one_or_none()
 
     if not follow:
         raise BadRequestException(
@@ -21,9 +28,14 @@ async def unfollow_organization(db: Session, current_user: User, organization_id
         )
 
     try:
-        db.delete(follow)
-        db.commit()
+        await db.delete(follow)
+        await stats_service.increment_organization_stats(
+            db, organization_id, follower_number=-1
+        )
+        await touch_resources(db, organization_tag(organization_id))
+        await db.commit()
+        await response_cache.invalidate(organization_tag(organization_id))
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise e
@@ -1,24 +1,22 @@
-from sqlmodel import Session, func, select
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.models.speaker import Speaker
 
 
-async def listing_random_speakers(db: Session):
-    speakers = (
-        db.exec(
-            select(
-                Speaker.id,
-                Speaker.first_name,
-                Speaker.last_name,
-                Speaker.avatar_url,
-                Speaker.industry_code,
-                Speaker.job_type_code,
-            )
-            .order_by(func.random())
-            .limit(4)
+async def listing_random_speakers(db: AsyncSession):
+    result = await db.exec(
+        select(
+            Speaker.id,
+            Speaker.first_name,
+            Speaker.last_name,
+            Speaker.avatar_url,
+            Speaker.industry_code,
+            Speaker.job_type_code,
         )
-        .mappings()
-        .all()
+        .order_by(func.random())
+        .limit(4)
     )
+    speakers = result.mappings().all()
 
     return speakers
@@ -0,0 +1,31 @@
+from .backfill_event_analytics_service import backfill_event_analytics
+from .flush_event_views_service import (
+    event_view_counter,
+    flush_event_views,
+    run_event_views_flusher,
+)
+from .increment_event_analytics_service import (
+    analytics_buckets,
+    increment_event_analytics,
+    increment_ticket_analytics,
+)
+from .increment_event_stats_service import increment_event_stats
+from .increment_organization_stats_service import increment_organization_stats
+from .increment_survey_stats_service import increment_survey_stats
+from .rebuild_survey_stats_service import rebuild_survey_stats
+from .reconcile_stats_service import reconcile_stats
+
+all = (
+    increment_event_stats,
+    increment_organization_stats,
+    reconcile_stats,
+    event_view_counter,
+    flush_event_views,
+    run_event_views_flusher,
+    analytics_buckets,
+    increment_event_analytics,
+    increment_ticket_analytics,
+    backfill_event_analytics,
+    increment_survey_stats,
+    rebuild_survey_stats,
+)
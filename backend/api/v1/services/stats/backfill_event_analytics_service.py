@@ -0,0 +1,156 @@
+from sqlmodel import text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core.config import logger
+
+# Every backfilled row: event id, time, counters (see _BACKFILL_EVENT_ANALYTICS)
+_ANALYTICS_SOURCES = """
+    SELECT a.event_id, a.created_at AS at, 1 AS application_number,
+        0 AS revenue, 0 AS sold_tickets_number, 0 AS check_in_number,
+        0 AS bookmark_number
+    FROM applications a
+    UNION ALL
+    SELECT t.event_id, t.created_at, 0, t.total_amount, t.quantity, 0, 0
+    FROM transactions t WHERE t.status = 'SUCCESS'
+    UNION ALL
+    SELECT c.event_id, c.created_at, 0, 0, 0, 1, 0 FROM check_ins c
+    UNION ALL
+    SELECT b.event_id, b.created_at, 0, 0, 0, 0, 1 FROM bookmarks b
+"""
+
+_ANALYTICS_PERIODS = """
+    (VALUES ('HOUR', 'hour'), ('DAY', 'day')) AS p(period, unit)
+"""
+
+_ANALYTICS_BUCKET = "date_trunc(p.unit, {at} AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'"
+
+# view_number has no source of truth to recount from, it is left untouched
+_RESET_EVENT_ANALYTICS = """
+    UPDATE event_analytics SET
+        application_number = 0,
+        revenue = 0,
+        sold_tickets_number = 0,
+        check_in_number = 0,
+        bookmark_number = 0
+    WHERE CAST(:event_ids AS bigint[]) IS NULL OR event_id = ANY(:event_ids)
+"""
+
+_BACKFILL_EVENT_ANALYTICS = f"""
+    INSERT INTO event_analytics (
+        event_id, organization_id, period, bucket_at, application_number,
+        revenue, sold_tickets_number, check_in_number, bookmark_number
+    )
+    SELECT
+        e.id,
+        e.organization_id,
+        CAST(p.period AS analyticsperiodcode),
+        {_ANALYTICS_BUCKET.format(at="s.at")} AS bucket_at,
+        SUM(s.application_number),
+        SUM(s.revenue),
+        SUM(s.sold_tickets_number),
+        SUM(s.check_in_number),
+        SUM(s.bookmark_number)
+    FROM ({_ANALYTICS_SOURCES}) AS s
+    JOIN events e ON e.id = s.event_id
+    CROSS JOIN {_ANALYTICS_PERIODS}
+    WHERE CAST(:event_ids AS bigint[]) IS NULL OR e.id = ANY(:event_ids)
+    GROUP BY e.id, p.period, bucket_at
+    ON CONFLICT (event_id, period, bucket_at) DO UPDATE SET
+        application_number = EXCLUDED.application_number,
+        revenue = EXCLUDED.revenue,
+        sold_tickets_number = EXCLUDED.sold_tickets_number,
+        check_in_number = EXCLUDED.check_in_number,
+        bookmark_number = EXCLUDED.bookmark_number,
+        updated_at = now()
+"""
+
+_DELETE_EMPTY_EVENT_ANALYTICS = """
+    DELETE FROM event_analytics
+    WHERE (CAST(:event_ids AS bigint[]) IS NULL OR event_id = ANY(:event_ids))
+        AND (
+            application_number, revenue, sold_tickets_number, check_in_number,
+            view_number, bookmark_number
+        ) = (0, 0, 0, 0, 0, 0)
+"""
+
+_DELETE_EVENT_TICKET_ANALYTICS = """
+    DELETE FROM event_ticket_analytics
+    WHERE CAST(:event_ids AS bigint[]) IS NULL OR event_id = ANY(:event_ids)
+"""
+
+_BACKFILL_EVENT_TICKET_ANALYTICS = f"""
+    INSERT INTO event_ticket_analytics (
+        event_id, ticket_id, period, bucket_at, sold_quantity, revenue
+    )
+    SELECT
+        t.event_id,
+        ti.ticket_id,
+        CAST(p.period AS analyticsperiodcode),
+        {_ANALYTICS_BUCKET.format(at="t.created_at")} AS bucket_at,
+        COUNT(*),
+        SUM(ti.amount)
+    FROM transaction_items ti
+    JOIN transactions t ON t.id = ti.transaction_id
+    CROSS JOIN {_ANALYTICS_PERIODS}
+    WHERE t.status = 'SUCCESS'
+        AND (CAST(:event_ids AS bigint[]) IS NULL OR t.event_id = ANY(:event_ids))
+    GROUP BY t.event_id, ti.ticket_id, p.period, bucket_at
+"""
+
+
+_ANALYTICS_ORGANIZATIONS = """
+    SELECT organization_id FROM events
+    WHERE CAST(:event_ids AS bigint[]) IS NULL OR id = ANY(:event_ids)
+"""
+
+_DELETE_ORGANIZATION_ANALYTICS = f"""
+    DELETE FROM organization_analytics
+    WHERE organization_id IN ({_ANALYTICS_ORGANIZATIONS})
+"""
+
+# Summed from the rebuilt event buckets (views included)
+_BACKFILL_ORGANIZATION_ANALYTICS = f"""
+    INSERT INTO organization_analytics (
+        organization_id, period, bucket_at, application_number, revenue,
+        sold_tickets_number, check_in_number, view_number, bookmark_number
+    )
+    SELECT
+        ea.organization_id, ea.period, ea.bucket_at, SUM(ea.application_number),
+        SUM(ea.revenue), SUM(ea.sold_tickets_number), SUM(ea.check_in_number),
+        SUM(ea.view_number), SUM(ea.bookmark_number)
+    FROM event_analytics ea
+    WHERE ea.organization_id IN ({_ANALYTICS_ORGANIZATIONS})
+    GROUP BY ea.organization_id, ea.period, ea.bucket_at
+"""
+
+
+async def backfill_event_analytics(
+    db: AsyncSession, event_ids: list[int] | None = None
+) -> int:
+    """
+    Rebuild the analytics of the events (all if `event_ids` is None) from the
+    source tables, and those of their organizations, and return the number of
+    event buckets written.
+
+    Increments committed while it runs may be overwritten, so run it off-peak.
+    """
+    params = {"event_ids": event_ids}
+    try:
+        await db.exec(text(_RESET_EVENT_ANALYTICS), params=params)
+        buckets = (
+            await db.exec(text(_BACKFILL_EVENT_ANALYTICS), params=params)
+        ).rowcount
+        await db.exec(text(_DELETE_EMPTY_EVENT_ANALYTICS), params=params)
+        await db.exec(text(_DELETE_EVENT_TICKET_ANALYTICS), params=params)
+        await db.exec(text(_BACKFILL_EVENT_TICKET_ANALYTICS), params=params)
+        await db.exec(text(_DELETE_ORGANIZATION_ANALYTICS), params=params)
+        await db.exec(text(_BACKFILL_ORGANIZATION_ANALYTICS), params=params)
+        await db.commit()
+
+    except Exception as e:
+        await db.rollback()
+        raise e
+
+    logger.info(f"Backfilled {buckets} event analytics buckets.")
+
+    return buckets
@@ -0,0 +1,102 @@
+import asyncio
+
+from sqlmodel import text
+
+from backend.core.config import logger, settings
+from backend.db.database import MasterDBSession
+from backend.utils.view_counter import ViewCounter
+
+event_view_counter = ViewCounter(
+    dedup_window_seconds=settings.EVENT_VIEW_DEDUP_WINDOW_SECONDS,
+    dedup_max_entries=settings.EVENT_VIEW_DEDUP_MAX_ENTRIES,
+)
+
+_FLUSH_EVENT_VIEWS = text(
+    """
+    INSERT INTO event_stats (event_id, view_number)
+    SELECT * FROM unnest(CAST(:event_ids AS bigint[]), CAST(:view_numbers AS int[]))
+    ON CONFLICT (event_id) DO UPDATE
+    SET view_number = event_stats.view_number + EXCLUDED.view_number
+    """
+)
+
+# Counted in the hour / day buckets of the flush
+_FLUSH_EVENT_VIEWS_ANALYTICS = text(
+    """
+    INSERT INTO event_analytics (
+        event_id, organization_id, period, bucket_at, view_number
+    )
+    SELECT
+        e.id,
+        e.organization_id,
+        CAST(p.period AS analyticsperiodcode),
+        date_trunc(p.unit, now() AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+        v.view_number
+    FROM unnest(CAST(:event_ids AS bigint[]), CAST(:view_numbers AS int[]))
+        AS v(event_id, view_number)
+    JOIN events e ON e.id = v.event_id
+    CROSS JOIN (VALUES ('HOUR', 'hour'), ('DAY', 'day')) AS p(period, unit)
+    ORDER BY e.id
+    ON CONFLICT (event_id, period, bucket_at) DO UPDATE
+    SET view_number = event_analytics.view_number + EXCLUDED.view_number
+    """
+)
+
+_FLUSH_ORGANIZATION_VIEWS_ANALYTICS = text(
+    """
+    INSERT INTO organization_analytics (
+        organization_id, period, bucket_at, view_number
+    )
+    SELECT
+        e.organization_id,
+        CAST(p.period AS analyticsperiodcode),
+        date_trunc(p.unit, now() AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+        SUM(v.view_number)
+    FROM unnest(CAST(:event_ids AS bigint[]), CAST(:view_numbers AS int[]))
+        AS v(event_id, view_number)
+    JOIN events e ON e.id = v.event_id
+    CROSS JOIN (VALUES ('HOUR', 'hour'), ('DAY', 'day')) AS p(period, unit)
+    GROUP BY e.organization_id, p.period, p.unit
+    ORDER BY e.organization_id
+    ON CONFLICT (organization_id, period, bucket_at) DO UPDATE
+    SET view_number = organization_analytics.view_number + EXCLUDED.view_number
+    """
+)
+
+
+async def flush_event_views():
+    """
+    Write the buffered event views to event_stats, event_analytics and
+    organization_analytics.
+    """
+    # Same lock order in every worker
+    deltas = dict(sorted(event_view_counter.drain().items()))
+    if not deltas:
+        return
+
+    try:
+        async with MasterDBSession() as db:
+            params = {
+                "event_ids": list(deltas.keys()),
+                "view_numbers": list(deltas.values()),
+            }
+            await db.exec(_FLUSH_EVENT_VIEWS, params=params)
+            await db.exec(_FLUSH_EVENT_VIEWS_ANALYTICS, params=params)
+            await db.exec(_FLUSH_ORGANIZATION_VIEWS_ANALYTICS, params=params)
+            await db.commit()
+
+    except Exception as e:
+        event_view_counter.restore(deltas)
+        raise e
+
+    event_view_counter.done(deltas)
+
+
+async def run_event_views_flusher():
+    """Flush the event views every EVENT_VIEW_FLUSH_INTERVAL_SECONDS until cancelled."""
+    while True:
+        await asyncio.sleep(settings.EVENT_VIEW_FLUSH_INTERVAL_SECONDS)
+        try:
+            await flush_event_views()
+        except Exception as e:
+            logger.error(f"Failed to flush event views: {e}")
@@ -0,0 +1,119 @@
+from datetime import datetime
+
+import pytz
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core.constants import AnalyticsPeriodCode
+from backend.models.event import Event
+from backend.models.event_analytics import (
+    EventAnalytics,
+    EventTicketAnalytics,
+    OrganizationAnalytics,
+)
+
+
+def analytics_buckets(at: datetime) -> dict[AnalyticsPeriodCode, datetime]:
+    """Start of the hour and day (UTC) `at` is counted in."""
+    hour = at.astimezone(pytz.utc).replace(minute=0, second=0, microsecond=0)
+    return {
+        AnalyticsPeriodCode.HOUR: hour,
+        AnalyticsPeriodCode.DAY: hour.replace(hour=0),
+    }
+
+
+async def increment_event_analytics(
+    db: AsyncSession, event_id: int, at: datetime | None = None, **deltas: int | float
+):
+    """
+    Add `deltas` (e.g. check_in_number=1) to the hour and day buckets of an
+    event and of its organization in the caller's transaction. A removal is
+    counted in the buckets of the removed row (`at` its creation).
+    """
+    organization_id = (
+        select(Event.organization_id).where(Event.id == event_id).scalar_subquery()
+    )
+    buckets = analytics_buckets(at or datetime.now(pytz.utc))
+    # Event rows before organization rows, as in every transaction
+    for model, keys, index_elements in (
+        (
+            EventAnalytics,
+            dict(event_id=event_id, organization_id=organization_id),
+            [EventAnalytics.event_id],
+        ),
+        (
+            OrganizationAnalytics,
+            dict(organization_id=organization_id),
+            [OrganizationAnalytics.organization_id],
+        ),
+    ):
+        await db.exec(
+            insert(model)
+            .values(
+                [
+                    dict(**keys, period=period, bucket_at=bucket_at, **deltas)
+                    for period, bucket_at in buckets.items()
+                ]
+            )
+            .on_conflict_do_update(
+                index_elements=[*index_elements, model.period, model.bucket_at],
+                set_={
+                    field: getattr(model, field) + delta
+                    for field, delta in deltas.items()
+                },
+            )
+        )
+
+
+async def increment_ticket_analytics(
+    db: AsyncSession,
+    event_id: int,
+    sales: dict[int, tuple[int, float]],
+    at: datetime | None = None,
+):
+    """
+    Count the tickets sold (ticket id -> quantity, revenue) in the buckets of
+    their ticket type and of the event.
+    """
+    sales = {ticket_id: sale for ticket_id, sale in sales.items() if sale[0]}
+    if not sales:
+        return
+
+    at = at or datetime.now(pytz.utc)
+    statement = insert(EventTicketAnalytics).values(
+        [
+            dict(
+                event_id=event_id,
+                ticket_id=ticket_id,
+                period=period,
+                bucket_at=bucket_at,
+                sold_quantity=quantity,
+                revenue=revenue,
+            )
+            # Same lock order in every transaction
+            for ticket_id, (quantity, revenue) in sorted(sales.items())
+            for period, bucket_at in analytics_buckets(at).items()
+        ]
+    )
+    await db.exec(
+        statement.on_conflict_do_update(
+            index_elements=[
+                EventTicketAnalytics.ticket_id,
+                EventTicketAnalytics.period,
+                EventTicketAnalytics.bucket_at,
+            ],
+            set_={
+                "sold_quantity": EventTicketAnalytics.sold_quantity
+                + statement.excluded.sold_quantity,
+                "revenue": EventTicketAnalytics.revenue + statement.excluded.revenue,
+            },
+        )
+    )
+    await increment_event_analytics(
+        db,
+        event_id,
+        at,
+        sold_tickets_number=sum(quantity for quantity, _ in sales.values()),
+        revenue=sum(revenue for _, revenue in sales.values()),
+    )
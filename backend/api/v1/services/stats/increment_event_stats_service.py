@@ -0,0 +1,22 @@
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.models.event_stats import EventStats
+
+
+async def increment_event_stats(db: AsyncSession, event_id: int, **deltas: int):
+    """
+    Add `deltas` (e.g. bookmark_number=-1) to the counters of an event in the
+    caller's transaction, creating its stats row if needed.
+    """
+    await db.exec(
+        insert(EventStats)
+        .values(event_id=event_id, **deltas)
+        .on_conflict_do_update(
+            index_elements=[EventStats.event_id],
+            set_={
+                field: getattr(EventStats, field) + delta
+                for field, delta in deltas.items()
+            },
+        )
+    )
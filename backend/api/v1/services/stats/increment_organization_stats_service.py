@@ -0,0 +1,24 @@
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.models.organization_stats import OrganizationStats
+
+
+async def increment_organization_stats(
+    db: AsyncSession, organization_id: int, **deltas: int
+):
+    """
+    Add `deltas` (e.g. follower_number=1) to the counters of an organization in
+    the caller's transaction, creating its stats row if needed.
+    """
+    await db.exec(
+        insert(OrganizationStats)
+        .values(organization_id=organization_id, **deltas)
+        .on_conflict_do_update(
+            index_elements=[OrganizationStats.organization_id],
+            set_={
+                field: getattr(OrganizationStats, field) + delta
+                for field, delta in deltas.items()
+            },
+        )
+    )
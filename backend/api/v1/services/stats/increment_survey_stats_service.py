@@ -0,0 +1,79 @@
+from sqlmodel import text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.models.survey_response_result import SurveyResponseResult
+
+# Answers of another question are not counted
+_INCREMENT_SURVEY_QUESTION_STATS = text(
+    """
+    INSERT INTO survey_question_stats (
+        survey_id, event_id, question_id, response_number, answer_text_number
+    )
+    SELECT
+        q.survey_id,
+        CAST(:event_id AS bigint),
+        q.id,
+        COUNT(*),
+        COUNT(*) FILTER (WHERE r.has_text)
+    FROM unnest(CAST(:question_ids AS bigint[]), CAST(:has_texts AS boolean[]))
+        AS r(question_id, has_text)
+    JOIN questions q ON q.id = r.question_id
+    GROUP BY q.survey_id, q.id
+    ORDER BY q.id
+    ON CONFLICT (event_id, question_id) DO UPDATE SET
+        response_number = survey_question_stats.response_number
+            + EXCLUDED.response_number,
+        answer_text_number = survey_question_stats.answer_text_number
+            + EXCLUDED.answer_text_number
+    """
+)
+
+_INCREMENT_SURVEY_ANSWER_STATS = text(
+    """
+    INSERT INTO survey_answer_stats (
+        survey_id, event_id, question_id, answer_id, response_number
+    )
+    SELECT q.survey_id, CAST(:event_id AS bigint), q.id, a.id, COUNT(*)
+    FROM unnest(CAST(:question_ids AS bigint[]), CAST(:answer_ids AS bigint[]))
+        AS r(question_id, answer_id)
+    JOIN questions q ON q.id = r.question_id
+    JOIN answers a ON a.id = r.answer_id AND a.question_id = q.id
+    GROUP BY q.survey_id, q.id, a.id
+    ORDER BY a.id
+    ON CONFLICT (event_id, question_id, answer_id) DO UPDATE SET
+        response_number = survey_answer_stats.response_number
+            + EXCLUDED.response_number
+    """
+)
+
+
+async def increment_survey_stats(
+    db: AsyncSession, event_id: int, responses: list[SurveyResponseResult]
+):
+    """Count new survey responses of an event in the caller's transaction."""
+    if not responses:
+        return
+
+    await db.exec(
+        _INCREMENT_SURVEY_QUESTION_STATS,
+        params={
+            "event_id": event_id,
+            "question_ids": [response.question_id for response in responses],
+            "has_texts": [bool(response.answer_text) for response in responses],
+        },
+    )
+
+    answers = [
+        (response.question_id, answer_id)
+        for response in responses
+        for answer_id in set(response.answers_ids or [])
+    ]
+    if answers:
+        await db.exec(
+            _INCREMENT_SURVEY_ANSWER_STATS,
+            params={
+                "event_id": event_id,
+                "question_ids": [question_id for question_id, _ in answers],
+                "answer_ids": [answer_id for _, answer_id in answers],
+            },
+        )
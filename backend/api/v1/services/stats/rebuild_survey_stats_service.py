@@ -0,0 +1,75 @@
+from sqlmodel import text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core.config import logger
+
+_SURVEY_SCOPE = (
+    "(CAST(:survey_ids AS bigint[]) IS NULL OR {survey_id} = ANY(:survey_ids))"
+)
+
+_DELETE_SURVEY_STATS = """
+    DELETE FROM {table} WHERE {scope}
+"""
+
+_REBUILD_SURVEY_QUESTION_STATS = f"""
+    INSERT INTO survey_question_stats (
+        survey_id, event_id, question_id, response_number, answer_text_number
+    )
+    SELECT
+        q.survey_id,
+        r.event_id,
+        q.id,
+        COUNT(*),
+        COUNT(*) FILTER (WHERE r.answer_text IS NOT NULL AND r.answer_text <> '')
+    FROM survey_response_results r
+    JOIN questions q ON q.id = r.question_id
+    WHERE {_SURVEY_SCOPE.format(survey_id="q.survey_id")}
+    GROUP BY q.survey_id, r.event_id, q.id
+"""
+
+_REBUILD_SURVEY_ANSWER_STATS = f"""
+    INSERT INTO survey_answer_stats (
+        survey_id, event_id, question_id, answer_id, response_number
+    )
+    SELECT q.survey_id, r.event_id, q.id, a.id, COUNT(DISTINCT r.id)
+    FROM survey_response_results r
+    JOIN questions q ON q.id = r.question_id
+    JOIN answers a ON a.id = ANY(r.answers_ids) AND a.question_id = q.id
+    WHERE {_SURVEY_SCOPE.format(survey_id="q.survey_id")}
+    GROUP BY q.survey_id, r.event_id, q.id, a.id
+"""
+
+
+async def rebuild_survey_stats(
+    db: AsyncSession, survey_ids: list[int] | None = None
+) -> int:
+    """
+    Recount the question / answer stats of the surveys (all if `survey_ids` is
+    None) from their responses and return the number of answer rows written.
+
+    Responses committed while it runs may not be counted, so run it off-peak.
+    """
+    params = {"survey_ids": survey_ids}
+    try:
+        for table in ("survey_answer_stats", "survey_question_stats"):
+            await db.exec(
+                text(
+                    _DELETE_SURVEY_STATS.format(
+                        table=table, scope=_SURVEY_SCOPE.format(survey_id="survey_id")
+                    )
+                ),
+                params=params,
+            )
+        await db.exec(text(_REBUILD_SURVEY_QUESTION_STATS), params=params)
+        answers = (
+            await db.exec(text(_REBUILD_SURVEY_ANSWER_STATS), params=params)
+        ).rowcount
+        await db.commit()
+
+    except Exception as e:
+        await db.rollback()
+        raise e
+
+    logger.info(f"Rebuilt {answers} survey answer stats.")
+
+    return answers
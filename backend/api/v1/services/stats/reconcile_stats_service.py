@@ -0,0 +1,88 @@
+from sqlmodel import text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core.config import logger
+
+# view_number has no source of truth to recount from, it is left untouched
+_RECONCILE_EVENT_STATS = """
+    INSERT INTO event_stats (
+        event_id, sold_tickets_number, application_number, bookmark_number
+    )
+    SELECT
+        e.id,
+        COALESCE((
+            SELECT SUM(ti.sold_quantity) FROM ticket_inventories ti
+            WHERE ti.event_id = e.id
+        ), 0),
+        (SELECT COUNT(*) FROM applications a WHERE a.event_id = e.id),
+        (SELECT COUNT(*) FROM bookmarks b WHERE b.event_id = e.id)
+    FROM events e
+    ON CONFLICT (event_id) DO UPDATE SET
+        sold_tickets_number = EXCLUDED.sold_tickets_number,
+        application_number = EXCLUDED.application_number,
+        bookmark_number = EXCLUDED.bookmark_number,
+        updated_at = now()
+    WHERE (
+        event_stats.sold_tickets_number,
+        event_stats.application_number,
+        event_stats.bookmark_number
+    ) IS DISTINCT FROM (
+        EXCLUDED.sold_tickets_number,
+        EXCLUDED.application_number,
+        EXCLUDED.bookmark_number
+    )
+    RETURNING event_id
+"""
+
+_RECONCILE_ORGANIZATION_STATS = """
+    INSERT INTO organization_stats (organization_id, event_number, follower_number)
+    SELECT
+        o.id,
+        (
+            SELECT COUNT(*) FROM events e
+            WHERE e.organization_id = o.id AND e.published_at IS NOT NULL
+        ),
+        (
+            SELECT COUNT(*) FROM follows f
+            WHERE f.following_id = o.id AND f.entity_code = 'ORGANIZATION'
+        )
+    FROM organizations o
+    ON CONFLICT (organization_id) DO UPDATE SET
+        event_number = EXCLUDED.event_number,
+        follower_number = EXCLUDED.follower_number,
+        updated_at = now()
+    WHERE (
+        organization_stats.event_number, organization_stats.follower_number
+    ) IS DISTINCT FROM (
+        EXCLUDED.event_number, EXCLUDED.follower_number
+    )
+    RETURNING organization_id
+"""
+
+
+async def reconcile_stats(db: AsyncSession) -> dict[str, list[int]]:
+    """
+    Recount every counter from the source tables, fix the rows which drifted
+    (or are missing) and return their ids.
+
+    Increments committed while it runs may be overwritten by the recount, so
+    run it off-peak.
+    """
+    try:
+        event_ids = (await db.exec(text(_RECONCILE_EVENT_STATS))).scalars().all()
+        organization_ids = (
+            (await db.exec(text(_RECONCILE_ORGANIZATION_STATS))).scalars().all()
+        )
+        await db.commit()
+
+    except Exception as e:
+        await db.rollback()
+        raise e
+
+    if event_ids or organization_ids:
+        logger.warning(
+            f"Fixed stats of events {list(event_ids)}"
+            f" and organizations {list(organization_ids)}"
+        )
+
+    return {"events": list(event_ids), "organizations": list(organization_ids)}
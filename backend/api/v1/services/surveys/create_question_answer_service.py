@@ -1,4 +1,4 @@
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.models.answer import Answer
 from backend.models.question import Question
@@ -7,7 +7,7 @@ from backend.utils.database import save
 
 
 async def create_question_answer(
-    db: Session, question_answers: CreateQuestionAnswerRequest, survey_id: int
+    db: AsyncSession, question_answers: CreateQuestionAnswerRequest, survey_id: int
 ):
     answers = []
 
@@ -19,7 +19,7 @@ async def create_question_answer(
             order_number=qa.order_number,
         )
 
-        question = save(db, question)
+        question = await save(db, question)
 
         answers.extend(
             [
@@ -33,5 +33,5 @@ async def create_question_answer(
             ]
         )
 
-    db.bulk_insert_mappings(Answer, answers)
-    db.flush()
+    db.add_all(answers)
+    await db.flush()
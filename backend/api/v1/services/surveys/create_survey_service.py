@@ -1,5 +1,7 @@
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from backend.core.cache import response_cache, surveys_tag
 from backend.core.constants import SurveyStatusCode
 from backend.core.error_code import ErrorCode, ErrorMessage
 from backend.core.exception import BadRequestException
@@ -11,14 +13,17 @@ from backend.utils.database import save
 from .create_question_answer_service import create_question_answer
 
 
-async def create_survey(db: Session, organizer: User, request: CreateSurveyRequest):
+async def create_survey(
+    db: AsyncSession, organizer: User, request: CreateSurveyRequest
+):
     try:
-        survey = db.exec(
+        result = await db.exec(
             select(Survey).where(
                 Survey.name == request.name,
                 Survey.organization_id == organizer.organization_id,
             )
-        ).one_or_none()
+        )
+        survey = result.one_or_none()
 
         if survey:
             raise BadRequestException(
@@ -36,10 +41,11 @@ async def create_survey(db: Session, organizer: User, request: CreateSurveyReque
             max_response_number=request.max_response_number,
         )
 
-        survey = save(db, new_survey)
+        survey = await save(db, new_survey)
 
         await create_question_answer(db, request.question_answers, new_survey.id)
+        await response_cache.invalidate(surveys_tag(organizer.organization_id))
         return new_survey.id
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise e
@@ -0,0 +1,132 @@
+from sqlmodel import func, select, true
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core.error_code import ErrorCode, ErrorMessage
+from backend.core.exception import BadRequestException
+from backend.models.answer import Answer
+from backend.models.question import Question
+from backend.models.survey import Survey
+from backend.models.survey_response_result import SurveyResponseResult
+from backend.models.survey_stats import SurveyAnswerStats, SurveyQuestionStats
+from backend.models.user import User
+from backend.schemas.survey import (
+    SurveyAnalyticsQueryParams,
+    SurveyAnalyticsResponse,
+    SurveyAnswerAnalyticsItem,
+    SurveyQuestionAnalyticsItem,
+)
+
+
+async def get_survey_analytics(
+    db: AsyncSession,
+    organizer: User,
+    survey_id: int,
+    query_params: SurveyAnalyticsQueryParams,
+) -> SurveyAnalyticsResponse:
+    """
+    Answer histograms of a survey from its stats tables (independent of the
+    number of responses), with the latest free text answers of each question.
+    """
+    survey = await db.get(Survey, survey_id)
+    if not survey or survey.organization_id != organizer.organization_id:
+        raise BadRequestException(
+            ErrorCode.ERR_SURVEY_NOT_FOUND, ErrorMessage.ERR_SURVEY_NOT_FOUND
+        )
+
+    event_id = query_params.event_id
+    question_stats = (
+        select(
+            SurveyQuestionStats.question_id,
+            func.sum(SurveyQuestionStats.response_number).label("response_number"),
+            func.sum(SurveyQuestionStats.answer_text_number).label(
+                "answer_text_number"
+            ),
+        )
+        .where(
+            SurveyQuestionStats.survey_id == survey_id,
+            *([SurveyQuestionStats.event_id == event_id] if event_id else []),
+        )
+        .group_by(SurveyQuestionStats.question_id)
+        .subquery()
+    )
+    questions = (
+        await db.exec(
+            select(
+                Question,
+                func.coalesce(question_stats.c.response_number, 0),
+                func.coalesce(question_stats.c.answer_text_number, 0),
+            )
+            .outerjoin(question_stats, question_stats.c.question_id == Question.id)
+            .where(Question.survey_id == survey_id)
+            .order_by(Question.order_number)
+        )
+    ).all()
+
+    answer_stats = (
+        select(
+            SurveyAnswerStats.answer_id,
+            func.sum(SurveyAnswerStats.response_number).label("response_number"),
+        )
+        .where(
+            SurveyAnswerStats.survey_id == survey_id,
+            *([SurveyAnswerStats.event_id == event_id] if event_id else []),
+        )
+        .group_by(SurveyAnswerStats.answer_id)
+        .subquery()
+    )
+    answers = (
+        await db.exec(
+            select(Answer, func.coalesce(answer_stats.c.response_number, 0))
+            .join(Question, Question.id == Answer.question_id)
+            .outerjoin(answer_stats, answer_stats.c.answer_id == Answer.id)
+            .where(Question.survey_id == survey_id)
+            .order_by(Answer.order_number)
+        )
+    ).all()
+
+    answer_texts = []
+    if query_params.answer_text_sample_size:
+        samples = (
+            select(SurveyResponseResult.answer_text)
+            .where(
+                SurveyResponseResult.question_id == Question.id,
+                SurveyResponseResult.answer_text.is_not(None),
+                SurveyResponseResult.answer_text != "",
+                *([SurveyResponseResult.event_id == event_id] if event_id else []),
+            )
+            .order_by(SurveyResponseResult.id.desc())
+            .limit(query_params.answer_text_sample_size)
+            .lateral()
+        )
+        answer_texts = (
+            await db.exec(
+                select(Question.id, samples.c.answer_text)
+                .join(samples, true())
+                .where(Question.survey_id == survey_id)
+            )
+        ).all()
+
+    items = {
+        question.id: SurveyQuestionAnalyticsItem(
+            question_id=question.id,
+            question=question.question,
+            type_code=question.type_code,
+            response_number=response_number,
+            answer_text_number=answer_text_number,
+        )
+        for question, response_number, answer_text_number in questions
+    }
+    for answer, response_number in answers:
+        items[answer.question_id].answers.append(
+            SurveyAnswerAnalyticsItem(
+                answer_id=answer.id,
+                answer=answer.answer,
+                response_number=response_number,
+            )
+        )
+    for question_id, answer_text in answer_texts:
+        items[question_id].answer_texts.append(answer_text)
+
+    return SurveyAnalyticsResponse(
+        survey_id=survey_id, event_id=event_id, questions=list(items.values())
+    )
@@ -1,4 +1,5 @@
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.models.answer import Answer
 from backend.models.question import Question
@@ -7,16 +8,17 @@ from backend.schemas.answer import AnswerItem
 from backend.schemas.survey import SurveyDetail
 
 
-def get_survey_detail(db: Session, survey_id: int):
-    survey = db.get(Survey, survey_id)
+async def get_survey_detail(db: AsyncSession, survey_id: int):
+    survey = await db.get(Survey, survey_id)
 
-    questions = db.exec(
+    result = await db.exec(
         select(Question)
         .where(Question.survey_id == survey_id)
         .order_by(Question.order_number)
-    ).fetchall()
+    )
+    questions = result.fetchall()
 
-    question_answers = _get_question_answers(db, questions)
+    question_answers = await _get_question_answers(db, questions)
     return SurveyDetail(
         id=survey_id,
         name=survey.name,
@@ -29,18 +31,19 @@ def get_survey_detail(db: Session, survey_id: int):
     )
 
 
-def _get_question_answers(db: Session, questions: list[Question]):
+async def _get_question_answers(db: AsyncSession, questions: list[Question]):
     question_answers = {}
     for question in questions:
         question_answers[question.id] = question.__dict__
 
     question_ids = list(question_answers.keys())
 
-    answers = db.exec(
+    result = await db.exec(
         select(Answer)
         .where(Answer.question_id.in_(question_ids))
         .order_by(Answer.order_number)
-    ).fetchall()
+    )
+    answers = result.fetchall()
 
     for answer in answers:
         question_id = answer.question_id
@@ -1,12 +1,13 @@
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.core.constants import TagAssociationEntityCode
 from backend.models.tag import Tag
 from backend.models.tag_association import TagAssociation
 
 
-def get_event_tags(db: Session, event_id: int):
-    event_tags = db.exec(
+async def get_event_tags(db: AsyncSession, event_id: int):
+    result = await db.exec(
         select(
             Tag.id,
             Tag.image_url,
@@ -17,6 +18,7 @@ def get_event_tags(db: Session, event_id: int):
             TagAssociation.entity_id == event_id,
             TagAssociation.entity_code == TagAssociationEntityCode.EVENT,
         )
-    ).all()
+    )
+    event_tags = result.all()
 
     return event_tags
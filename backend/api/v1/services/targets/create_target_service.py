@@ -1,5 +1,7 @@
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from backend.core.cache import response_cache, targets_tag
 from backend.core.error_code import ErrorCode, ErrorMessage
 from backend.core.exception import BadRequestException
 from backend.models.target import Target
@@ -8,14 +10,17 @@ from backend.schemas.target import CreateTargetRequest
 from backend.utils.database import save
 
 
-async def create_target(db: Session, organizer: User, request: CreateTargetRequest):
+async def create_target(
+    db: AsyncSession, organizer: User, request: CreateTargetRequest
+):
     try:
-        target = db.exec(
+        result = await db.exec(
             select(Target).where(
                 Target.name == request.name,
                 Target.organization_id == organizer.organization_id,
             )
-        ).one_or_none()
+        )
+        target = result.one_or_none()
 
         if target:
             raise BadRequestException(
@@ -30,9 +35,10 @@ async def create_target(db: Session, organizer: User, request: CreateTargetReque
             job_type_codes=request.job_type_codes,
         )
         target.created_by = organizer.id
-        target = save(db, target)
+        target = await save(db, target)
+        await response_cache.invalidate(targets_tag(organizer.organization_id))
 
         return target.id
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise e
@@ -1,17 +1,15 @@
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.models import Target, User
 
 
-async def listing_target_options(db: Session, organizer: User):
-    target_options = (
-        db.exec(
-            select(Target.id, Target.name).where(
-                Target.organization_id == organizer.organization_id
-            )
+async def listing_target_options(db: AsyncSession, organizer: User):
+    result = await db.exec(
+        select(Target.id, Target.name).where(
+            Target.organization_id == organizer.organization_id
         )
-        .mappings()
-        .all()
     )
+    target_options = result.mappings().all()
 
     return target_options
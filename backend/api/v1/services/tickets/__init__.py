@@ -1,5 +1,27 @@
+from .confirm_ticket_reservations_service import confirm_ticket_reservations
 from .create_ticket_service import create_ticket
 from .get_sold_tickets_number_query_service import get_sold_tickets_number_query
 from .listing_tickets_of_event_service import listing_tickets_of_event
+from .release_ticket_reservations_service import (
+    release_expired_ticket_reservations,
+    release_ticket_reservations,
+    run_ticket_reservations_sweeper,
+)
+from .reserve_tickets_service import (
+    extend_ticket_reservations,
+    reserve_tickets,
+    sell_tickets,
+)
 
-all = create_ticket, listing_tickets_of_event, get_sold_tickets_number_query
+all = (
+    create_ticket,
+    listing_tickets_of_event,
+    get_sold_tickets_number_query,
+    reserve_tickets,
+    extend_ticket_reservations,
+    sell_tickets,
+    confirm_ticket_reservations,
+    release_ticket_reservations,
+    release_expired_ticket_reservations,
+    run_ticket_reservations_sweeper,
+)
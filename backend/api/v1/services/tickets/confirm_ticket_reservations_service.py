@@ -0,0 +1,26 @@
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.api.v1.services.tickets.release_ticket_reservations_service import (
+    settle_ticket_reservations,
+)
+from backend.core.constants import TicketReservationStatusCode
+from backend.models.ticket_inventory import TicketInventory
+from backend.models.ticket_reservation import TicketReservation
+
+
+async def confirm_ticket_reservations(
+    db: AsyncSession, reference: str
+) -> dict[int, int]:
+    """
+    Sell the tickets held by a checkout (reserved -> sold), in the caller's
+    transaction.
+
+    Idempotent: returns the confirmed quantities by ticket id, empty if the
+    reservations were already confirmed, released or expired.
+    """
+    return await settle_ticket_reservations(
+        db,
+        TicketReservation.reference == reference,
+        TicketReservationStatusCode.CONFIRMED,
+        TicketInventory.sold_quantity,
+    )
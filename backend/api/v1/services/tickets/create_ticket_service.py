@@ -1,11 +1,13 @@
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from backend.core.cache import event_tag, response_cache
+from backend.core.conditional import touch_resources
 from backend.models.ticket import Ticket
 from backend.schemas.ticket import CreateTicketRequest
 from backend.utils.database import save
 
 
-async def create_ticket(db: Session, request: CreateTicketRequest):
+async def create_ticket(db: AsyncSession, request: CreateTicketRequest):
     ticket = Ticket(
         event_id=request.event_id,
         name=request.name,
@@ -20,9 +22,11 @@ async def create_ticket(db: Session, request: CreateTicketRequest):
         sales_start_at=request.sales_start_at,
     )
     try:
-        ticket = save(db, ticket)
+        await touch_resources(db, event_tag(request.event_id))
+        ticket = await save(db, ticket)
+        await response_cache.invalidate(event_tag(request.event_id))
 
         return ticket.id
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise e
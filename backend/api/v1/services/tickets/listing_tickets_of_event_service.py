@@ -1,4 +1,5 @@
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.models.event import Event
 from backend.models.ticket import Ticket
@@ -6,8 +7,8 @@ from backend.models.user import User
 from backend.utils.database import fetch_all
 
 
-async def listing_tickets_of_event(db: Session, organizer: User, event_id: int):
-    tickets = fetch_all(
+async def listing_tickets_of_event(db: AsyncSession, organizer: User, event_id: int):
+    tickets = await fetch_all(
         db,
         select(Ticket)
         .join(Event, Event.id == Ticket.event_id)
@@ -0,0 +1,131 @@
+import asyncio
+from collections import Counter
+from datetime import datetime
+
+import pytz
+from sqlmodel import select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core.cache import EVENTS_TAG, event_tag, response_cache
+from backend.core.conditional import touch_resources
+from backend.core.config import logger, settings
+from backend.core.constants import TicketReservationStatusCode
+from backend.db.database import MasterDBSession
+from backend.models.ticket_inventory import TicketInventory
+from backend.models.ticket_reservation import TicketReservation
+
+
+async def release_ticket_reservations(
+    db: AsyncSession, reference: str
+) -> dict[int, int]:
+    """
+    Give the tickets held by a checkout back (reserved -> available), in the
+    caller's transaction.
+
+    Idempotent: returns the released quantities by ticket id, empty if the
+    reservations were already confirmed or released.
+    """
+    return await settle_ticket_reservations(
+        db,
+        TicketReservation.reference == reference,
+        TicketReservationStatusCode.RELEASED,
+        TicketInventory.available_quantity,
+    )
+
+
+async def release_expired_ticket_reservations(db: AsyncSession) -> int:
+    """
+    Release a batch of the expired reservations (at most
+    TICKET_RESERVATION_SWEEP_BATCH_SIZE) and commit. Returns the number of
+    released tickets.
+    """
+    try:
+        # Skip the ones being confirmed / released concurrently
+        expired_reservations = (
+            await db.exec(
+                select(TicketReservation.id, TicketReservation.event_id)
+                .where(
+                    TicketReservation.status == TicketReservationStatusCode.HELD,
+                    TicketReservation.expired_at < datetime.now(pytz.utc),
+                )
+                .order_by(TicketReservation.id)
+                .limit(settings.TICKET_RESERVATION_SWEEP_BATCH_SIZE)
+                .with_for_update(skip_locked=True)
+            )
+        ).all()
+        if not expired_reservations:
+            await db.rollback()
+            return 0
+
+        released = await settle_ticket_reservations(
+            db,
+            TicketReservation.id.in_(
+                [reservation_id for reservation_id, _ in expired_reservations]
+            ),
+            TicketReservationStatusCode.RELEASED,
+            TicketInventory.available_quantity,
+        )
+        # The available quantities of their events changed
+        event_tags = {event_tag(event_id) for _, event_id in expired_reservations}
+        await touch_resources(db, EVENTS_TAG, *event_tags)
+        await db.commit()
+
+    except Exception as e:
+        await db.rollback()
+        raise e
+
+    await response_cache.invalidate(EVENTS_TAG, *event_tags)
+
+    return sum(released.values())
+
+
+async def run_ticket_reservations_sweeper():
+    """
+    Release the expired reservations every
+    TICKET_RESERVATION_SWEEP_INTERVAL_SECONDS until cancelled.
+    """
+    while True:
+        await asyncio.sleep(settings.TICKET_RESERVATION_SWEEP_INTERVAL_SECONDS)
+        try:
+            async with MasterDBSession() as db:
+                released = await release_expired_ticket_reservations(db)
+            if released:
+                logger.info(f"Released {released} expired ticket reservations.")
+        except Exception as e:
+            logger.error(f"Failed to release expired ticket reservations: {e}")
+
+
+async def settle_ticket_reservations(
+    db: AsyncSession, condition, status: TicketReservationStatusCode, target
+) -> dict[int, int]:
+    """
+    Move the held reservations matching `condition` to `status`, and their
+    quantities from the reserved tickets to `target` (sold or available).
+    """
+    result = await db.exec(
+        update(TicketReservation)
+        .where(condition, TicketReservation.status == TicketReservationStatusCode.HELD)
+        .values(status=status)
+        .returning(TicketReservation.ticket_id, TicketReservation.quantity)
+        .execution_options(synchronize_session=False)
+    )
+    quantities = Counter()
+    for ticket_id, quantity in result.all():
+        quantities[ticket_id] += quantity
+
+    # Same lock order as reserve_tickets
+    for ticket_id, quantity in sorted(quantities.items()):
+        await db.exec(
+            update(TicketInventory)
+            .where(TicketInventory.ticket_id == ticket_id)
+            .values(
+                {
+                    TicketInventory.reserved_quantity: (
+                        TicketInventory.reserved_quantity - quantity
+                    ),
+                    target: target + quantity,
+                }
+            )
+        )
+
+    return dict(quantities)
@@ -0,0 +1,137 @@
+from datetime import datetime, timedelta
+
+import pytz
+from sqlmodel import select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core.config import settings
+from backend.core.constants import TicketReservationStatusCode
+from backend.core.error_code import ErrorCode, ErrorMessage
+from backend.core.exception import BadRequestException
+from backend.models.ticket_inventory import TicketInventory
+from backend.models.ticket_reservation import TicketReservation
+
+
+async def reserve_tickets(
+    db: AsyncSession,
+    event_id: int,
+    quantities: dict[int, int],
+    reference: str,
+    user_id: int | None = None,
+    ttl_seconds: int | None = None,
+) -> list[TicketReservation]:
+    """
+    Hold `quantities` (ticket id -> quantity) of the event's tickets for a
+    checkout until confirmed / released (see confirm_ticket_reservations and
+    release_ticket_reservations), or until the TTL expires.
+
+    Each ticket is moved from available to reserved by a single conditional
+    update, so concurrent buyers can never oversell. Runs in the caller's
+    transaction: on error nothing is held once the caller rolls back.
+    """
+    await _move_available_tickets(
+        db, event_id, quantities, TicketInventory.reserved_quantity
+    )
+
+    expired_at = datetime.now(pytz.utc) + timedelta(
+        seconds=ttl_seconds or settings.TICKET_RESERVATION_TTL_SECONDS
+    )
+    reservations = [
+        TicketReservation(
+            reference=reference,
+            event_id=event_id,
+            ticket_id=ticket_id,
+            user_id=user_id,
+            quantity=quantity,
+            expired_at=expired_at,
+        )
+        for ticket_id, quantity in sorted(quantities.items())
+    ]
+    db.add_all(reservations)
+    await db.flush()
+
+    return reservations
+
+
+async def extend_ticket_reservations(
+    db: AsyncSession, reference: str, expired_at: datetime
+) -> int:
+    """
+    Move the expiry of the tickets still held by a checkout to `expired_at`, in
+    the caller's transaction. Returns the number of updated reservations.
+    """
+    result = await db.exec(
+        update(TicketReservation)
+        .where(
+            TicketReservation.reference == reference,
+            TicketReservation.status == TicketReservationStatusCode.HELD,
+        )
+        .values(expired_at=expired_at)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+async def sell_tickets(db: AsyncSession, event_id: int, quantities: dict[int, int]):
+    """
+    Sell `quantities` (ticket id -> quantity) of the event's tickets without a
+    hold (free applications), with the same guarantee as reserve_tickets.
+    """
+    await _move_available_tickets(
+        db, event_id, quantities, TicketInventory.sold_quantity
+    )
+
+
+async def _move_available_tickets(
+    db: AsyncSession, event_id: int, quantities: dict[int, int], target
+):
+    # A non-positive quantity would pass the availability check and give
+    # tickets back to the inventory
+    if any(quantity <= 0 for quantity in quantities.values()):
+        raise BadRequestException(
+            ErrorCode.ERR_INVALID_TICKET_QUANTITY,
+            ErrorMessage.ERR_INVALID_TICKET_QUANTITY,
+        )
+
+    # Same lock order in every transaction (no deadlock between buyers)
+    for ticket_id, quantity in sorted(quantities.items()):
+        result = await db.exec(
+            update(TicketInventory)
+            .where(
+                TicketInventory.ticket_id == ticket_id,
+                TicketInventory.event_id == event_id,
+                TicketInventory.available_quantity >= quantity,
+            )
+            .values(
+                {
+                    TicketInventory.available_quantity: (
+                        TicketInventory.available_quantity - quantity
+                    ),
+                    target: target + quantity,
+                }
+            )
+            .returning(TicketInventory.id)
+        )
+
+        if result.first() is None:
+            available_quantity = (
+                await db.exec(
+                    select(TicketInventory.available_quantity).where(
+                        TicketInventory.ticket_id == ticket_id,
+                        TicketInventory.event_id == event_id,
+                    )
+                )
+            ).first()
+
+            if available_quantity is None:
+                raise BadRequestException(
+                    ErrorCode.ERR_INVALID_TICKET, ErrorMessage.ERR_INVALID_TICKET
+                )
+            if available_quantity == 0:
+                raise BadRequestException(
+                    ErrorCode.ERR_TICKET_SOLD_OUT, ErrorMessage.ERR_TICKET_SOLD_OUT
+                )
+            raise BadRequestException(
+                ErrorCode.ERR_NOT_ENOUGH_TICKETS_FOR_REQUEST,
+                ErrorMessage.ERR_NOT_ENOUGH_TICKETS_FOR_REQUEST,
+            )
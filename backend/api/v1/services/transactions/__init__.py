@@ -1,3 +1,17 @@
-from .handle_application_transaction_service import handle_application_transaction
+from .complete_checkout_service import complete_checkout
+from .enqueue_stripe_event_service import enqueue_stripe_event
+from .get_stripe_webhook_metrics_service import get_stripe_webhook_metrics
+from .process_stripe_event_service import process_stripe_event
+from .run_stripe_webhook_worker_service import (
+    process_next_stripe_event,
+    run_stripe_webhook_worker,
+)
 
-all = handle_application_transaction
+all = (
+    complete_checkout,
+    enqueue_stripe_event,
+    get_stripe_webhook_metrics,
+    process_stripe_event,
+    process_next_stripe_event,
+    run_stripe_webhook_worker,
+)
@@ -0,0 +1,127 @@
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import backend.api.v1.services.stats as stats_service
+import backend.api.v1.services.tickets as tickets_service
+import backend.api.v1.services.users as users_service
+from backend.core.cache import EVENTS_TAG, event_tag
+from backend.core.conditional import touch_resources
+from backend.core.config import logger
+from backend.core.constants import CheckoutStatusCode
+from backend.core.exception import BadRequestException
+from backend.models.application import Application
+from backend.models.checkout import Checkout
+from backend.models.survey_response_result import SurveyResponseResult
+from backend.models.transaction import Transaction, TransactionStatusCode
+from backend.models.transaction_item import TransactionItem
+
+
+async def complete_checkout(
+    db: AsyncSession, checkout: Checkout, payment_intent_id: str | None
+) -> bool:
+    """
+    Turn a paid pending checkout into its application and transaction, in the
+    caller's transaction. Returns False if its tickets could not be sold (hold
+    expired and sold out meanwhile), the checkout is then FAILED.
+    """
+    event_id = checkout.event_id
+    quantities = {ticket["id"]: ticket["quantity"] for ticket in checkout.tickets}
+
+    # Normally held until now. Expired holds are sold again if still available.
+    if not await tickets_service.confirm_ticket_reservations(db, checkout.reference):
+        try:
+            async with db.begin_nested():
+                await tickets_service.sell_tickets(db, event_id, quantities)
+        except BadRequestException as e:
+            logger.error(
+                f"Paid checkout {checkout.reference} (payment intent "
+                f"{payment_intent_id}) could not get its tickets: {e.error_code}"
+            )
+            checkout.status = CheckoutStatusCode.FAILED
+            db.add(checkout)
+            return False
+
+    request = checkout.application_request
+    application = (
+        await db.exec(
+            select(Application).where(
+                Application.event_id == event_id,
+                Application.user_id == checkout.user_id,
+            )
+        )
+    ).first()
+
+    if not application:
+        application = Application(
+            event_id=event_id,
+            user_id=checkout.user_id,
+            email=request["email"],
+            first_name=request["first_name"],
+            last_name=request.get("last_name"),
+            workplace_name=request.get("workplace_name"),
+            phone=request.get("phone"),
+            industry_code=request.get("industry_code"),
+            job_type_code=request.get("job_type_code"),
+        )
+        db.add(application)
+        await stats_service.increment_event_stats(db, event_id, application_number=1)
+        await stats_service.increment_event_analytics(
+            db, event_id, application_number=1
+        )
+        await db.flush()
+
+        survey_responses = [
+            SurveyResponseResult(
+                event_id=event_id,
+                application_id=application.id,
+                email=request["email"],
+                question_id=srr["question_id"],
+                answers_ids=srr["answers_ids"],
+                answer_text=srr.get("answer_text"),
+            )
+            for srr in request.get("survey_response_results") or []
+        ]
+        db.add_all(survey_responses)
+        await stats_service.increment_survey_stats(db, event_id, survey_responses)
+
+    total_quantity = sum(quantities.values())
+    transaction = Transaction(
+        event_id=event_id,
+        application_id=application.id,
+        quantity=total_quantity,
+        total_amount=checkout.total_amount,
+        status=TransactionStatusCode.SUCCESS,
+        stripe_payment_intent_id=payment_intent_id,
+        stripe_checkout_session_id=checkout.stripe_checkout_session_id,
+        reference=checkout.reference,
+    )
+    db.add(transaction)
+    await db.flush()
+
+    db.add_all(
+        TransactionItem(
+            transaction_id=transaction.id,
+            ticket_id=ticket["id"],
+            amount=ticket["price"],
+        )
+        for ticket in checkout.tickets
+        for _ in range(ticket["quantity"])
+    )
+    await stats_service.increment_event_stats(
+        db, event_id, sold_tickets_number=total_quantity
+    )
+    await stats_service.increment_ticket_analytics(
+        db,
+        event_id,
+        {
+            ticket["id"]: (ticket["quantity"], ticket["price"] * ticket["quantity"])
+            for ticket in checkout.tickets
+        },
+    )
+    await users_service.refresh_user_interests(db, checkout.user_id)
+    await touch_resources(db, EVENTS_TAG, event_tag(event_id))
+
+    checkout.status = CheckoutStatusCode.COMPLETED
+    db.add(checkout)
+
+    return True
@@ -0,0 +1,51 @@
+import json
+
+import stripe
+from fastapi import HTTPException, Request
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.api.v1.services.transactions.process_stripe_event_service import (
+    get_stripe_event_checkout_reference,
+)
+from backend.core.config import settings
+from backend.models.stripe_webhook_event import StripeWebhookEvent
+
+stripe.api_key = settings.STRIPE_SECRET_KEY
+
+
+async def enqueue_stripe_event(db: AsyncSession, request: Request):
+    """
+    Verify a Stripe webhook call and queue its event for the webhook worker.
+    Stripe's retries and duplicates of an event are queued once.
+    """
+    payload = await request.body()
+    sig = request.headers.get("stripe-signature")
+
+    try:
+        # Verify the Stripe event
+        stripe.Webhook.construct_event(payload, sig, settings.STRIPE_WEBHOOK_SECRET)
+    except (ValueError, stripe.SignatureVerificationError):
+        raise HTTPException(status_code=400, detail="Invalid Stripe webhook signature")
+
+    stripe_event = json.loads(payload)
+    try:
+        await db.exec(
+            insert(StripeWebhookEvent)
+            .values(
+                stripe_event_id=stripe_event["id"],
+                type=stripe_event["type"],
+                # Events of other checkouts are processed in parallel
+                ordering_key=(
+                    get_stripe_event_checkout_reference(stripe_event)
+                    or stripe_event["id"]
+                ),
+                payload=stripe_event,
+            )
+            .on_conflict_do_nothing(index_elements=[StripeWebhookEvent.stripe_event_id])
+        )
+        await db.commit()
+
+    except Exception as e:
+        await db.rollback()
+        raise e
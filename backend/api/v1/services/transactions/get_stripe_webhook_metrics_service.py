@@ -0,0 +1,50 @@
+from datetime import timedelta
+
+from sqlmodel import case, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core.constants import WebhookEventStatusCode
+from backend.models.stripe_webhook_event import StripeWebhookEvent
+
+# Window of the processed events counted in the metrics
+STRIPE_WEBHOOK_METRICS_WINDOW = timedelta(hours=1)
+
+
+async def get_stripe_webhook_metrics(db: AsyncSession) -> dict[str, float | int]:
+    """
+    The pending events (and the age of the oldest one), then over the last
+    hour the processed and dead events and the average lag from reception to
+    processing.
+    """
+    since = func.now() - STRIPE_WEBHOOK_METRICS_WINDOW
+    pending = StripeWebhookEvent.status == WebhookEventStatusCode.PENDING
+    processed = StripeWebhookEvent.processed_at >= since
+    dead = (StripeWebhookEvent.status == WebhookEventStatusCode.DEAD) & (
+        StripeWebhookEvent.updated_at >= since
+    )
+    result = await db.exec(
+        select(
+            func.count().filter(pending),
+            func.extract(
+                "epoch",
+                func.now() - func.min(case((pending, StripeWebhookEvent.created_at))),
+            ),
+            func.count().filter(processed),
+            func.count().filter(dead),
+            func.extract(
+                "epoch",
+                func.avg(
+                    StripeWebhookEvent.processed_at - StripeWebhookEvent.created_at
+                ).filter(processed),
+            ),
+        ).where(pending | processed | dead)
+    )
+    pending_count, oldest_age, processed_count, dead_count, avg_lag = result.one()
+
+    return {
+        "pending": pending_count,
+        "oldest_pending_age_seconds": float(oldest_age or 0),
+        "processed_last_hour": processed_count,
+        "dead_last_hour": dead_count,
+        "avg_lag_seconds_last_hour": float(avg_lag or 0),
+    }
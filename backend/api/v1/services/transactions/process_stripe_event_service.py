@@ -0,0 +1,81 @@
+from typing import Any
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import backend.api.v1.services.tickets as tickets_service
+from backend.api.v1.services.transactions.complete_checkout_service import (
+    complete_checkout,
+)
+from backend.core.cache import EVENTS_TAG, event_tag
+from backend.core.conditional import touch_resources
+from backend.core.config import logger
+from backend.core.constants import CheckoutStatusCode
+from backend.models.checkout import Checkout
+
+_PAID_EVENT_TYPES = (
+    "checkout.session.completed",
+    "checkout.session.async_payment_succeeded",
+    "payment_intent.succeeded",
+)
+_EXPIRED_EVENT_TYPES = (
+    "checkout.session.expired",
+    "checkout.session.async_payment_failed",
+)
+
+
+def get_stripe_event_checkout_reference(stripe_event: dict[str, Any]) -> str | None:
+    data = stripe_event["data"]["object"]
+    return (data.get("metadata") or {}).get("checkout_reference")
+
+
+async def process_stripe_event(
+    db: AsyncSession, stripe_event: dict[str, Any]
+) -> Checkout | None:
+    """
+    Apply a verified Stripe event to its checkout, in the caller's transaction.
+    Returns the checkout if its event's tickets changed (completed, or expired
+    with tickets released), whose cache tags the caller invalidates after
+    commit.
+    """
+    reference = get_stripe_event_checkout_reference(stripe_event)
+    if not reference:
+        return None
+
+    checkout = (
+        await db.exec(
+            select(Checkout).where(Checkout.reference == reference).with_for_update()
+        )
+    ).first()
+    if not checkout or checkout.status != CheckoutStatusCode.PENDING:
+        # Unknown, or already finalized by another event of the payment
+        return None
+
+    data = stripe_event["data"]["object"]
+    if stripe_event["type"] in _PAID_EVENT_TYPES:
+        if data.get("payment_status") == "unpaid":
+            # Delayed payment method, wait for async_payment_succeeded
+            return None
+
+        payment_intent_id = (
+            data["id"] if data["object"] == "payment_intent" else data["payment_intent"]
+        )
+        if await complete_checkout(db, checkout, payment_intent_id):
+            return checkout
+
+    elif stripe_event["type"] in _EXPIRED_EVENT_TYPES:
+        released = await tickets_service.release_ticket_reservations(
+            db, checkout.reference
+        )
+        checkout.status = CheckoutStatusCode.EXPIRED
+        db.add(checkout)
+        if released:
+            await touch_resources(db, EVENTS_TAG, event_tag(checkout.event_id))
+            return checkout
+
+    else:
+        # e.g. payment_intent.payment_failed: the customer may retry within the
+        # session, its tickets stay held until it expires
+        logger.info(f"Checkout {checkout.reference}: {stripe_event['type']}")
+
+    return None
@@ -0,0 +1,123 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytz
+from sqlalchemy.orm import aliased
+from sqlmodel import exists, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.api.v1.services.transactions.process_stripe_event_service import (
+    process_stripe_event,
+)
+from backend.core.cache import EVENTS_TAG, event_tag, response_cache
+from backend.core.config import logger, settings
+from backend.core.constants import WebhookEventStatusCode
+from backend.db.database import MasterDBSession
+from backend.models.stripe_webhook_dead_letter import StripeWebhookDeadLetter
+from backend.models.stripe_webhook_event import StripeWebhookEvent
+
+
+async def process_next_stripe_event(db: AsyncSession) -> bool:
+    """
+    Claim the next due Stripe event, process it and commit. Returns False if no
+    event is due.
+
+    An event waits for the earlier pending events of its checkout (including
+    the ones waiting for a retry). Failures are retried with exponential
+    backoff, then dead-lettered.
+    """
+    earlier = aliased(StripeWebhookEvent)
+    webhook_event = (
+        await db.exec(
+            select(StripeWebhookEvent)
+            .where(
+                StripeWebhookEvent.status == WebhookEventStatusCode.PENDING,
+                StripeWebhookEvent.next_attempt_at <= func.now(),
+                ~exists().where(
+                    earlier.ordering_key == StripeWebhookEvent.ordering_key,
+                    earlier.status == WebhookEventStatusCode.PENDING,
+                    earlier.id < StripeWebhookEvent.id,
+                ),
+            )
+            .order_by(StripeWebhookEvent.id)
+            .limit(1)
+            .with_for_update(skip_locked=True, of=StripeWebhookEvent)
+        )
+    ).first()
+
+    if not webhook_event:
+        await db.rollback()
+        return False
+
+    changed_checkout = None
+    try:
+        async with db.begin_nested():
+            changed_checkout = await process_stripe_event(db, webhook_event.payload)
+        webhook_event.status = WebhookEventStatusCode.DONE
+        webhook_event.processed_at = datetime.now(pytz.utc)
+
+    except Exception as e:
+        webhook_event.attempts += 1
+        webhook_event.last_error = repr(e)
+
+        if webhook_event.attempts >= settings.STRIPE_WEBHOOK_MAX_ATTEMPTS:
+            logger.error(
+                f"Stripe event {webhook_event.stripe_event_id} dead-lettered: {e!r}"
+            )
+            webhook_event.status = WebhookEventStatusCode.DEAD
+            db.add(
+                StripeWebhookDeadLetter(
+                    stripe_event_id=webhook_event.stripe_event_id,
+                    type=webhook_event.type,
+                    ordering_key=webhook_event.ordering_key,
+                    payload=webhook_event.payload,
+                    attempts=webhook_event.attempts,
+                    last_error=webhook_event.last_error,
+                )
+            )
+        else:
+            delay = min(
+                settings.STRIPE_WEBHOOK_RETRY_BASE_SECONDS
+                * 2 ** (webhook_event.attempts - 1),
+                settings.STRIPE_WEBHOOK_RETRY_MAX_SECONDS,
+            )
+            logger.warning(
+                f"Stripe event {webhook_event.stripe_event_id} failed "
+                f"(attempt {webhook_event.attempts}), retry in {delay:.0f}s: {e!r}"
+            )
+            webhook_event.next_attempt_at = datetime.now(pytz.utc) + timedelta(
+                seconds=delay
+            )
+
+    db.add(webhook_event)
+    await db.commit()
+
+    if changed_checkout:
+        await response_cache.invalidate(
+            EVENTS_TAG, event_tag(changed_checkout.event_id)
+        )
+
+    return True
+
+
+async def run_stripe_webhook_worker(concurrency: int | None = None):
+    """Process the queued Stripe events with `concurrency` consumers, forever."""
+
+    async def consume():
+        while True:
+            try:
+                async with MasterDBSession() as db:
+                    processed = await process_next_stripe_event(db)
+            except Exception as e:
+                logger.error(f"Stripe webhook worker error: {e!r}")
+                processed = False
+
+            if not processed:
+                await asyncio.sleep(settings.STRIPE_WEBHOOK_POLL_INTERVAL_SECONDS)
+
+    await asyncio.gather(
+        *(
+            consume()
+            for _ in range(concurrency or settings.STRIPE_WEBHOOK_WORKER_CONCURRENCY)
+        )
+    )
@@ -1,3 +1,11 @@
+from .refresh_user_interests_service import (
+    rebuild_user_interests,
+    refresh_user_interests,
+)
 from .update_audience_service import update_audience
 
-all = update_audience
+all = (
+    update_audience,
+    refresh_user_interests,
+    rebuild_user_interests,
+)
@@ -0,0 +1,135 @@
+from sqlmodel import delete, func, select, text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.models.user_interest import UserInterest
+
+APPLICATION_SCORE = 7
+APPLICATION_WITH_SURVEY_SCORE = 8
+BOOKMARK_SCORE = 5
+PROFILE_SCORE = 3
+
+_INSERT_USER_INTERESTS = """
+    WITH user_interactions AS (
+        SELECT
+            a.user_id,
+            t.industry_codes,
+            t.job_type_codes,
+            event_tags.tag_ids,
+            CASE WHEN EXISTS (
+                SELECT 1 FROM survey_response_results srr WHERE srr.application_id = a.id
+            ) THEN {application_with_survey_score} ELSE {application_score} END AS score
+        FROM applications a
+        JOIN events e ON e.id = a.event_id
+        LEFT JOIN targets t ON t.id = e.target_id
+        LEFT JOIN LATERAL (
+            SELECT array_agg(ta.tag_id) AS tag_ids
+            FROM tag_associations ta
+            WHERE ta.entity_code = 'EVENT' AND ta.entity_id = e.id
+        ) event_tags ON TRUE
+        WHERE {application_filter}
+
+        UNION ALL
+
+        SELECT
+            b.user_id,
+            t.industry_codes,
+            t.job_type_codes,
+            event_tags.tag_ids,
+            {bookmark_score} AS score
+        FROM bookmarks b
+        JOIN events e ON e.id = b.event_id
+        LEFT JOIN targets t ON t.id = e.target_id
+        LEFT JOIN LATERAL (
+            SELECT array_agg(ta.tag_id) AS tag_ids
+            FROM tag_associations ta
+            WHERE ta.entity_code = 'EVENT' AND ta.entity_id = e.id
+        ) event_tags ON TRUE
+        WHERE {bookmark_filter}
+
+        UNION ALL
+
+        SELECT
+            u.id AS user_id,
+            ARRAY[u.industry_code]::varchar[] AS industry_codes,
+            ARRAY[u.job_type_code]::varchar[] AS job_type_codes,
+            array_agg(ta.tag_id) AS tag_ids,
+            {profile_score} AS score
+        FROM users u
+        LEFT JOIN tag_associations ta ON ta.entity_id = u.id AND ta.entity_code = 'USER'
+        WHERE {user_filter}
+        GROUP BY u.id
+    ),
+
+    interest_codes AS (
+        SELECT user_id, unnest(industry_codes) AS code, score FROM user_interactions
+        UNION ALL
+        SELECT user_id, unnest(job_type_codes) AS code, score FROM user_interactions
+        UNION ALL
+        SELECT user_id, unnest(tag_ids::varchar[]) AS code, score FROM user_interactions
+    )
+
+    INSERT INTO user_interests (user_id, code, score)
+    SELECT user_id, code, SUM(score)
+    FROM interest_codes
+    WHERE code IS NOT NULL
+    GROUP BY user_id, code
+    ON CONFLICT (user_id, code) DO UPDATE SET
+        score = EXCLUDED.score,
+        updated_at = now()
+"""
+
+_SCORES = {
+    "application_score": APPLICATION_SCORE,
+    "application_with_survey_score": APPLICATION_WITH_SURVEY_SCORE,
+    "bookmark_score": BOOKMARK_SCORE,
+    "profile_score": PROFILE_SCORE,
+}
+
+
+async def refresh_user_interests(db: AsyncSession, user_id: int):
+    """
+    Recompute the interest profile of one user from their applications,
+    bookmarks, survey responses and profile/tags.
+
+    Runs in the caller's transaction (pending changes are flushed first), so
+    call it before the caller commits.
+    """
+    await db.flush()
+    # Concurrent refreshes of the user wait for each other until commit, and
+    # then see each other's interactions
+    await db.exec(
+        select(func.pg_advisory_xact_lock(func.hashtext("user_interests"), user_id))
+    )
+    await db.exec(delete(UserInterest).where(UserInterest.user_id == user_id))
+    await db.exec(
+        text(
+            _INSERT_USER_INTERESTS.format(
+                application_filter="a.user_id = :user_id",
+                bookmark_filter="b.user_id = :user_id",
+                user_filter="u.id = :user_id",
+                **_SCORES,
+            )
+        ),
+        params={"user_id": user_id},
+    )
+
+
+async def rebuild_user_interests(db: AsyncSession):
+    """Recompute the interest profile of every user (batch rebuild)."""
+    try:
+        await db.exec(delete(UserInterest))
+        await db.exec(
+            text(
+                _INSERT_USER_INTERESTS.format(
+                    application_filter="TRUE",
+                    bookmark_filter="TRUE",
+                    user_filter="u.deleted_at IS NULL",
+                    **_SCORES,
+                )
+            )
+        )
+        await db.commit()
+
+    except Exception as e:
+        await db.rollback()
+        raise e
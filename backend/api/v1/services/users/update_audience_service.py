@@ -1,8 +1,15 @@
-from sqlmodel import Session, delete, select
+from sqlmodel import delete, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from backend.api.v1.services.users.refresh_user_interests_service import (
+    refresh_user_interests,
+)
+from backend.core.cache import TAGS_TAG, response_cache
+from backend.core.conditional import touch_resources
 from backend.core.constants import TagAssociationEntityCode
 from backend.core.error_code import ErrorCode, ErrorMessage
 from backend.core.exception import BadRequestException
+from backend.core.principal_cache import principal_cache
 from backend.models.tag import Tag
 from backend.models.tag_association import TagAssociation
 from backend.models.user import User
@@ -11,14 +18,14 @@ from backend.utils.database import save
 
 
 async def update_audience(
-    db: Session, current_user: User, request: UpdateUserRequest
+    db: AsyncSession, current_user: User, request: UpdateUserRequest
 ) -> User:
     try:
         for attr, value in request:
             if attr != "tags" and value is not None:
                 setattr(current_user, attr, value)
 
-        db.exec(
+        await db.exec(
             delete(TagAssociation).where(
                 TagAssociation.entity_id == current_user.id,
                 TagAssociation.entity_code == TagAssociationEntityCode.USER,
@@ -26,7 +33,7 @@ async def update_audience(
         )
 
         if request.tags:
-            tags = db.exec(select(Tag.id).where(Tag.id.in_(request.tags))).all()
+            tags = (await db.exec(select(Tag.id).where(Tag.id.in_(request.tags)))).all()
             if (not tags) or (len(request.tags) != len(tags)):
                 raise BadRequestException(
                     ErrorCode.ERR_TAG_NOT_FOUND, ErrorMessage.ERR_TAG_NOT_FOUND
@@ -42,9 +49,13 @@ async def update_audience(
             db.add_all(user_tags)
 
         current_user.updated_by = current_user.id
-        current_user = save(db, current_user)
+        await refresh_user_interests(db, current_user.id)
+        await touch_resources(db, TAGS_TAG)
+        current_user = await save(db, current_user)
+        await response_cache.invalidate(TAGS_TAG)
+        await principal_cache.invalidate(current_user.id)
         return current_user
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise e
@@ -0,0 +1,27 @@
+"""
+Rebuild the hourly / daily event analytics (event_analytics,
+event_ticket_analytics, organization_analytics) from applications, transactions, check-ins and
+bookmarks. Views are only counted from the deployment of the analytics.
+
+    python -m backend.commands.backfill_event_analytics [--event-id 1 --event-id 2]
+"""
+
+import argparse
+import asyncio
+
+import backend.api.v1.services.stats as stats_service
+from backend.db.database import MasterDBSession, master_engine
+
+
+async def main(event_ids: list[int] | None):
+    async with MasterDBSession() as db:
+        await stats_service.backfill_event_analytics(db, event_ids)
+    await master_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--event-id", type=int, action="append", dest="event_ids")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.event_ids))
@@ -0,0 +1,73 @@
+"""
+Login throughput benchmark of the password hashing pool: for each pool size,
+`--requests` concurrent logins verify a bcrypt password (cost factor of the
+settings) while a ticker measures how late the event loop gets.
+
+    python -m backend.commands.benchmark_password_hashing --requests 200 \
+        --pool-sizes 1 2 4 8
+
+No database access, only the hashing is measured.
+"""
+
+import argparse
+import asyncio
+import time
+
+from backend.api.v1.services.auth.password_service import (
+    PasswordHashingPool,
+    pwd_context,
+)
+from backend.core.config import logger, settings
+
+TICK_SECONDS = 0.01
+
+
+async def measure_loop_lag(stop: asyncio.Event) -> float:
+    max_lag = 0.0
+    while not stop.is_set():
+        started_at = time.perf_counter()
+        await asyncio.sleep(TICK_SECONDS)
+        max_lag = max(max_lag, time.perf_counter() - started_at - TICK_SECONDS)
+    return max_lag
+
+
+async def benchmark(pool_size: int, requests: int, hashed_password: str):
+    pool = PasswordHashingPool(pool_size, requests)
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(measure_loop_lag(stop))
+
+    started_at = time.perf_counter()
+    results = await asyncio.gather(
+        *(
+            pool.run(pwd_context.verify, "benchmark-password", hashed_password)
+            for _ in range(requests)
+        )
+    )
+    elapsed = time.perf_counter() - started_at
+
+    stop.set()
+    max_lag = await ticker
+    pool.shutdown()
+
+    logger.info(
+        f"pool {pool_size}: {requests} logins in {elapsed:.2f}s "
+        f"({requests / elapsed:.1f} logins/s), max queued "
+        f"{pool.metrics()['max_queued']}, max loop lag {max_lag * 1000:.0f}ms, "
+        f"all verified {all(results)}"
+    )
+
+
+async def main(requests: int, pool_sizes: list[int]):
+    hashed_password = pwd_context.hash("benchmark-password")
+    logger.info(f"bcrypt cost factor {settings.PASSWORD_BCRYPT_ROUNDS}")
+    for pool_size in pool_sizes:
+        await benchmark(pool_size, requests, hashed_password)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--pool-sizes", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    asyncio.run(main(args.requests, args.pool_sizes))
@@ -0,0 +1,106 @@
+"""
+Concurrency stress benchmark of the ticket inventory: `--requests` buyers
+(`--concurrency` at a time) race to reserve `--quantity` tickets of one ticket,
+then the inventory is checked for oversell and every hold is released.
+
+    python -m backend.commands.benchmark_ticket_reservations --ticket-id 1 \
+        --requests 1000 --concurrency 20
+
+Exits with status 1 if any ticket was oversold or lost.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from uuid import uuid4
+
+from sqlmodel import select
+
+import backend.api.v1.services.tickets as tickets_service
+from backend.core.config import logger
+from backend.core.exception import BadRequestException
+from backend.db.database import MasterDBSession, master_engine
+from backend.models.ticket_inventory import TicketInventory
+
+
+async def get_inventory(ticket_id: int) -> TicketInventory:
+    async with MasterDBSession() as db:
+        result = await db.exec(
+            select(TicketInventory).where(TicketInventory.ticket_id == ticket_id)
+        )
+        return result.one()
+
+
+async def reserve(event_id: int, ticket_id: int, quantity: int, reference: str):
+    async with MasterDBSession() as db:
+        try:
+            await tickets_service.reserve_tickets(
+                db, event_id, {ticket_id: quantity}, reference
+            )
+            await db.commit()
+            return True
+        except BadRequestException:
+            await db.rollback()
+            return False
+
+
+async def main(ticket_id: int, requests: int, concurrency: int, quantity: int):
+    before = await get_inventory(ticket_id)
+    reference = f"benchmark-{uuid4()}"
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def buyer():
+        async with semaphore:
+            return await reserve(before.event_id, ticket_id, quantity, reference)
+
+    started_at = time.perf_counter()
+    results = await asyncio.gather(*(buyer() for _ in range(requests)))
+    elapsed = time.perf_counter() - started_at
+
+    after = await get_inventory(ticket_id)
+    held = sum(results) * quantity
+    expected_held = min(
+        before.available_quantity - before.available_quantity % quantity,
+        requests * quantity,
+    )
+    consistent = (
+        after.available_quantity == before.available_quantity - held
+        and after.reserved_quantity == before.reserved_quantity + held
+        and after.sold_quantity == before.sold_quantity
+    )
+    oversold = max(0, held - before.available_quantity)
+
+    async with MasterDBSession() as db:
+        await tickets_service.release_ticket_reservations(db, reference)
+        await db.commit()
+    released = await get_inventory(ticket_id)
+    await master_engine.dispose()
+
+    logger.info(
+        f"{requests} reservations in {elapsed:.2f}s "
+        f"({requests / elapsed:.0f} req/s, concurrency {concurrency}): "
+        f"{sum(results)} accepted, {requests - sum(results)} rejected"
+    )
+    logger.info(
+        f"available {before.available_quantity} -> {after.available_quantity}, "
+        f"held {held} (expected {expected_held}), oversold {oversold}, "
+        f"consistent {consistent}, "
+        f"restored {released.available_quantity == before.available_quantity}"
+    )
+
+    return oversold == 0 and held == expected_held and consistent
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ticket-id", type=int, required=True)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--quantity", type=int, default=1)
+    args = parser.parse_args()
+
+    ok = asyncio.run(
+        main(args.ticket_id, args.requests, args.concurrency, args.quantity)
+    )
+    sys.exit(0 if ok else 1)
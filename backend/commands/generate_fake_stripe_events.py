@@ -0,0 +1,126 @@
+"""
+Load test of the Stripe webhook: post signed fake Stripe events (signed with
+STRIPE_WEBHOOK_SECRET, like Stripe does) to the API.
+
+    python -m backend.commands.generate_fake_stripe_events \
+        --url http://localhost:8000/api/v1/transactions/webhook \
+        --events 1000 --concurrency 50 --duplicates 0.2 [--reference <checkout>]
+
+Events are checkout.session.completed / expired and payment_intent.succeeded
+events of the given checkout references (random unknown ones by default, which
+the worker ignores). A share of them is re-sent as Stripe's retries would.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import hmac
+import json
+import random
+import time
+from uuid import uuid4
+
+import httpx
+
+from backend.core.config import logger, settings
+
+EVENT_TYPES = (
+    "checkout.session.completed",
+    "checkout.session.expired",
+    "payment_intent.succeeded",
+)
+
+
+def fake_stripe_event(reference: str) -> dict:
+    event_type = random.choice(EVENT_TYPES)
+    metadata = {"checkout_reference": reference}
+    if event_type.startswith("payment_intent"):
+        data = {"object": "payment_intent", "id": f"pi_{uuid4().hex}"}
+    else:
+        data = {
+            "object": "checkout.session",
+            "id": f"cs_{uuid4().hex}",
+            "payment_intent": f"pi_{uuid4().hex}",
+            "payment_status": "paid",
+        }
+
+    return {
+        "id": f"evt_{uuid4().hex}",
+        "object": "event",
+        "type": event_type,
+        "created": int(time.time()),
+        "data": {"object": {**data, "metadata": metadata}},
+    }
+
+
+def sign(payload: str, secret: str) -> str:
+    timestamp = int(time.time())
+    signature = hmac.new(
+        secret.encode(), f"{timestamp}.{payload}".encode(), hashlib.sha256
+    ).hexdigest()
+    return f"t={timestamp},v1={signature}"
+
+
+async def main(
+    url: str, events: int, concurrency: int, duplicates: float, references: list[str]
+):
+    payloads = [
+        json.dumps(
+            fake_stripe_event(random.choice(references) if references else str(uuid4()))
+        )
+        for _ in range(events)
+    ]
+    payloads += random.sample(payloads, int(len(payloads) * duplicates))
+    random.shuffle(payloads)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    status_codes = {}
+
+    async with httpx.AsyncClient(timeout=30) as client:
+
+        async def post(payload: str):
+            async with semaphore:
+                started_at = time.perf_counter()
+                response = await client.post(
+                    url,
+                    content=payload,
+                    headers={
+                        "Content-Type": "application/json",
+                        "Stripe-Signature": sign(
+                            payload, settings.STRIPE_WEBHOOK_SECRET
+                        ),
+                    },
+                )
+                latencies.append(time.perf_counter() - started_at)
+                status_codes[response.status_code] = (
+                    status_codes.get(response.status_code, 0) + 1
+                )
+
+        started_at = time.perf_counter()
+        await asyncio.gather(*(post(payload) for payload in payloads))
+        elapsed = time.perf_counter() - started_at
+
+    latencies.sort()
+    logger.info(
+        f"{len(payloads)} events in {elapsed:.2f}s ({len(payloads) / elapsed:.0f}/s), "
+        f"status codes {status_codes}, "
+        f"p50 {latencies[len(latencies) // 2] * 1000:.0f}ms, "
+        f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.0f}ms"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--url", default="http://localhost:8000/api/v1/transactions/webhook"
+    )
+    parser.add_argument("--events", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duplicates", type=float, default=0.2)
+    parser.add_argument("--reference", action="append", default=[])
+    args = parser.parse_args()
+
+    asyncio.run(
+        main(args.url, args.events, args.concurrency, args.duplicates, args.reference)
+    )
@@ -0,0 +1,22 @@
+"""
+Rebuild the similar events (event_similarities) of every public event.
+
+    python -m backend.commands.rebuild_event_similarities
+"""
+
+import asyncio
+
+import backend.api.v1.services.events as events_service
+from backend.core.config import logger
+from backend.db.database import MasterDBSession, master_engine
+
+
+async def main():
+    async with MasterDBSession() as db:
+        await events_service.rebuild_event_similarities(db)
+    await master_engine.dispose()
+    logger.info("Rebuilt event similarities.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,26 @@
+"""
+Recount the survey question / answer stats (survey_question_stats,
+survey_answer_stats) from the survey responses.
+
+    python -m backend.commands.rebuild_survey_stats [--survey-id 1 --survey-id 2]
+"""
+
+import argparse
+import asyncio
+
+import backend.api.v1.services.stats as stats_service
+from backend.db.database import MasterDBSession, master_engine
+
+
+async def main(survey_ids: list[int] | None):
+    async with MasterDBSession() as db:
+        await stats_service.rebuild_survey_stats(db, survey_ids)
+    await master_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--survey-id", type=int, action="append", dest="survey_ids")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.survey_ids))
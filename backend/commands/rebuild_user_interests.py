@@ -0,0 +1,22 @@
+"""
+Rebuild the recommendation interest profile (user_interests) of every user.
+
+    python -m backend.commands.rebuild_user_interests
+"""
+
+import asyncio
+
+import backend.api.v1.services.users as users_service
+from backend.core.config import logger
+from backend.db.database import MasterDBSession, master_engine
+
+
+async def main():
+    async with MasterDBSession() as db:
+        await users_service.rebuild_user_interests(db)
+    await master_engine.dispose()
+    logger.info("Rebuilt user interests.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
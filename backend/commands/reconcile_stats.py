@@ -0,0 +1,23 @@
+"""
+Recount the event / organization counters (event_stats, organization_stats) and
+fix the ones which drifted.
+
+    python -m backend.commands.reconcile_stats
+"""
+
+import asyncio
+
+import backend.api.v1.services.stats as stats_service
+from backend.core.config import logger
+from backend.db.database import MasterDBSession, master_engine
+
+
+async def main():
+    async with MasterDBSession() as db:
+        await stats_service.reconcile_stats(db)
+    await master_engine.dispose()
+    logger.info("Reconciled stats.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
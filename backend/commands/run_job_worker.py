@@ -0,0 +1,42 @@
+"""
+Run the background jobs (emails, exports, ...) queued in the jobs table.
+
+    python -m backend.commands.run_job_worker [--concurrency 4]
+
+Several workers can run side by side (jobs are claimed with SKIP LOCKED).
+"""
+
+import argparse
+import asyncio
+
+import backend.api.v1.services.email_campaigns  # noqa: F401 (registers its job)
+import backend.api.v1.services.exports  # noqa: F401 (registers its job)
+import backend.api.v1.services.jobs as jobs_service
+import backend.mails.mail as mail  # registers the email jobs
+from backend.core.config import logger, settings
+from backend.db.database import master_engine
+
+
+async def main(concurrency: int):
+    if settings.EMAIL_PRECOMPILE_TEMPLATES:
+        mail.precompile_templates()
+
+    logger.info(f"Job worker started (concurrency {concurrency}).")
+    try:
+        await jobs_service.run_job_worker(concurrency)
+    finally:
+        await mail.close_smtp_pool()
+        await master_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--concurrency", type=int, default=settings.JOB_WORKER_CONCURRENCY
+    )
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(main(args.concurrency))
+    except KeyboardInterrupt:
+        logger.info("Job worker stopped.")
@@ -0,0 +1,35 @@
+"""
+Process the Stripe webhook events queued by POST /transactions/webhook.
+
+    python -m backend.commands.run_stripe_webhook_worker [--concurrency 4]
+
+Several workers can run side by side (events are claimed with SKIP LOCKED).
+"""
+
+import argparse
+import asyncio
+
+import backend.api.v1.services.transactions as transactions_service
+from backend.core.config import logger, settings
+from backend.db.database import master_engine
+
+
+async def main(concurrency: int):
+    logger.info(f"Stripe webhook worker started (concurrency {concurrency}).")
+    try:
+        await transactions_service.run_stripe_webhook_worker(concurrency)
+    finally:
+        await master_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--concurrency", type=int, default=settings.STRIPE_WEBHOOK_WORKER_CONCURRENCY
+    )
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(main(args.concurrency))
+    except KeyboardInterrupt:
+        logger.info("Stripe webhook worker stopped.")
@@ -0,0 +1,96 @@
+import asyncio
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import AsyncIterator
+
+from backend.core.config import settings
+
+ARTIFACT_CHUNK_SIZE = 64 * 1024
+
+
+class ArtifactStore(ABC):
+    """Files produced in the background (exports), written and read by chunks."""
+
+    @abstractmethod
+    async def write(self, key: str, chunks: AsyncIterator[bytes]) -> int:
+        """Store the chunks under `key`, returns the size of the file."""
+
+    @abstractmethod
+    async def size(self, key: str) -> int | None:
+        ...
+
+    @abstractmethod
+    def read(
+        self, key: str, start: int = 0, end: int | None = None
+    ) -> AsyncIterator[bytes]:
+        """Bytes `start` to `end` (included) of the file."""
+
+    @abstractmethod
+    async def delete(self, key: str):
+        ...
+
+
+class LocalArtifactStore(ArtifactStore):
+    """
+    Files under a directory, which must be shared by the API and the job
+    worker (same host or mounted volume).
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key
+
+    async def write(self, key: str, chunks: AsyncIterator[bytes]) -> int:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Readers never see a partial file
+        partial_path = path.with_name(f"{path.name}.part")
+
+        size = 0
+        try:
+            with open(partial_path, "wb") as file:
+                async for chunk in chunks:
+                    await asyncio.to_thread(file.write, chunk)
+                    size += len(chunk)
+            os.replace(partial_path, path)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
+
+        return size
+
+    async def size(self, key: str) -> int | None:
+        try:
+            return self._path(key).stat().st_size
+        except FileNotFoundError:
+            return None
+
+    async def read(
+        self, key: str, start: int = 0, end: int | None = None
+    ) -> AsyncIterator[bytes]:
+        with open(self._path(key), "rb") as file:
+            file.seek(start)
+            remaining = None if end is None else end - start + 1
+            while remaining is None or remaining > 0:
+                size = ARTIFACT_CHUNK_SIZE
+                if remaining is not None:
+                    size = min(size, remaining)
+                chunk = await asyncio.to_thread(file.read, size)
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    async def delete(self, key: str):
+        self._path(key).unlink(missing_ok=True)
+
+
+def _create_store() -> ArtifactStore:
+    return LocalArtifactStore(settings.EXPORT_ARTIFACT_DIR)
+
+
+artifact_store = _create_store()
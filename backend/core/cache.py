@@ -0,0 +1,229 @@
+import hashlib
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Iterable
+from urllib.parse import urlencode
+
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+
+from backend.core.config import logger, settings
+from backend.core.metrics import record_cache_lookup
+
+# Cache tags, invalidated by the services changing the cached data
+EVENTS_TAG = "events"
+TAGS_TAG = "tags"
+
+
+def event_tag(event_id: int) -> str:
+    return f"event:{event_id}"
+
+
+def organization_tag(organization_id: int) -> str:
+    return f"organization:{organization_id}"
+
+
+def targets_tag(organization_id: int) -> str:
+    return f"targets:{organization_id}"
+
+
+def surveys_tag(organization_id: int) -> str:
+    return f"surveys:{organization_id}"
+
+
+class CacheBackend(ABC):
+    @abstractmethod
+    async def get(self, key: str) -> str | None:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: int, tags: Iterable[str]):
+        ...
+
+    @abstractmethod
+    async def invalidate(self, tags: Iterable[str]):
+        ...
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU cache with TTL (per worker process)."""
+
+    def __init__(self, max_entries: int = 1000):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[
+            str, tuple[float, str, tuple[str, ...]]
+        ] = OrderedDict()
+        self._keys_by_tag: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                self._delete(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    async def set(self, key: str, value: str, ttl: int, tags: Iterable[str]):
+        tags = tuple(tags)
+        with self._lock:
+            self._delete(key)
+            self._entries[key] = (time.monotonic() + ttl, value, tags)
+            for tag in tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                self._delete(next(iter(self._entries)))
+
+    async def invalidate(self, tags: Iterable[str]):
+        with self._lock:
+            for tag in tags:
+                for key in self._keys_by_tag.pop(tag, set()):
+                    self._delete(key)
+
+    def _delete(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache shared by every worker, on any client with the `redis.asyncio` API
+    (e.g. a fakeredis client in local development).
+
+    Each tag is a set of the keys cached with it. Tag sets live as long as the
+    longest entry added to them (`EXPIRE ... NX` / `GT`, Redis >= 7).
+    """
+
+    def __init__(self, client, prefix: str = "cache:"):
+        self.client = client
+        self.prefix = prefix
+
+    async def get(self, key: str) -> str | None:
+        value = await self.client.get(self.prefix + key)
+        return value.decode() if isinstance(value, bytes) else value
+
+    async def set(self, key: str, value: str, ttl: int, tags: Iterable[str]):
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.set(self.prefix + key, value, ex=ttl)
+            for tag in tags:
+                tag_key = self._tag_key(tag)
+                pipe.sadd(tag_key, self.prefix + key)
+                pipe.expire(tag_key, ttl, nx=True)
+                pipe.expire(tag_key, ttl, gt=True)
+            await pipe.execute()
+
+    async def invalidate(self, tags: Iterable[str]):
+        for tag in tags:
+            tag_key = self._tag_key(tag)
+            keys = await self.client.smembers(tag_key)
+            await self.client.delete(tag_key, *keys)
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+
+class ResponseCache:
+    """
+    Cache of JSON compatible endpoint results, keyed by route and query params
+    and invalidated by tags.
+
+    Backend errors are logged and never fail the request (treated as a miss).
+    """
+
+    def __init__(self, backend: CacheBackend, default_ttl: int):
+        self.backend = backend
+        self.default_ttl = default_ttl
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+
+    async def get_or_set(
+        self,
+        request: Request,
+        factory: Callable[[], Awaitable[Any]],
+        tags: Iterable[str] | Callable[[Any], Iterable[str]] = (),
+        ttl: int | None = None,
+        vary: Hashable = None,
+    ) -> Any:
+        """
+        Cached result of `factory()` for this request.
+
+        `tags` may be computed from the result. `vary` separates the entries
+        of the same URL (e.g. per organization).
+        """
+        route = self._route_name(request)
+        key = self.key(request, vary)
+
+        try:
+            cached = await self.backend.get(key)
+        except Exception as e:
+            logger.error(f"Response cache get failed: {e}")
+            cached = None
+
+        record_cache_lookup("response", cached is not None)
+        if cached is not None:
+            self.hits[route] += 1
+            return json.loads(cached)
+
+        self.misses[route] += 1
+        value = jsonable_encoder(await factory())
+        tags = tags(value) if callable(tags) else tags
+
+        try:
+            await self.backend.set(
+                key, json.dumps(value), ttl or self.default_ttl, tags
+            )
+        except Exception as e:
+            logger.error(f"Response cache set failed: {e}")
+
+        return value
+
+    async def invalidate(self, *tags: str):
+        """Drop every entry cached with one of the tags (call after commit)."""
+        try:
+            await self.backend.invalidate(tags)
+        except Exception as e:
+            logger.error(f"Response cache invalidation of {tags} failed: {e}")
+
+    def key(self, request: Request, vary: Hashable = None) -> str:
+        query = urlencode(sorted(request.query_params.multi_items()))
+        raw = f"{request.method}:{request.url.path}?{query}#{vary}"
+        return hashlib.sha1(raw.encode()).hexdigest()
+
+    def metrics(self) -> dict[str, dict[str, int]]:
+        return {
+            route: {"hits": self.hits[route], "misses": self.misses[route]}
+            for route in sorted(self.hits.keys() | self.misses.keys())
+        }
+
+    def _route_name(self, request: Request) -> str:
+        route = request.scope.get("route")
+        return route.path if route else request.url.path
+
+
+def _create_backend() -> CacheBackend:
+    if settings.CACHE_BACKEND == "redis":
+        import redis.asyncio as redis
+
+        return RedisCacheBackend(redis.from_url(settings.CACHE_REDIS_URL))
+
+    return MemoryCacheBackend(settings.CACHE_MAX_ENTRIES)
+
+
+response_cache = ResponseCache(_create_backend(), settings.CACHE_DEFAULT_TTL_SECONDS)
@@ -0,0 +1,165 @@
+import hashlib
+import time
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Iterable
+
+from fastapi import Request, Response
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from backend.core.config import settings
+from backend.models.resource_version import ResourceVersion
+
+PUBLIC_CACHE_CONTROL = (
+    f"public, max-age={settings.HTTP_CACHE_MAX_AGE_SECONDS}, "
+    f"s-maxage={settings.HTTP_CACHE_S_MAXAGE_SECONDS}, "
+    f"stale-while-revalidate={settings.HTTP_CACHE_STALE_WHILE_REVALIDATE_SECONDS}"
+)
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+# Headers of a 200 response kept in its 304 (RFC 9110 15.4.5)
+_NOT_MODIFIED_HEADERS = (
+    "cache-control",
+    "content-location",
+    "date",
+    "etag",
+    "expires",
+    "last-modified",
+    "surrogate-key",
+    "vary",
+)
+
+
+async def touch_resources(db: AsyncSession, *tags: str):
+    """
+    Bump the versions of the resources named by the cache tags, in the caller's
+    transaction (call it before commit, with the tags invalidated after it).
+    """
+    if not tags:
+        return
+
+    statement = insert(ResourceVersion).values(
+        [{"key": tag, "version": 1} for tag in sorted(set(tags))]
+    )
+    await db.exec(
+        statement.on_conflict_do_update(
+            index_elements=[ResourceVersion.key],
+            set_={
+                "version": ResourceVersion.version + 1,
+                "updated_at": func.now(),
+            },
+        )
+    )
+
+
+async def get_resource_validators(
+    db: AsyncSession, tags: Iterable[str], time_bucket_seconds: int | None = None
+) -> tuple[str, datetime | None]:
+    """
+    Weak ETag and Last-Modified of the resources named by the cache tags. With
+    `time_bucket_seconds` (responses filtered on the current time), they also
+    change at the start of every time bucket.
+    """
+    tags = sorted(set(tags))
+    result = await db.exec(
+        select(
+            ResourceVersion.key, ResourceVersion.version, ResourceVersion.updated_at
+        ).where(ResourceVersion.key.in_(tags))
+    )
+    rows = {row.key: row for row in result.all()}
+
+    # Resources never bumped since the table was created are at version 0
+    raw = ",".join(f"{tag}={rows[tag].version if tag in rows else 0}" for tag in tags)
+    last_modified = max((row.updated_at for row in rows.values()), default=None)
+
+    if time_bucket_seconds:
+        bucket = int(time.time()) // time_bucket_seconds
+        raw += f",time={bucket}"
+        bucket_at = datetime.fromtimestamp(bucket * time_bucket_seconds, timezone.utc)
+        last_modified = max(last_modified or bucket_at, bucket_at)
+
+    etag = f'W/"{hashlib.sha1(raw.encode()).hexdigest()}"'
+
+    return etag, last_modified
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: datetime | None = None
+) -> bool:
+    """
+    Whether the client's copy is still fresh. If-None-Match (weak comparison)
+    takes precedence over If-Modified-Since.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        opaque_tag = etag.removeprefix("W/")
+        return any(
+            candidate.strip().removeprefix("W/") == opaque_tag
+            for candidate in if_none_match.split(",")
+        )
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            return False
+        return last_modified.replace(microsecond=0) <= since
+
+    return False
+
+
+def validator_headers(etag: str, last_modified: datetime | None) -> dict[str, str]:
+    headers = {"ETag": etag}
+    if last_modified:
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    return headers
+
+
+class ETagMiddleware(BaseHTTPMiddleware):
+    """
+    Weak ETag from the body of the JSON GET responses without validators of
+    their own, answering If-None-Match with 304. Saves the transfer only, the
+    routes declaring `conditional_response` also skip their queries.
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+
+        if (
+            request.method != "GET"
+            or response.status_code != 200
+            or "etag" in response.headers
+            or not response.headers.get("content-type", "").startswith(
+                "application/json"
+            )
+        ):
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        etag = f'W/"{hashlib.sha1(body).hexdigest()}"'
+
+        if is_not_modified(request, etag):
+            headers = {
+                name: value
+                for name, value in response.headers.items()
+                if name in _NOT_MODIFIED_HEADERS
+            }
+            headers["etag"] = etag
+            return Response(status_code=304, headers=headers)
+
+        headers = dict(response.headers)
+        headers["etag"] = etag
+        return Response(
+            content=body,
+            status_code=response.status_code,
+            headers=headers,
+            background=response.background,
+        )
@@ -1,4 +1,5 @@
 import logging
+import tempfile
 from pathlib import Path
 from typing import Any, Literal, Optional
 
@@ -44,6 +45,93 @@ class Settings(BaseSettings):
     READ_DB_USERNAME: Optional[str]
     READ_DB_PASSWORD: Optional[str]
     READ_DATABASE_URI: Optional[PostgresDsn | str] = None
+    # Additional read replicas (JSON list of URIs), balanced with READ_DATABASE_URI
+    READ_REPLICA_DATABASE_URIS: list[str] = []
+    # Replicas lagging behind master more than this are skipped (fallback to master)
+    DB_REPLICA_MAX_LAG_SECONDS: float = 5.0
+    DB_REPLICA_LAG_CHECK_INTERVAL_SECONDS: float = 2.0
+
+    # DB connection pool config (applied to both master and read engines)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_ECHO: bool = False
+
+    # Statements of each request, sent in the Server-Timing header and logged as
+    # JSON (QUERY_STATS_LOG). Requests over the query budget of their route or
+    # running a statement QUERY_N_PLUS_ONE_THRESHOLD times (0 disables) are
+    # logged, or fail with QUERY_STATS_STRICT (development and tests).
+    QUERY_STATS_LOG: bool = False
+    QUERY_STATS_SLOWEST_COUNT: int = 3
+    QUERY_N_PLUS_ONE_THRESHOLD: int = 10
+    QUERY_STATS_STRICT: bool = False
+
+    # Event keyword search: "postgres" uses tsvector/pg_trgm indexes,
+    # "memory" an in-process inverted index (no extension required)
+    EVENT_SEARCH_BACKEND: Literal["postgres", "memory"] = "postgres"
+    EVENT_SEARCH_INDEX_TTL_SECONDS: int = 300
+    EVENT_SEARCH_MAX_RESULTS: int = 1000
+
+    # Number of similar events stored per event (related events)
+    EVENT_SIMILARITY_TOP_K: int = 12
+
+    # Event views are buffered in process and flushed to event_stats in batches.
+    # The same viewer (user / IP) is counted once per event within the window.
+    EVENT_VIEW_FLUSH_INTERVAL_SECONDS: float = 10.0
+    EVENT_VIEW_DEDUP_WINDOW_SECONDS: float = 1800.0
+    EVENT_VIEW_DEDUP_MAX_ENTRIES: int = 100_000
+
+    # Tickets held by a checkout are released after the TTL if not confirmed
+    # (also the lifetime of the Stripe checkout session, at least 30 minutes).
+    # The sweeper releases at most TICKET_RESERVATION_SWEEP_BATCH_SIZE per run.
+    TICKET_RESERVATION_TTL_SECONDS: int = 1800
+    TICKET_RESERVATION_SWEEP_INTERVAL_SECONDS: float = 30.0
+    TICKET_RESERVATION_SWEEP_BATCH_SIZE: int = 500
+
+    # Stripe webhook events are queued by the API and processed by the worker
+    # (python -m backend.commands.run_stripe_webhook_worker). Failed events are
+    # retried with exponential backoff, then moved to the dead letters.
+    STRIPE_WEBHOOK_WORKER_CONCURRENCY: int = 4
+    STRIPE_WEBHOOK_POLL_INTERVAL_SECONDS: float = 1.0
+    STRIPE_WEBHOOK_MAX_ATTEMPTS: int = 8
+    STRIPE_WEBHOOK_RETRY_BASE_SECONDS: float = 5.0
+    STRIPE_WEBHOOK_RETRY_MAX_SECONDS: float = 3600.0
+
+    # Background jobs (emails, ...) are written to the jobs table in the
+    # transaction of the request and run by the job worker
+    # (python -m backend.commands.run_job_worker), retried with exponential
+    # backoff up to JOB_MAX_ATTEMPTS times.
+    JOB_WORKER_CONCURRENCY: int = 4
+    JOB_POLL_INTERVAL_SECONDS: float = 1.0
+    JOB_MAX_ATTEMPTS: int = 5
+    JOB_RETRY_BASE_SECONDS: float = 10.0
+    JOB_RETRY_MAX_SECONDS: float = 3600.0
+
+    # Large exports run by the job worker. Files are kept under
+    # EXPORT_ARTIFACT_DIR (shared by the API and the worker) until the TTL.
+    EXPORT_ARTIFACT_BACKEND: Literal["local"] = "local"
+    EXPORT_ARTIFACT_DIR: Path = Path(tempfile.gettempdir()) / "roominar-exports"
+    EXPORT_ARTIFACT_TTL_SECONDS: int = 86400
+    EXPORT_SWEEP_INTERVAL_SECONDS: float = 600.0
+    EXPORT_PROGRESS_INTERVAL_ROWS: int = 5000
+
+    # Response cache of public read endpoints: "memory" (per process LRU, other
+    # workers only see invalidations after the TTL) or "redis" (shared, requires
+    # the redis extra and CACHE_REDIS_URL)
+    CACHE_BACKEND: Literal["memory", "redis"] = "memory"
+    CACHE_REDIS_URL: Optional[str] = None
+    CACHE_DEFAULT_TTL_SECONDS: int = 60
+    CACHE_MAX_ENTRIES: int = 1000
+
+    # HTTP caching of public responses: browsers revalidate (ETag) after
+    # HTTP_CACHE_MAX_AGE_SECONDS, shared caches (CDN) after HTTP_CACHE_S_MAXAGE_SECONDS
+    HTTP_CACHE_MAX_AGE_SECONDS: int = 0
+    HTTP_CACHE_S_MAXAGE_SECONDS: int = 60
+    HTTP_CACHE_STALE_WHILE_REVALIDATE_SECONDS: int = 30
+    # Validators of the responses filtered on the current time change this often
+    HTTP_CACHE_TIME_BUCKET_SECONDS: int = 60
 
     # Auth config
     ALGORITHM: Optional[str]
@@ -51,10 +139,45 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: Optional[int]
     REFRESH_TOKEN_EXPIRE_MINUTES: Optional[int]
     REFRESH_TOKEN_REMEMBERED_EXPIRE_MINUTES: Optional[int]
+    # Refresh tokens are rotated on use, reusing a rotated token revokes its
+    # family, unless within REFRESH_TOKEN_REUSE_GRACE_SECONDS of its rotation
+    # (concurrent refreshes of the tabs of a browser get its successor). Revoked
+    # tokens are remembered per process (LRU) and expired ones deleted every
+    # REFRESH_TOKEN_COMPACT_INTERVAL_SECONDS.
+    REFRESH_TOKEN_REUSE_GRACE_SECONDS: int = 10
+    REFRESH_TOKEN_REVOKED_CACHE_MAX_ENTRIES: int = 100_000
+    REFRESH_TOKEN_COMPACT_INTERVAL_SECONDS: float = 3600.0
+    REFRESH_TOKEN_COMPACT_BATCH_SIZE: int = 5000
+    # Users of the access tokens are cached per process (0 disables). A change
+    # of the user reaches the other workers after the TTL.
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10_000
+    # bcrypt runs in a pool of PASSWORD_HASH_POOL_SIZE threads, with up to
+    # PASSWORD_HASH_MAX_QUEUE more calls waiting (further ones get a 503 with
+    # Retry-After: PASSWORD_HASH_RETRY_AFTER_SECONDS).
+    # Passwords hashed with another cost factor are rehashed on login.
+    PASSWORD_BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_POOL_SIZE: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+    PASSWORD_HASH_RETRY_AFTER_SECONDS: int = 1
     EMAIL_HOST: Optional[str]
     EMAIL_USERNAME: Optional[str]
     EMAIL_PASSWORD: Optional[str]
     EMAIL_PORT: Optional[str]
+    EMAIL_STARTTLS: bool = True
+    EMAIL_VALIDATE_CERTS: bool = True
+    # Authenticated SMTP connections kept open and reused by the mailer
+    EMAIL_POOL_SIZE: int = 4
+    EMAIL_POOL_IDLE_CHECK_SECONDS: float = 30.0
+    EMAIL_TIMEOUT_SECONDS: float = 30.0
+    # Compile the email templates when the API / job worker starts
+    EMAIL_PRECOMPILE_TEMPLATES: bool = True
+    # Email campaigns of organizers are sent by the job worker, recipients are
+    # paged by EMAIL_CAMPAIGN_BATCH_SIZE. A failed recipient is retried with
+    # the campaign job, up to EMAIL_CAMPAIGN_MAX_ATTEMPTS times.
+    EMAIL_CAMPAIGN_BATCH_SIZE: int = 500
+    EMAIL_CAMPAIGN_RATE_PER_SECOND: int = 50
+    EMAIL_CAMPAIGN_MAX_ATTEMPTS: int = 3
     AUD_SENDER_EMAIL: Optional[str]
     ORG_SENDER_EMAIL: Optional[str]
 
@@ -133,6 +133,16 @@ class EventSortByCode(str, Enum):
     PUBLISHED_AT = "PUBLISHED_AT"
     APPLICATION_END_AT = "APPLICATION_END_AT"
     RECOMMENDATION = "RECOMMENDATION"
+    RELEVANCE = "RELEVANCE"
+
+
+class EventSearchModeCode(str, Enum):
+    # Every keyword token matches a word (or word prefix) of the event
+    FULLTEXT = "FULLTEXT"
+    # FULLTEXT + trigram similarity on the event name (typo tolerant)
+    FUZZY = "FUZZY"
+    # Substring match on the event name
+    PARTIAL = "PARTIAL"
 
 
 class QuestionTypeCode(str, Enum):
@@ -165,6 +175,67 @@ class TicketStatusCode(str, Enum):
     CANCELED = "CANCELED"
 
 
+class CheckoutStatusCode(str, Enum):
+    PENDING = "PENDING"
+    COMPLETED = "COMPLETED"
+    EXPIRED = "EXPIRED"
+    FAILED = "FAILED"
+
+
+class WebhookEventStatusCode(str, Enum):
+    PENDING = "PENDING"
+    DONE = "DONE"
+    DEAD = "DEAD"
+
+
+class JobStatusCode(str, Enum):
+    PENDING = "PENDING"
+    DONE = "DONE"
+    DEAD = "DEAD"
+
+
+class ExportFormatCode(str, Enum):
+    CSV = "CSV"
+    XLSX = "XLSX"
+
+
+class ExportKindCode(str, Enum):
+    ATTENDEES = "ATTENDEES"
+    SURVEY_RESPONSES = "SURVEY_RESPONSES"
+    TRANSACTIONS = "TRANSACTIONS"
+
+
+class ExportJobStatusCode(str, Enum):
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    DONE = "DONE"
+    FAILED = "FAILED"
+    EXPIRED = "EXPIRED"
+
+
+class AnalyticsPeriodCode(str, Enum):
+    HOUR = "HOUR"
+    DAY = "DAY"
+
+
+class EmailCampaignStatusCode(str, Enum):
+    PENDING = "PENDING"
+    SENDING = "SENDING"
+    DONE = "DONE"
+
+
+class EmailDeliveryStatusCode(str, Enum):
+    PENDING = "PENDING"
+    SENT = "SENT"
+    FAILED = "FAILED"
+
+
+class TicketReservationStatusCode(str, Enum):
+    HELD = "HELD"
+    CONFIRMED = "CONFIRMED"
+    RELEASED = "RELEASED"
+
+
 class TransactionStatusCode(str, Enum):
     PENDING = "PENDING"
     SUCCESS = "SUCCESS"
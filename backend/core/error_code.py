@@ -34,6 +34,7 @@ class ErrorCode:
     ERR_ONLINE_EVENT_MISSING_ADDRESS = "ERR_ONLINE_EVENT_MISSING_ADDRESS"
     ERR_SURVEY_INVALID_START_END_DATE = "ERR_SURVEY_INVALID_START_END_DATE"
     ERR_SURVEY_NAME_ALREADY_EXISTED = "ERR_SURVEY_NAME_ALREADY_EXISTED"
+    ERR_SURVEY_NOT_FOUND = "ERR_SURVEY_NOT_FOUND"
     ERR_TARGET_ALREADY_EXISTED = "ERR_TARGET_ALREADY_EXISTED"
     ERR_ORGANIZATION_FOLLOW_EXISTED = "ERR_ORGANIZATION_FOLLOW_EXISTED"
     ERR_ORGANIZATION_FOLLOW_NOT_FOUND = "ERR_ORGANIZATION_FOLLOW_NOT_FOUND"
@@ -44,9 +45,17 @@ class ErrorCode:
     ERR_INVALID_TICKET = "ERR_INVALID_TICKET"
     ERR_TICKET_NOT_FREE = "ERR_TICKET_NOT_FREE"
     ERR_NOT_ENOUGH_TICKETS_FOR_REQUEST = "ERR_NOT_ENOUGH_TICKETS_FOR_REQUEST"
+    ERR_INVALID_TICKET_QUANTITY = "ERR_INVALID_TICKET_QUANTITY"
     ERR_CHECK_IN_ALREADY_EXISTED = "ERR_CHECK_IN_ALREADY_EXISTED"
     ERR_CHECK_IN_NOT_FOUND = "ERR_CHECK_IN_NOT_FOUND"
     ERR_ATTENDEE_NOT_FOUND = "ERR_ATTENDEE_NOT_FOUND"
+    ERR_INVALID_CURSOR = "ERR_INVALID_CURSOR"
+    ERR_EMAIL_CAMPAIGN_NOT_FOUND = "ERR_EMAIL_CAMPAIGN_NOT_FOUND"
+    ERR_EXPORT_JOB_NOT_FOUND = "ERR_EXPORT_JOB_NOT_FOUND"
+    ERR_EXPORT_NOT_READY = "ERR_EXPORT_NOT_READY"
+    ERR_SERVER_BUSY = "ERR_SERVER_BUSY"
+    ERR_INVALID_ANALYTICS_RANGE = "ERR_INVALID_ANALYTICS_RANGE"
+    ERR_ANALYTICS_RANGE_TOO_LONG = "ERR_ANALYTICS_RANGE_TOO_LONG"
 
 
 class ErrorMessage:
@@ -87,6 +96,7 @@ class ErrorMessage:
     ERR_ONLINE_EVENT_MISSING_ADDRESS = "Missing meeting tool, url of online event."
     ERR_SURVEY_INVALID_START_END_DATE = "Survey end date must greater than start date."
     ERR_SURVEY_NAME_ALREADY_EXISTED = "The survey name already existed."
+    ERR_SURVEY_NOT_FOUND = "The survey doesn't exist."
     ERR_TARGET_ALREADY_EXISTED = "The target already existed."
     ERR_ORGANIZATION_FOLLOW_EXISTED = "The organization follow existed."
     ERR_ORGANIZATION_FOLLOW_NOT_FOUND = "The organization follow doesn't exist."
@@ -97,6 +107,16 @@ class ErrorMessage:
     ERR_INVALID_TICKET = "Invalid ticket."
     ERR_TICKET_NOT_FREE = "Ticket not free."
     ERR_NOT_ENOUGH_TICKETS_FOR_REQUEST = "Not enough tickets for request."
+    ERR_INVALID_TICKET_QUANTITY = "The ticket quantity must be positive."
     ERR_CHECK_IN_ALREADY_EXISTED = "The check-in already existed."
     ERR_CHECK_IN_NOT_FOUND = "The check-in doesn't exist."
     ERR_ATTENDEE_NOT_FOUND = "The attendee doesn't exist."
+    ERR_INVALID_CURSOR = "Invalid pagination cursor."
+    ERR_EMAIL_CAMPAIGN_NOT_FOUND = "The email campaign doesn't exist."
+    ERR_EXPORT_JOB_NOT_FOUND = "The export doesn't exist."
+    ERR_EXPORT_NOT_READY = "The export file isn't available."
+    ERR_SERVER_BUSY = "The server is busy, please try again later."
+    ERR_INVALID_ANALYTICS_RANGE = "from_at must be before to_at."
+    ERR_ANALYTICS_RANGE_TOO_LONG = (
+        "The range is too long for the period (31 days by hour, 366 days by day)."
+    )
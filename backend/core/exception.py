@@ -29,3 +29,28 @@ class AccessDeniedException(Exception):
         self.error_code = error_code
         self.message = message
         self.debug_info = debug_info
+
+
+class ServiceUnavailableException(Exception):
+    """The server is overloaded, the client should retry after `retry_after`."""
+
+    def __init__(
+        self,
+        error_code: str,
+        message: str = None,
+        retry_after: int = 1,
+        debug_info: str = None,
+    ) -> None:
+        self.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        self.error_code = error_code
+        self.message = message
+        self.retry_after = retry_after
+        self.debug_info = debug_info
+
+
+class NotModifiedException(Exception):
+    """The client's cached response is still valid (answered with 304)."""
+
+    def __init__(self, headers: dict[str, str]) -> None:
+        self.status_code = status.HTTP_304_NOT_MODIFIED
+        self.headers = headers
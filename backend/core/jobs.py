@@ -0,0 +1,26 @@
+from typing import Any, Awaitable, Callable
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+JobHandler = Callable[..., Awaitable[Any]]
+
+# Handlers of the background jobs by name, called as handler(db, **payload)
+job_handlers: dict[str, JobHandler] = {}
+
+
+def job_handler(name: str) -> Callable[[JobHandler], JobHandler]:
+    """Register the decorated coroutine as the handler of the `name` jobs."""
+
+    def decorator(handler: JobHandler) -> JobHandler:
+        if name in job_handlers:
+            raise ValueError(f"Job handler {name} is already registered")
+        job_handlers[name] = handler
+        return handler
+
+    return decorator
+
+
+async def run_job_handler(db: AsyncSession, name: str, payload: dict[str, Any]):
+    if name not in job_handlers:
+        raise LookupError(f"No handler registered for job {name}")
+    return await job_handlers[name](db, **payload)
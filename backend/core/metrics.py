@@ -0,0 +1,177 @@
+import os
+import time
+
+from fastapi import Request
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.core import GaugeMetricFamily
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.middleware.base import BaseHTTPMiddleware
+
+# With several uvicorn workers, PROMETHEUS_MULTIPROC_DIR must name a directory
+# shared by them (emptied before they start): each worker writes its samples
+# there and /metrics aggregates them.
+MULTIPROCESS = bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP requests", ["method", "route", "status"]
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time until the response starts, per route template",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests being handled",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Connections kept by the pools",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "Connections in use",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow_connections",
+    "Connections in use beyond the pool size",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests_total", "Cache lookups (hit ratio)", ["cache", "result"]
+)
+
+
+def instrument_pool(engine: AsyncEngine, name: str):
+    """Track the connections of the engine's pool in the db_pool_* gauges."""
+    size = engine.sync_engine.pool.size()
+    checked_out = 0
+    DB_POOL_SIZE.labels(name).set(size)
+
+    def update(delta: int):
+        nonlocal checked_out
+        checked_out += delta
+        DB_POOL_CHECKED_OUT.labels(name).set(checked_out)
+        DB_POOL_OVERFLOW.labels(name).set(max(checked_out - size, 0))
+
+    event.listen(engine.sync_engine, "checkout", lambda *args: update(1))
+    event.listen(engine.sync_engine, "checkin", lambda *args: update(-1))
+
+
+def record_cache_lookup(cache: str, hit: bool):
+    CACHE_REQUESTS.labels(cache, "hit" if hit else "miss").inc()
+
+
+class MetricsMiddleware(BaseHTTPMiddleware):
+    """Latency, in-flight requests and status codes per route template."""
+
+    async def dispatch(self, request: Request, call_next):
+        in_flight = HTTP_REQUESTS_IN_FLIGHT.labels(request.method)
+        in_flight.inc()
+        started_at = time.perf_counter()
+        status_code = 500
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            in_flight.dec()
+            route = request.scope.get("route")
+            route_path = route.path if route else "unmatched"
+            HTTP_REQUEST_DURATION.labels(request.method, route_path).observe(
+                time.perf_counter() - started_at
+            )
+            HTTP_REQUESTS.labels(request.method, route_path, str(status_code)).inc()
+
+
+class _SnapshotCollector:
+    def __init__(self, families: list[GaugeMetricFamily]):
+        self.families = families
+
+    def collect(self):
+        return self.families
+
+
+def _queue_families(
+    job_metrics: dict[str, dict], stripe_webhook_metrics: dict[str, float | int]
+) -> list[GaugeMetricFamily]:
+    job_pending = GaugeMetricFamily(
+        "job_queue_pending", "Pending background jobs", labels=["job"]
+    )
+    job_due = GaugeMetricFamily(
+        "job_queue_due", "Pending background jobs due to run", labels=["job"]
+    )
+    job_age = GaugeMetricFamily(
+        "job_queue_oldest_pending_age_seconds",
+        "Age of the oldest pending background job",
+        labels=["job"],
+    )
+    for name, metrics in job_metrics.items():
+        job_pending.add_metric([name], metrics["pending"])
+        job_due.add_metric([name], metrics["due"])
+        job_age.add_metric([name], metrics["oldest_pending_age_seconds"] or 0)
+
+    return [
+        job_pending,
+        job_due,
+        job_age,
+        GaugeMetricFamily(
+            "stripe_webhook_pending",
+            "Stripe events waiting to be processed",
+            value=stripe_webhook_metrics["pending"],
+        ),
+        GaugeMetricFamily(
+            "stripe_webhook_oldest_pending_age_seconds",
+            "Age of the oldest Stripe event waiting to be processed",
+            value=stripe_webhook_metrics["oldest_pending_age_seconds"],
+        ),
+        GaugeMetricFamily(
+            "stripe_webhook_lag_seconds",
+            "Average time from reception to processing of the Stripe events "
+            "processed in the last hour",
+            value=stripe_webhook_metrics["avg_lag_seconds_last_hour"],
+        ),
+    ]
+
+
+def generate_metrics(
+    job_metrics: dict[str, dict], stripe_webhook_metrics: dict[str, float | int]
+) -> bytes:
+    """
+    Prometheus text exposition of the metrics of every worker, followed by the
+    queues (read from the database by the caller).
+    """
+    registry = REGISTRY
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+
+    queues = CollectorRegistry()
+    queues.register(
+        _SnapshotCollector(_queue_families(job_metrics, stripe_webhook_metrics))
+    )
+
+    return generate_latest(registry) + generate_latest(queues)
+
+
+def mark_process_dead():
+    """Drop the live gauges of this worker (call on shutdown)."""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
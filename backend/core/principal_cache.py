@@ -0,0 +1,80 @@
+import json
+from collections import Counter
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm import make_transient_to_detached
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core.cache import MemoryCacheBackend
+from backend.core.config import logger, settings
+from backend.core.metrics import record_cache_lookup
+from backend.models.user import User
+
+
+def user_tag(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+class PrincipalCache:
+    """
+    Users authenticated by an access token, keyed by its (sub, role) claims,
+    so that most requests skip the user lookup.
+
+    Entries are kept in process only (they hold the password hash) and are
+    dropped by the services changing the user. Other workers keep serving
+    their entry until the TTL, keep it short.
+    """
+
+    def __init__(self, ttl: int, max_entries: int):
+        self.ttl = ttl
+        self.backend = MemoryCacheBackend(max_entries)
+        self.counts: Counter = Counter()
+
+    async def get(self, db: AsyncSession, email: str, role: str) -> User | None:
+        """Cached user, attached to `db` as if loaded by it (no query)."""
+        if self.ttl <= 0:
+            return None
+
+        cached = await self.backend.get(self._key(email, role))
+        record_cache_lookup("principal", cached is not None)
+        if cached is None:
+            self.counts["misses"] += 1
+            return None
+
+        self.counts["hits"] += 1
+        user = User.model_validate(json.loads(cached))
+        make_transient_to_detached(user)
+        return await db.merge(user, load=False)
+
+    async def set(self, email: str, role: str, user: User):
+        if self.ttl <= 0:
+            return
+
+        try:
+            await self.backend.set(
+                self._key(email, role),
+                json.dumps(jsonable_encoder(user.model_dump())),
+                self.ttl,
+                (user_tag(user.id),),
+            )
+        except Exception as e:
+            logger.error(f"Principal cache set of user {user.id} failed: {e}")
+
+    async def invalidate(self, user_id: int):
+        """Drop the entries of the user (call after commit)."""
+        await self.backend.invalidate((user_tag(user_id),))
+
+    def metrics(self) -> dict[str, int]:
+        return {
+            "hits": self.counts["hits"],
+            "misses": self.counts["misses"],
+            "entries": len(self.backend),
+        }
+
+    def _key(self, email: str, role: str) -> str:
+        return f"{role}:{email}"
+
+
+principal_cache = PrincipalCache(
+    settings.PRINCIPAL_CACHE_TTL_SECONDS, settings.PRINCIPAL_CACHE_MAX_ENTRIES
+)
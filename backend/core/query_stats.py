@@ -0,0 +1,159 @@
+import json
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Callable
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from backend.core.config import logger, settings
+
+# asyncpg placeholders with their casts ($1::INTEGER)
+_PARAMETER = re.compile(
+    r"\$\d+(?:::\w+(?: WITH(?:OUT)? TIME ZONE)?(?:\[\])?)?|%\(\w+\)s"
+)
+_PARAMETER_LIST = re.compile(r"\(\?(?:\s*,\s*\?)*\)")
+_REPEATED_PARAMETER_LISTS = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(Exception):
+    """A request ran too many statements (QUERY_STATS_STRICT only)."""
+
+
+def statement_shape(statement: str) -> str:
+    """The statement without its parameters (IN lists / VALUES of any length)."""
+    shape = _PARAMETER.sub("?", statement)
+    shape = _PARAMETER_LIST.sub("(?)", shape)
+    shape = _REPEATED_PARAMETER_LISTS.sub("(?)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class RequestQueries:
+    """Statements run while handling a request."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.shapes: Counter = Counter()
+        self.slowest: list[tuple[float, str]] = []
+
+    def record(self, statement: str, duration: float):
+        shape = statement_shape(statement)
+        self.count += 1
+        self.duration += duration
+        self.shapes[shape] += 1
+
+        limit = settings.QUERY_STATS_SLOWEST_COUNT
+        self.slowest.append((duration, shape))
+        self.slowest.sort(reverse=True)
+        del self.slowest[limit:]
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statements run at least `threshold` times (N+1 suspects)."""
+        if threshold <= 0:
+            return []
+        return [(shape, n) for shape, n in self.shapes.most_common() if n >= threshold]
+
+
+_request_queries: ContextVar[RequestQueries | None] = ContextVar(
+    "request_queries", default=None
+)
+
+
+def instrument_engine(engine: AsyncEngine):
+    """Record the statements of the engine in the current request, if any."""
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        if context is not None:
+            context._query_started_at = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        queries = _request_queries.get()
+        started_at = getattr(context, "_query_started_at", None)
+        if queries is not None and started_at is not None:
+            queries.record(statement, time.perf_counter() - started_at)
+
+
+def query_budget(max_queries: int) -> Callable:
+    """Maximum number of statements of a route (checked by QueryStatsMiddleware)."""
+
+    def decorator(endpoint: Callable) -> Callable:
+        endpoint.query_budget = max_queries
+        return endpoint
+
+    return decorator
+
+
+class QueryStatsMiddleware(BaseHTTPMiddleware):
+    """
+    Number, total duration and slowest statements of each request, sent in the
+    Server-Timing header and logged (QUERY_STATS_LOG).
+
+    Requests over their `query_budget` or repeating a statement
+    QUERY_N_PLUS_ONE_THRESHOLD times are logged, and fail with
+    QUERY_STATS_STRICT (development and tests).
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        queries = RequestQueries()
+        token = _request_queries.set(queries)
+        started_at = time.perf_counter()
+        try:
+            response = await call_next(request)
+        finally:
+            _request_queries.reset(token)
+        duration = time.perf_counter() - started_at
+
+        response.headers.append(
+            "Server-Timing",
+            f'db;dur={queries.duration * 1000:.1f};desc="{queries.count} queries", '
+            f"app;dur={duration * 1000:.1f}",
+        )
+
+        route = request.scope.get("route")
+        route_path = route.path if route else request.url.path
+        if settings.QUERY_STATS_LOG and queries.count:
+            logger.info(
+                json.dumps(
+                    {
+                        "method": request.method,
+                        "route": route_path,
+                        "status": response.status_code,
+                        "queries": queries.count,
+                        "db_ms": round(queries.duration * 1000, 1),
+                        "duration_ms": round(duration * 1000, 1),
+                        "slowest": [
+                            {"ms": round(d * 1000, 1), "statement": shape}
+                            for d, shape in queries.slowest
+                        ],
+                    }
+                )
+            )
+
+        self._check(request.method, route_path, route, queries)
+        return response
+
+    def _check(self, method: str, route_path: str, route, queries: RequestQueries):
+        problems = []
+
+        budget = getattr(getattr(route, "endpoint", None), "query_budget", None)
+        if budget is not None and queries.count > budget:
+            problems.append(f"{queries.count} queries (budget {budget})")
+
+        for shape, n in queries.repeated(settings.QUERY_N_PLUS_ONE_THRESHOLD):
+            problems.append(f"{n} times (N+1?) {shape[:200]}")
+
+        if not problems:
+            return
+
+        message = f"{method} {route_path}: " + "; ".join(problems)
+        if settings.QUERY_STATS_STRICT:
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
@@ -1,5 +1,6 @@
 from fastapi import status
 from fastapi.responses import JSONResponse
+
 from backend.schemas.error import ErrorResponse400, ErrorResponse401, ErrorResponse403
 
 public_api_responses = {
@@ -50,3 +51,17 @@ class AccessDeniedResponse(JSONResponse):
             "debug_info": debug_info,
         }
         super().__init__(status_code=status.HTTP_403_FORBIDDEN, content=custom_content)
+
+
+class ServiceUnavailableResponse(JSONResponse):
+    def __init__(self, error_code, message=None, retry_after=1, debug_info=None):
+        custom_content = {
+            "error_code": error_code,
+            "message": message,
+            "debug_info": debug_info,
+        }
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content=custom_content,
+            headers={"Retry-After": str(retry_after)},
+        )
@@ -1,31 +1,156 @@
-from typing import Generator
-from sqlmodel import Session, create_engine
-from backend.core.config import settings
+import itertools
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator
 
-master_engine = create_engine(settings.MASTER_DATABASE_URI)
-read_engine = create_engine(settings.READ_DATABASE_URI)
+from fastapi import Request
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-MasterDBSession = Session(autocommit=False, autoflush=False, bind=master_engine)
-ReadDBSession = Session(autocommit=False, autoflush=False, bind=read_engine)
+from backend.core.config import logger, settings
+from backend.core.metrics import instrument_pool
+from backend.core.query_stats import instrument_engine
 
+READ_ONLY_METHODS = ("GET", "HEAD", "OPTIONS")
 
-def get_master_db() -> Generator[Session, None, None]:
+# Primary (or not yet replaying) -> 0. Otherwise seconds since the last replayed
+# transaction, unless the replica has already replayed everything it received.
+REPLICA_LAG_QUERY = text(
     """
-    データベースセッションを取得するジェネレータ関数
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+        )
+    END
+    """
+)
+
+
+def _create_engine(database_uri: str, name: str) -> AsyncEngine:
+    """
+    asyncpg ドライバーで非同期エンジンを作成する
+
+    URI は `postgresql://` のままでも `postgresql+asyncpg://` に差し替える。
+    """
+    url = make_url(str(database_uri)).set(drivername="postgresql+asyncpg")
+    engine = create_async_engine(
+        url,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        echo=settings.DB_ECHO,
+    )
+    instrument_engine(engine)
+    instrument_pool(engine, name)
+    return engine
+
+
+def _create_sessionmaker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    # expire_on_commit=False: commit 後に属性へアクセスしても暗黙の再読み込み
+    # (= 非同期コンテキスト外での I/O) が発生しないようにする
+    return async_sessionmaker(
+        engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+    )
+
+
+class ReadReplica:
+    def __init__(self, database_uri: str, name: str):
+        self.engine = _create_engine(database_uri, name)
+        self.sessionmaker = _create_sessionmaker(self.engine)
+        self.lag = 0.0
+        self.checked_at = 0.0
+
+    async def get_lag(self) -> float:
+        """
+        レプリケーション遅延 (秒) を返す
+
+        DB_REPLICA_LAG_CHECK_INTERVAL_SECONDS の間は前回の結果を使い回す。
+        接続できない場合は無限大とみなし、ルーティング対象から外す。
+        """
+        now = time.monotonic()
+        if now - self.checked_at < settings.DB_REPLICA_LAG_CHECK_INTERVAL_SECONDS:
+            return self.lag
+
+        self.checked_at = now
+        try:
+            async with self.engine.connect() as conn:
+                self.lag = float((await conn.execute(REPLICA_LAG_QUERY)).scalar() or 0)
+        except Exception as e:
+            logger.warning(f"Failed to check replica lag ({self.engine.url}): {e}")
+            self.lag = math.inf
+
+        return self.lag
+
+
+master_engine = _create_engine(settings.MASTER_DATABASE_URI, "master")
+MasterDBSession = _create_sessionmaker(master_engine)
+
+read_replicas = [
+    ReadReplica(uri, f"read_{i}")
+    for i, uri in enumerate(
+        dict.fromkeys(
+            [str(settings.READ_DATABASE_URI), *settings.READ_REPLICA_DATABASE_URIS]
+        )
+    )
+]
+_replica_cycle = itertools.cycle(read_replicas)
+
+
+async def _choose_read_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """
+    遅延が閾値以内のレプリカをラウンドロビンで選ぶ
+
+    すべてのレプリカが閾値を超えている場合はマスターにフォールバックする。
+    """
+    for _ in range(len(read_replicas)):
+        replica = next(_replica_cycle)
+        if await replica.get_lag() <= settings.DB_REPLICA_MAX_LAG_SECONDS:
+            return replica.sessionmaker
+
+    logger.warning("All read replicas are lagging behind, falling back to master.")
+    return MasterDBSession
+
+
+async def get_master_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    リクエストごとに新しいデータベースセッションを取得するジェネレータ関数
 
     Returns:
-        DbSession: データベースセッションオブジェクト
+        AsyncSession: データベースセッションオブジェクト
     """
-    db = MasterDBSession
-    try:
+    async with MasterDBSession() as db:
         yield db
-    finally:
-        db.close()
 
 
-def get_read_db():
-    db = ReadDBSession
-    try:
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    sessionmaker = await _choose_read_sessionmaker()
+    async with sessionmaker() as db:
+        yield db
+
+
+# レスポンス送信中も使うセッション (StreamingResponse など)
+# FastAPI は本文を送る前に依存関係のセッションを閉じるため
+read_db_session = asynccontextmanager(get_read_db)
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    HTTP メソッドで読み書きを振り分けるセッション
+
+    GET / HEAD / OPTIONS はレプリカ、それ以外 (書き込み) はマスターを使う。
+    直前の書き込みを読む必要があるエンドポイントは get_master_db を直接使うこと。
+    """
+    if request.method in READ_ONLY_METHODS:
+        sessionmaker = await _choose_read_sessionmaker()
+    else:
+        sessionmaker = MasterDBSession
+
+    async with sessionmaker() as db:
         yield db
-    finally:
-        db.close()
@@ -1,23 +1,64 @@
+import asyncio
+from email.message import EmailMessage
+from email.utils import formataddr
 from typing import Any
 
-from fastapi_mail import ConnectionConfig, FastMail, MessageSchema, MessageType
-from jinja2 import Environment, FileSystemLoader
-
-from backend.core.config import settings
-
-conf = ConnectionConfig(
-    MAIL_USERNAME=settings.EMAIL_USERNAME,
-    MAIL_PASSWORD=settings.EMAIL_PASSWORD,
-    MAIL_FROM=settings.AUD_SENDER_EMAIL,
-    MAIL_PORT=settings.EMAIL_PORT,
-    MAIL_SERVER=settings.EMAIL_HOST,
-    MAIL_STARTTLS=True,
-    MAIL_SSL_TLS=False,
-    USE_CREDENTIALS=True,
-    VALIDATE_CERTS=True,
-    TEMPLATE_FOLDER=settings.TEMPLATE_FOLDER,
+from jinja2 import Environment, FileSystemLoader, TemplateSyntaxError
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import backend.api.v1.services.jobs as jobs_service
+from backend.core.config import logger, settings
+from backend.core.jobs import job_handler
+from backend.mails.smtp_pool import SMTPConnectionPool
+
+# Templates are compiled once and kept (no reload check on each render)
+template_env = Environment(
+    loader=FileSystemLoader(settings.TEMPLATE_FOLDER),
+    auto_reload=False,
+    cache_size=-1,
 )
 
+_smtp_pool: SMTPConnectionPool | None = None
+
+
+def get_smtp_pool() -> SMTPConnectionPool:
+    global _smtp_pool
+    if _smtp_pool is None:
+        _smtp_pool = SMTPConnectionPool(
+            settings.EMAIL_POOL_SIZE,
+            settings.EMAIL_POOL_IDLE_CHECK_SECONDS,
+            hostname=settings.EMAIL_HOST,
+            port=int(settings.EMAIL_PORT) if settings.EMAIL_PORT else None,
+            username=settings.EMAIL_USERNAME or None,
+            password=settings.EMAIL_PASSWORD or None,
+            start_tls=settings.EMAIL_STARTTLS,
+            validate_certs=settings.EMAIL_VALIDATE_CERTS,
+            timeout=settings.EMAIL_TIMEOUT_SECONDS,
+        )
+    return _smtp_pool
+
+
+async def close_smtp_pool():
+    global _smtp_pool
+    if _smtp_pool is not None:
+        pool, _smtp_pool = _smtp_pool, None
+        await pool.close()
+
+
+def precompile_templates():
+    """Compile every email template ahead of the first send."""
+    compiled = 0
+    for name in template_env.list_templates(extensions=["html"]):
+        try:
+            template_env.get_template(name)
+            compiled += 1
+        except TemplateSyntaxError as e:
+            logger.error(f"Email template {name} is invalid: {e}")
+    logger.info(f"{compiled} email templates compiled.")
+
+
+SEND_AUD_EMAIL_JOB = "send_aud_email"
+
 
 class Email:
     def __init__(self):
@@ -30,24 +71,82 @@ class Email:
     async def send_aud_email(
         self, receivers: str | list, template: str, subject: str, data
     ):
+        message = self.build_aud_message(receivers, template, subject, data)
+        await get_smtp_pool().send(message)
+
+    async def send_many(self, emails: list[dict[str, Any]]) -> list[Exception | None]:
+        """
+        Send several emails (`receivers`, `template`, `subject`, `data` each)
+        over the pooled connections. Returns the error of each email, or None
+        if it was sent.
+        """
+        return await self.send_messages(
+            [self.build_aud_message(**email) for email in emails]
+        )
+
+    async def send_messages(
+        self, messages: list[EmailMessage]
+    ) -> list[Exception | None]:
+        """Send built messages, see `send_many`."""
+        results = await asyncio.gather(
+            *(get_smtp_pool().send(message) for message in messages),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+
+        return [result if isinstance(result, Exception) else None for result in results]
+
+    def build_aud_message(
+        self, receivers: str | list, template: str, subject: str, data
+    ) -> EmailMessage:
         content = self.render_template(template, {**self.constant_data, **data})
+        return self.build_message(receivers, subject, content)
 
+    def build_message(
+        self, receivers: str | list, subject: str, content: str
+    ) -> EmailMessage:
         if isinstance(receivers, str):
             receivers = [receivers]
 
-        message = MessageSchema(
-            subject=subject,
-            recipients=list(receivers),
-            template_body=content,
-            subtype=MessageType.html,
+        message = EmailMessage()
+        message["From"] = formataddr((self.aud_sender_name, self.aud_sender_email))
+        message["To"] = ", ".join(receivers)
+        message["Subject"] = subject
+        message.set_content(content, subtype="html")
+
+        return message
+
+    def queue_aud_email(
+        self,
+        db: AsyncSession,
+        receivers: str | list,
+        template: str,
+        subject: str,
+        data,
+    ):
+        """Send the email from the job worker once the caller commits."""
+        jobs_service.enqueue_job(
+            db,
+            SEND_AUD_EMAIL_JOB,
+            {
+                "receivers": receivers,
+                "template": template,
+                "subject": subject,
+                "data": data,
+            },
         )
-        await FastMail(conf).send_message(message)
 
     def render_template(self, template_name: str, data: dict[str, Any]) -> str:
-        template_folder = settings.TEMPLATE_FOLDER
-
-        env = Environment(loader=FileSystemLoader(template_folder))
-        j2template = env.get_template(template_name)
+        j2template = template_env.get_template(template_name)
 
         html = j2template.render(data)
         return html
+
+
+@job_handler(SEND_AUD_EMAIL_JOB)
+async def send_aud_email_job(
+    db: AsyncSession, receivers: str | list, template: str, subject: str, data
+):
+    await Email().send_aud_email(receivers, template, subject, data)
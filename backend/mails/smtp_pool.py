@@ -0,0 +1,89 @@
+import asyncio
+import time
+from email.message import EmailMessage
+
+from aiosmtplib import SMTP, SMTPResponseException, SMTPServerDisconnected
+
+from backend.core.config import logger
+
+
+class SMTPConnectionPool:
+    """
+    Connected and authenticated SMTP clients reused across messages, instead
+    of a connect + STARTTLS + login per email. A connection idle for more than
+    `idle_check_seconds` is checked (NOOP) before reuse, dropped connections
+    are replaced.
+    """
+
+    def __init__(self, size: int, idle_check_seconds: float, **smtp_options):
+        self.size = size
+        self.idle_check_seconds = idle_check_seconds
+        self.smtp_options = smtp_options
+        self._idle: list[tuple[SMTP, float]] = []
+        self._semaphore = asyncio.Semaphore(size)
+
+    async def _connect(self) -> SMTP:
+        smtp = SMTP(**self.smtp_options)
+        # Also runs STARTTLS and login as configured
+        await smtp.connect()
+        return smtp
+
+    async def _acquire(self) -> SMTP:
+        await self._semaphore.acquire()
+        try:
+            while self._idle:
+                smtp, released_at = self._idle.pop()
+                if not smtp.is_connected:
+                    continue
+                if time.monotonic() - released_at < self.idle_check_seconds:
+                    return smtp
+                try:
+                    await smtp.noop()
+                    return smtp
+                except Exception:
+                    smtp.close()
+
+            return await self._connect()
+
+        except Exception:
+            self._semaphore.release()
+            raise
+
+    def _release(self, smtp: SMTP, reusable: bool):
+        if reusable and smtp.is_connected:
+            self._idle.append((smtp, time.monotonic()))
+        else:
+            smtp.close()
+        self._semaphore.release()
+
+    async def send(self, message: EmailMessage):
+        # A pooled connection may have been closed by the server meanwhile:
+        # the message is sent again once on a new connection
+        for retry in (True, False):
+            smtp = await self._acquire()
+            try:
+                await smtp.send_message(message)
+            except (SMTPServerDisconnected, ConnectionError) as e:
+                self._release(smtp, False)
+                if not retry:
+                    raise
+                logger.warning(f"SMTP connection lost, reconnecting: {e!r}")
+                continue
+            except SMTPResponseException:
+                # Rejected by the server, the connection is still usable
+                self._release(smtp, True)
+                raise
+            except BaseException:
+                self._release(smtp, False)
+                raise
+
+            self._release(smtp, True)
+            return
+
+    async def close(self):
+        idle, self._idle = self._idle, []
+        for smtp, _ in idle:
+            try:
+                await smtp.quit()
+            except Exception:
+                smtp.close()
@@ -1,36 +1,92 @@
+import asyncio
 import os
 import time
+from contextlib import asynccontextmanager, suppress
 
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-
+from fastapi.responses import JSONResponse, Response
+from prometheus_client import CONTENT_TYPE_LATEST
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import backend.api.v1.services.auth as auth_service
+import backend.api.v1.services.exports as exports_service
+import backend.api.v1.services.jobs as jobs_service
+import backend.api.v1.services.stats as stats_service
+import backend.api.v1.services.tickets as tickets_service
+import backend.api.v1.services.transactions as transactions_service
 from backend.api.v1.routes.router import api_router
+from backend.core.cache import response_cache
+from backend.core.conditional import ETagMiddleware
+from backend.core.config import settings
 from backend.core.exception import (
     AccessDeniedException,
     BadRequestException,
+    NotModifiedException,
+    ServiceUnavailableException,
     UnauthorizedException,
 )
+from backend.core.metrics import MetricsMiddleware, generate_metrics, mark_process_dead
+from backend.core.query_stats import QueryStatsMiddleware
 from backend.core.response import (
     AccessDeniedResponse,
     BadRequestResponse,
+    ServiceUnavailableResponse,
     UnauthorizedResponse,
 )
+from backend.db.database import get_db
+from backend.mails import mail
+
 
-app = FastAPI(title="Roominar", openapi_url="/api/v1/openapi.json")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.EMAIL_PRECOMPILE_TEMPLATES:
+        mail.precompile_templates()
+    event_views_flusher = asyncio.create_task(stats_service.run_event_views_flusher())
+    ticket_reservations_sweeper = asyncio.create_task(
+        tickets_service.run_ticket_reservations_sweeper()
+    )
+    export_artifacts_sweeper = asyncio.create_task(
+        exports_service.run_export_artifacts_sweeper()
+    )
+    refresh_tokens_compactor = asyncio.create_task(
+        auth_service.run_refresh_tokens_compactor()
+    )
+    yield
+
+    # Graceful shutdown: don't lose the buffered event views
+    for task in (
+        event_views_flusher,
+        ticket_reservations_sweeper,
+        export_artifacts_sweeper,
+        refresh_tokens_compactor,
+    ):
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await stats_service.flush_event_views()
+    await mail.close_smtp_pool()
+    auth_service.password_hashing_pool.shutdown()
+    mark_process_dead()
+
+
+app = FastAPI(title="Roominar", openapi_url="/api/v1/openapi.json", lifespan=lifespan)
 
 os.environ["TZ"] = "Asia/Ho_Chi_Minh"
 time.tzset()
 
+app.add_middleware(ETagMiddleware)
+app.add_middleware(QueryStatsMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
-    expose_headers=["content-disposition"],
+    expose_headers=["content-disposition", "etag", "last-modified"],
 )
+app.add_middleware(MetricsMiddleware)
 
 
 @app.get("/healthcheck")
@@ -38,6 +94,32 @@ async def healthcheck():
     return {"status": "OK"}
 
 
+@app.get("/metrics")
+async def metrics(db: AsyncSession = Depends(get_db)):
+    return Response(
+        generate_metrics(
+            await jobs_service.get_job_metrics(db),
+            await transactions_service.get_stripe_webhook_metrics(db),
+        ),
+        headers={"Content-Type": CONTENT_TYPE_LATEST},
+    )
+
+
+@app.get("/metrics/cache")
+async def cache_metrics():
+    return response_cache.metrics()
+
+
+@app.get("/metrics/password-hashing")
+async def password_hashing_metrics():
+    return auth_service.password_hashing_pool.metrics()
+
+
+@app.get("/metrics/jobs")
+async def job_metrics(db: AsyncSession = Depends(get_db)):
+    return await jobs_service.get_job_metrics(db)
+
+
 app.include_router(api_router, prefix="/api/v1")
 
 
@@ -56,6 +138,20 @@ def access_denied_exception_handler(request: Request, exc: UnauthorizedException
     return AccessDeniedResponse(exc.message, exc.debug_info)
 
 
+@app.exception_handler(ServiceUnavailableException)
+def service_unavailable_exception_handler(
+    request: Request, exc: ServiceUnavailableException
+):
+    return ServiceUnavailableResponse(
+        exc.error_code, exc.message, exc.retry_after, exc.debug_info
+    )
+
+
+@app.exception_handler(NotModifiedException)
+def not_modified_exception_handler(request: Request, exc: NotModifiedException):
+    return Response(status_code=exc.status_code, headers=exc.headers)
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     return JSONResponse(
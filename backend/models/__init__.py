@@ -2,22 +2,38 @@ from .answer import Answer
 from .application import Application
 from .bookmark import Bookmark
 from .check_in import CheckIn
+from .checkout import Checkout
+from .email_campaign import EmailCampaign
+from .email_delivery import EmailDelivery
 from .event import Event
+from .event_analytics import EventAnalytics, EventTicketAnalytics, OrganizationAnalytics
+from .event_similarity import EventSimilarity
+from .event_stats import EventStats
+from .export_job import ExportJob
 from .follow import Follow
+from .job import Job
 from .organization import Organization
+from .organization_stats import OrganizationStats
 from .question import Question
+from .refresh_token import RefreshToken
+from .resource_version import ResourceVersion
 from .speaker import Speaker
+from .stripe_webhook_dead_letter import StripeWebhookDeadLetter
+from .stripe_webhook_event import StripeWebhookEvent
 from .survey import Survey
 from .survey_response_result import SurveyResponseResult
+from .survey_stats import SurveyAnswerStats, SurveyQuestionStats
 from .tag import Tag
 from .tag_association import TagAssociation
 from .tag_group import TagGroup
 from .target import Target
 from .ticket import Ticket
 from .ticket_inventory import TicketInventory
+from .ticket_reservation import TicketReservation
 from .transaction import Transaction
 from .transaction_item import TransactionItem
 from .user import User
+from .user_interest import UserInterest
 
 all = (
     Application,
@@ -40,4 +56,23 @@ all = (
     CheckIn,
     TicketInventory,
     Speaker,
+    UserInterest,
+    EventSimilarity,
+    EventStats,
+    OrganizationStats,
+    ResourceVersion,
+    TicketReservation,
+    Checkout,
+    StripeWebhookEvent,
+    StripeWebhookDeadLetter,
+    Job,
+    EmailCampaign,
+    EmailDelivery,
+    ExportJob,
+    EventAnalytics,
+    EventTicketAnalytics,
+    OrganizationAnalytics,
+    SurveyQuestionStats,
+    SurveyAnswerStats,
+    RefreshToken,
 )
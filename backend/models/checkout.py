@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import DateTime, Enum, Field, String
+
+from backend.core.constants import CheckoutStatusCode
+from backend.models.base_model import BaseModel
+
+
+class Checkout(BaseModel, table=True):
+    """
+    Paid application waiting for its Stripe checkout session, with its tickets
+    held (TicketReservation rows sharing the `reference`).
+
+    `application_request` is the CreateApplicationRequest and `tickets` the
+    requested tickets ({id, quantity, price}) at session creation time, so that
+    the webhook only has to finalize it.
+    """
+
+    __tablename__: str = "checkouts"
+
+    reference: str = Field(sa_type=String(255), unique=True)
+    stripe_checkout_session_id: Optional[str] = Field(sa_type=String(255), unique=True)
+    event_id: int = Field(foreign_key="events.id")
+    user_id: int = Field(foreign_key="users.id")
+    status: CheckoutStatusCode = Field(
+        sa_type=Enum(CheckoutStatusCode), default=CheckoutStatusCode.PENDING
+    )
+    total_amount: float
+    application_request: dict[str, Any] = Field(sa_type=JSONB)
+    tickets: list[dict[str, Any]] = Field(sa_type=JSONB)
+    expired_at: datetime = Field(sa_type=DateTime(timezone=True))
@@ -0,0 +1,22 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlmodel import DateTime, Enum, Field, String, Text
+
+from backend.core.constants import EmailCampaignStatusCode
+from backend.models.base_model import BaseModel
+
+
+class EmailCampaign(BaseModel, table=True):
+    """Email of an organizer to all the attendees of an event."""
+
+    __tablename__: str = "email_campaigns"
+
+    event_id: int = Field(foreign_key="events.id", index=True)
+    subject: str = Field(sa_type=String(255))
+    content: str = Field(sa_type=Text)
+    status: EmailCampaignStatusCode = Field(
+        sa_type=Enum(EmailCampaignStatusCode), default=EmailCampaignStatusCode.PENDING
+    )
+    recipients_count: int = Field(default=0)
+    finished_at: Optional[datetime] = Field(sa_type=DateTime(timezone=True))
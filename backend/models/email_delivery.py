@@ -0,0 +1,31 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlmodel import DateTime, Enum, Field, Index, String, Text, UniqueConstraint
+
+from backend.core.constants import EmailDeliveryStatusCode
+from backend.models.base_model import BaseModel
+
+
+class EmailDelivery(BaseModel, table=True):
+    """Delivery status of an email campaign to one application."""
+
+    __tablename__: str = "email_deliveries"
+    __table_args__ = (
+        UniqueConstraint("email_campaign_id", "application_id"),
+        Index(
+            "ix_email_deliveries_email_campaign_id_status",
+            "email_campaign_id",
+            "status",
+        ),
+    )
+
+    email_campaign_id: int = Field(foreign_key="email_campaigns.id")
+    application_id: int = Field(foreign_key="applications.id")
+    email: str = Field(sa_type=String(255))
+    status: EmailDeliveryStatusCode = Field(
+        sa_type=Enum(EmailDeliveryStatusCode), default=EmailDeliveryStatusCode.PENDING
+    )
+    attempts: int = Field(default=0)
+    last_error: Optional[str] = Field(sa_type=Text)
+    sent_at: Optional[datetime] = Field(sa_type=DateTime(timezone=True))
@@ -2,7 +2,8 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlmodel import ARRAY, Column, DateTime, Enum, Field, String, Text, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlmodel import ARRAY, Column, DateTime, Enum, Field, Index, String, Text, func
 
 from backend.core.constants import EventMeetingToolCode, EventStatusCode
 from backend.models.base_model import BaseModel
@@ -10,6 +11,16 @@ from backend.models.base_model import BaseModel
 
 class Event(BaseModel, table=True):
     __tablename__: str = "events"
+    __table_args__ = (
+        Index("ix_events_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_events_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index("ix_events_target_id", "target_id"),
+    )
 
     organization_id: Optional[int] = Field(foreign_key="organizations.id")
 
@@ -59,5 +70,9 @@ class Event(BaseModel, table=True):
 
     published_at: Optional[datetime] = Field(sa_type=DateTime(timezone=True))
     application_form_url: Optional[str] = Field(sa_type=String(2048))
-    view_number: Optional[int] = Field(default=0)
     max_ticket_number_per_account: Optional[int] = Field(default=10)
+
+    # Maintained by DB triggers (name / organization name / tag names / description)
+    search_vector: Optional[str] = Field(
+        default=None, sa_column=Column(TSVECTOR, nullable=True)
+    )
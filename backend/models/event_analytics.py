@@ -0,0 +1,73 @@
+from datetime import datetime
+
+from sqlmodel import DateTime, Enum, Field, Index, UniqueConstraint
+
+from backend.core.constants import AnalyticsPeriodCode
+from backend.models.base_model import BaseModel
+
+
+class EventAnalytics(BaseModel, table=True):
+    """
+    Counters of an event per hour / day (UTC buckets), incremented in the same
+    transaction as the change they count (see services/stats) and rebuilt by
+    python -m backend.commands.backfill_event_analytics.
+    """
+
+    __tablename__: str = "event_analytics"
+    __table_args__ = (
+        UniqueConstraint("event_id", "period", "bucket_at"),
+        Index(
+            "ix_event_analytics_organization_id",
+            "organization_id",
+            "period",
+            "bucket_at",
+        ),
+    )
+
+    event_id: int = Field(foreign_key="events.id")
+    organization_id: int = Field(foreign_key="organizations.id")
+    period: AnalyticsPeriodCode = Field(sa_type=Enum(AnalyticsPeriodCode))
+    bucket_at: datetime = Field(sa_type=DateTime(timezone=True))
+    application_number: int = Field(default=0)
+    revenue: float = Field(default=0)
+    sold_tickets_number: int = Field(default=0)
+    check_in_number: int = Field(default=0)
+    view_number: int = Field(default=0)
+    bookmark_number: int = Field(default=0)
+
+
+class OrganizationAnalytics(BaseModel, table=True):
+    """
+    EventAnalytics of all the events of an organization, incremented with
+    them (the organization dashboard reads one row per bucket).
+    """
+
+    __tablename__: str = "organization_analytics"
+    __table_args__ = (UniqueConstraint("organization_id", "period", "bucket_at"),)
+
+    organization_id: int = Field(foreign_key="organizations.id")
+    period: AnalyticsPeriodCode = Field(sa_type=Enum(AnalyticsPeriodCode))
+    bucket_at: datetime = Field(sa_type=DateTime(timezone=True))
+    application_number: int = Field(default=0)
+    revenue: float = Field(default=0)
+    sold_tickets_number: int = Field(default=0)
+    check_in_number: int = Field(default=0)
+    view_number: int = Field(default=0)
+    bookmark_number: int = Field(default=0)
+
+
+class EventTicketAnalytics(BaseModel, table=True):
+    """Tickets sold per ticket type and hour / day, see EventAnalytics."""
+
+    __tablename__: str = "event_ticket_analytics"
+    __table_args__ = (
+        UniqueConstraint("ticket_id", "period", "bucket_at"),
+        Index("ix_event_ticket_analytics_event_id", "event_id", "period", "bucket_at"),
+    )
+
+    event_id: int = Field(foreign_key="events.id")
+    ticket_id: int = Field(foreign_key="tickets.id")
+    period: AnalyticsPeriodCode = Field(sa_type=Enum(AnalyticsPeriodCode))
+    bucket_at: datetime = Field(sa_type=DateTime(timezone=True))
+    sold_quantity: int = Field(default=0)
+    revenue: float = Field(default=0)
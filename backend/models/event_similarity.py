@@ -0,0 +1,26 @@
+from sqlmodel import Field, Index, UniqueConstraint
+
+from backend.models.base_model import BaseModel
+
+
+class EventSimilarity(BaseModel, table=True):
+    """
+    Top-K most similar public events of an event (related events).
+
+    `score` is the weighted overlap of the target industry / job type codes and
+    of the tags of both events.
+    """
+
+    __tablename__: str = "event_similarities"
+    __table_args__ = (
+        UniqueConstraint(
+            "event_id",
+            "similar_event_id",
+            name="uq_event_similarities_event_id_similar_event_id",
+        ),
+        Index("ix_event_similarities_similar_event_id", "similar_event_id"),
+    )
+
+    event_id: int = Field(foreign_key="events.id")
+    similar_event_id: int = Field(foreign_key="events.id")
+    score: int = Field(default=0)
@@ -0,0 +1,19 @@
+from sqlmodel import Field
+
+from backend.models.base_model import BaseModel
+
+
+class EventStats(BaseModel, table=True):
+    """
+    Denormalized counters of an event, incremented in the same transaction as
+    the change they count (see services/stats) and fixed by the reconciliation
+    job (python -m backend.commands.reconcile_stats).
+    """
+
+    __tablename__: str = "event_stats"
+
+    event_id: int = Field(foreign_key="events.id", unique=True)
+    sold_tickets_number: int = Field(default=0)
+    application_number: int = Field(default=0)
+    bookmark_number: int = Field(default=0)
+    view_number: int = Field(default=0)
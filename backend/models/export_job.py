@@ -0,0 +1,36 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import BIGINT, DateTime, Enum, Field, Index, String, Text
+
+from backend.core.constants import ExportFormatCode, ExportJobStatusCode, ExportKindCode
+from backend.models.base_model import BaseModel
+
+
+class ExportJob(BaseModel, table=True):
+    """
+    Export of an organization's data, written to the artifact store by the job
+    worker. Identical requests (same `fingerprint`) share a running or
+    unexpired export.
+    """
+
+    __tablename__: str = "export_jobs"
+    __table_args__ = (Index("ix_export_jobs_fingerprint", "fingerprint", "status"),)
+
+    organization_id: int = Field(foreign_key="organizations.id")
+    kind: ExportKindCode = Field(sa_type=Enum(ExportKindCode))
+    format: ExportFormatCode = Field(sa_type=Enum(ExportFormatCode))
+    gzip: bool = Field(default=False)
+    params: dict[str, Any] = Field(sa_type=JSONB, default_factory=dict)
+    fingerprint: str = Field(sa_type=String(64))
+    status: ExportJobStatusCode = Field(
+        sa_type=Enum(ExportJobStatusCode), default=ExportJobStatusCode.PENDING
+    )
+    total_rows: Optional[int]
+    processed_rows: int = Field(default=0)
+    artifact_key: Optional[str] = Field(sa_type=String(255))
+    size_bytes: Optional[int] = Field(sa_type=BIGINT)
+    error: Optional[str] = Field(sa_type=Text)
+    finished_at: Optional[datetime] = Field(sa_type=DateTime(timezone=True))
+    expired_at: Optional[datetime] = Field(sa_type=DateTime(timezone=True))
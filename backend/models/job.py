@@ -0,0 +1,41 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import DateTime, Enum, Field, Index, String, Text, func, text
+
+from backend.core.constants import JobStatusCode
+from backend.models.base_model import BaseModel
+
+
+class Job(BaseModel, table=True):
+    """
+    Outbox of the background jobs: inserted in the transaction of the change
+    which triggers them, run by the job worker with the handler registered
+    under `name` (see backend.core.jobs).
+    """
+
+    __tablename__: str = "jobs"
+    __table_args__ = (
+        Index(
+            "ix_jobs_pending",
+            "run_at",
+            "id",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+    )
+
+    name: str = Field(sa_type=String(255))
+    payload: dict[str, Any] = Field(sa_type=JSONB)
+    status: JobStatusCode = Field(
+        sa_type=Enum(JobStatusCode), default=JobStatusCode.PENDING
+    )
+    attempts: int = Field(default=0)
+    max_attempts: int
+    run_at: datetime = Field(
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
+    )
+    last_error: Optional[str] = Field(sa_type=Text)
+    started_at: Optional[datetime] = Field(sa_type=DateTime(timezone=True))
+    finished_at: Optional[datetime] = Field(sa_type=DateTime(timezone=True))
@@ -0,0 +1,17 @@
+from sqlmodel import Field
+
+from backend.models.base_model import BaseModel
+
+
+class OrganizationStats(BaseModel, table=True):
+    """
+    Denormalized counters of an organization, see EventStats.
+
+    `event_number` counts the published events of the organization.
+    """
+
+    __tablename__: str = "organization_stats"
+
+    organization_id: int = Field(foreign_key="organizations.id", unique=True)
+    event_number: int = Field(default=0)
+    follower_number: int = Field(default=0)
@@ -0,0 +1,24 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlmodel import DateTime, Field, String
+
+from backend.models.base_model import BaseModel
+
+
+class RefreshToken(BaseModel, table=True):
+    """
+    Refresh token issued to a user (`jti` claim). Each use rotates it into a
+    new token of the same family; presenting a used token again revokes the
+    whole family, unless it was rotated a few seconds ago (concurrent
+    refreshes). Rows are deleted once expired (see services/auth).
+    """
+
+    __tablename__: str = "refresh_tokens"
+
+    user_id: int = Field(foreign_key="users.id", index=True)
+    jti: str = Field(sa_type=String(32), unique=True)
+    family_id: str = Field(sa_type=String(32), index=True)
+    expired_at: datetime = Field(sa_type=DateTime(timezone=True), index=True)
+    used_at: Optional[datetime] = Field(sa_type=DateTime(timezone=True))
+    revoked_at: Optional[datetime] = Field(sa_type=DateTime(timezone=True))
@@ -0,0 +1,18 @@
+from sqlmodel import BIGINT, Field
+
+from backend.models.base_model import BaseModel
+
+
+class ResourceVersion(BaseModel, table=True):
+    """
+    Version counter of a group of rows, named by a cache tag (e.g. `event:1`).
+
+    Bumped in the transaction of every write changing the public representation
+    of the rows, it validates HTTP conditional requests (ETag / Last-Modified)
+    without running the queries of the response.
+    """
+
+    __tablename__: str = "resource_versions"
+
+    key: str = Field(unique=True)
+    version: int = Field(sa_type=BIGINT, default=0)
@@ -0,0 +1,19 @@
+from typing import Any, Optional
+
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field, String, Text
+
+from backend.models.base_model import BaseModel
+
+
+class StripeWebhookDeadLetter(BaseModel, table=True):
+    """Stripe events which failed STRIPE_WEBHOOK_MAX_ATTEMPTS times."""
+
+    __tablename__: str = "stripe_webhook_dead_letters"
+
+    stripe_event_id: str = Field(sa_type=String(255), index=True)
+    type: str = Field(sa_type=String(255))
+    ordering_key: str = Field(sa_type=String(255))
+    payload: dict[str, Any] = Field(sa_type=JSONB)
+    attempts: int
+    last_error: Optional[str] = Field(sa_type=Text)
@@ -0,0 +1,49 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import DateTime, Enum, Field, Index, String, Text, func, text
+
+from backend.core.constants import WebhookEventStatusCode
+from backend.models.base_model import BaseModel
+
+
+class StripeWebhookEvent(BaseModel, table=True):
+    """
+    Queue of the verified Stripe events, processed by the webhook worker in
+    order per `ordering_key` (the checkout reference).
+
+    Rows are kept once processed: the unique `stripe_event_id` is the
+    idempotency ledger of Stripe's retries and duplicates.
+    """
+
+    __tablename__: str = "stripe_webhook_events"
+    __table_args__ = (
+        Index(
+            "ix_stripe_webhook_events_pending",
+            "next_attempt_at",
+            "id",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+        Index(
+            "ix_stripe_webhook_events_pending_ordering_key",
+            "ordering_key",
+            "id",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+    )
+
+    stripe_event_id: str = Field(sa_type=String(255), unique=True)
+    type: str = Field(sa_type=String(255))
+    ordering_key: str = Field(sa_type=String(255))
+    payload: dict[str, Any] = Field(sa_type=JSONB)
+    status: WebhookEventStatusCode = Field(
+        sa_type=Enum(WebhookEventStatusCode), default=WebhookEventStatusCode.PENDING
+    )
+    attempts: int = Field(default=0)
+    next_attempt_at: datetime = Field(
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
+    )
+    last_error: Optional[str] = Field(sa_type=Text)
+    processed_at: Optional[datetime] = Field(sa_type=DateTime(timezone=True))
@@ -1,12 +1,26 @@
 from typing import Optional
 
-from sqlmodel import ARRAY, Field, Integer, String
+from sqlmodel import ARRAY, Field, Index, Integer, String, text
 
 from backend.models.base_model import BaseModel
 
 
 class SurveyResponseResult(BaseModel, table=True):
     __tablename__: str = "survey_response_results"
+    __table_args__ = (
+        Index(
+            "ix_survey_response_results_answers_ids",
+            "answers_ids",
+            postgresql_using="gin",
+        ),
+        # Latest free text answers of a question
+        Index(
+            "ix_survey_response_results_question_id_answer_text",
+            "question_id",
+            "id",
+            postgresql_where=text("answer_text IS NOT NULL"),
+        ),
+    )
 
     event_id: int = Field(foreign_key="events.id")
     application_id: Optional[int] = Field(foreign_key="applications.id")
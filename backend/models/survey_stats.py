@@ -0,0 +1,33 @@
+from sqlmodel import Field, UniqueConstraint
+
+from backend.models.base_model import BaseModel
+
+
+class SurveyQuestionStats(BaseModel, table=True):
+    """
+    Responses to a question of a survey per event, incremented in the same
+    transaction as the responses (see services/stats) and rebuilt by
+    python -m backend.commands.rebuild_survey_stats.
+    """
+
+    __tablename__: str = "survey_question_stats"
+    __table_args__ = (UniqueConstraint("event_id", "question_id"),)
+
+    survey_id: int = Field(foreign_key="surveys.id", index=True)
+    event_id: int = Field(foreign_key="events.id")
+    question_id: int = Field(foreign_key="questions.id")
+    response_number: int = Field(default=0)
+    answer_text_number: int = Field(default=0)
+
+
+class SurveyAnswerStats(BaseModel, table=True):
+    """Times an answer was chosen per event (histogram), see SurveyQuestionStats."""
+
+    __tablename__: str = "survey_answer_stats"
+    __table_args__ = (UniqueConstraint("event_id", "question_id", "answer_id"),)
+
+    survey_id: int = Field(foreign_key="surveys.id", index=True)
+    event_id: int = Field(foreign_key="events.id")
+    question_id: int = Field(foreign_key="questions.id")
+    answer_id: int = Field(foreign_key="answers.id")
+    response_number: int = Field(default=0)
@@ -1,4 +1,4 @@
-from sqlmodel import Enum, Field
+from sqlmodel import Enum, Field, Index
 
 from backend.core.constants import TagAssociationEntityCode
 from backend.models.base_model import BaseModel
@@ -6,6 +6,9 @@ from backend.models.base_model import BaseModel
 
 class TagAssociation(BaseModel, table=True):
     __tablename__: str = "tag_associations"
+    __table_args__ = (
+        Index("ix_tag_associations_entity_code_tag_id", "entity_code", "tag_id"),
+    )
 
     entity_id: int
     tag_id: int = Field(foreign_key="tags.id")
@@ -1,6 +1,6 @@
 from typing import Optional
 
-from sqlmodel import Field, ARRAY, String
+from sqlmodel import ARRAY, Field, Index, String
 
 from backend.core.constants import IndustryCode, JobTypeCode
 from backend.models.base_model import BaseModel
@@ -8,6 +8,10 @@ from backend.models.base_model import BaseModel
 
 class Target(BaseModel, table=True):
     __tablename__: str = "targets"
+    __table_args__ = (
+        Index("ix_targets_industry_codes", "industry_codes", postgresql_using="gin"),
+        Index("ix_targets_job_type_codes", "job_type_codes", postgresql_using="gin"),
+    )
 
     organization_id: Optional[int] = Field(foreign_key="organizations.id")
 
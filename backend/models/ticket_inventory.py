@@ -1,10 +1,17 @@
-from sqlmodel import Field
+from sqlmodel import CheckConstraint, Field, Index
 
 from backend.models.base_model import BaseModel
 
 
 class TicketInventory(BaseModel, table=True):
     __tablename__: str = "ticket_inventories"
+    __table_args__ = (
+        Index("ix_ticket_inventories_ticket_id", "ticket_id"),
+        CheckConstraint(
+            "available_quantity >= 0 AND reserved_quantity >= 0 AND sold_quantity >= 0",
+            name="ck_ticket_inventories_quantities_non_negative",
+        ),
+    )
 
     ticket_id: int = Field(foreign_key="tickets.id")
     event_id: int = Field(foreign_key="events.id")
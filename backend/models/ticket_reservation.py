@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlmodel import DateTime, Enum, Field, Index, String
+
+from backend.core.constants import TicketReservationStatusCode
+from backend.models.base_model import BaseModel
+
+
+class TicketReservation(BaseModel, table=True):
+    """
+    Tickets held for a checkout, counted in TicketInventory.reserved_quantity
+    until confirmed (sold) or released (back to available).
+
+    The reservations of one checkout share their `reference`.
+    """
+
+    __tablename__: str = "ticket_reservations"
+    __table_args__ = (
+        Index("ix_ticket_reservations_reference", "reference"),
+        Index("ix_ticket_reservations_status_expired_at", "status", "expired_at"),
+    )
+
+    reference: str = Field(sa_type=String(255))
+    event_id: int = Field(foreign_key="events.id")
+    ticket_id: int = Field(foreign_key="tickets.id")
+    user_id: Optional[int] = Field(foreign_key="users.id")
+    quantity: int
+    status: TicketReservationStatusCode = Field(
+        sa_type=Enum(TicketReservationStatusCode),
+        default=TicketReservationStatusCode.HELD,
+    )
+    expired_at: datetime = Field(sa_type=DateTime(timezone=True))
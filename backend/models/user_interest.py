@@ -0,0 +1,22 @@
+from sqlmodel import Field, String, UniqueConstraint
+
+from backend.models.base_model import BaseModel
+
+
+class UserInterest(BaseModel, table=True):
+    """
+    Per-user interest profile used by event recommendation.
+
+    `code` is an industry code, a job type code or a tag id (as string), and
+    `score` the sum of interaction weights (application 7 / with survey
+    response 8, bookmark 5, user profile & tags 3) for that code.
+    """
+
+    __tablename__: str = "user_interests"
+    __table_args__ = (
+        UniqueConstraint("user_id", "code", name="uq_user_interests_user_id_code"),
+    )
+
+    user_id: int = Field(foreign_key="users.id")
+    code: str = Field(sa_type=String(255))
+    score: int = Field(default=0)
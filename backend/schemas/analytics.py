@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta
+
+import pytz
+from pydantic import BaseModel, Field, model_validator
+
+from backend.core.constants import AnalyticsPeriodCode
+from backend.core.error_code import ErrorCode, ErrorMessage
+from backend.core.exception import BadRequestException
+
+ANALYTICS_DEFAULT_RANGES = {
+    AnalyticsPeriodCode.HOUR: timedelta(hours=48),
+    AnalyticsPeriodCode.DAY: timedelta(days=30),
+}
+
+# At most 744 hourly or 366 daily buckets per response
+ANALYTICS_MAX_RANGES = {
+    AnalyticsPeriodCode.HOUR: timedelta(days=31),
+    AnalyticsPeriodCode.DAY: timedelta(days=366),
+}
+
+
+class AnalyticsQueryParams(BaseModel):
+    period: AnalyticsPeriodCode = Field(AnalyticsPeriodCode.DAY)
+    # Defaults to the last 30 days (DAY) or 48 hours (HOUR)
+    from_at: datetime | None = Field(None)
+    to_at: datetime | None = Field(None)
+
+    @model_validator(mode="after")
+    def validate_range(self):
+        # Without an offset, in UTC
+        if self.from_at and not self.from_at.tzinfo:
+            self.from_at = self.from_at.replace(tzinfo=pytz.utc)
+        if self.to_at and not self.to_at.tzinfo:
+            self.to_at = self.to_at.replace(tzinfo=pytz.utc)
+
+        to_at = self.to_at or datetime.now(pytz.utc)
+        from_at = self.from_at or to_at - ANALYTICS_DEFAULT_RANGES[self.period]
+        if from_at > to_at:
+            raise BadRequestException(
+                ErrorCode.ERR_INVALID_ANALYTICS_RANGE,
+                ErrorMessage.ERR_INVALID_ANALYTICS_RANGE,
+            )
+        if to_at - from_at > ANALYTICS_MAX_RANGES[self.period]:
+            raise BadRequestException(
+                ErrorCode.ERR_ANALYTICS_RANGE_TOO_LONG,
+                ErrorMessage.ERR_ANALYTICS_RANGE_TOO_LONG,
+            )
+
+        return self
+
+
+class AnalyticsCounters(BaseModel):
+    application_number: int = 0
+    revenue: float = 0
+    sold_tickets_number: int = 0
+    check_in_number: int = 0
+    view_number: int = 0
+    bookmark_number: int = 0
+
+
+class AnalyticsBucket(AnalyticsCounters):
+    bucket_at: datetime
+
+
+class TicketAnalyticsItem(BaseModel):
+    ticket_id: int
+    ticket_name: str
+    sold_quantity: int
+    revenue: float
+
+
+class AnalyticsResponse(BaseModel):
+    period: AnalyticsPeriodCode
+    from_at: datetime
+    to_at: datetime
+    # Buckets without activity are left out
+    buckets: list[AnalyticsBucket]
+    totals: AnalyticsCounters
+
+
+class EventAnalyticsResponse(AnalyticsResponse):
+    event_id: int
+    tickets: list[TicketAnalyticsItem]
@@ -1,4 +1,11 @@
-from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    EmailStr,
+    Field,
+    PositiveInt,
+    field_validator,
+)
 
 from backend.core.constants import IndustryCode, JobTypeCode
 from backend.schemas.common import (
@@ -11,7 +18,7 @@ from backend.schemas.survey_response_result import SurveyResponseResultItem
 
 class ApplicationTicket(BaseModel):
     id: int
-    quantity: int
+    quantity: PositiveInt
 
 
 class CreateApplicationRequest(BaseModel):
@@ -12,8 +12,11 @@ T = TypeVar("T")
 class PaginationResponse(BaseModel, Generic[T]):
     page: int
     per_page: int
-    total: int
+    # None when the count was skipped (see `with_total`)
+    total: int | None = None
     data: Annotated[List[T], Field(None, description="")]
+    # Opaque keyset cursor of the next page, None on the last page
+    next_cursor: str | None = None
 
 
 def phone_validator(v):
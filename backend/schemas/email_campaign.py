@@ -0,0 +1,26 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from backend.core.constants import EmailCampaignStatusCode
+
+
+class CreateEmailCampaignRequest(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    subject: str = Field(min_length=1, max_length=255)
+    content: str = Field(min_length=1, max_length=10000)
+
+
+class EmailCampaignItem(BaseModel):
+    id: int
+    event_id: int
+    subject: str
+    status: EmailCampaignStatusCode
+    recipients_count: int
+    sent_count: int
+    failed_count: int
+    pending_count: int
+    created_at: datetime
+    finished_at: Optional[datetime]
@@ -6,6 +6,7 @@ from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validat
 from backend.core.constants import (
     CityCode,
     EventMeetingToolCode,
+    EventSearchModeCode,
     EventSortByCode,
     EventStatusCode,
     EventTimeStatusCode,
@@ -48,6 +49,9 @@ class SearchEventsItem(BaseModel):
 
 class SearchEventsQueryParams(BaseModel):
     keyword: str | None = Field(Query(default=None))
+    search_mode: EventSearchModeCode | None = Field(
+        Query(default=EventSearchModeCode.FULLTEXT)
+    )
 
     # exclude_bookmarks: bool] = Field(Query(default=False)
     # exclude_applications: bool] = Field(Query(default=False)
@@ -72,6 +76,12 @@ class SearchEventsQueryParams(BaseModel):
     sort_by: EventSortByCode | None = Field(Query(default=EventSortByCode.PUBLISHED_AT))
     per_page: int | None = Field(Query(default=10, le=100, ge=1))
     page: int | None = Field(Query(default=1, ge=1))
+    cursor: str | None = Field(
+        Query(default=None, description="next_cursor of the previous page")
+    )
+    with_total: bool | None = Field(
+        Query(default=None, description="default: count only without cursor")
+    )
 
     @field_validator(
         "job_type_codes", "industry_codes", "city_codes", "tags", mode="before"
@@ -84,6 +94,7 @@ class SearchEventsQueryParams(BaseModel):
         """Factory method to initialize with real values, allowing overrides"""
         default_values = {
             "keyword": None,
+            "search_mode": "FULLTEXT",
             "is_online": False,
             "is_offline": False,
             "is_apply_ongoing": False,
@@ -101,6 +112,8 @@ class SearchEventsQueryParams(BaseModel):
             "sort_by": "PUBLISHED_AT",
             "per_page": 10,
             "page": 1,
+            "cursor": None,
+            "with_total": None,
         }
         # Update default values with any parameters passed
         default_values.update(kwargs)
@@ -213,6 +226,12 @@ class ListingMyEventsQueryParams(BaseModel):
     status: MyEventStatusCode = Field(Query(default=MyEventStatusCode.ALL))
     per_page: int | None = Field(Query(default=10, le=100, ge=1))
     page: int | None = Field(Query(default=1, ge=1))
+    cursor: str | None = Field(
+        Query(default=None, description="next_cursor of the previous page")
+    )
+    with_total: bool | None = Field(
+        Query(default=None, description="default: count only without cursor")
+    )
 
 
 class ListingMyEventsResponse(PaginationResponse[MyEventItem]):
@@ -294,6 +313,12 @@ class ListingOrganizationEventsQueryParams(BaseModel):
     )
     per_page: int | None = Field(Query(default=10, le=100, ge=1))
     page: int | None = Field(Query(default=1, ge=1))
+    cursor: str | None = Field(
+        Query(default=None, description="next_cursor of the previous page")
+    )
+    with_total: bool | None = Field(
+        Query(default=None, description="default: count only without cursor")
+    )
 
     @field_validator("tags", mode="before")
     def check_list_empty(cls, v):
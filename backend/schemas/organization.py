@@ -5,6 +5,9 @@ from pydantic import BaseModel, ConfigDict, Field
 
 from backend.core.constants import (
     AttendeeSortByCode,
+    ExportFormatCode,
+    ExportJobStatusCode,
+    ExportKindCode,
     IndustryCode,
     JobTypeCode,
     TransactionStatusCode,
@@ -50,6 +53,12 @@ class ListingAttendeesQueryParams(BaseModel):
     )
     per_page: int | None = Field(Query(default=10, le=100, ge=1))
     page: int | None = Field(Query(default=1, ge=1))
+    cursor: str | None = Field(
+        Query(default=None, description="next_cursor of the previous page")
+    )
+    with_total: bool | None = Field(
+        Query(default=None, description="default: count only without cursor")
+    )
 
 
 class ListingAttendeesItem(BaseModel):
@@ -87,6 +96,30 @@ class DownloadAttendeesRequest(BaseModel):
     with_filter: bool | None = Field(None)
     page: int | None = Field(None)
     per_page: int | None = Field(None)
+    format: ExportFormatCode = Field(ExportFormatCode.CSV)
+    # Gzipped CSV (XLSX files are already compressed)
+    gzip: bool = Field(False)
+
+
+class CreateExportJobRequest(DownloadAttendeesRequest):
+    kind: ExportKindCode
+    # Survey responses and transactions of one event only
+    event_id: int | None = Field(None)
+
+
+class ExportJobItem(BaseModel):
+    id: int
+    kind: ExportKindCode
+    format: ExportFormatCode
+    gzip: bool
+    status: ExportJobStatusCode
+    total_rows: int | None
+    processed_rows: int
+    size_bytes: int | None
+    error: str | None
+    created_at: datetime
+    finished_at: datetime | None
+    expired_at: datetime | None
 
 
 class AttendeeAppliedEvent(BaseModel):
@@ -64,3 +64,32 @@ class ListingSurveyOptionsItem(BaseModel):
     id: int
     name: str
     question_number: int
+
+
+class SurveyAnalyticsQueryParams(BaseModel):
+    # Responses of one event only
+    event_id: int | None = Field(None)
+    answer_text_sample_size: int = Field(20, ge=0, le=100)
+
+
+class SurveyAnswerAnalyticsItem(BaseModel):
+    answer_id: int
+    answer: str
+    response_number: int
+
+
+class SurveyQuestionAnalyticsItem(BaseModel):
+    question_id: int
+    question: str
+    type_code: QuestionTypeCode
+    response_number: int
+    answer_text_number: int
+    answers: list[SurveyAnswerAnalyticsItem] = Field([])
+    # Latest free text answers
+    answer_texts: list[str] = Field([])
+
+
+class SurveyAnalyticsResponse(BaseModel):
+    survey_id: int
+    event_id: int | None
+    questions: list[SurveyQuestionAnalyticsItem]
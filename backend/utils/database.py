@@ -1,22 +1,22 @@
 from typing import Any
 
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.models.base_model import BaseModel
 
 
-def save(db: Session, object: BaseModel):
+async def save(db: AsyncSession, object: BaseModel):
     db.add(object)
-    db.commit()
-    db.refresh(object)
+    await db.commit()
+    await db.refresh(object)
     return object
 
 
-def fetch_one(db: Session, query: Any) -> dict[str, Any] | None:
-    ret = db.exec(query).one_or_none()
+async def fetch_one(db: AsyncSession, query: Any) -> dict[str, Any] | None:
+    ret = (await db.exec(query)).one_or_none()
     return ret if ret else None
 
 
-def fetch_all(db: Session, query: Any) -> list[dict[str, Any]]:
-    ret = db.exec(query).fetchall()
+async def fetch_all(db: AsyncSession, query: Any) -> list[dict[str, Any]]:
+    ret = (await db.exec(query)).fetchall()
     return [r.__dict__ for r in ret]
@@ -0,0 +1,132 @@
+import asyncio
+import csv
+import io
+import tempfile
+import zlib
+from datetime import datetime
+from enum import Enum
+from typing import Any, AsyncIterator, Mapping
+
+from openpyxl import Workbook
+
+from backend.core.constants import ExportFormatCode
+
+# Size of the chunks yielded by the writers
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormatCode.CSV: "text/csv",
+    ExportFormatCode.XLSX: (
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    ),
+}
+
+
+def export_file_info(
+    name: str, format: ExportFormatCode, gzip: bool = False
+) -> tuple[str, str]:
+    """File name and media type of an export (XLSX is never gzipped)."""
+    filename = f"{name}.{format.value.lower()}"
+    if gzip and format == ExportFormatCode.CSV:
+        return f"{filename}.gz", "application/gzip"
+
+    return filename, EXPORT_MEDIA_TYPES[format]
+
+
+def format_export_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+async def iter_csv(
+    headers: dict[str, str], rows: AsyncIterator[Mapping[str, Any]]
+) -> AsyncIterator[bytes]:
+    """Write `rows` (keys of `headers`) as CSV, by chunks of about 64KB."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(headers.values())
+
+    async for row in rows:
+        writer.writerow(format_export_value(row[key]) for key in headers)
+        if buffer.tell() >= EXPORT_CHUNK_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue().encode()
+
+
+async def iter_xlsx(
+    headers: dict[str, str], rows: AsyncIterator[Mapping[str, Any]]
+) -> AsyncIterator[bytes]:
+    """
+    Write `rows` as an XLSX sheet in openpyxl's write-only mode (rows are
+    written to disk as they come), then yield the file by chunks.
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(list(headers.values()))
+
+    async for row in rows:
+        sheet.append([format_export_value(row[key]) for key in headers])
+
+    with tempfile.TemporaryFile() as file:
+        await asyncio.to_thread(workbook.save, file)
+        file.seek(0)
+        while chunk := await asyncio.to_thread(file.read, EXPORT_CHUNK_SIZE):
+            yield chunk
+
+
+async def iter_gzip(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    async for chunk in chunks:
+        if compressed := compressor.compress(chunk):
+            yield compressed
+
+    yield compressor.flush()
+
+
+def iter_export(
+    headers: dict[str, str],
+    rows: AsyncIterator[Mapping[str, Any]],
+    format: ExportFormatCode,
+    gzip: bool = False,
+) -> AsyncIterator[bytes]:
+    if format == ExportFormatCode.XLSX:
+        return iter_xlsx(headers, rows)
+
+    chunks = iter_csv(headers, rows)
+    return iter_gzip(chunks) if gzip else chunks
+
+
+def parse_byte_range(range_header: str | None, size: int) -> tuple[int, int] | None:
+    """
+    First and last byte of a single `Range: bytes=...` header, None for the
+    whole file. Raises ValueError if the range can't be satisfied.
+    """
+    if not range_header or not range_header.startswith("bytes="):
+        return None
+
+    # Multiple ranges are answered with the whole file
+    spec = range_header.removeprefix("bytes=").strip()
+    if "," in spec:
+        return None
+
+    first, _, last = spec.partition("-")
+    if not first:
+        # Suffix range: the last N bytes
+        if not last.isdigit() or int(last) == 0:
+            raise ValueError(range_header)
+        return max(size - int(last), 0), size - 1
+
+    if not first.isdigit() or (last and not last.isdigit()):
+        raise ValueError(range_header)
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError(range_header)
+
+    return start, end
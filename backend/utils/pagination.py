@@ -0,0 +1,124 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, NamedTuple, Sequence
+
+from sqlmodel import and_, false, or_
+
+from backend.core.error_code import ErrorCode, ErrorMessage
+from backend.core.exception import BadRequestException
+
+
+class SortKey(NamedTuple):
+    """
+    One column of a keyset (cursor) ordering.
+
+    `field` is the key of the column in the fetched rows, used to build the
+    cursor of the next page. The last key must be unique (usually the id).
+    """
+
+    column: Any
+    field: str
+    descending: bool = False
+
+
+def encode_cursor(sort_name: str, row: Any, sort_keys: Sequence[SortKey]) -> str:
+    values = []
+    for sort_key in sort_keys:
+        value = row[sort_key.field]
+        if isinstance(value, datetime):
+            values.append({"dt": value.isoformat()})
+        else:
+            values.append(value)
+
+    payload = json.dumps({"s": sort_name, "v": values}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, sort_name: str, sort_keys: Sequence[SortKey]) -> list:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        values = [
+            datetime.fromisoformat(value["dt"]) if isinstance(value, dict) else value
+            for value in payload["v"]
+        ]
+    except (binascii.Error, ValueError, KeyError, TypeError, UnicodeError):
+        raise BadRequestException(
+            ErrorCode.ERR_INVALID_CURSOR, ErrorMessage.ERR_INVALID_CURSOR
+        )
+
+    # A cursor is only valid for the ordering it was issued for
+    if payload.get("s") != sort_name or len(values) != len(sort_keys):
+        raise BadRequestException(
+            ErrorCode.ERR_INVALID_CURSOR, ErrorMessage.ERR_INVALID_CURSOR
+        )
+
+    return values
+
+
+def keyset_order_by(sort_keys: Sequence[SortKey]) -> list:
+    return [
+        sort_key.column.desc() if sort_key.descending else sort_key.column.asc()
+        for sort_key in sort_keys
+    ]
+
+
+def keyset_filter(sort_keys: Sequence[SortKey], values: Sequence[Any]):
+    """
+    Rows strictly after `values` in the given ordering:
+    (k1 > v1) OR (k1 = v1 AND k2 > v2) OR ...
+
+    NULLs follow the PostgreSQL default (last on ASC, first on DESC).
+    """
+    conditions = []
+    for i, (sort_key, value) in enumerate(zip(sort_keys, values)):
+        equals = [
+            _equals(previous_key.column, previous_value)
+            for previous_key, previous_value in zip(sort_keys[:i], values[:i])
+        ]
+        conditions.append(and_(*equals, _after(sort_key, value)))
+
+    return or_(*conditions)
+
+
+def paginate_by_keyset(
+    rows: Sequence[Any], per_page: int, sort_name: str, sort_keys: Sequence[SortKey]
+) -> tuple[list, str | None]:
+    """
+    Split rows fetched with `LIMIT per_page + 1` into the page and the cursor
+    of the next page (None on the last page).
+    """
+    rows = list(rows)
+    if len(rows) <= per_page:
+        return rows, None
+
+    rows = rows[:per_page]
+    return rows, encode_cursor(sort_name, rows[-1], sort_keys)
+
+
+def should_count_total(query_params: Any) -> bool:
+    """
+    COUNT(*) is skipped when following a cursor (the client already has it
+    from the first page) unless `with_total` says otherwise.
+    """
+    if query_params.with_total is not None:
+        return query_params.with_total
+    return not query_params.cursor
+
+
+def _equals(column, value):
+    return column.is_(None) if value is None else column == value
+
+
+def _after(sort_key: SortKey, value):
+    column = sort_key.column
+    if value is None:
+        # ASC: NULLs are last, nothing comes after them
+        # DESC: NULLs are first, every non NULL value comes after them
+        return column.isnot(None) if sort_key.descending else false()
+
+    if sort_key.descending:
+        return column < value
+
+    return or_(column > value, column.is_(None))
@@ -0,0 +1,133 @@
+import bisect
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Iterable
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+EXACT_MATCH_FACTOR = 1.0
+PREFIX_MATCH_FACTOR = 0.8
+SUBSTRING_MATCH_FACTOR = 0.6
+FUZZY_MATCH_FACTOR = 0.5
+
+
+def tokenize(text: str | None) -> list[str]:
+    if not text:
+        return []
+    return TOKEN_PATTERN.findall(unicodedata.normalize("NFKC", text).lower())
+
+
+def build_prefix_tsquery(keyword: str | None) -> str | None:
+    """
+    Build a `to_tsquery` expression matching every token of the keyword as a prefix.
+
+    Tokens only contain word characters, so tsquery operators in user input
+    can never reach the query parser.
+    """
+    tokens = tokenize(keyword)
+    if not tokens:
+        return None
+    return " & ".join(f"{token}:*" for token in tokens)
+
+
+def trigrams(token: str) -> set[str]:
+    # Same padding as pg_trgm: two spaces before, one after
+    padded = f"  {token} "
+    return {"".join(chars) for chars in zip(padded, padded[1:], padded[2:])}
+
+
+def similarity(a: str, b: str) -> float:
+    a_trigrams, b_trigrams = trigrams(a), trigrams(b)
+    return len(a_trigrams & b_trigrams) / len(a_trigrams | b_trigrams)
+
+
+class InvertedIndex:
+    """
+    In-process inverted index with weighted fields, prefix, substring and
+    trigram (typo tolerant) matching.
+
+    Used as a search backend when the database has no full-text/pg_trgm support.
+    """
+
+    def __init__(self):
+        self._postings: dict[str, dict[int, float]] = defaultdict(dict)
+        self._trigrams: dict[str, set[str]] = defaultdict(set)
+        self._vocabulary: list[str] = []
+
+    def __len__(self) -> int:
+        return len({doc_id for docs in self._postings.values() for doc_id in docs})
+
+    def add(self, doc_id: int, fields: Iterable[tuple[str | None, float]]):
+        """Index a document given as (text, weight) pairs."""
+        for text, weight in fields:
+            for token in tokenize(text):
+                if token not in self._postings:
+                    bisect.insort(self._vocabulary, token)
+                    for trigram in trigrams(token):
+                        self._trigrams[trigram].add(token)
+                postings = self._postings[token]
+                postings[doc_id] = postings.get(doc_id, 0) + weight
+
+    def search(
+        self,
+        keyword: str | None,
+        fuzzy: bool = False,
+        substring: bool = False,
+        similarity_threshold: float = 0.3,
+        limit: int | None = None,
+    ) -> dict[int, float]:
+        """
+        Return {doc_id: score} of documents matching every keyword token,
+        highest score first.
+        """
+        scores: dict[int, float] | None = None
+        for token in tokenize(keyword):
+            token_scores: dict[int, float] = {}
+            terms = self._expand(token, fuzzy, substring, similarity_threshold)
+            for term, factor in terms.items():
+                for doc_id, weight in self._postings[term].items():
+                    token_scores[doc_id] = max(
+                        token_scores.get(doc_id, 0), weight * factor
+                    )
+
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {
+                    doc_id: score + token_scores[doc_id]
+                    for doc_id, score in scores.items()
+                    if doc_id in token_scores
+                }
+            if not scores:
+                return {}
+
+        ranked = sorted((scores or {}).items(), key=lambda item: -item[1])
+        return dict(ranked[:limit] if limit else ranked)
+
+    def _expand(
+        self, token: str, fuzzy: bool, substring: bool, similarity_threshold: float
+    ) -> dict[str, float]:
+        terms: dict[str, float] = {}
+
+        start = bisect.bisect_left(self._vocabulary, token)
+        for term in self._vocabulary[start:]:
+            if not term.startswith(token):
+                break
+            terms[term] = EXACT_MATCH_FACTOR if term == token else PREFIX_MATCH_FACTOR
+
+        if substring:
+            for term in self._vocabulary:
+                if token in term:
+                    terms.setdefault(term, SUBSTRING_MATCH_FACTOR)
+
+        if fuzzy:
+            candidates = set().union(
+                *(self._trigrams.get(t, set()) for t in trigrams(token))
+            )
+            for term in candidates - terms.keys():
+                score = similarity(token, term)
+                if score >= similarity_threshold:
+                    terms[term] = FUZZY_MATCH_FACTOR * score
+
+        return terms
@@ -0,0 +1,71 @@
+import threading
+import time
+from collections import Counter
+from typing import Hashable
+
+
+class ViewCounter:
+    """
+    In-process view accumulator, flushed to the database in batches.
+
+    Views of the same viewer on the same item within `dedup_window_seconds`
+    are counted once (0 disables it). At most `dedup_max_entries` viewers are
+    remembered, beyond that views are counted without dedup until the next
+    prune. Safe to use from the event loop and from worker threads.
+    """
+
+    def __init__(self, dedup_window_seconds: float = 0, dedup_max_entries: int = 0):
+        self.dedup_window_seconds = dedup_window_seconds
+        self.dedup_max_entries = dedup_max_entries
+        self._lock = threading.Lock()
+        self._pending: Counter = Counter()
+        self._in_flight: Counter = Counter()
+        self._seen: dict[tuple[Hashable, Hashable], float] = {}
+
+    def record(self, key: Hashable, viewer: Hashable | None = None) -> bool:
+        """Count a view of `key`, return False if deduplicated."""
+        now = time.monotonic()
+        with self._lock:
+            if viewer is not None and self.dedup_window_seconds > 0:
+                seen_until = self._seen.get((key, viewer))
+                if seen_until and seen_until > now:
+                    return False
+                if len(self._seen) < self.dedup_max_entries:
+                    self._seen[(key, viewer)] = now + self.dedup_window_seconds
+
+            self._pending[key] += 1
+            return True
+
+    def pending(self, key: Hashable) -> int:
+        """Views of `key` not committed to the database yet."""
+        with self._lock:
+            return self._pending.get(key, 0) + self._in_flight.get(key, 0)
+
+    def drain(self) -> dict[Hashable, int]:
+        """
+        Take every pending delta to flush it, then call `done` (or `restore` if
+        the flush failed). Also prunes expired viewers.
+        """
+        now = time.monotonic()
+        with self._lock:
+            deltas, self._pending = dict(self._pending), Counter()
+            self._in_flight.update(deltas)
+            self._seen = {
+                seen: seen_until
+                for seen, seen_until in self._seen.items()
+                if seen_until > now
+            }
+        return deltas
+
+    def done(self, deltas: dict[Hashable, int]):
+        """The drained deltas were committed."""
+        with self._lock:
+            self._in_flight.subtract(deltas)
+            self._in_flight = +self._in_flight
+
+    def restore(self, deltas: dict[Hashable, int]):
+        """The flush of the drained deltas failed, retry them on the next one."""
+        with self._lock:
+            self._in_flight.subtract(deltas)
+            self._in_flight = +self._in_flight
+            self._pending.update(deltas)